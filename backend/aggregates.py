@@ -0,0 +1,216 @@
+"""
+Per-user weekly aggregates shared by the analytics endpoints.
+
+`weekly_rows` returns one row per week that has events, with the columns of
+rollup.weekly_columns(). UTC weeks come from the weekly_rollup table, and
+localtime weeks are aggregated from raw events. Results are kept in an
+in-process LRU cache keyed by the user's data version (see versions.py), so
+entries of a user whose events changed are simply never read again.
+"""
+import os
+from datetime import date, datetime, time, timedelta
+from collections import OrderedDict
+from typing import Any, Hashable, List
+
+from sqlalchemy import Float, String, case, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import Event, EventType, WeeklyRollup
+from . import rollup, versions
+
+WEEKLY_CACHE_SIZE = int(os.getenv("WEEKLY_CACHE_SIZE", "1024"))
+
+
+class LRUCache:
+    """A size-bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable):
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        if self.max_size <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+_cache = LRUCache(WEEKLY_CACHE_SIZE)
+
+
+def cache_stats() -> dict:
+    return {"entries": len(_cache), "max_entries": _cache.max_size, "hits": _cache.hits, "misses": _cache.misses}
+
+
+def week_start_expr(use_localtime: bool):
+    """
+    Week-start (Monday) bucket for Event rows as a 'YYYY-MM-DD' string.
+    Reads the indexed event_week column. SQLite's 'localtime' depends on the
+    server timezone, so that case still computes the bucket per row; order
+    matters there: 'localtime' is applied *before* 'weekday 1' and '-7 days'.
+    """
+    if not use_localtime:
+        return Event.event_week
+    ts_norm = func.replace(cast(Event.event_timestamp, String), 'T', ' ')
+    return func.date(ts_norm, 'localtime', 'weekday 1', '-7 days')
+
+
+def _event_range(week_start, use_localtime: bool, start_week: str | None, end_week: str | None):
+    """WHERE terms keeping events whose week bucket is within the bounds."""
+    terms = []
+    if start_week is not None:
+        terms.append(week_start >= start_week)
+    if end_week is not None:
+        terms.append(week_start <= end_week)
+    if use_localtime and terms:
+        # The localtime bucket is computed per row, so add a slightly wider
+        # range on the raw timestamp for the index to scan. A week's events
+        # run from its Tuesday to the next Monday (see week_start_of), and
+        # local time is within a day of UTC.
+        if start_week is not None:
+            terms.append(Event.event_timestamp >= datetime.combine(date.fromisoformat(start_week), time.min))
+        if end_week is not None:
+            terms.append(Event.event_timestamp < datetime.combine(date.fromisoformat(end_week) + timedelta(days=9), time.min))
+    return terms
+
+
+async def weekly_rows_from_events(db: AsyncSession, user_id: str, use_localtime: bool,
+                                  start_week: str | None = None, end_week: str | None = None,
+                                  latest: int | None = None):
+    """
+    Aggregates a user's raw events per week, with the same columns as
+    rollup.weekly_columns(). Used where the rollup's UTC week buckets do not
+    apply (use_localtime).
+    """
+    week_start = week_start_expr(use_localtime)
+
+    # Normalize numeric metrics (sleep -> hours; meals -> count). Stress excluded.
+    value_std = rollup.value_std_expr()
+
+    base_q = (
+        select(
+            week_start.label('week_start_monday'),
+            Event.event_type.label('event_type'),
+            Event.severity.label('severity'),
+            value_std.label('value_std')
+        )
+        .where(Event.user_id == user_id, week_start.isnot(None),
+               *_event_range(week_start, use_localtime, start_week, end_week))
+    ).subquery()
+
+    weekly_q = (
+        select(
+            base_q.c.week_start_monday,
+
+            # migraines
+            func.sum(case((base_q.c.event_type == EventType.migraine, 1), else_=0)).label('migraine_events'),
+            func.avg(case((base_q.c.event_type == EventType.migraine, cast(base_q.c.severity, Float)), else_=None)).label('migraine_avg_severity'),
+
+            # sleep hours
+            func.sum(case((base_q.c.event_type == EventType.sleep, base_q.c.value_std), else_=0.0)).label('sleep_hours'),
+
+            func.sum(case((base_q.c.event_type == EventType.stress, 1), else_=0)).label('stress_events'),
+            func.avg(case((base_q.c.event_type == EventType.stress, cast(base_q.c.severity, Float)), else_=None)).label('stress_avg_severity'),
+
+            # meals count
+            func.sum(case((base_q.c.event_type == EventType.meals, base_q.c.value_std), else_=0.0)).label('meals_count'),
+
+            # exercise
+            func.sum(case((base_q.c.event_type == EventType.exercise, base_q.c.value_std), else_=0.0)).label('exercise_days'),
+            # medication
+            func.sum(case((base_q.c.event_type == EventType.medication, base_q.c.value_std), else_=0.0)).label('medication_days'),
+
+        )
+        .group_by(base_q.c.week_start_monday)
+    )
+    if latest is None:
+        return (await db.execute(weekly_q.order_by(base_q.c.week_start_monday))).all()
+    rows = (await db.execute(weekly_q.order_by(base_q.c.week_start_monday.desc()).limit(latest))).all()
+    return rows[::-1]
+
+
+async def weekly_rows_from_rollup(db: AsyncSession, user_id: str,
+                                  start_week: str | None = None, end_week: str | None = None,
+                                  latest: int | None = None):
+    # A range scan of the (user_id, week_start) primary key
+    stmt = select(*rollup.weekly_columns()).where(WeeklyRollup.user_id == user_id)
+    if start_week is not None:
+        stmt = stmt.where(WeeklyRollup.week_start >= start_week)
+    if end_week is not None:
+        stmt = stmt.where(WeeklyRollup.week_start <= end_week)
+    if latest is None:
+        return (await db.execute(stmt.order_by(WeeklyRollup.week_start))).all()
+    rows = (await db.execute(stmt.order_by(WeeklyRollup.week_start.desc()).limit(latest))).all()
+    return rows[::-1]
+
+
+async def _first_week(db: AsyncSession, user_id: str, use_localtime: bool) -> str | None:
+    if not use_localtime:
+        return (await db.execute(
+            select(func.min(WeeklyRollup.week_start)).where(WeeklyRollup.user_id == user_id)
+        )).scalar()
+    # Bucket only the earliest timestamp (an index seek) rather than every row.
+    earliest = (
+        select(func.min(Event.event_timestamp))
+          .where(Event.user_id == user_id)
+          .scalar_subquery()
+    )
+    ts_norm = func.replace(cast(earliest, String), 'T', ' ')
+    return (await db.execute(select(func.date(ts_norm, 'localtime', 'weekday 1', '-7 days')))).scalar()
+
+
+async def _cached(db: AsyncSession, user_id: str, version: int | None, key: tuple, fetch):
+    # Read the version before querying, so a write committed mid-query
+    # can only leave its result under an already-stale key.
+    if version is None:
+        version = await versions.get(db, user_id)
+    key = (versions.user_key(user_id), version) + key
+    value = _cache.get(key)
+    if value is None:
+        value = await fetch()
+        _cache.put(key, value)
+    return value
+
+
+async def weekly_rows(db: AsyncSession, user_id: str, use_localtime: bool = False,
+                      start_week: str | None = None, end_week: str | None = None,
+                      latest: int | None = None, version: int | None = None) -> List[Any]:
+    """
+    The user's weekly aggregates between the optional inclusive
+    'YYYY-MM-DD' week bounds, oldest first; only the `latest` weeks with
+    data if given. Cached until the user's data changes. Pass `version` if
+    the caller has already read it.
+    """
+    async def fetch():
+        if use_localtime:
+            return await weekly_rows_from_events(db, user_id, use_localtime, start_week, end_week, latest)
+        return await weekly_rows_from_rollup(db, user_id, start_week, end_week, latest)
+
+    return await _cached(db, user_id, version, ('weeks', use_localtime, start_week, end_week, latest), fetch)
+
+
+async def first_week(db: AsyncSession, user_id: str, use_localtime: bool = False,
+                     version: int | None = None) -> str | None:
+    """The user's earliest week with data, or None. Cached like weekly_rows."""
+    async def fetch():
+        # Cache misses are looked up again, so store "no data" as ''.
+        return await _first_week(db, user_id, use_localtime) or ''
+
+    return await _cached(db, user_id, version, ('first', use_localtime), fetch) or None
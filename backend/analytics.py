@@ -0,0 +1,192 @@
+"""
+Rolling weekly analytics over a NumPy-backed weekly frame.
+
+`rolling_weekly` turns sparse per-week aggregate rows (week_start_monday plus
+the metric columns of rollup.weekly_columns()) into the continuous series
+served by /api/weekly/rolling: each metric with its previous-week value,
+week-over-week percent change and a NaN-aware moving average.
+`rolling_weekly_columns` returns the same series as one list per key.
+
+Missing averages are NaN inside the frame and None in the output.
+"""
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from .models import week_start_of
+
+# (metric, lag key, percent-change key, moving-average key, integer counts?)
+METRICS = [
+    ('migraine_events', 'migraine_events_prev', 'pct_migraine_events_change', 'moving_average_migraine_events', True),
+    ('migraine_avg_severity', 'migraine_severity_prev', 'pct_migraine_severity_change', 'moving_average_migraine_severity', False),
+    ('sleep_hours', 'sleep_hours_prev', 'pct_sleep_hours_change', 'moving_average_sleep_hours', False),
+    ('stress_events', 'stress_events_prev', 'pct_stress_events_change', 'moving_average_stress_events', True),
+    ('stress_avg_severity', 'stress_severity_prev', 'pct_stress_severity_change', 'moving_average_stress_severity', False),
+    ('meals_count', 'meals_count_prev', 'pct_meals_count_change', 'moving_average_meals_count', False),
+    ('exercise_days', 'exercise_days_prev', 'pct_exercise_days_change', 'moving_average_exercise_days', False),
+    ('medication_days', 'medication_days_prev', 'pct_medication_days_change', 'moving_average_medication_days', False),
+]
+
+# Averages stay missing (NaN) in weeks without data; sums and counts are 0.
+AVERAGES = {'migraine_avg_severity', 'stress_avg_severity'}
+
+# Output keys, in the original per-week dict order: base metrics, lags,
+# percent changes, then moving averages.
+KEYS = (['week_start_monday'] + [m[0] for m in METRICS] + [m[1] for m in METRICS]
+        + [m[2] for m in METRICS] + [m[3] for m in METRICS])
+
+
+def week_calendar(first_week: str, last_week: str, start_date: str | None = None,
+                  end_date: str | None = None) -> np.ndarray:
+    """
+    Every week start from the first to the last data week as datetime64[D],
+    widened (never narrowed) to the Monday-aligned start/end dates.
+    """
+    lo = date.fromisoformat(first_week)
+    hi = date.fromisoformat(last_week)
+    if start_date:
+        lo = min(lo, week_start_of(datetime.strptime(start_date, "%Y-%m-%d").date()))
+    if end_date:
+        hi = max(hi, week_start_of(datetime.strptime(end_date, "%Y-%m-%d").date()))
+    return np.arange(np.datetime64(lo, 'D'), np.datetime64(hi, 'D') + 1, 7)
+
+
+def weekly_frame(rows: Sequence[Any], weeks: np.ndarray) -> Dict[str, np.ndarray]:
+    """Scatter sparse weekly rows onto the calendar as float64 columns."""
+    n = len(weeks)
+    positions = ((np.array([r.week_start_monday for r in rows], dtype='datetime64[D]') - weeks[0]) // 7).astype(int)
+    frame = {}
+    for name, *_ in METRICS:
+        column = np.full(n, np.nan if name in AVERAGES else 0.0)
+        values = np.array([getattr(r, name) for r in rows], dtype=float)
+        column[positions] = values
+        frame[name] = column
+    return frame
+
+
+def lag(values: np.ndarray) -> np.ndarray:
+    """Previous week's value; NaN for the first week."""
+    out = np.empty_like(values)
+    out[0] = np.nan
+    out[1:] = values[:-1]
+    return out
+
+
+def pct_change(curr: np.ndarray, prev: np.ndarray) -> np.ndarray:
+    """(curr - prev) / prev; NaN where prev is missing or zero. A missing
+    current value counts as 0."""
+    curr = np.nan_to_num(curr, nan=0.0)
+    out = np.full(len(curr), np.nan)
+    ok = ~np.isnan(prev) & (prev != 0)
+    out[ok] = (curr[ok] - prev[ok]) / prev[ok]
+    return out
+
+
+def rolling_mean(values: np.ndarray, k: int, exact_sums: bool = False) -> np.ndarray:
+    """
+    Mean of the non-NaN values in each trailing window of k weeks (including
+    the current one); NaN when the window holds no values.
+
+    With `exact_sums` (integer-valued columns, where float64 sums are exact)
+    window sums come from one prefix sum in O(n). Otherwise the window is
+    accumulated oldest to newest in k vectorized passes, which keeps the
+    left-to-right summation order and so the exact floating-point results of
+    a plain `sum(window)`.
+    """
+    n = len(values)
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+    if exact_sums:
+        sums = np.concatenate(([0.0], np.cumsum(filled)))
+        counts = np.concatenate(([0], np.cumsum(present)))
+        lo = np.maximum(np.arange(n) - k + 1, 0)
+        window_sum = sums[1:] - sums[lo]
+        window_count = counts[1:] - counts[lo]
+    else:
+        window_sum = np.zeros(n)
+        window_count = np.zeros(n, dtype=int)
+        for offset in range(min(k, n) - 1, -1, -1):
+            window_sum[offset:] += filled[:n - offset]
+            window_count[offset:] += present[:n - offset]
+    out = np.full(n, np.nan)
+    has = window_count > 0
+    out[has] = window_sum[has] / window_count[has]
+    return out
+
+
+def _to_list(values: np.ndarray, as_int: bool = False) -> List[Any]:
+    """Python values for JSON output: NaN -> None, optionally ints."""
+    if as_int:
+        return [None if np.isnan(v) else int(v) for v in values.tolist()]
+    return [None if v != v else v for v in values.tolist()]
+
+
+def history_start(start_date: str, window_size: int, first_week: str) -> str:
+    """
+    First week that the series for a range starting at `start_date` depends
+    on: the lag and moving average of its first week look back
+    `window_size` weeks, but never before the user's first week with data.
+    """
+    start = week_start_of(datetime.strptime(start_date, "%Y-%m-%d").date())
+    if first_week >= start.isoformat():
+        return start.isoformat()
+    return max(first_week, (start - timedelta(weeks=max(window_size, 1))).isoformat())
+
+
+def range_calendar(rows: Sequence[Any], history_from: str, end_date: str | None = None) -> np.ndarray:
+    """Week starts from `history_from` to the last data week or the end date, whichever is later."""
+    candidates = [date.fromisoformat(rows[-1].week_start_monday)] if rows else []
+    if end_date:
+        candidates.append(week_start_of(datetime.strptime(end_date, "%Y-%m-%d").date()))
+    if not candidates:
+        return np.array([], dtype='datetime64[D]')
+    return np.arange(np.datetime64(history_from, 'D'), np.datetime64(max(candidates), 'D') + 1, 7)
+
+
+def rolling_weekly_columns(rows: Sequence[Any], window_size: int, start_date: str | None = None,
+                           end_date: str | None = None, history_from: str | None = None) -> Dict[str, List[Any]]:
+    """
+    Continuous weekly series with lags, percent changes and moving averages,
+    as one list per output key (see KEYS).
+
+    Without `history_from` the series covers every week of `rows`, widened to
+    the start/end dates. For a bounded read pass `history_from` from
+    history_start() along with the rows from that week on: the series then
+    only covers start_date onwards, with the same values as if every week
+    had been read.
+    """
+    if history_from is None:
+        weeks = week_calendar(rows[0].week_start_monday, rows[-1].week_start_monday,
+                              start_date, end_date) if rows else np.array([], dtype='datetime64[D]')
+    else:
+        weeks = range_calendar(rows, history_from, end_date)
+    if not len(weeks):
+        return {key: [] for key in KEYS}
+    frame = weekly_frame(rows, weeks)
+    k = max(window_size, 1)
+
+    # The look-back weeks before start_date are computed on, not returned.
+    skip = 0
+    if history_from is not None:
+        first = week_start_of(datetime.strptime(start_date, "%Y-%m-%d").date())
+        skip = max(int((np.datetime64(first, 'D') - weeks[0]) // np.timedelta64(7, 'D')), 0)
+
+    columns: Dict[str, List[Any]] = {"week_start_monday": [str(w) for w in weeks[skip:]]}
+    for name, lag_key, pct_key, ma_key, is_count in METRICS:
+        values = frame[name]
+        prev = lag(values)
+        # Counts and sums are never missing, so an exact-sum check is cheap.
+        integral = is_count or bool(np.all(values == np.round(values)))
+        columns[name] = _to_list(values[skip:], as_int=is_count)
+        columns[lag_key] = _to_list(prev[skip:], as_int=is_count)
+        columns[pct_key] = _to_list(pct_change(values, prev)[skip:])
+        columns[ma_key] = _to_list(rolling_mean(values, k, exact_sums=integral)[skip:])
+    return {key: columns[key] for key in KEYS}
+
+
+def rolling_weekly(rows: Sequence[Any], window_size: int, start_date: str | None = None,
+                   end_date: str | None = None, history_from: str | None = None) -> List[Dict[str, Any]]:
+    """rolling_weekly_columns() as one dict per week."""
+    columns = rolling_weekly_columns(rows, window_size, start_date, end_date, history_from)
+    return [dict(zip(KEYS, values)) for values in zip(*columns.values())]
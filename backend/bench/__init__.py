@@ -0,0 +1,77 @@
+"""
+Benchmarks behind the performance changes, run from the repository root:
+
+    python -m backend.bench.<name> [options]
+
+Each one works on a scratch database in a temporary directory (DB_PATH is
+set before the backend is imported) unless DB_PATH is already set, and
+prints its timings.
+"""
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+SCRATCH_DIR = tempfile.mkdtemp(prefix="backend-bench-")
+os.environ.setdefault("DB_PATH", os.path.join(SCRATCH_DIR, "app.db"))
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+
+from ..database import SessionLocal
+from ..ingest import new_event_row, utc_now
+from ..migrations import upgrade
+from ..models import Event, EventType, Unit, User
+from .. import rollup, versions
+
+
+@contextmanager
+def timed(label: str, count: int | None = None):
+    """Print how long the block took, and its rate if it handled `count` items."""
+    started = time.perf_counter()
+    yield
+    seconds = time.perf_counter() - started
+    rate = f" ({count / seconds:,.0f}/s)" if count else ""
+    print(f"{label}: {seconds:.3f}s{rate}")
+
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(int(p * len(values)), len(values) - 1)] if values else float('nan')
+
+
+def random_payload(rng: random.Random, event_type: EventType | None = None) -> Dict[str, Any]:
+    """A dumped EventRequest with plausible values, at a random time in 2024-2025."""
+    event_type = event_type or rng.choice(list(EventType))
+    payload = {'system': 'bench', 'code': event_type.value, 'event_type': event_type.value, 'severity': None,
+               'numerical_value': None, 'numerical_unit': None, 'description': 'bench',
+               'event_timestamp': datetime(2024, 1, 1) + timedelta(minutes=rng.randint(0, 2 * 365 * 24 * 60))}
+    if event_type in (EventType.migraine, EventType.stress):
+        payload['severity'] = rng.randint(1, 5)
+    elif event_type is EventType.sleep:
+        payload['numerical_value'], payload['numerical_unit'] = rng.randint(300, 540), Unit.minutes.value
+    else:
+        payload['numerical_value'], payload['numerical_unit'] = rng.randint(1, 3), Unit.number.value
+    return payload
+
+
+def seed(users: int, events_per_user: int, seed: int = 0) -> List:
+    """Create `users` users with `events_per_user` random events each; returns their ids."""
+    upgrade()
+    rng = random.Random(seed)
+    now = utc_now()
+    with SessionLocal() as db:
+        new_users = [User(name=f"bench-{i}") for i in range(users)]
+        db.add_all(new_users)
+        db.flush()
+        user_ids = [user.id for user in new_users]
+        for user_id in user_ids:
+            rows = [new_event_row(user_id, random_payload(rng), now) for _ in range(events_per_user)]
+            db.execute(insert(Event.__table__), rows)
+            rollup.apply_rows(db, rows)
+        versions.bump(db, user_ids)
+        db.commit()
+    return user_ids
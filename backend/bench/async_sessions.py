@@ -0,0 +1,89 @@
+"""
+Concurrent request throughput with the synchronous Session the routes used
+to call from `async def` against the AsyncSession they use now.
+
+Requests arrive at a steady rate on one event loop, as at the server's
+worker: most are a quick lookup of a user, some a slow aggregation over
+every event. With the synchronous Session each query blocks the loop, so
+a quick request arriving during an aggregation waits for it; with the
+AsyncSession queries run on aiosqlite's threads and the loop keeps serving.
+
+    python -m backend.bench.async_sessions [requests per second] [seconds]
+"""
+import asyncio
+import random
+import sys
+from typing import List
+
+from sqlalchemy import func, select
+
+from . import percentile, seed
+from ..database import AsyncSessionLocal, SessionLocal, async_engine
+from ..models import Event, User
+
+# One request in SLOW_EVERY is the slow aggregation.
+SLOW_EVERY = 10
+
+
+def quick(user_id):
+    return select(User.id, User.name).where(User.id == user_id)
+
+
+def slow():
+    return select(Event.user_id, Event.event_type, func.count(), func.avg(Event.numerical_value)) \
+        .group_by(Event.user_id, Event.event_type)
+
+
+async def sync_session(stmt):
+    # What the routes did: a blocking query inside `async def`.
+    with SessionLocal() as db:
+        return db.execute(stmt).all()
+
+
+async def async_session(stmt):
+    async with AsyncSessionLocal() as db:
+        return (await db.execute(stmt)).all()
+
+
+async def run(execute, user_ids: List, rate: float, seconds: float):
+    """
+    Requests arrive `rate` a second for `seconds`, each started as its own
+    task, like a server's requests. Latency is counted from the arrival,
+    so it includes any time spent waiting for the loop.
+    Returns (requests served a second, quick latencies, slow latencies).
+    """
+    rng = random.Random(0)
+    latencies = {'quick': [], 'slow': []}
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async def request(i: int, arrival: float):
+        kind = 'slow' if i % SLOW_EVERY == 0 else 'quick'
+        await execute(slow() if kind == 'slow' else quick(rng.choice(user_ids)))
+        latencies[kind].append(loop.time() - arrival)
+
+    tasks = []
+    for i in range(int(rate * seconds)):
+        arrival = started + i / rate
+        await asyncio.sleep(max(arrival - loop.time(), 0))
+        tasks.append(asyncio.create_task(request(i, arrival)))
+    await asyncio.gather(*tasks)
+    return len(tasks) / (loop.time() - started), latencies['quick'], latencies['slow']
+
+
+async def main(rate: float, seconds: float):
+    user_ids = seed(users=200, events_per_user=500)
+    print(f"{len(user_ids) * 500} events; {rate:g} requests/s for {seconds:g}s, 1 in {SLOW_EVERY} a slow aggregation")
+    for name, execute in (("sync Session", sync_session), ("AsyncSession", async_session)):
+        await run(execute, user_ids, rate, 0.5)  # warm up the pools and caches
+        throughput, quick_latencies, slow_latencies = await run(execute, user_ids, rate, seconds)
+
+        def ms(values):
+            return f"p50 {percentile(values, .5) * 1000:7.1f} ms  p95 {percentile(values, .95) * 1000:7.1f} ms"
+
+        print(f"{name:>13}: {throughput:6.0f} requests/s  quick {ms(quick_latencies)}  slow {ms(slow_latencies)}")
+    await async_engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(float(sys.argv[1]) if len(sys.argv) > 1 else 50, float(sys.argv[2]) if len(sys.argv) > 2 else 5))
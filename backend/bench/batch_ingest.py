@@ -0,0 +1,82 @@
+"""
+Loading events through POST /api/events/batch, as a JSON array and as
+NDJSON, against one POST /api/event per event, sent one after another
+and `concurrency` at a time (those are group-committed, see
+ingest.WriteCoalescer). Requests go to the app in-process, over httpx's
+ASGI transport, so the timings are the server's share of the work.
+
+    python -m backend.bench.batch_ingest [events] [concurrency]
+"""
+import asyncio
+import random
+import sys
+import time
+
+import httpx
+import orjson
+from sqlalchemy import func, select
+
+from . import random_payload, seed
+from ..database import AsyncSessionLocal, async_engine
+from ..ingest import write_coalescer
+from ..main import app
+from ..models import Event
+
+
+async def measure(label: str, count: int, function):
+    started = time.perf_counter()
+    await function()
+    seconds = time.perf_counter() - started
+    print(f"{label:<34} {seconds:7.2f} s  {count / seconds:8,.0f} events/s")
+
+
+async def stored(user_id) -> int:
+    async with AsyncSessionLocal() as db:
+        return (await db.execute(select(func.count()).where(Event.user_id == user_id))).scalar()
+
+
+async def main(count: int, concurrency: int):
+    # One user per run; seed gives each an event of its own.
+    user_ids = seed(users=4, events_per_user=1)
+    rng = random.Random(0)
+    payloads = [orjson.loads(orjson.dumps(random_payload(rng))) for _ in range(count)]
+    print(f"{count} events")
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url="http://bench") as client:
+        async def json_array(user_id):
+            response = await client.post("/api/events/batch", params={'user_id': user_id},
+                                         content=orjson.dumps(payloads), headers={'Content-Type': 'application/json'})
+            assert response.json()['created'] == count
+
+        async def ndjson(user_id):
+            body = b'\n'.join(orjson.dumps(p) for p in payloads)
+            response = await client.post("/api/events/batch", params={'user_id': user_id},
+                                         content=body, headers={'Content-Type': 'application/x-ndjson'})
+            assert response.json()['created'] == count
+
+        async def per_event(user_id, at_once):
+            slots = asyncio.Semaphore(at_once)
+
+            async def post(payload):
+                async with slots:
+                    response = await client.post("/api/event", params={'user_id': user_id}, json=payload)
+                    response.raise_for_status()
+
+            await asyncio.gather(*(post(p) for p in payloads))
+
+        runs = [
+            ("batch, JSON array", json_array),
+            ("batch, NDJSON", ndjson),
+            ("POST /api/event, one at a time", lambda user_id: per_event(user_id, 1)),
+            (f"POST /api/event, {concurrency} at a time", lambda user_id: per_event(user_id, concurrency)),
+        ]
+        for (label, run), user_id in zip(runs, user_ids):
+            await measure(label, count, lambda: run(str(user_id)))
+            assert await stored(user_id) == count + 1
+    await write_coalescer.close()
+    await async_engine.dispose()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    asyncio.run(main(int(args[0]) if args else 2000, int(args[1]) if len(args) > 1 else 32))
@@ -0,0 +1,61 @@
+"""
+Serializing 10k events for the listing endpoints: ORM objects through
+jsonable_encoder and json, as the routes returned them before, against the
+column rows of main.EVENT_COLUMNS validated by schemas.EventResponse, and
+the same rows through orjson as the routes send them now (main.row_dicts
+plus ORJSONResponse). Also times loading the objects against the rows.
+
+    python -m backend.bench.event_json [events]
+"""
+import asyncio
+import json
+import sys
+import time
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from . import seed
+from ..database import AsyncSessionLocal, async_engine
+from ..main import EVENT_COLUMNS, row_dicts
+from ..models import Event
+from ..schemas import EventResponse
+
+EVENTS = TypeAdapter(List[EventResponse])
+
+
+async def measure(label: str, function, repeat: int = 5):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+        if asyncio.iscoroutine(result):
+            result = await result
+    print(f"{label:<40} {(time.perf_counter() - started) / repeat * 1000:7.1f} ms")
+    return result
+
+
+async def main(count: int):
+    seed(users=count // 1000, events_per_user=1000)
+    async with AsyncSessionLocal() as db:
+        async def load_objects():
+            db.expunge_all()
+            return (await db.execute(select(Event).limit(count))).scalars().all()
+
+        async def load_rows():
+            return (await db.execute(select(*EVENT_COLUMNS).limit(count))).all()
+
+        print(f"{count} events")
+        objects = await measure("load ORM objects", load_objects)
+        rows = await measure("load column rows", load_rows)
+        await measure("ORM objects -> jsonable_encoder -> json", lambda: json.dumps(jsonable_encoder(objects)).encode())
+        await measure("rows -> pydantic validate -> dump_json",
+                      lambda: EVENTS.dump_json(EVENTS.validate_python(rows, from_attributes=True)))
+        await measure("rows -> dict -> orjson", lambda: ORJSONResponse(row_dicts(rows)).body)
+    await async_engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
@@ -0,0 +1,48 @@
+"""
+Observation JSON for the export: fhirclient models (main.convert_event_to_fhir
+plus as_json) against the dicts of fhir_resources.observation.
+
+    python -m backend.bench.fhir_resources [events]
+"""
+import random
+import sys
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from fhirclient.models.fhirreference import FHIRReference
+
+from . import timed
+from ..fhir_resources import observation
+from ..fhir_state import PENDING_COLUMNS
+from ..main import convert_event_to_fhir
+from ..models import EventType, Severity, Unit
+
+Row = namedtuple('Row', [c.key for c in PENDING_COLUMNS])
+
+
+def random_rows(count: int):
+    rng = random.Random(0)
+    return [
+        Row(uuid.uuid4(), 'LOINC', 'LA15141-7', rng.choice(list(EventType)), rng.choice([None, *Severity]),
+            rng.choice([None, 0, 7, 480]), rng.choice([None, *Unit]), rng.choice(['', 'slept well']),
+            datetime(2025, 1, 1) + timedelta(minutes=rng.randint(0, 10 ** 6)), datetime(2025, 1, 1))
+        for _ in range(count)
+    ]
+
+
+def fhirclient_observation(row, patient_id: str):
+    resource = convert_event_to_fhir(row)
+    resource.subject = FHIRReference({'reference': f'Patient/{patient_id}'})
+    return resource.as_json()
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = random_rows(count)
+    with timed(f"{count} events, fhirclient models", count):
+        for row in rows:
+            fhirclient_observation(row, '1')
+    with timed(f"{count} events, fhir_resources dicts", count):
+        for row in rows:
+            observation(row, '1')
@@ -0,0 +1,113 @@
+"""
+/api/weekly/rolling post-processing: analytics.rolling_weekly against the
+list-based code it replaced (`list_rolling_weekly`, kept here as the
+reference), on a 10-year series. Checks that both give the same output.
+
+    python -m backend.bench.rolling [window weeks ...]
+"""
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+from ..analytics import METRICS, rolling_weekly
+
+YEARS = 10
+
+
+def list_rolling_weekly(rows, window_size, start_date=None, end_date=None):
+    """The previous implementation: parallel lists, lag copies and an O(n*k) moving average."""
+    def to_date(s: str) -> datetime:
+        return datetime.strptime(s, "%Y-%m-%d")
+
+    def align_to_monday(d: datetime) -> datetime:
+        return (d + timedelta(days=(7 - d.weekday()) % 7)) - timedelta(days=7)
+
+    min_week = to_date(rows[0].week_start_monday)
+    max_week = to_date(rows[-1].week_start_monday)
+    if start_date:
+        min_week = min(align_to_monday(to_date(start_date)), min_week)
+    if end_date:
+        max_week = max(align_to_monday(to_date(end_date)), max_week)
+    weeks, cur = [], min_week
+    while cur <= max_week:
+        weeks.append(cur.strftime("%Y-%m-%d"))
+        cur += timedelta(days=7)
+
+    sparse = {r.week_start_monday: r for r in rows}
+    series = []
+    for w in weeks:
+        r = sparse.get(w)
+        row = {"week_start_monday": w}
+        for name, *_, is_count in METRICS:
+            value = getattr(r, name) if r else None
+            if is_count:
+                row[name] = int(value) if r else 0
+            elif name.endswith('_avg_severity'):
+                row[name] = float(value) if value is not None else None
+            else:
+                row[name] = float(value) if r else 0.0
+        series.append(row)
+
+    def pct_change(curr, prev):
+        if prev is None or prev == 0:
+            return None
+        return (curr - prev) / prev
+
+    def moving_avg(values, k):
+        out = []
+        for i in range(len(values)):
+            window = values[max(0, i - k + 1): i + 1]
+            nums = [v for v in window if v is not None]
+            out.append(sum(nums) / len(nums) if nums else None)
+        return out
+
+    k = max(window_size, 1)
+    lags, pcts, mas = {}, {}, {}
+    for name, lag_key, pct_key, ma_key, _ in METRICS:
+        values = [x[name] for x in series]
+        prev = [None] + values[:-1]
+        lags[lag_key] = prev
+        if name.endswith('_avg_severity'):
+            pcts[pct_key] = [pct_change(c if c is not None else 0, p if p is not None else 0) for c, p in zip(values, prev)]
+        else:
+            pcts[pct_key] = [pct_change(c, p) for c, p in zip(values, prev)]
+        mas[ma_key] = moving_avg(values, k)
+
+    return [{**row, **{key: lags[key][i] for key in lags}, **{key: pcts[key][i] for key in pcts},
+             **{key: mas[key][i] for key in mas}} for i, row in enumerate(series)]
+
+
+def random_rows(seed: int = 0):
+    """Weekly aggregate rows for YEARS years, about one week in ten missing."""
+    rng = random.Random(seed)
+    first = date(2015, 1, 5)
+    return [
+        SimpleNamespace(
+            week_start_monday=str(first + timedelta(weeks=i)), migraine_events=rng.randint(0, 5),
+            migraine_avg_severity=rng.choice([None, rng.uniform(1, 5)]), sleep_hours=rng.uniform(40, 60),
+            stress_events=rng.randint(0, 7), stress_avg_severity=rng.choice([None, rng.uniform(1, 5)]),
+            meals_count=float(rng.randint(10, 25)), exercise_days=float(rng.randint(0, 7)),
+            medication_days=float(rng.randint(0, 3)),
+        )
+        for i in range(YEARS * 52) if rng.random() < .9
+    ]
+
+
+def per_call_ms(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+if __name__ == '__main__':
+    windows = [int(w) for w in sys.argv[1:]] or [4, 52]
+    rows = random_rows()
+    print(f"{YEARS} years, {len(rows)} weeks with data")
+    for window in windows:
+        assert rolling_weekly(rows, window) == list_rolling_weekly(rows, window), "outputs differ"
+        before = per_call_ms(lambda: list_rolling_weekly(rows, window), 20)
+        after = per_call_ms(lambda: rolling_weekly(rows, window), 20)
+        print(f"window {window:>2}: lists {before:6.2f} ms, NumPy frame {after:6.2f} ms per call")
@@ -0,0 +1,116 @@
+"""
+Mixed read/write load under each DB_PROFILE (see database.py).
+
+Writer threads commit one event per transaction, as POST /api/event did
+before group commit, while reader threads page through users' events like
+GET /api/migraines. Under the 'default' profile (rollback journal) a
+writer locks readers out; under 'production' (WAL) they read alongside it.
+Each profile runs in its own process, since database.py reads DB_PROFILE
+at import, on its own scratch database.
+
+    python -m backend.bench.sqlite_profiles [seconds] [writers] [readers]
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import orjson
+
+from . import SCRATCH_DIR
+
+
+def run_profile(seconds: float, writers: int, readers: int):
+    # Imported here: this runs in the child, under its DB_PROFILE.
+    import random
+    from sqlalchemy import insert, select
+    from sqlalchemy.exc import OperationalError
+    from . import percentile, random_payload, seed
+    from ..database import SessionLocal
+    from ..ingest import new_event_row, utc_now
+    from ..models import Event
+    from .. import rollup, versions
+
+    user_ids = seed(users=100, events_per_user=200)
+    stop = time.perf_counter() + seconds
+    counts = {'writes': 0, 'reads': 0, 'errors': 0}
+    read_latencies, write_latencies = [], []
+    lock = threading.Lock()
+
+    def writer(n: int):
+        rng = random.Random(n)
+        while time.perf_counter() < stop:
+            started = time.perf_counter()
+            try:
+                with SessionLocal() as db:
+                    user_id = rng.choice(user_ids)
+                    rows = [new_event_row(user_id, random_payload(rng), utc_now())]
+                    db.execute(insert(Event.__table__), rows)
+                    rollup.apply_rows(db, rows)
+                    versions.bump(db, [user_id])
+                    db.commit()
+            except OperationalError:
+                with lock:
+                    counts['errors'] += 1
+                continue
+            with lock:
+                counts['writes'] += 1
+                write_latencies.append(time.perf_counter() - started)
+
+    def reader(n: int):
+        rng = random.Random(1000 + n)
+        while time.perf_counter() < stop:
+            started = time.perf_counter()
+            try:
+                with SessionLocal() as db:
+                    db.execute(
+                        select(Event.id, Event.event_type, Event.severity, Event.event_timestamp)
+                          .where(Event.user_id == rng.choice(user_ids))
+                          .order_by(Event.event_timestamp.desc(), Event.id.desc())
+                          .limit(50)
+                    ).all()
+            except OperationalError:
+                with lock:
+                    counts['errors'] += 1
+                continue
+            with lock:
+                counts['reads'] += 1
+                read_latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    threads += [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {
+        'writes_per_second': counts['writes'] / seconds,
+        'reads_per_second': counts['reads'] / seconds,
+        'errors': counts['errors'],
+        'write_p95_ms': percentile(write_latencies, .95) * 1000,
+        'read_p95_ms': percentile(read_latencies, .95) * 1000,
+    }
+
+
+def main(seconds: float, writers: int, readers: int):
+    print(f"{writers} writers and {readers} readers for {seconds:g}s per profile")
+    for profile in ('default', 'production'):
+        env = {**os.environ, 'DB_PROFILE': profile, 'DB_PATH': os.path.join(SCRATCH_DIR, f"{profile}.db")}
+        child = subprocess.run(
+            [sys.executable, '-m', __spec__.name, '--run', str(seconds), str(writers), str(readers)],
+            env=env, capture_output=True, check=True,
+        )
+        result = orjson.loads(child.stdout.splitlines()[-1])
+        print(f"{profile:>10}: {result['writes_per_second']:7.0f} writes/s (p95 {result['write_p95_ms']:6.1f} ms)  "
+              f"{result['reads_per_second']:7.0f} reads/s (p95 {result['read_p95_ms']:6.1f} ms)  "
+              f"{result['errors']} lock errors")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--run']:
+        seconds, writers, readers = sys.argv[2:5]
+        print(orjson.dumps(run_profile(float(seconds), int(writers), int(readers))).decode())
+    else:
+        args = sys.argv[1:]
+        main(float(args[0]) if args else 5, int(args[1]) if len(args) > 1 else 2, int(args[2]) if len(args) > 2 else 4)
@@ -0,0 +1,35 @@
+"""
+Serializing /api/weekly/rolling: the row format through FastAPI's
+jsonable_encoder and json, as before, against orjson for the row and
+`format=columnar` outputs. Prints time per response and payload size.
+
+    python -m backend.bench.weekly_json [window weeks]
+"""
+import json
+import sys
+import time
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from ..analytics import rolling_weekly, rolling_weekly_columns
+from .rolling import YEARS, random_rows
+
+
+def measure(label: str, serialize, repeat: int = 50):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        body = serialize()
+    ms = (time.perf_counter() - started) / repeat * 1000
+    print(f"{label:<32} {ms:6.1f} ms  {len(body) / 1000:6.0f} KB")
+
+
+if __name__ == '__main__':
+    window = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    rows = random_rows()
+    weeks = rolling_weekly(rows, window)
+    columns = rolling_weekly_columns(rows, window)
+    print(f"{YEARS} years ({len(weeks)} weeks), window {window}")
+    measure("rows, jsonable_encoder + json", lambda: json.dumps(jsonable_encoder(weeks)).encode())
+    measure("rows, orjson", lambda: orjson.dumps(weeks))
+    measure("columnar, orjson", lambda: orjson.dumps(columns))
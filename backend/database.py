@@ -1,20 +1,93 @@
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Settings are read from the environment; the defaults suit local development.
+DB_PATH = os.getenv("DB_PATH", "./app.db")
+DB_URL = f"sqlite:///{DB_PATH}"
+ASYNC_DB_URL = f"sqlite+aiosqlite:///{DB_PATH}"
+
+# Logging every statement is synchronous and slow; opt in with DB_ECHO=1.
+DB_ECHO = os.getenv("DB_ECHO", "0").lower() in ("1", "true", "yes")
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# PRAGMAs applied to every new connection, per profile.
+PROFILES = {
+    # SQLite's own defaults (rollback journal: a writer blocks all readers).
+    'default': {
+        'busy_timeout': 5000,
+    },
+    # WAL lets readers run alongside the single writer, and synchronous=NORMAL
+    # only fsyncs at checkpoints, which is still durable across app crashes.
+    'production': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'temp_store': 'MEMORY',
+        'mmap_size': 256 * 1024 * 1024,
+        # Negative values are KiB rather than pages.
+        'cache_size': -64 * 1024,
+    },
+}
+DB_PROFILE = os.getenv("DB_PROFILE", "production")
+if DB_PROFILE not in PROFILES:
+    raise ValueError(f"Unknown DB_PROFILE {DB_PROFILE!r}; expected one of {sorted(PROFILES)}")
+
+# Individual PRAGMAs can be overridden with DB_PRAGMA_<NAME>, e.g. DB_PRAGMA_MMAP_SIZE=0.
+SQLITE_PRAGMAS = dict(PROFILES[DB_PROFILE])
+for key, value in os.environ.items():
+    if key.startswith("DB_PRAGMA_"):
+        SQLITE_PRAGMAS[key[len("DB_PRAGMA_"):].lower()] = value
 
-DB_URL = "sqlite:///./app.db"
 
+def apply_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        # PRAGMA does not accept bound parameters.
+        cursor.execute(f"PRAGMA {name} = {value}")
+    cursor.close()
+
+
+# Synchronous engine: schema migrations and command-line maintenance
 engine = create_engine(
-    DB_URL, echo=True, connect_args={"check_same_thread": False}
+    DB_URL,
+    echo=DB_ECHO,
+    poolclass=QueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    connect_args={"check_same_thread": False},
 )
+event.listen(engine, "connect", apply_pragmas)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine used by the API routes, so a slow query does not block the
+# event loop for every other request on the worker.
+async_engine = create_async_engine(
+    ASYNC_DB_URL,
+    echo=DB_ECHO,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+)
+event.listen(async_engine.sync_engine, "connect", apply_pragmas)
+
+# Routes return ORM objects after committing, so keep them loaded.
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -1,3 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const s of document.querySelectorAll('link[rel="modulepreload"]'))i(s);new MutationObserver(s=>{for(const o of s)if(o.type==="childList")for(const r of o.addedNodes)r.tagName==="LINK"&&r.rel==="modulepreload"&&i(r)}).observe(document,{childList:!0,subtree:!0});function n(s){const o={};return s.integrity&&(o.integrity=s.integrity),s.referrerPolicy&&(o.referrerPolicy=s.referrerPolicy),s.crossOrigin==="use-credentials"?o.credentials="include":s.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function i(s){if(s.ep)return;s.ep=!0;const o=n(s);fetch(s.href,o)}})();function er(e){const t=Object.create(null);for(const n of e.split(","))t[n]=1;return n=>n in t}const _t={},In=[],Ce=()=>{},ic=()=>!1,Ts=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&(e.charCodeAt(2)>122||e.charCodeAt(2)<97),nr=e=>e.startsWith("onUpdate:"),jt=Object.assign,ir=(e,t)=>{const n=e.indexOf(t);n>-1&&e.splice(n,1)},Mh=Object.prototype.hasOwnProperty,pt=(e,t)=>Mh.call(e,t),J=Array.isArray,Ln=e=>Li(e)==="[object Map]",sc=e=>Li(e)==="[object Set]",Wr=e=>Li(e)==="[object Date]",et=e=>typeof e=="function",Et=e=>typeof e=="string",Ae=e=>typeof e=="symbol",yt=e=>e!==null&&typeof e=="object",oc=e=>(yt(e)||et(e))&&et(e.then)&&et(e.catch),rc=Object.prototype.toString,Li=e=>rc.call(e),Ch=e=>Li(e).slice(8,-1),ac=e=>Li(e)==="[object Object]",sr=e=>Et(e)&&e!=="NaN"&&e[0]!=="-"&&""+parseInt(e,10)===e,ui=er(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),Rs=e=>{const t=Object.create(null);return(n=>t[n]||(t[n]=e(n)))},Ph=/-\w/g,en=Rs(e=>e.replace(Ph,t=>t.slice(1).toUpperCase())),Ah=/\B([A-Z])/g,an=Rs(e=>e.replace(Ah,"-$1").toLowerCase()),lc=Rs(e=>e.charAt(0).toUpperCase()+e.slice(1)),Qs=Rs(e=>e?`on${lc(e)}`:""),Qe=(e,t)=>!Object.is(e,t),is=(e,...t)=>{for(let n=0;n<e.length;n++)e[n](...t)},cc=(e,t,n,i=!1)=>{Object.defineProperty(e,t,{configurable:!0,enumerable:!1,writable:i,value:n})},or=e=>{const t=parseFloat(e);return isNaN(t)?e:t};let jr;const Is=()=>jr||(jr=typeof globalThis<"u"?globalThis:typeof self<"u"?self:typeof window<"u"?window:typeof global<"u"?global:{});function rr(e){if(J(e)){const t={};for(let n=0;n<e.length;n++){const i=e[n],s=Et(i)?Eh(i):rr(i);if(s)for(const o in s)t[o]=s[o]}return t}else if(Et(e)||yt(e))return e}const kh=/;(?![^(]*\))/g,Oh=/:([^]+)/,Dh=/\/\*[^]*?\*\//g;function Eh(e){const t={};return e.replace(Dh,"").split(kh).forEach(n=>{if(n){const i=n.split(Oh);i.length>1&&(t[i[0].trim()]=i[1].trim())}}),t}function Fn(e){let t="";if(Et(e))t=e;else if(J(e))for(let n=0;n<e.length;n++){const i=Fn(e[n]);i&&(t+=i+" ")}else if(yt(e))for(const n in e)e[n]&&(t+=n+" ");return t.trim()}const Th="itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly",Rh=er(Th);function uc(e){return!!e||e===""}function Ih(e,t){if(e.length!==t.length)return!1;let n=!0;for(let i=0;n&&i<e.length;i++)n=hs(e[i],t[i]);return n}function hs(e,t){if(e===t)return!0;let n=Wr(e),i=Wr(t);if(n||i)return n&&i?e.getTime()===t.getTime():!1;if(n=Ae(e),i=Ae(t),n||i)return e===t;if(n=J(e),i=J(t),n||i)return n&&i?Ih(e,t):!1;if(n=yt(e),i=yt(t),n||i){if(!n||!i)return!1;const s=Object.keys(e).length,o=Object.keys(t).length;if(s!==o)return!1;for(const r in e){const a=e.hasOwnProperty(r),l=t.hasOwnProperty(r);if(a&&!l||!a&&l||!hs(e[r],t[r]))return!1}}return String(e)===String(t)}const hc=e=>!!(e&&e.__v_isRef===!0),se=e=>Et(e)?e:e==null?"":J(e)||yt(e)&&(e.toString===rc||!et(e.toString))?hc(e)?se(e.value):JSON.stringify(e,fc,2):String(e),fc=(e,t)=>hc(t)?fc(e,t.value):Ln(t)?{[`Map(${t.size})`]:[...t.entries()].reduce((n,[i,s],o)=>(n[to(i,o)+" =>"]=s,n),{})}:sc(t)?{[`Set(${t.size})`]:[...t.values()].map(n=>to(n))}:Ae(t)?to(t):yt(t)&&!J(t)&&!ac(t)?String(t):t,to=(e,t="")=>{var n;return Ae(e)?`Symbol(${(n=e.description)!=null?n:t})`:e};let te;class Lh{constructor(t=!1){this.detached=t,this._active=!0,this._on=0,this.effects=[],this.cleanups=[],this._isPaused=!1,this.parent=te,!t&&te&&(this.index=(te.scopes||(te.scopes=[])).push(this)-1)}get active(){return this._active}pause(){if(this._active){this._isPaused=!0;let t,n;if(this.scopes)for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].pause();for(t=0,n=this.effects.length;t<n;t++)this.effects[t].pause()}}resume(){if(this._active&&this._isPaused){this._isPaused=!1;let t,n;if(this.scopes)for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].resume();for(t=0,n=this.effects.length;t<n;t++)this.effects[t].resume()}}run(t){if(this._active){const n=te;try{return te=this,t()}finally{te=n}}}on(){++this._on===1&&(this.prevScope=te,te=this)}off(){this._on>0&&--this._on===0&&(te=this.prevScope,this.prevScope=void 0)}stop(t){if(this._active){this._active=!1;let n,i;for(n=0,i=this.effects.length;n<i;n++)this.effects[n].stop();for(this.effects.length=0,n=0,i=this.cleanups.length;n<i;n++)this.cleanups[n]();if(this.cleanups.length=0,this.scopes){for(n=0,i=this.scopes.length;n<i;n++)this.scopes[n].stop(!0);this.scopes.length=0}if(!this.detached&&this.parent&&!t){const s=this.parent.scopes.pop();s&&s!==this&&(this.parent.scopes[this.index]=s,s.index=this.index)}this.parent=void 0}}}function Fh(){return te}let vt;const eo=new WeakSet;class dc{constructor(t){this.fn=t,this.deps=void 0,this.depsTail=void 0,this.flags=5,this.next=void 0,this.cleanup=void 0,this.scheduler=void 0,te&&te.active&&te.effects.push(this)}pause(){this.flags|=64}resume(){this.flags&64&&(this.flags&=-65,eo.has(this)&&(eo.delete(this),this.trigger()))}notify(){this.flags&2&&!(this.flags&32)||this.flags&8||gc(this)}run(){if(!(this.flags&1))return this.fn();this.flags|=2,$r(this),mc(this);const t=vt,n=pe;vt=this,pe=!0;try{return this.fn()}finally{bc(this),vt=t,pe=n,this.flags&=-3}}stop(){if(this.flags&1){for(let t=this.deps;t;t=t.nextDep)cr(t);this.deps=this.depsTail=void 0,$r(this),this.onStop&&this.onStop(),this.flags&=-2}}trigger(){this.flags&64?eo.add(this):this.scheduler?this.scheduler():this.runIfDirty()}runIfDirty(){ko(this)&&this.run()}get dirty(){return ko(this)}}let pc=0,hi,fi;function gc(e,t=!1){if(e.flags|=8,t){e.next=fi,fi=e;return}e.next=hi,hi=e}function ar(){pc++}function lr(){if(--pc>0)return;if(fi){let t=fi;for(fi=void 0;t;){const n=t.next;t.next=void 0,t.flags&=-9,t=n}}let e;for(;hi;){let t=hi;for(hi=void 0;t;){const n=t.next;if(t.next=void 0,t.flags&=-9,t.flags&1)try{t.trigger()}catch(i){e||(e=i)}t=n}}if(e)throw e}function mc(e){for(let t=e.deps;t;t=t.nextDep)t.version=-1,t.prevActiveLink=t.dep.activeLink,t.dep.activeLink=t}function bc(e){let t,n=e.depsTail,i=n;for(;i;){const s=i.prevDep;i.version===-1?(i===n&&(n=s),cr(i),Nh(i)):t=i,i.dep.activeLink=i.prevActiveLink,i.prevActiveLink=void 0,i=s}e.deps=t,e.depsTail=n}function ko(e){for(let t=e.deps;t;t=t.nextDep)if(t.dep.version!==t.version||t.dep.computed&&(_c(t.dep.computed)||t.dep.version!==t.version))return!0;return!!e._dirty}function _c(e){if(e.flags&4&&!(e.flags&16)||(e.flags&=-17,e.globalVersion===wi)||(e.globalVersion=wi,!e.isSSR&&e.flags&128&&(!e.deps&&!e._dirty||!ko(e))))return;e.flags|=2;const t=e.dep,n=vt,i=pe;vt=e,pe=!0;try{mc(e);const s=e.fn(e._value);(t.version===0||Qe(s,e._value))&&(e.flags|=128,e._value=s,t.version++)}catch(s){throw t.version++,s}finally{vt=n,pe=i,bc(e),e.flags&=-3}}function cr(e,t=!1){const{dep:n,prevSub:i,nextSub:s}=e;if(i&&(i.nextSub=s,e.prevSub=void 0),s&&(s.prevSub=i,e.nextSub=void 0),n.subs===e&&(n.subs=i,!i&&n.computed)){n.computed.flags&=-5;for(let o=n.computed.deps;o;o=o.nextDep)cr(o,!0)}!t&&!--n.sc&&n.map&&n.map.delete(n.key)}function Nh(e){const{prevDep:t,nextDep:n}=e;t&&(t.nextDep=n,e.prevDep=void 0),n&&(n.prevDep=t,e.nextDep=void 0)}let pe=!0;const yc=[];function He(){yc.push(pe),pe=!1}function We(){const e=yc.pop();pe=e===void 0?!0:e}function $r(e){const{cleanup:t}=e;if(e.cleanup=void 0,t){const n=vt;vt=void 0;try{t()}finally{vt=n}}}let wi=0;class Bh{constructor(t,n){this.sub=t,this.dep=n,this.version=n.version,this.nextDep=this.prevDep=this.nextSub=this.prevSub=this.prevActiveLink=void 0}}class ur{constructor(t){this.computed=t,this.version=0,this.activeLink=void 0,this.subs=void 0,this.map=void 0,this.key=void 0,this.sc=0,this.__v_skip=!0}track(t){if(!vt||!pe||vt===this.computed)return;let n=this.activeLink;if(n===void 0||n.sub!==vt)n=this.activeLink=new Bh(vt,this),vt.deps?(n.prevDep=vt.depsTail,vt.depsTail.nextDep=n,vt.depsTail=n):vt.deps=vt.depsTail=n,xc(n);else if(n.version===-1&&(n.version=this.version,n.nextDep)){const i=n.nextDep;i.prevDep=n.prevDep,n.prevDep&&(n.prevDep.nextDep=i),n.prevDep=vt.depsTail,n.nextDep=void 0,vt.depsTail.nextDep=n,vt.depsTail=n,vt.deps===n&&(vt.deps=i)}return n}trigger(t){this.version++,wi++,this.notify(t)}notify(t){ar();try{for(let n=this.subs;n;n=n.prevSub)n.sub.notify()&&n.sub.dep.notify()}finally{lr()}}}function xc(e){if(e.dep.sc++,e.sub.flags&4){const t=e.dep.computed;if(t&&!e.dep.subs){t.flags|=20;for(let i=t.deps;i;i=i.nextDep)xc(i)}const n=e.dep.subs;n!==e&&(e.prevSub=n,n&&(n.nextSub=e)),e.dep.subs=e}}const Oo=new WeakMap,wn=Symbol(""),Do=Symbol(""),Si=Symbol("");function zt(e,t,n){if(pe&&vt){let i=Oo.get(e);i||Oo.set(e,i=new Map);let s=i.get(n);s||(i.set(n,s=new ur),s.map=i,s.key=n),s.track()}}function Fe(e,t,n,i,s,o){const r=Oo.get(e);if(!r){wi++;return}const a=l=>{l&&l.trigger()};if(ar(),t==="clear")r.forEach(a);else{const l=J(e),c=l&&sr(n);if(l&&n==="length"){const u=Number(i);r.forEach((h,f)=>{(f==="length"||f===Si||!Ae(f)&&f>=u)&&a(h)})}else switch((n!==void 0||r.has(void 0))&&a(r.get(n)),c&&a(r.get(Si)),t){case"add":l?c&&a(r.get("length")):(a(r.get(wn)),Ln(e)&&a(r.get(Do)));break;case"delete":l||(a(r.get(wn)),Ln(e)&&a(r.get(Do)));break;case"set":Ln(e)&&a(r.get(wn));break}}lr()}function On(e){const t=dt(e);return t===e?t:(zt(t,"iterate",Si),fe(e)?t:t.map(Ft))}function Ls(e){return zt(e=dt(e),"iterate",Si),e}const Vh={__proto__:null,[Symbol.iterator](){return no(this,Symbol.iterator,Ft)},concat(...e){return On(this).concat(...e.map(t=>J(t)?On(t):t))},entries(){return no(this,"entries",e=>(e[1]=Ft(e[1]),e))},every(e,t){return Oe(this,"every",e,t,void 0,arguments)},filter(e,t){return Oe(this,"filter",e,t,n=>n.map(Ft),arguments)},find(e,t){return Oe(this,"find",e,t,Ft,arguments)},findIndex(e,t){return Oe(this,"findIndex",e,t,void 0,arguments)},findLast(e,t){return Oe(this,"findLast",e,t,Ft,arguments)},findLastIndex(e,t){return Oe(this,"findLastIndex",e,t,void 0,arguments)},forEach(e,t){return Oe(this,"forEach",e,t,void 0,arguments)},includes(...e){return io(this,"includes",e)},indexOf(...e){return io(this,"indexOf",e)},join(e){return On(this).join(e)},lastIndexOf(...e){return io(this,"lastIndexOf",e)},map(e,t){return Oe(this,"map",e,t,void 0,arguments)},pop(){return Xn(this,"pop")},push(...e){return Xn(this,"push",e)},reduce(e,...t){return Ur(this,"reduce",e,t)},reduceRight(e,...t){return Ur(this,"reduceRight",e,t)},shift(){return Xn(this,"shift")},some(e,t){return Oe(this,"some",e,t,void 0,arguments)},splice(...e){return Xn(this,"splice",e)},toReversed(){return On(this).toReversed()},toSorted(e){return On(this).toSorted(e)},toSpliced(...e){return On(this).toSpliced(...e)},unshift(...e){return Xn(this,"unshift",e)},values(){return no(this,"values",Ft)}};function no(e,t,n){const i=Ls(e),s=i[t]();return i!==e&&!fe(e)&&(s._next=s.next,s.next=()=>{const o=s._next();return o.done||(o.value=n(o.value)),o}),s}const zh=Array.prototype;function Oe(e,t,n,i,s,o){const r=Ls(e),a=r!==e&&!fe(e),l=r[t];if(l!==zh[t]){const h=l.apply(e,o);return a?Ft(h):h}let c=n;r!==e&&(a?c=function(h,f){return n.call(this,Ft(h),f,e)}:n.length>2&&(c=function(h,f){return n.call(this,h,f,e)}));const u=l.call(r,c,i);return a&&s?s(u):u}function Ur(e,t,n,i){const s=Ls(e);let o=n;return s!==e&&(fe(e)?n.length>3&&(o=function(r,a,l){return n.call(this,r,a,l,e)}):o=function(r,a,l){return n.call(this,r,Ft(a),l,e)}),s[t](o,...i)}function io(e,t,n){const i=dt(e);zt(i,"iterate",Si);const s=i[t](...n);return(s===-1||s===!1)&&dr(n[0])?(n[0]=dt(n[0]),i[t](...n)):s}function Xn(e,t,n=[]){He(),ar();const i=dt(e)[t].apply(e,n);return lr(),We(),i}const Hh=er("__proto__,__v_isRef,__isVue"),vc=new Set(Object.getOwnPropertyNames(Symbol).filter(e=>e!=="arguments"&&e!=="caller").map(e=>Symbol[e]).filter(Ae));function Wh(e){Ae(e)||(e=String(e));const t=dt(this);return zt(t,"has",e),t.hasOwnProperty(e)}class wc{constructor(t=!1,n=!1){this._isReadonly=t,this._isShallow=n}get(t,n,i){if(n==="__v_skip")return t.__v_skip;const s=this._isReadonly,o=this._isShallow;if(n==="__v_isReactive")return!s;if(n==="__v_isReadonly")return s;if(n==="__v_isShallow")return o;if(n==="__v_raw")return i===(s?o?Zh:Pc:o?Cc:Mc).get(t)||Object.getPrototypeOf(t)===Object.getPrototypeOf(i)?t:void 0;const r=J(t);if(!s){let l;if(r&&(l=Vh[n]))return l;if(n==="hasOwnProperty")return Wh}const a=Reflect.get(t,n,Wt(t)?t:i);if((Ae(n)?vc.has(n):Hh(n))||(s||zt(t,"get",n),o))return a;if(Wt(a)){const l=r&&sr(n)?a:a.value;return s&&yt(l)?To(l):l}return yt(a)?s?To(a):Fs(a):a}}class Sc extends wc{constructor(t=!1){super(!1,t)}set(t,n,i,s){let o=t[n];if(!this._isShallow){const l=nn(o);if(!fe(i)&&!nn(i)&&(o=dt(o),i=dt(i)),!J(t)&&Wt(o)&&!Wt(i))return l||(o.value=i),!0}const r=J(t)&&sr(n)?Number(n)<t.length:pt(t,n),a=Reflect.set(t,n,i,Wt(t)?t:s);return t===dt(s)&&(r?Qe(i,o)&&Fe(t,"set",n,i):Fe(t,"add",n,i)),a}deleteProperty(t,n){const i=pt(t,n);t[n];const s=Reflect.deleteProperty(t,n);return s&&i&&Fe(t,"delete",n,void 0),s}has(t,n){const i=Reflect.has(t,n);return(!Ae(n)||!vc.has(n))&&zt(t,"has",n),i}ownKeys(t){return zt(t,"iterate",J(t)?"length":wn),Reflect.ownKeys(t)}}class jh extends wc{constructor(t=!1){super(!0,t)}set(t,n){return!0}deleteProperty(t,n){return!0}}const $h=new Sc,Uh=new jh,Yh=new Sc(!0);const Eo=e=>e,zi=e=>Reflect.getPrototypeOf(e);function Kh(e,t,n){return function(...i){const s=this.__v_raw,o=dt(s),r=Ln(o),a=e==="entries"||e===Symbol.iterator&&r,l=e==="keys"&&r,c=s[e](...i),u=n?Eo:t?fs:Ft;return!t&&zt(o,"iterate",l?Do:wn),{next(){const{value:h,done:f}=c.next();return f?{value:h,done:f}:{value:a?[u(h[0]),u(h[1])]:u(h),done:f}},[Symbol.iterator](){return this}}}}function Hi(e){return function(...t){return e==="delete"?!1:e==="clear"?void 0:this}}function Gh(e,t){const n={get(s){const o=this.__v_raw,r=dt(o),a=dt(s);e||(Qe(s,a)&&zt(r,"get",s),zt(r,"get",a));const{has:l}=zi(r),c=t?Eo:e?fs:Ft;if(l.call(r,s))return c(o.get(s));if(l.call(r,a))return c(o.get(a));o!==r&&o.get(s)},get size(){const s=this.__v_raw;return!e&&zt(dt(s),"iterate",wn),s.size},has(s){const o=this.__v_raw,r=dt(o),a=dt(s);return e||(Qe(s,a)&&zt(r,"has",s),zt(r,"has",a)),s===a?o.has(s):o.has(s)||o.has(a)},forEach(s,o){const r=this,a=r.__v_raw,l=dt(a),c=t?Eo:e?fs:Ft;return!e&&zt(l,"iterate",wn),a.forEach((u,h)=>s.call(o,c(u),c(h),r))}};return jt(n,e?{add:Hi("add"),set:Hi("set"),delete:Hi("delete"),clear:Hi("clear")}:{add(s){!t&&!fe(s)&&!nn(s)&&(s=dt(s));const o=dt(this);return zi(o).has.call(o,s)||(o.add(s),Fe(o,"add",s,s)),this},set(s,o){!t&&!fe(o)&&!nn(o)&&(o=dt(o));const r=dt(this),{has:a,get:l}=zi(r);let c=a.call(r,s);c||(s=dt(s),c=a.call(r,s));const u=l.call(r,s);return r.set(s,o),c?Qe(o,u)&&Fe(r,"set",s,o):Fe(r,"add",s,o),this},delete(s){const o=dt(this),{has:r,get:a}=zi(o);let l=r.call(o,s);l||(s=dt(s),l=r.call(o,s)),a&&a.call(o,s);const c=o.delete(s);return l&&Fe(o,"delete",s,void 0),c},clear(){const s=dt(this),o=s.size!==0,r=s.clear();return o&&Fe(s,"clear",void 0,void 0),r}}),["keys","values","entries",Symbol.iterator].forEach(s=>{n[s]=Kh(s,e,t)}),n}function hr(e,t){const n=Gh(e,t);return(i,s,o)=>s==="__v_isReactive"?!e:s==="__v_isReadonly"?e:s==="__v_raw"?i:Reflect.get(pt(n,s)&&s in i?n:i,s,o)}const Xh={get:hr(!1,!1)},qh={get:hr(!1,!0)},Jh={get:hr(!0,!1)};const Mc=new WeakMap,Cc=new WeakMap,Pc=new WeakMap,Zh=new WeakMap;function Qh(e){switch(e){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}function tf(e){return e.__v_skip||!Object.isExtensible(e)?0:Qh(Ch(e))}function Fs(e){return nn(e)?e:fr(e,!1,$h,Xh,Mc)}function Ac(e){return fr(e,!1,Yh,qh,Cc)}function To(e){return fr(e,!0,Uh,Jh,Pc)}function fr(e,t,n,i,s){if(!yt(e)||e.__v_raw&&!(t&&e.__v_isReactive))return e;const o=tf(e);if(o===0)return e;const r=s.get(e);if(r)return r;const a=new Proxy(e,o===2?i:n);return s.set(e,a),a}function Nn(e){return nn(e)?Nn(e.__v_raw):!!(e&&e.__v_isReactive)}function nn(e){return!!(e&&e.__v_isReadonly)}function fe(e){return!!(e&&e.__v_isShallow)}function dr(e){return e?!!e.__v_raw:!1}function dt(e){const t=e&&e.__v_raw;return t?dt(t):e}function ef(e){return!pt(e,"__v_skip")&&Object.isExtensible(e)&&cc(e,"__v_skip",!0),e}const Ft=e=>yt(e)?Fs(e):e,fs=e=>yt(e)?To(e):e;function Wt(e){return e?e.__v_isRef===!0:!1}function Yt(e){return kc(e,!1)}function nf(e){return kc(e,!0)}function kc(e,t){return Wt(e)?e:new sf(e,t)}class sf{constructor(t,n){this.dep=new ur,this.__v_isRef=!0,this.__v_isShallow=!1,this._rawValue=n?t:dt(t),this._value=n?t:Ft(t),this.__v_isShallow=n}get value(){return this.dep.track(),this._value}set value(t){const n=this._rawValue,i=this.__v_isShallow||fe(t)||nn(t);t=i?t:dt(t),Qe(t,n)&&(this._rawValue=t,this._value=i?t:Ft(t),this.dep.trigger())}}function Sn(e){return Wt(e)?e.value:e}const of={get:(e,t,n)=>t==="__v_raw"?e:Sn(Reflect.get(e,t,n)),set:(e,t,n,i)=>{const s=e[t];return Wt(s)&&!Wt(n)?(s.value=n,!0):Reflect.set(e,t,n,i)}};function Oc(e){return Nn(e)?e:new Proxy(e,of)}class rf{constructor(t,n,i){this.fn=t,this.setter=n,this._value=void 0,this.dep=new ur(this),this.__v_isRef=!0,this.deps=void 0,this.depsTail=void 0,this.flags=16,this.globalVersion=wi-1,this.next=void 0,this.effect=this,this.__v_isReadonly=!n,this.isSSR=i}notify(){if(this.flags|=16,!(this.flags&8)&&vt!==this)return gc(this,!0),!0}get value(){const t=this.dep.track();return _c(this),t&&(t.version=this.dep.version),this._value}set value(t){this.setter&&this.setter(t)}}function af(e,t,n=!1){let i,s;return et(e)?i=e:(i=e.get,s=e.set),new rf(i,s,n)}const Wi={},ds=new WeakMap;let bn;function lf(e,t=!1,n=bn){if(n){let i=ds.get(n);i||ds.set(n,i=[]),i.push(e)}}function cf(e,t,n=_t){const{immediate:i,deep:s,once:o,scheduler:r,augmentJob:a,call:l}=n,c=v=>s?v:fe(v)||s===!1||s===0?Ne(v,1):Ne(v);let u,h,f,d,g=!1,p=!1;if(Wt(e)?(h=()=>e.value,g=fe(e)):Nn(e)?(h=()=>c(e),g=!0):J(e)?(p=!0,g=e.some(v=>Nn(v)||fe(v)),h=()=>e.map(v=>{if(Wt(v))return v.value;if(Nn(v))return c(v);if(et(v))return l?l(v,2):v()})):et(e)?t?h=l?()=>l(e,2):e:h=()=>{if(f){He();try{f()}finally{We()}}const v=bn;bn=u;try{return l?l(e,3,[d]):e(d)}finally{bn=v}}:h=Ce,t&&s){const v=h,S=s===!0?1/0:s;h=()=>Ne(v(),S)}const b=Fh(),y=()=>{u.stop(),b&&b.active&&ir(b.effects,u)};if(o&&t){const v=t;t=(...S)=>{v(...S),y()}}let _=p?new Array(e.length).fill(Wi):Wi;const M=v=>{if(!(!(u.flags&1)||!u.dirty&&!v))if(t){const S=u.run();if(s||g||(p?S.some((E,O)=>Qe(E,_[O])):Qe(S,_))){f&&f();const E=bn;bn=u;try{const O=[S,_===Wi?void 0:p&&_[0]===Wi?[]:_,d];_=S,l?l(t,3,O):t(...O)}finally{bn=E}}}else u.run()};return a&&a(M),u=new dc(h),u.scheduler=r?()=>r(M,!1):M,d=v=>lf(v,!1,u),f=u.onStop=()=>{const v=ds.get(u);if(v){if(l)l(v,4);else for(const S of v)S();ds.delete(u)}},t?i?M(!0):_=u.run():r?r(M.bind(null,!0),!0):u.run(),y.pause=u.pause.bind(u),y.resume=u.resume.bind(u),y.stop=y,y}function Ne(e,t=1/0,n){if(t<=0||!yt(e)||e.__v_skip||(n=n||new Map,(n.get(e)||0)>=t))return e;if(n.set(e,t),t--,Wt(e))Ne(e.value,t,n);else if(J(e))for(let i=0;i<e.length;i++)Ne(e[i],t,n);else if(sc(e)||Ln(e))e.forEach(i=>{Ne(i,t,n)});else if(ac(e)){for(const i in e)Ne(e[i],t,n);for(const i of Object.getOwnPropertySymbols(e))Object.prototype.propertyIsEnumerable.call(e,i)&&Ne(e[i],t,n)}return e}function Fi(e,t,n,i){try{return i?e(...i):e()}catch(s){Ns(s,t,n)}}function ke(e,t,n,i){if(et(e)){const s=Fi(e,t,n,i);return s&&oc(s)&&s.catch(o=>{Ns(o,t,n)}),s}if(J(e)){const s=[];for(let o=0;o<e.length;o++)s.push(ke(e[o],t,n,i));return s}}function Ns(e,t,n,i=!0){const s=t?t.vnode:null,{errorHandler:o,throwUnhandledErrorInProduction:r}=t&&t.appContext.config||_t;if(t){let a=t.parent;const l=t.proxy,c=`https://vuejs.org/error-reference/#runtime-${n}`;for(;a;){const u=a.ec;if(u){for(let h=0;h<u.length;h++)if(u[h](e,l,c)===!1)return}a=a.parent}if(o){He(),Fi(o,null,10,[e,l,c]),We();return}}uf(e,n,s,i,r)}function uf(e,t,n,i=!0,s=!1){if(s)throw e;console.error(e)}const Gt=[];let we=-1;const Bn=[];let Ye=null,Tn=0;const Dc=Promise.resolve();let ps=null;function Ec(e){const t=ps||Dc;return e?t.then(this?e.bind(this):e):t}function hf(e){let t=we+1,n=Gt.length;for(;t<n;){const i=t+n>>>1,s=Gt[i],o=Mi(s);o<e||o===e&&s.flags&2?t=i+1:n=i}return t}function pr(e){if(!(e.flags&1)){const t=Mi(e),n=Gt[Gt.length-1];!n||!(e.flags&2)&&t>=Mi(n)?Gt.push(e):Gt.splice(hf(t),0,e),e.flags|=1,Tc()}}function Tc(){ps||(ps=Dc.then(Ic))}function ff(e){J(e)?Bn.push(...e):Ye&&e.id===-1?Ye.splice(Tn+1,0,e):e.flags&1||(Bn.push(e),e.flags|=1),Tc()}function Yr(e,t,n=we+1){for(;n<Gt.length;n++){const i=Gt[n];if(i&&i.flags&2){if(e&&i.id!==e.uid)continue;Gt.splice(n,1),n--,i.flags&4&&(i.flags&=-2),i(),i.flags&4||(i.flags&=-2)}}}function Rc(e){if(Bn.length){const t=[...new Set(Bn)].sort((n,i)=>Mi(n)-Mi(i));if(Bn.length=0,Ye){Ye.push(...t);return}for(Ye=t,Tn=0;Tn<Ye.length;Tn++){const n=Ye[Tn];n.flags&4&&(n.flags&=-2),n.flags&8||n(),n.flags&=-2}Ye=null,Tn=0}}const Mi=e=>e.id==null?e.flags&2?-1:1/0:e.id;function Ic(e){try{for(we=0;we<Gt.length;we++){const t=Gt[we];t&&!(t.flags&8)&&(t.flags&4&&(t.flags&=-2),Fi(t,t.i,t.i?15:14),t.flags&4||(t.flags&=-2))}}finally{for(;we<Gt.length;we++){const t=Gt[we];t&&(t.flags&=-2)}we=-1,Gt.length=0,Rc(),ps=null,(Gt.length||Bn.length)&&Ic()}}let he=null,Lc=null;function gs(e){const t=he;return he=e,Lc=e&&e.type.__scopeId||null,t}function df(e,t=he,n){if(!t||e._n)return e;const i=(...s)=>{i._d&&_s(-1);const o=gs(t);let r;try{r=e(...s)}finally{gs(o),i._d&&_s(1)}return r};return i._n=!0,i._c=!0,i._d=!0,i}function un(e,t){if(he===null)return e;const n=Ws(he),i=e.dirs||(e.dirs=[]);for(let s=0;s<t.length;s++){let[o,r,a,l=_t]=t[s];o&&(et(o)&&(o={mounted:o,updated:o}),o.deep&&Ne(r),i.push({dir:o,instance:n,value:r,oldValue:void 0,arg:a,modifiers:l}))}return e}function hn(e,t,n,i){const s=e.dirs,o=t&&t.dirs;for(let r=0;r<s.length;r++){const a=s[r];o&&(a.oldValue=o[r].value);let l=a.dir[i];l&&(He(),ke(l,n,8,[e.el,a,e,t]),We())}}const pf=Symbol("_vte"),gf=e=>e.__isTeleport,mf=Symbol("_leaveCb");function gr(e,t){e.shapeFlag&6&&e.component?(e.transition=t,gr(e.component.subTree,t)):e.shapeFlag&128?(e.ssContent.transition=t.clone(e.ssContent),e.ssFallback.transition=t.clone(e.ssFallback)):e.transition=t}function Bs(e,t){return et(e)?jt({name:e.name},t,{setup:e}):e}function Fc(e){e.ids=[e.ids[0]+e.ids[2]+++"-",0,0]}const ms=new WeakMap;function di(e,t,n,i,s=!1){if(J(e)){e.forEach((g,p)=>di(g,t&&(J(t)?t[p]:t),n,i,s));return}if(pi(i)&&!s){i.shapeFlag&512&&i.type.__asyncResolved&&i.component.subTree.component&&di(e,t,n,i.component.subTree);return}const o=i.shapeFlag&4?Ws(i.component):i.el,r=s?null:o,{i:a,r:l}=e,c=t&&t.r,u=a.refs===_t?a.refs={}:a.refs,h=a.setupState,f=dt(h),d=h===_t?ic:g=>pt(f,g);if(c!=null&&c!==l){if(Kr(t),Et(c))u[c]=null,d(c)&&(h[c]=null);else if(Wt(c)){c.value=null;const g=t;g.k&&(u[g.k]=null)}}if(et(l))Fi(l,a,12,[r,u]);else{const g=Et(l),p=Wt(l);if(g||p){const b=()=>{if(e.f){const y=g?d(l)?h[l]:u[l]:l.value;if(s)J(y)&&ir(y,o);else if(J(y))y.includes(o)||y.push(o);else if(g)u[l]=[o],d(l)&&(h[l]=u[l]);else{const _=[o];l.value=_,e.k&&(u[e.k]=_)}}else g?(u[l]=r,d(l)&&(h[l]=r)):p&&(l.value=r,e.k&&(u[e.k]=r))};if(r){const y=()=>{b(),ms.delete(e)};y.id=-1,ms.set(e,y),ie(y,n)}else Kr(e),b()}}}function Kr(e){const t=ms.get(e);t&&(t.flags|=8,ms.delete(e))}Is().requestIdleCallback;Is().cancelIdleCallback;const pi=e=>!!e.type.__asyncLoader,Nc=e=>e.type.__isKeepAlive;function bf(e,t){Bc(e,"a",t)}function _f(e,t){Bc(e,"da",t)}function Bc(e,t,n=Xt){const i=e.__wdc||(e.__wdc=()=>{let s=n;for(;s;){if(s.isDeactivated)return;s=s.parent}return e()});if(Vs(t,i,n),n){let s=n.parent;for(;s&&s.parent;)Nc(s.parent.vnode)&&yf(i,t,n,s),s=s.parent}}function yf(e,t,n,i){const s=Vs(t,e,i,!0);Vc(()=>{ir(i[t],s)},n)}function Vs(e,t,n=Xt,i=!1){if(n){const s=n[e]||(n[e]=[]),o=t.__weh||(t.__weh=(...r)=>{He();const a=Ni(n),l=ke(t,n,e,r);return a(),We(),l});return i?s.unshift(o):s.push(o),o}}const je=e=>(t,n=Xt)=>{(!Pi||e==="sp")&&Vs(e,(...i)=>t(...i),n)},xf=je("bm"),mr=je("m"),vf=je("bu"),wf=je("u"),Sf=je("bum"),Vc=je("um"),Mf=je("sp"),Cf=je("rtg"),Pf=je("rtc");function Af(e,t=Xt){Vs("ec",e,t)}const kf=Symbol.for("v-ndc");function Ro(e,t,n,i){let s;const o=n,r=J(e);if(r||Et(e)){const a=r&&Nn(e);let l=!1,c=!1;a&&(l=!fe(e),c=nn(e),e=Ls(e)),s=new Array(e.length);for(let u=0,h=e.length;u<h;u++)s[u]=t(l?c?fs(Ft(e[u])):Ft(e[u]):e[u],u,void 0,o)}else if(typeof e=="number"){s=new Array(e);for(let a=0;a<e;a++)s[a]=t(a+1,a,void 0,o)}else if(yt(e))if(e[Symbol.iterator])s=Array.from(e,(a,l)=>t(a,l,void 0,o));else{const a=Object.keys(e);s=new Array(a.length);for(let l=0,c=a.length;l<c;l++){const u=a[l];s[l]=t(e[u],u,l,o)}}else s=[];return s}const Io=e=>e?ru(e)?Ws(e):Io(e.parent):null,gi=jt(Object.create(null),{$:e=>e,$el:e=>e.vnode.el,$data:e=>e.data,$props:e=>e.props,$attrs:e=>e.attrs,$slots:e=>e.slots,$refs:e=>e.refs,$parent:e=>Io(e.parent),$root:e=>Io(e.root),$host:e=>e.ce,$emit:e=>e.emit,$options:e=>Hc(e),$forceUpdate:e=>e.f||(e.f=()=>{pr(e.update)}),$nextTick:e=>e.n||(e.n=Ec.bind(e.proxy)),$watch:e=>Xf.bind(e)}),so=(e,t)=>e!==_t&&!e.__isScriptSetup&&pt(e,t),Of={get({_:e},t){if(t==="__v_skip")return!0;const{ctx:n,setupState:i,data:s,props:o,accessCache:r,type:a,appContext:l}=e;let c;if(t[0]!=="$"){const d=r[t];if(d!==void 0)switch(d){case 1:return i[t];case 2:return s[t];case 4:return n[t];case 3:return o[t]}else{if(so(i,t))return r[t]=1,i[t];if(s!==_t&&pt(s,t))return r[t]=2,s[t];if((c=e.propsOptions[0])&&pt(c,t))return r[t]=3,o[t];if(n!==_t&&pt(n,t))return r[t]=4,n[t];Lo&&(r[t]=0)}}const u=gi[t];let h,f;if(u)return t==="$attrs"&&zt(e.attrs,"get",""),u(e);if((h=a.__cssModules)&&(h=h[t]))return h;if(n!==_t&&pt(n,t))return r[t]=4,n[t];if(f=l.config.globalProperties,pt(f,t))return f[t]},set({_:e},t,n){const{data:i,setupState:s,ctx:o}=e;return so(s,t)?(s[t]=n,!0):i!==_t&&pt(i,t)?(i[t]=n,!0):pt(e.props,t)||t[0]==="$"&&t.slice(1)in e?!1:(o[t]=n,!0)},has({_:{data:e,setupState:t,accessCache:n,ctx:i,appContext:s,propsOptions:o,type:r}},a){let l,c;return!!(n[a]||e!==_t&&a[0]!=="$"&&pt(e,a)||so(t,a)||(l=o[0])&&pt(l,a)||pt(i,a)||pt(gi,a)||pt(s.config.globalProperties,a)||(c=r.__cssModules)&&c[a])},defineProperty(e,t,n){return n.get!=null?e._.accessCache[t]=0:pt(n,"value")&&this.set(e,t,n.value,null),Reflect.defineProperty(e,t,n)}};function Gr(e){return J(e)?e.reduce((t,n)=>(t[n]=null,t),{}):e}let Lo=!0;function Df(e){const t=Hc(e),n=e.proxy,i=e.ctx;Lo=!1,t.beforeCreate&&Xr(t.beforeCreate,e,"bc");const{data:s,computed:o,methods:r,watch:a,provide:l,inject:c,created:u,beforeMount:h,mounted:f,beforeUpdate:d,updated:g,activated:p,deactivated:b,beforeDestroy:y,beforeUnmount:_,destroyed:M,unmounted:v,render:S,renderTracked:E,renderTriggered:O,errorCaptured:I,serverPrefetch:j,expose:U,inheritAttrs:X,components:Q,directives:ut,filters:R}=t;if(c&&Ef(c,i,null),r)for(const z in r){const Y=r[z];et(Y)&&(i[z]=Y.bind(n))}if(s){const z=s.call(n,n);yt(z)&&(e.data=Fs(z))}if(Lo=!0,o)for(const z in o){const Y=o[z],nt=et(Y)?Y.bind(n,n):et(Y.get)?Y.get.bind(n,n):Ce,bt=!et(Y)&&et(Y.set)?Y.set.bind(n):Ce,ot=ue({get:nt,set:bt});Object.defineProperty(i,z,{enumerable:!0,configurable:!0,get:()=>ot.value,set:lt=>ot.value=lt})}if(a)for(const z in a)zc(a[z],i,n,z);if(l){const z=et(l)?l.call(n):l;Reflect.ownKeys(z).forEach(Y=>{ss(Y,z[Y])})}u&&Xr(u,e,"c");function L(z,Y){J(Y)?Y.forEach(nt=>z(nt.bind(n))):Y&&z(Y.bind(n))}if(L(xf,h),L(mr,f),L(vf,d),L(wf,g),L(bf,p),L(_f,b),L(Af,I),L(Pf,E),L(Cf,O),L(Sf,_),L(Vc,v),L(Mf,j),J(U))if(U.length){const z=e.exposed||(e.exposed={});U.forEach(Y=>{Object.defineProperty(z,Y,{get:()=>n[Y],set:nt=>n[Y]=nt,enumerable:!0})})}else e.exposed||(e.exposed={});S&&e.render===Ce&&(e.render=S),X!=null&&(e.inheritAttrs=X),Q&&(e.components=Q),ut&&(e.directives=ut),j&&Fc(e)}function Ef(e,t,n=Ce){J(e)&&(e=Fo(e));for(const i in e){const s=e[i];let o;yt(s)?"default"in s?o=ge(s.from||i,s.default,!0):o=ge(s.from||i):o=ge(s),Wt(o)?Object.defineProperty(t,i,{enumerable:!0,configurable:!0,get:()=>o.value,set:r=>o.value=r}):t[i]=o}}function Xr(e,t,n){ke(J(e)?e.map(i=>i.bind(t.proxy)):e.bind(t.proxy),t,n)}function zc(e,t,n,i){let s=i.includes(".")?tu(n,i):()=>n[i];if(Et(e)){const o=t[e];et(o)&&os(s,o)}else if(et(e))os(s,e.bind(n));else if(yt(e))if(J(e))e.forEach(o=>zc(o,t,n,i));else{const o=et(e.handler)?e.handler.bind(n):t[e.handler];et(o)&&os(s,o,e)}}function Hc(e){const t=e.type,{mixins:n,extends:i}=t,{mixins:s,optionsCache:o,config:{optionMergeStrategies:r}}=e.appContext,a=o.get(t);let l;return a?l=a:!s.length&&!n&&!i?l=t:(l={},s.length&&s.forEach(c=>bs(l,c,r,!0)),bs(l,t,r)),yt(t)&&o.set(t,l),l}function bs(e,t,n,i=!1){const{mixins:s,extends:o}=t;o&&bs(e,o,n,!0),s&&s.forEach(r=>bs(e,r,n,!0));for(const r in t)if(!(i&&r==="expose")){const a=Tf[r]||n&&n[r];e[r]=a?a(e[r],t[r]):t[r]}return e}const Tf={data:qr,props:Jr,emits:Jr,methods:oi,computed:oi,beforeCreate:Ut,created:Ut,beforeMount:Ut,mounted:Ut,beforeUpdate:Ut,updated:Ut,beforeDestroy:Ut,beforeUnmount:Ut,destroyed:Ut,unmounted:Ut,activated:Ut,deactivated:Ut,errorCaptured:Ut,serverPrefetch:Ut,components:oi,directives:oi,watch:If,provide:qr,inject:Rf};function qr(e,t){return t?e?function(){return jt(et(e)?e.call(this,this):e,et(t)?t.call(this,this):t)}:t:e}function Rf(e,t){return oi(Fo(e),Fo(t))}function Fo(e){if(J(e)){const t={};for(let n=0;n<e.length;n++)t[e[n]]=e[n];return t}return e}function Ut(e,t){return e?[...new Set([].concat(e,t))]:t}function oi(e,t){return e?jt(Object.create(null),e,t):t}function Jr(e,t){return e?J(e)&&J(t)?[...new Set([...e,...t])]:jt(Object.create(null),Gr(e),Gr(t??{})):t}function If(e,t){if(!e)return t;if(!t)return e;const n=jt(Object.create(null),e);for(const i in t)n[i]=Ut(e[i],t[i]);return n}function Wc(){return{app:null,config:{isNativeTag:ic,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let Lf=0;function Ff(e,t){return function(i,s=null){et(i)||(i=jt({},i)),s!=null&&!yt(s)&&(s=null);const o=Wc(),r=new WeakSet,a=[];let l=!1;const c=o.app={_uid:Lf++,_component:i,_props:s,_container:null,_context:o,_instance:null,version:bd,get config(){return o.config},set config(u){},use(u,...h){return r.has(u)||(u&&et(u.install)?(r.add(u),u.install(c,...h)):et(u)&&(r.add(u),u(c,...h))),c},mixin(u){return o.mixins.includes(u)||o.mixins.push(u),c},component(u,h){return h?(o.components[u]=h,c):o.components[u]},directive(u,h){return h?(o.directives[u]=h,c):o.directives[u]},mount(u,h,f){if(!l){const d=c._ceVNode||ae(i,s);return d.appContext=o,f===!0?f="svg":f===!1&&(f=void 0),e(d,u,f),l=!0,c._container=u,u.__vue_app__=c,Ws(d.component)}},onUnmount(u){a.push(u)},unmount(){l&&(ke(a,c._instance,16),e(null,c._container),delete c._container.__vue_app__)},provide(u,h){return o.provides[u]=h,c},runWithContext(u){const h=Vn;Vn=c;try{return u()}finally{Vn=h}}};return c}}let Vn=null;function ss(e,t){if(Xt){let n=Xt.provides;const i=Xt.parent&&Xt.parent.provides;i===n&&(n=Xt.provides=Object.create(i)),n[e]=t}}function ge(e,t,n=!1){const i=hd();if(i||Vn){let s=Vn?Vn._context.provides:i?i.parent==null||i.ce?i.vnode.appContext&&i.vnode.appContext.provides:i.parent.provides:void 0;if(s&&e in s)return s[e];if(arguments.length>1)return n&&et(t)?t.call(i&&i.proxy):t}}const jc={},$c=()=>Object.create(jc),Uc=e=>Object.getPrototypeOf(e)===jc;function Nf(e,t,n,i=!1){const s={},o=$c();e.propsDefaults=Object.create(null),Yc(e,t,s,o);for(const r in e.propsOptions[0])r in s||(s[r]=void 0);n?e.props=i?s:Ac(s):e.type.props?e.props=s:e.props=o,e.attrs=o}function Bf(e,t,n,i){const{props:s,attrs:o,vnode:{patchFlag:r}}=e,a=dt(s),[l]=e.propsOptions;let c=!1;if((i||r>0)&&!(r&16)){if(r&8){const u=e.vnode.dynamicProps;for(let h=0;h<u.length;h++){let f=u[h];if(zs(e.emitsOptions,f))continue;const d=t[f];if(l)if(pt(o,f))d!==o[f]&&(o[f]=d,c=!0);else{const g=en(f);s[g]=No(l,a,g,d,e,!1)}else d!==o[f]&&(o[f]=d,c=!0)}}}else{Yc(e,t,s,o)&&(c=!0);let u;for(const h in a)(!t||!pt(t,h)&&((u=an(h))===h||!pt(t,u)))&&(l?n&&(n[h]!==void 0||n[u]!==void 0)&&(s[h]=No(l,a,h,void 0,e,!0)):delete s[h]);if(o!==a)for(const h in o)(!t||!pt(t,h))&&(delete o[h],c=!0)}c&&Fe(e.attrs,"set","")}function Yc(e,t,n,i){const[s,o]=e.propsOptions;let r=!1,a;if(t)for(let l in t){if(ui(l))continue;const c=t[l];let u;s&&pt(s,u=en(l))?!o||!o.includes(u)?n[u]=c:(a||(a={}))[u]=c:zs(e.emitsOptions,l)||(!(l in i)||c!==i[l])&&(i[l]=c,r=!0)}if(o){const l=dt(n),c=a||_t;for(let u=0;u<o.length;u++){const h=o[u];n[h]=No(s,l,h,c[h],e,!pt(c,h))}}return r}function No(e,t,n,i,s,o){const r=e[n];if(r!=null){const a=pt(r,"default");if(a&&i===void 0){const l=r.default;if(r.type!==Function&&!r.skipFactory&&et(l)){const{propsDefaults:c}=s;if(n in c)i=c[n];else{const u=Ni(s);i=c[n]=l.call(null,t),u()}}else i=l;s.ce&&s.ce._setProp(n,i)}r[0]&&(o&&!a?i=!1:r[1]&&(i===""||i===an(n))&&(i=!0))}return i}const Vf=new WeakMap;function Kc(e,t,n=!1){const i=n?Vf:t.propsCache,s=i.get(e);if(s)return s;const o=e.props,r={},a=[];let l=!1;if(!et(e)){const u=h=>{l=!0;const[f,d]=Kc(h,t,!0);jt(r,f),d&&a.push(...d)};!n&&t.mixins.length&&t.mixins.forEach(u),e.extends&&u(e.extends),e.mixins&&e.mixins.forEach(u)}if(!o&&!l)return yt(e)&&i.set(e,In),In;if(J(o))for(let u=0;u<o.length;u++){const h=en(o[u]);Zr(h)&&(r[h]=_t)}else if(o)for(const u in o){const h=en(u);if(Zr(h)){const f=o[u],d=r[h]=J(f)||et(f)?{type:f}:jt({},f),g=d.type;let p=!1,b=!0;if(J(g))for(let y=0;y<g.length;++y){const _=g[y],M=et(_)&&_.name;if(M==="Boolean"){p=!0;break}else M==="String"&&(b=!1)}else p=et(g)&&g.name==="Boolean";d[0]=p,d[1]=b,(p||pt(d,"default"))&&a.push(h)}}const c=[r,a];return yt(e)&&i.set(e,c),c}function Zr(e){return e[0]!=="$"&&!ui(e)}const br=e=>e==="_"||e==="_ctx"||e==="$stable",_r=e=>J(e)?e.map(Me):[Me(e)],zf=(e,t,n)=>{if(t._n)return t;const i=df((...s)=>_r(t(...s)),n);return i._c=!1,i},Gc=(e,t,n)=>{const i=e._ctx;for(const s in e){if(br(s))continue;const o=e[s];if(et(o))t[s]=zf(s,o,i);else if(o!=null){const r=_r(o);t[s]=()=>r}}},Xc=(e,t)=>{const n=_r(t);e.slots.default=()=>n},qc=(e,t,n)=>{for(const i in t)(n||!br(i))&&(e[i]=t[i])},Hf=(e,t,n)=>{const i=e.slots=$c();if(e.vnode.shapeFlag&32){const s=t._;s?(qc(i,t,n),n&&cc(i,"_",s,!0)):Gc(t,i)}else t&&Xc(e,t)},Wf=(e,t,n)=>{const{vnode:i,slots:s}=e;let o=!0,r=_t;if(i.shapeFlag&32){const a=t._;a?n&&a===1?o=!1:qc(s,t,n):(o=!t.$stable,Gc(t,s)),r=t}else t&&(Xc(e,t),r={default:1});if(o)for(const a in s)!br(a)&&r[a]==null&&delete s[a]},ie=id;function jf(e){return $f(e)}function $f(e,t){const n=Is();n.__VUE__=!0;const{insert:i,remove:s,patchProp:o,createElement:r,createText:a,createComment:l,setText:c,setElementText:u,parentNode:h,nextSibling:f,setScopeId:d=Ce,insertStaticContent:g}=e,p=(m,x,w,A=null,D=null,C=null,B=void 0,N=null,F=!!x.dynamicChildren)=>{if(m===x)return;m&&!qn(m,x)&&(A=k(m),lt(m,D,C,!0),m=null),x.patchFlag===-2&&(F=!1,x.dynamicChildren=null);const{type:T,ref:q,shapeFlag:H}=x;switch(T){case Hs:b(m,x,w,A);break;case sn:y(m,x,w,A);break;case ro:m==null&&_(x,w,A,B);break;case ce:Q(m,x,w,A,D,C,B,N,F);break;default:H&1?S(m,x,w,A,D,C,B,N,F):H&6?ut(m,x,w,A,D,C,B,N,F):(H&64||H&128)&&T.process(m,x,w,A,D,C,B,N,F,K)}q!=null&&D?di(q,m&&m.ref,C,x||m,!x):q==null&&m&&m.ref!=null&&di(m.ref,null,C,m,!0)},b=(m,x,w,A)=>{if(m==null)i(x.el=a(x.children),w,A);else{const D=x.el=m.el;x.children!==m.children&&c(D,x.children)}},y=(m,x,w,A)=>{m==null?i(x.el=l(x.children||""),w,A):x.el=m.el},_=(m,x,w,A)=>{[m.el,m.anchor]=g(m.children,x,w,A,m.el,m.anchor)},M=({el:m,anchor:x},w,A)=>{let D;for(;m&&m!==x;)D=f(m),i(m,w,A),m=D;i(x,w,A)},v=({el:m,anchor:x})=>{let w;for(;m&&m!==x;)w=f(m),s(m),m=w;s(x)},S=(m,x,w,A,D,C,B,N,F)=>{if(x.type==="svg"?B="svg":x.type==="math"&&(B="mathml"),m==null)E(x,w,A,D,C,B,N,F);else{const T=m.el&&m.el._isVueCE?m.el:null;try{T&&T._beginPatch(),j(m,x,D,C,B,N,F)}finally{T&&T._endPatch()}}},E=(m,x,w,A,D,C,B,N)=>{let F,T;const{props:q,shapeFlag:H,transition:G,dirs:Z}=m;if(F=m.el=r(m.type,C,q&&q.is,q),H&8?u(F,m.children):H&16&&I(m.children,F,null,A,D,oo(m,C),B,N),Z&&hn(m,null,A,"created"),O(F,m,m.scopeId,B,A),q){for(const xt in q)xt!=="value"&&!ui(xt)&&o(F,xt,null,q[xt],C,A);"value"in q&&o(F,"value",null,q.value,C),(T=q.onVnodeBeforeMount)&&xe(T,A,m)}Z&&hn(m,null,A,"beforeMount");const at=Uf(D,G);at&&G.beforeEnter(F),i(F,x,w),((T=q&&q.onVnodeMounted)||at||Z)&&ie(()=>{T&&xe(T,A,m),at&&G.enter(F),Z&&hn(m,null,A,"mounted")},D)},O=(m,x,w,A,D)=>{if(w&&d(m,w),A)for(let C=0;C<A.length;C++)d(m,A[C]);if(D){let C=D.subTree;if(x===C||nu(C.type)&&(C.ssContent===x||C.ssFallback===x)){const B=D.vnode;O(m,B,B.scopeId,B.slotScopeIds,D.parent)}}},I=(m,x,w,A,D,C,B,N,F=0)=>{for(let T=F;T<m.length;T++){const q=m[T]=N?Ke(m[T]):Me(m[T]);p(null,q,x,w,A,D,C,B,N)}},j=(m,x,w,A,D,C,B)=>{const N=x.el=m.el;let{patchFlag:F,dynamicChildren:T,dirs:q}=x;F|=m.patchFlag&16;const H=m.props||_t,G=x.props||_t;let Z;if(w&&fn(w,!1),(Z=G.onVnodeBeforeUpdate)&&xe(Z,w,x,m),q&&hn(x,m,w,"beforeUpdate"),w&&fn(w,!0),(H.innerHTML&&G.innerHTML==null||H.textContent&&G.textContent==null)&&u(N,""),T?U(m.dynamicChildren,T,N,w,A,oo(x,D),C):B||Y(m,x,N,null,w,A,oo(x,D),C,!1),F>0){if(F&16)X(N,H,G,w,D);else if(F&2&&H.class!==G.class&&o(N,"class",null,G.class,D),F&4&&o(N,"style",H.style,G.style,D),F&8){const at=x.dynamicProps;for(let xt=0;xt<at.length;xt++){const gt=at[xt],Jt=H[gt],Zt=G[gt];(Zt!==Jt||gt==="value")&&o(N,gt,Jt,Zt,D,w)}}F&1&&m.children!==x.children&&u(N,x.children)}else!B&&T==null&&X(N,H,G,w,D);((Z=G.onVnodeUpdated)||q)&&ie(()=>{Z&&xe(Z,w,x,m),q&&hn(x,m,w,"updated")},A)},U=(m,x,w,A,D,C,B)=>{for(let N=0;N<x.length;N++){const F=m[N],T=x[N],q=F.el&&(F.type===ce||!qn(F,T)||F.shapeFlag&198)?h(F.el):w;p(F,T,q,null,A,D,C,B,!0)}},X=(m,x,w,A,D)=>{if(x!==w){if(x!==_t)for(const C in x)!ui(C)&&!(C in w)&&o(m,C,x[C],null,D,A);for(const C in w){if(ui(C))continue;const B=w[C],N=x[C];B!==N&&C!=="value"&&o(m,C,N,B,D,A)}"value"in w&&o(m,"value",x.value,w.value,D)}},Q=(m,x,w,A,D,C,B,N,F)=>{const T=x.el=m?m.el:a(""),q=x.anchor=m?m.anchor:a("");let{patchFlag:H,dynamicChildren:G,slotScopeIds:Z}=x;Z&&(N=N?N.concat(Z):Z),m==null?(i(T,w,A),i(q,w,A),I(x.children||[],w,q,D,C,B,N,F)):H>0&&H&64&&G&&m.dynamicChildren?(U(m.dynamicChildren,G,w,D,C,B,N),(x.key!=null||D&&x===D.subTree)&&Jc(m,x,!0)):Y(m,x,w,q,D,C,B,N,F)},ut=(m,x,w,A,D,C,B,N,F)=>{x.slotScopeIds=N,m==null?x.shapeFlag&512?D.ctx.activate(x,w,A,B,F):R(x,w,A,D,C,B,F):P(m,x,F)},R=(m,x,w,A,D,C,B)=>{const N=m.component=ud(m,A,D);if(Nc(m)&&(N.ctx.renderer=K),fd(N,!1,B),N.asyncDep){if(D&&D.registerDep(N,L,B),!m.el){const F=N.subTree=ae(sn);y(null,F,x,w),m.placeholder=F.el}}else L(N,m,x,w,D,C,B)},P=(m,x,w)=>{const A=x.component=m.component;if(ed(m,x,w))if(A.asyncDep&&!A.asyncResolved){z(A,x,w);return}else A.next=x,A.update();else x.el=m.el,A.vnode=x},L=(m,x,w,A,D,C,B)=>{const N=()=>{if(m.isMounted){let{next:H,bu:G,u:Z,parent:at,vnode:xt}=m;{const _e=Zc(m);if(_e){H&&(H.el=xt.el,z(m,H,B)),_e.asyncDep.then(()=>{m.isUnmounted||N()});return}}let gt=H,Jt;fn(m,!1),H?(H.el=xt.el,z(m,H,B)):H=xt,G&&is(G),(Jt=H.props&&H.props.onVnodeBeforeUpdate)&&xe(Jt,at,H,xt),fn(m,!0);const Zt=ta(m),be=m.subTree;m.subTree=Zt,p(be,Zt,h(be.el),k(be),m,D,C),H.el=Zt.el,gt===null&&nd(m,Zt.el),Z&&ie(Z,D),(Jt=H.props&&H.props.onVnodeUpdated)&&ie(()=>xe(Jt,at,H,xt),D)}else{let H;const{el:G,props:Z}=x,{bm:at,m:xt,parent:gt,root:Jt,type:Zt}=m,be=pi(x);fn(m,!1),at&&is(at),!be&&(H=Z&&Z.onVnodeBeforeMount)&&xe(H,gt,x),fn(m,!0);{Jt.ce&&Jt.ce._def.shadowRoot!==!1&&Jt.ce._injectChildStyle(Zt);const _e=m.subTree=ta(m);p(null,_e,w,A,m,D,C),x.el=_e.el}if(xt&&ie(xt,D),!be&&(H=Z&&Z.onVnodeMounted)){const _e=x;ie(()=>xe(H,gt,_e),D)}(x.shapeFlag&256||gt&&pi(gt.vnode)&&gt.vnode.shapeFlag&256)&&m.a&&ie(m.a,D),m.isMounted=!0,x=w=A=null}};m.scope.on();const F=m.effect=new dc(N);m.scope.off();const T=m.update=F.run.bind(F),q=m.job=F.runIfDirty.bind(F);q.i=m,q.id=m.uid,F.scheduler=()=>pr(q),fn(m,!0),T()},z=(m,x,w)=>{x.component=m;const A=m.vnode.props;m.vnode=x,m.next=null,Bf(m,x.props,A,w),Wf(m,x.children,w),He(),Yr(m),We()},Y=(m,x,w,A,D,C,B,N,F=!1)=>{const T=m&&m.children,q=m?m.shapeFlag:0,H=x.children,{patchFlag:G,shapeFlag:Z}=x;if(G>0){if(G&128){bt(T,H,w,A,D,C,B,N,F);return}else if(G&256){nt(T,H,w,A,D,C,B,N,F);return}}Z&8?(q&16&&Dt(T,D,C),H!==T&&u(w,H)):q&16?Z&16?bt(T,H,w,A,D,C,B,N,F):Dt(T,D,C,!0):(q&8&&u(w,""),Z&16&&I(H,w,A,D,C,B,N,F))},nt=(m,x,w,A,D,C,B,N,F)=>{m=m||In,x=x||In;const T=m.length,q=x.length,H=Math.min(T,q);let G;for(G=0;G<H;G++){const Z=x[G]=F?Ke(x[G]):Me(x[G]);p(m[G],Z,w,null,D,C,B,N,F)}T>q?Dt(m,D,C,!0,!1,H):I(x,w,A,D,C,B,N,F,H)},bt=(m,x,w,A,D,C,B,N,F)=>{let T=0;const q=x.length;let H=m.length-1,G=q-1;for(;T<=H&&T<=G;){const Z=m[T],at=x[T]=F?Ke(x[T]):Me(x[T]);if(qn(Z,at))p(Z,at,w,null,D,C,B,N,F);else break;T++}for(;T<=H&&T<=G;){const Z=m[H],at=x[G]=F?Ke(x[G]):Me(x[G]);if(qn(Z,at))p(Z,at,w,null,D,C,B,N,F);else break;H--,G--}if(T>H){if(T<=G){const Z=G+1,at=Z<q?x[Z].el:A;for(;T<=G;)p(null,x[T]=F?Ke(x[T]):Me(x[T]),w,at,D,C,B,N,F),T++}}else if(T>G)for(;T<=H;)lt(m[T],D,C,!0),T++;else{const Z=T,at=T,xt=new Map;for(T=at;T<=G;T++){const ne=x[T]=F?Ke(x[T]):Me(x[T]);ne.key!=null&&xt.set(ne.key,T)}let gt,Jt=0;const Zt=G-at+1;let be=!1,_e=0;const Gn=new Array(Zt);for(T=0;T<Zt;T++)Gn[T]=0;for(T=Z;T<=H;T++){const ne=m[T];if(Jt>=Zt){lt(ne,D,C,!0);continue}let ye;if(ne.key!=null)ye=xt.get(ne.key);else for(gt=at;gt<=G;gt++)if(Gn[gt-at]===0&&qn(ne,x[gt])){ye=gt;break}ye===void 0?lt(ne,D,C,!0):(Gn[ye-at]=T+1,ye>=_e?_e=ye:be=!0,p(ne,x[ye],w,null,D,C,B,N,F),Jt++)}const Vr=be?Yf(Gn):In;for(gt=Vr.length-1,T=Zt-1;T>=0;T--){const ne=at+T,ye=x[ne],zr=x[ne+1],Hr=ne+1<q?zr.el||zr.placeholder:A;Gn[T]===0?p(null,ye,w,Hr,D,C,B,N,F):be&&(gt<0||T!==Vr[gt]?ot(ye,w,Hr,2):gt--)}}},ot=(m,x,w,A,D=null)=>{const{el:C,type:B,transition:N,children:F,shapeFlag:T}=m;if(T&6){ot(m.component.subTree,x,w,A);return}if(T&128){m.suspense.move(x,w,A);return}if(T&64){B.move(m,x,w,K);return}if(B===ce){i(C,x,w);for(let H=0;H<F.length;H++)ot(F[H],x,w,A);i(m.anchor,x,w);return}if(B===ro){M(m,x,w);return}if(A!==2&&T&1&&N)if(A===0)N.beforeEnter(C),i(C,x,w),ie(()=>N.enter(C),D);else{const{leave:H,delayLeave:G,afterLeave:Z}=N,at=()=>{m.ctx.isUnmounted?s(C):i(C,x,w)},xt=()=>{C._isLeaving&&C[mf](!0),H(C,()=>{at(),Z&&Z()})};G?G(C,at,xt):xt()}else i(C,x,w)},lt=(m,x,w,A=!1,D=!1)=>{const{type:C,props:B,ref:N,children:F,dynamicChildren:T,shapeFlag:q,patchFlag:H,dirs:G,cacheIndex:Z}=m;if(H===-2&&(D=!1),N!=null&&(He(),di(N,null,w,m,!0),We()),Z!=null&&(x.renderCache[Z]=void 0),q&256){x.ctx.deactivate(m);return}const at=q&1&&G,xt=!pi(m);let gt;if(xt&&(gt=B&&B.onVnodeBeforeUnmount)&&xe(gt,x,m),q&6)ht(m.component,w,A);else{if(q&128){m.suspense.unmount(w,A);return}at&&hn(m,null,x,"beforeUnmount"),q&64?m.type.remove(m,x,w,K,A):T&&!T.hasOnce&&(C!==ce||H>0&&H&64)?Dt(T,x,w,!1,!0):(C===ce&&H&384||!D&&q&16)&&Dt(F,x,w),A&&qt(m)}(xt&&(gt=B&&B.onVnodeUnmounted)||at)&&ie(()=>{gt&&xe(gt,x,m),at&&hn(m,null,x,"unmounted")},w)},qt=m=>{const{type:x,el:w,anchor:A,transition:D}=m;if(x===ce){Nt(w,A);return}if(x===ro){v(m);return}const C=()=>{s(w),D&&!D.persisted&&D.afterLeave&&D.afterLeave()};if(m.shapeFlag&1&&D&&!D.persisted){const{leave:B,delayLeave:N}=D,F=()=>B(w,C);N?N(m.el,C,F):F()}else C()},Nt=(m,x)=>{let w;for(;m!==x;)w=f(m),s(m),m=w;s(x)},ht=(m,x,w)=>{const{bum:A,scope:D,job:C,subTree:B,um:N,m:F,a:T}=m;Qr(F),Qr(T),A&&is(A),D.stop(),C&&(C.flags|=8,lt(B,m,x,w)),N&&ie(N,x),ie(()=>{m.isUnmounted=!0},x)},Dt=(m,x,w,A=!1,D=!1,C=0)=>{for(let B=C;B<m.length;B++)lt(m[B],x,w,A,D)},k=m=>{if(m.shapeFlag&6)return k(m.component.subTree);if(m.shapeFlag&128)return m.suspense.next();const x=f(m.anchor||m.el),w=x&&x[pf];return w?f(w):x};let W=!1;const V=(m,x,w)=>{m==null?x._vnode&&lt(x._vnode,null,null,!0):p(x._vnode||null,m,x,null,null,null,w),x._vnode=m,W||(W=!0,Yr(),Rc(),W=!1)},K={p,um:lt,m:ot,r:qt,mt:R,mc:I,pc:Y,pbc:U,n:k,o:e};return{render:V,hydrate:void 0,createApp:Ff(V)}}function oo({type:e,props:t},n){return n==="svg"&&e==="foreignObject"||n==="mathml"&&e==="annotation-xml"&&t&&t.encoding&&t.encoding.includes("html")?void 0:n}function fn({effect:e,job:t},n){n?(e.flags|=32,t.flags|=4):(e.flags&=-33,t.flags&=-5)}function Uf(e,t){return(!e||e&&!e.pendingBranch)&&t&&!t.persisted}function Jc(e,t,n=!1){const i=e.children,s=t.children;if(J(i)&&J(s))for(let o=0;o<i.length;o++){const r=i[o];let a=s[o];a.shapeFlag&1&&!a.dynamicChildren&&((a.patchFlag<=0||a.patchFlag===32)&&(a=s[o]=Ke(s[o]),a.el=r.el),!n&&a.patchFlag!==-2&&Jc(r,a)),a.type===Hs&&a.patchFlag!==-1&&(a.el=r.el),a.type===sn&&!a.el&&(a.el=r.el)}}function Yf(e){const t=e.slice(),n=[0];let i,s,o,r,a;const l=e.length;for(i=0;i<l;i++){const c=e[i];if(c!==0){if(s=n[n.length-1],e[s]<c){t[i]=s,n.push(i);continue}for(o=0,r=n.length-1;o<r;)a=o+r>>1,e[n[a]]<c?o=a+1:r=a;c<e[n[o]]&&(o>0&&(t[i]=n[o-1]),n[o]=i)}}for(o=n.length,r=n[o-1];o-- >0;)n[o]=r,r=t[r];return n}function Zc(e){const t=e.subTree.component;if(t)return t.asyncDep&&!t.asyncResolved?t:Zc(t)}function Qr(e){if(e)for(let t=0;t<e.length;t++)e[t].flags|=8}const Kf=Symbol.for("v-scx"),Gf=()=>ge(Kf);function os(e,t,n){return Qc(e,t,n)}function Qc(e,t,n=_t){const{immediate:i,deep:s,flush:o,once:r}=n,a=jt({},n),l=t&&i||!t&&o!=="post";let c;if(Pi){if(o==="sync"){const d=Gf();c=d.__watcherHandles||(d.__watcherHandles=[])}else if(!l){const d=()=>{};return d.stop=Ce,d.resume=Ce,d.pause=Ce,d}}const u=Xt;a.call=(d,g,p)=>ke(d,u,g,p);let h=!1;o==="post"?a.scheduler=d=>{ie(d,u&&u.suspense)}:o!=="sync"&&(h=!0,a.scheduler=(d,g)=>{g?d():pr(d)}),a.augmentJob=d=>{t&&(d.flags|=4),h&&(d.flags|=2,u&&(d.id=u.uid,d.i=u))};const f=cf(e,t,a);return Pi&&(c?c.push(f):l&&f()),f}function Xf(e,t,n){const i=this.proxy,s=Et(e)?e.includes(".")?tu(i,e):()=>i[e]:e.bind(i,i);let o;et(t)?o=t:(o=t.handler,n=t);const r=Ni(this),a=Qc(s,o.bind(i),n);return r(),a}function tu(e,t){const n=t.split(".");return()=>{let i=e;for(let s=0;s<n.length&&i;s++)i=i[n[s]];return i}}const qf=(e,t)=>t==="modelValue"||t==="model-value"?e.modelModifiers:e[`${t}Modifiers`]||e[`${en(t)}Modifiers`]||e[`${an(t)}Modifiers`];function Jf(e,t,...n){if(e.isUnmounted)return;const i=e.vnode.props||_t;let s=n;const o=t.startsWith("update:"),r=o&&qf(i,t.slice(7));r&&(r.trim&&(s=n.map(u=>Et(u)?u.trim():u)),r.number&&(s=n.map(or)));let a,l=i[a=Qs(t)]||i[a=Qs(en(t))];!l&&o&&(l=i[a=Qs(an(t))]),l&&ke(l,e,6,s);const c=i[a+"Once"];if(c){if(!e.emitted)e.emitted={};else if(e.emitted[a])return;e.emitted[a]=!0,ke(c,e,6,s)}}const Zf=new WeakMap;function eu(e,t,n=!1){const i=n?Zf:t.emitsCache,s=i.get(e);if(s!==void 0)return s;const o=e.emits;let r={},a=!1;if(!et(e)){const l=c=>{const u=eu(c,t,!0);u&&(a=!0,jt(r,u))};!n&&t.mixins.length&&t.mixins.forEach(l),e.extends&&l(e.extends),e.mixins&&e.mixins.forEach(l)}return!o&&!a?(yt(e)&&i.set(e,null),null):(J(o)?o.forEach(l=>r[l]=null):jt(r,o),yt(e)&&i.set(e,r),r)}function zs(e,t){return!e||!Ts(t)?!1:(t=t.slice(2).replace(/Once$/,""),pt(e,t[0].toLowerCase()+t.slice(1))||pt(e,an(t))||pt(e,t))}function ta(e){const{type:t,vnode:n,proxy:i,withProxy:s,propsOptions:[o],slots:r,attrs:a,emit:l,render:c,renderCache:u,props:h,data:f,setupState:d,ctx:g,inheritAttrs:p}=e,b=gs(e);let y,_;try{if(n.shapeFlag&4){const v=s||i,S=v;y=Me(c.call(S,v,u,h,d,f,g)),_=a}else{const v=t;y=Me(v.length>1?v(h,{attrs:a,slots:r,emit:l}):v(h,null)),_=t.props?a:Qf(a)}}catch(v){mi.length=0,Ns(v,e,1),y=ae(sn)}let M=y;if(_&&p!==!1){const v=Object.keys(_),{shapeFlag:S}=M;v.length&&S&7&&(o&&v.some(nr)&&(_=td(_,o)),M=Wn(M,_,!1,!0))}return n.dirs&&(M=Wn(M,null,!1,!0),M.dirs=M.dirs?M.dirs.concat(n.dirs):n.dirs),n.transition&&gr(M,n.transition),y=M,gs(b),y}const Qf=e=>{let t;for(const n in e)(n==="class"||n==="style"||Ts(n))&&((t||(t={}))[n]=e[n]);return t},td=(e,t)=>{const n={};for(const i in e)(!nr(i)||!(i.slice(9)in t))&&(n[i]=e[i]);return n};function ed(e,t,n){const{props:i,children:s,component:o}=e,{props:r,children:a,patchFlag:l}=t,c=o.emitsOptions;if(t.dirs||t.transition)return!0;if(n&&l>=0){if(l&1024)return!0;if(l&16)return i?ea(i,r,c):!!r;if(l&8){const u=t.dynamicProps;for(let h=0;h<u.length;h++){const f=u[h];if(r[f]!==i[f]&&!zs(c,f))return!0}}}else return(s||a)&&(!a||!a.$stable)?!0:i===r?!1:i?r?ea(i,r,c):!0:!!r;return!1}function ea(e,t,n){const i=Object.keys(t);if(i.length!==Object.keys(e).length)return!0;for(let s=0;s<i.length;s++){const o=i[s];if(t[o]!==e[o]&&!zs(n,o))return!0}return!1}function nd({vnode:e,parent:t},n){for(;t;){const i=t.subTree;if(i.suspense&&i.suspense.activeBranch===e&&(i.el=e.el),i===e)(e=t.vnode).el=n,t=t.parent;else break}}const nu=e=>e.__isSuspense;function id(e,t){t&&t.pendingBranch?J(e)?t.effects.push(...e):t.effects.push(e):ff(e)}const ce=Symbol.for("v-fgt"),Hs=Symbol.for("v-txt"),sn=Symbol.for("v-cmt"),ro=Symbol.for("v-stc"),mi=[];let re=null;function kt(e=!1){mi.push(re=e?null:[])}function sd(){mi.pop(),re=mi[mi.length-1]||null}let Ci=1;function _s(e,t=!1){Ci+=e,e<0&&re&&t&&(re.hasOnce=!0)}function iu(e){return e.dynamicChildren=Ci>0?re||In:null,sd(),Ci>0&&re&&re.push(e),e}function Rt(e,t,n,i,s,o){return iu($(e,t,n,i,s,o,!0))}function su(e,t,n,i,s){return iu(ae(e,t,n,i,s,!0))}function ys(e){return e?e.__v_isVNode===!0:!1}function qn(e,t){return e.type===t.type&&e.key===t.key}const ou=({key:e})=>e??null,rs=({ref:e,ref_key:t,ref_for:n})=>(typeof e=="number"&&(e=""+e),e!=null?Et(e)||Wt(e)||et(e)?{i:he,r:e,k:t,f:!!n}:e:null);function $(e,t=null,n=null,i=0,s=null,o=e===ce?0:1,r=!1,a=!1){const l={__v_isVNode:!0,__v_skip:!0,type:e,props:t,key:t&&ou(t),ref:t&&rs(t),scopeId:Lc,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:o,patchFlag:i,dynamicProps:s,dynamicChildren:null,appContext:null,ctx:he};return a?(yr(l,n),o&128&&e.normalize(l)):n&&(l.shapeFlag|=Et(n)?8:16),Ci>0&&!r&&re&&(l.patchFlag>0||o&6)&&l.patchFlag!==32&&re.push(l),l}const ae=od;function od(e,t=null,n=null,i=0,s=null,o=!1){if((!e||e===kf)&&(e=sn),ys(e)){const a=Wn(e,t,!0);return n&&yr(a,n),Ci>0&&!o&&re&&(a.shapeFlag&6?re[re.indexOf(e)]=a:re.push(a)),a.patchFlag=-2,a}if(md(e)&&(e=e.__vccOpts),t){t=rd(t);let{class:a,style:l}=t;a&&!Et(a)&&(t.class=Fn(a)),yt(l)&&(dr(l)&&!J(l)&&(l=jt({},l)),t.style=rr(l))}const r=Et(e)?1:nu(e)?128:gf(e)?64:yt(e)?4:et(e)?2:0;return $(e,t,n,i,s,r,o,!0)}function rd(e){return e?dr(e)||Uc(e)?jt({},e):e:null}function Wn(e,t,n=!1,i=!1){const{props:s,ref:o,patchFlag:r,children:a,transition:l}=e,c=t?ad(s||{},t):s,u={__v_isVNode:!0,__v_skip:!0,type:e.type,props:c,key:c&&ou(c),ref:t&&t.ref?n&&o?J(o)?o.concat(rs(t)):[o,rs(t)]:rs(t):o,scopeId:e.scopeId,slotScopeIds:e.slotScopeIds,children:a,target:e.target,targetStart:e.targetStart,targetAnchor:e.targetAnchor,staticCount:e.staticCount,shapeFlag:e.shapeFlag,patchFlag:t&&e.type!==ce?r===-1?16:r|16:r,dynamicProps:e.dynamicProps,dynamicChildren:e.dynamicChildren,appContext:e.appContext,dirs:e.dirs,transition:l,component:e.component,suspense:e.suspense,ssContent:e.ssContent&&Wn(e.ssContent),ssFallback:e.ssFallback&&Wn(e.ssFallback),placeholder:e.placeholder,el:e.el,anchor:e.anchor,ctx:e.ctx,ce:e.ce};return l&&i&&gr(u,l.clone(u)),u}function as(e=" ",t=0){return ae(Hs,null,e,t)}function Jn(e="",t=!1){return t?(kt(),su(sn,null,e)):ae(sn,null,e)}function Me(e){return e==null||typeof e=="boolean"?ae(sn):J(e)?ae(ce,null,e.slice()):ys(e)?Ke(e):ae(Hs,null,String(e))}function Ke(e){return e.el===null&&e.patchFlag!==-1||e.memo?e:Wn(e)}function yr(e,t){let n=0;const{shapeFlag:i}=e;if(t==null)t=null;else if(J(t))n=16;else if(typeof t=="object")if(i&65){const s=t.default;s&&(s._c&&(s._d=!1),yr(e,s()),s._c&&(s._d=!0));return}else{n=32;const s=t._;!s&&!Uc(t)?t._ctx=he:s===3&&he&&(he.slots._===1?t._=1:(t._=2,e.patchFlag|=1024))}else et(t)?(t={default:t,_ctx:he},n=32):(t=String(t),i&64?(n=16,t=[as(t)]):n=8);e.children=t,e.shapeFlag|=n}function ad(...e){const t={};for(let n=0;n<e.length;n++){const i=e[n];for(const s in i)if(s==="class")t.class!==i.class&&(t.class=Fn([t.class,i.class]));else if(s==="style")t.style=rr([t.style,i.style]);else if(Ts(s)){const o=t[s],r=i[s];r&&o!==r&&!(J(o)&&o.includes(r))&&(t[s]=o?[].concat(o,r):r)}else s!==""&&(t[s]=i[s])}return t}function xe(e,t,n,i=null){ke(e,t,7,[n,i])}const ld=Wc();let cd=0;function ud(e,t,n){const i=e.type,s=(t?t.appContext:e.appContext)||ld,o={uid:cd++,vnode:e,type:i,parent:t,appContext:s,root:null,next:null,subTree:null,effect:null,update:null,job:null,scope:new Lh(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:t?t.provides:Object.create(s.provides),ids:t?t.ids:["",0,0],accessCache:null,renderCache:[],components:null,directives:null,propsOptions:Kc(i,s),emitsOptions:eu(i,s),emit:null,emitted:null,propsDefaults:_t,inheritAttrs:i.inheritAttrs,ctx:_t,data:_t,props:_t,attrs:_t,slots:_t,refs:_t,setupState:_t,setupContext:null,suspense:n,suspenseId:n?n.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return o.ctx={_:o},o.root=t?t.root:o,o.emit=Jf.bind(null,o),e.ce&&e.ce(o),o}let Xt=null;const hd=()=>Xt||he;let xs,Bo;{const e=Is(),t=(n,i)=>{let s;return(s=e[n])||(s=e[n]=[]),s.push(i),o=>{s.length>1?s.forEach(r=>r(o)):s[0](o)}};xs=t("__VUE_INSTANCE_SETTERS__",n=>Xt=n),Bo=t("__VUE_SSR_SETTERS__",n=>Pi=n)}const Ni=e=>{const t=Xt;return xs(e),e.scope.on(),()=>{e.scope.off(),xs(t)}},na=()=>{Xt&&Xt.scope.off(),xs(null)};function ru(e){return e.vnode.shapeFlag&4}let Pi=!1;function fd(e,t=!1,n=!1){t&&Bo(t);const{props:i,children:s}=e.vnode,o=ru(e);Nf(e,i,o,t),Hf(e,s,n||t);const r=o?dd(e,t):void 0;return t&&Bo(!1),r}function dd(e,t){const n=e.type;e.accessCache=Object.create(null),e.proxy=new Proxy(e.ctx,Of);const{setup:i}=n;if(i){He();const s=e.setupContext=i.length>1?gd(e):null,o=Ni(e),r=Fi(i,e,0,[e.props,s]),a=oc(r);if(We(),o(),(a||e.sp)&&!pi(e)&&Fc(e),a){if(r.then(na,na),t)return r.then(l=>{ia(e,l)}).catch(l=>{Ns(l,e,0)});e.asyncDep=r}else ia(e,r)}else au(e)}function ia(e,t,n){et(t)?e.type.__ssrInlineRender?e.ssrRender=t:e.render=t:yt(t)&&(e.setupState=Oc(t)),au(e)}function au(e,t,n){const i=e.type;e.render||(e.render=i.render||Ce);{const s=Ni(e);He();try{Df(e)}finally{We(),s()}}}const pd={get(e,t){return zt(e,"get",""),e[t]}};function gd(e){const t=n=>{e.exposed=n||{}};return{attrs:new Proxy(e.attrs,pd),slots:e.slots,emit:e.emit,expose:t}}function Ws(e){return e.exposed?e.exposeProxy||(e.exposeProxy=new Proxy(Oc(ef(e.exposed)),{get(t,n){if(n in t)return t[n];if(n in gi)return gi[n](e)},has(t,n){return n in t||n in gi}})):e.proxy}function md(e){return et(e)&&"__vccOpts"in e}const ue=(e,t)=>af(e,t,Pi);function lu(e,t,n){try{_s(-1);const i=arguments.length;return i===2?yt(t)&&!J(t)?ys(t)?ae(e,null,[t]):ae(e,t):ae(e,null,t):(i>3?n=Array.prototype.slice.call(arguments,2):i===3&&ys(n)&&(n=[n]),ae(e,t,n))}finally{_s(1)}}const bd="3.5.24";let Vo;const sa=typeof window<"u"&&window.trustedTypes;if(sa)try{Vo=sa.createPolicy("vue",{createHTML:e=>e})}catch{}const cu=Vo?e=>Vo.createHTML(e):e=>e,_d="http://www.w3.org/2000/svg",yd="http://www.w3.org/1998/Math/MathML",Ie=typeof document<"u"?document:null,oa=Ie&&Ie.createElement("template"),xd={insert:(e,t,n)=>{t.insertBefore(e,n||null)},remove:e=>{const t=e.parentNode;t&&t.removeChild(e)},createElement:(e,t,n,i)=>{const s=t==="svg"?Ie.createElementNS(_d,e):t==="mathml"?Ie.createElementNS(yd,e):n?Ie.createElement(e,{is:n}):Ie.createElement(e);return e==="select"&&i&&i.multiple!=null&&s.setAttribute("multiple",i.multiple),s},createText:e=>Ie.createTextNode(e),createComment:e=>Ie.createComment(e),setText:(e,t)=>{e.nodeValue=t},setElementText:(e,t)=>{e.textContent=t},parentNode:e=>e.parentNode,nextSibling:e=>e.nextSibling,querySelector:e=>Ie.querySelector(e),setScopeId(e,t){e.setAttribute(t,"")},insertStaticContent(e,t,n,i,s,o){const r=n?n.previousSibling:t.lastChild;if(s&&(s===o||s.nextSibling))for(;t.insertBefore(s.cloneNode(!0),n),!(s===o||!(s=s.nextSibling)););else{oa.innerHTML=cu(i==="svg"?`<svg>${e}</svg>`:i==="mathml"?`<math>${e}</math>`:e);const a=oa.content;if(i==="svg"||i==="mathml"){const l=a.firstChild;for(;l.firstChild;)a.appendChild(l.firstChild);a.removeChild(l)}t.insertBefore(a,n)}return[r?r.nextSibling:t.firstChild,n?n.previousSibling:t.lastChild]}},vd=Symbol("_vtc");function wd(e,t,n){const i=e[vd];i&&(t=(t?[t,...i]:[...i]).join(" ")),t==null?e.removeAttribute("class"):n?e.setAttribute("class",t):e.className=t}const vs=Symbol("_vod"),uu=Symbol("_vsh"),ra={name:"show",beforeMount(e,{value:t},{transition:n}){e[vs]=e.style.display==="none"?"":e.style.display,n&&t?n.beforeEnter(e):Zn(e,t)},mounted(e,{value:t},{transition:n}){n&&t&&n.enter(e)},updated(e,{value:t,oldValue:n},{transition:i}){!t!=!n&&(i?t?(i.beforeEnter(e),Zn(e,!0),i.enter(e)):i.leave(e,()=>{Zn(e,!1)}):Zn(e,t))},beforeUnmount(e,{value:t}){Zn(e,t)}};function Zn(e,t){e.style.display=t?e[vs]:"none",e[uu]=!t}const Sd=Symbol(""),Md=/(?:^|;)\s*display\s*:/;function Cd(e,t,n){const i=e.style,s=Et(n);let o=!1;if(n&&!s){if(t)if(Et(t))for(const r of t.split(";")){const a=r.slice(0,r.indexOf(":")).trim();n[a]==null&&ls(i,a,"")}else for(const r in t)n[r]==null&&ls(i,r,"");for(const r in n)r==="display"&&(o=!0),ls(i,r,n[r])}else if(s){if(t!==n){const r=i[Sd];r&&(n+=";"+r),i.cssText=n,o=Md.test(n)}}else t&&e.removeAttribute("style");vs in e&&(e[vs]=o?i.display:"",e[uu]&&(i.display="none"))}const aa=/\s*!important$/;function ls(e,t,n){if(J(n))n.forEach(i=>ls(e,t,i));else if(n==null&&(n=""),t.startsWith("--"))e.setProperty(t,n);else{const i=Pd(e,t);aa.test(n)?e.setProperty(an(i),n.replace(aa,""),"important"):e[i]=n}}const la=["Webkit","Moz","ms"],ao={};function Pd(e,t){const n=ao[t];if(n)return n;let i=en(t);if(i!=="filter"&&i in e)return ao[t]=i;i=lc(i);for(let s=0;s<la.length;s++){const o=la[s]+i;if(o in e)return ao[t]=o}return t}const ca="http://www.w3.org/1999/xlink";function ua(e,t,n,i,s,o=Rh(t)){i&&t.startsWith("xlink:")?n==null?e.removeAttributeNS(ca,t.slice(6,t.length)):e.setAttributeNS(ca,t,n):n==null||o&&!uc(n)?e.removeAttribute(t):e.setAttribute(t,o?"":Ae(n)?String(n):n)}function ha(e,t,n,i,s){if(t==="innerHTML"||t==="textContent"){n!=null&&(e[t]=t==="innerHTML"?cu(n):n);return}const o=e.tagName;if(t==="value"&&o!=="PROGRESS"&&!o.includes("-")){const a=o==="OPTION"?e.getAttribute("value")||"":e.value,l=n==null?e.type==="checkbox"?"on":"":String(n);(a!==l||!("_value"in e))&&(e.value=l),n==null&&e.removeAttribute(t),e._value=n;return}let r=!1;if(n===""||n==null){const a=typeof e[t];a==="boolean"?n=uc(n):n==null&&a==="string"?(n="",r=!0):a==="number"&&(n=0,r=!0)}try{e[t]=n}catch{}r&&e.removeAttribute(s||t)}function xn(e,t,n,i){e.addEventListener(t,n,i)}function Ad(e,t,n,i){e.removeEventListener(t,n,i)}const fa=Symbol("_vei");function kd(e,t,n,i,s=null){const o=e[fa]||(e[fa]={}),r=o[t];if(i&&r)r.value=i;else{const[a,l]=Od(t);if(i){const c=o[t]=Td(i,s);xn(e,a,c,l)}else r&&(Ad(e,a,r,l),o[t]=void 0)}}const da=/(?:Once|Passive|Capture)$/;function Od(e){let t;if(da.test(e)){t={};let i;for(;i=e.match(da);)e=e.slice(0,e.length-i[0].length),t[i[0].toLowerCase()]=!0}return[e[2]===":"?e.slice(3):an(e.slice(2)),t]}let lo=0;const Dd=Promise.resolve(),Ed=()=>lo||(Dd.then(()=>lo=0),lo=Date.now());function Td(e,t){const n=i=>{if(!i._vts)i._vts=Date.now();else if(i._vts<=n.attached)return;ke(Rd(i,n.value),t,5,[i])};return n.value=e,n.attached=Ed(),n}function Rd(e,t){if(J(t)){const n=e.stopImmediatePropagation;return e.stopImmediatePropagation=()=>{n.call(e),e._stopped=!0},t.map(i=>s=>!s._stopped&&i&&i(s))}else return t}const pa=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&e.charCodeAt(2)>96&&e.charCodeAt(2)<123,Id=(e,t,n,i,s,o)=>{const r=s==="svg";t==="class"?wd(e,i,r):t==="style"?Cd(e,n,i):Ts(t)?nr(t)||kd(e,t,n,i,o):(t[0]==="."?(t=t.slice(1),!0):t[0]==="^"?(t=t.slice(1),!1):Ld(e,t,i,r))?(ha(e,t,i),!e.tagName.includes("-")&&(t==="value"||t==="checked"||t==="selected")&&ua(e,t,i,r,o,t!=="value")):e._isVueCE&&(/[A-Z]/.test(t)||!Et(i))?ha(e,en(t),i,o,t):(t==="true-value"?e._trueValue=i:t==="false-value"&&(e._falseValue=i),ua(e,t,i,r))};function Ld(e,t,n,i){if(i)return!!(t==="innerHTML"||t==="textContent"||t in e&&pa(t)&&et(n));if(t==="spellcheck"||t==="draggable"||t==="translate"||t==="autocorrect"||t==="sandbox"&&e.tagName==="IFRAME"||t==="form"||t==="list"&&e.tagName==="INPUT"||t==="type"&&e.tagName==="TEXTAREA")return!1;if(t==="width"||t==="height"){const s=e.tagName;if(s==="IMG"||s==="VIDEO"||s==="CANVAS"||s==="SOURCE")return!1}return pa(t)&&Et(n)?!1:t in e}const ws=e=>{const t=e.props["onUpdate:modelValue"]||!1;return J(t)?n=>is(t,n):t};function Fd(e){e.target.composing=!0}function ga(e){const t=e.target;t.composing&&(t.composing=!1,t.dispatchEvent(new Event("input")))}const zn=Symbol("_assign");function ma(e,t,n){return t&&(e=e.trim()),n&&(e=or(e)),e}const ji={created(e,{modifiers:{lazy:t,trim:n,number:i}},s){e[zn]=ws(s);const o=i||s.props&&s.props.type==="number";xn(e,t?"change":"input",r=>{r.target.composing||e[zn](ma(e.value,n,o))}),(n||o)&&xn(e,"change",()=>{e.value=ma(e.value,n,o)}),t||(xn(e,"compositionstart",Fd),xn(e,"compositionend",ga),xn(e,"change",ga))},mounted(e,{value:t}){e.value=t??""},beforeUpdate(e,{value:t,oldValue:n,modifiers:{lazy:i,trim:s,number:o}},r){if(e[zn]=ws(r),e.composing)return;const a=(o||e.type==="number")&&!/^0\d/.test(e.value)?or(e.value):e.value,l=t??"";a!==l&&(document.activeElement===e&&e.type!=="range"&&(i&&t===n||s&&e.value.trim()===l)||(e.value=l))}},Nd={created(e,{value:t},n){e.checked=hs(t,n.props.value),e[zn]=ws(n),xn(e,"change",()=>{e[zn](Bd(e))})},beforeUpdate(e,{value:t,oldValue:n},i){e[zn]=ws(i),t!==n&&(e.checked=hs(t,i.props.value))}};function Bd(e){return"_value"in e?e._value:e.value}const Vd={esc:"escape",space:" ",up:"arrow-up",left:"arrow-left",right:"arrow-right",down:"arrow-down",delete:"backspace"},zd=(e,t)=>{const n=e._withKeys||(e._withKeys={}),i=t.join(".");return n[i]||(n[i]=(s=>{if(!("key"in s))return;const o=an(s.key);if(t.some(r=>r===o||Vd[r]===o))return e(s)}))},Hd=jt({patchProp:Id},xd);let ba;function Wd(){return ba||(ba=jf(Hd))}const jd=((...e)=>{const t=Wd().createApp(...e),{mount:n}=t;return t.mount=i=>{const s=Ud(i);if(!s)return;const o=t._component;!et(o)&&!o.render&&!o.template&&(o.template=s.innerHTML),s.nodeType===1&&(s.textContent="");const r=n(s,!1,$d(s));return s instanceof Element&&(s.removeAttribute("v-cloak"),s.setAttribute("data-v-app","")),r},t});function $d(e){if(e instanceof SVGElement)return"svg";if(typeof MathMLElement=="function"&&e instanceof MathMLElement)return"mathml"}function Ud(e){return Et(e)?document.querySelector(e):e}const Rn=typeof document<"u";function hu(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function Yd(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&hu(e.default)}const ft=Object.assign;function co(e,t){const n={};for(const i in t){const s=t[i];n[i]=me(s)?s.map(e):e(s)}return n}const bi=()=>{},me=Array.isArray;function _a(e,t){const n={};for(const i in e)n[i]=i in t?t[i]:e[i];return n}const fu=/#/g,Kd=/&/g,Gd=/\//g,Xd=/=/g,qd=/\?/g,du=/\+/g,Jd=/%5B/g,Zd=/%5D/g,pu=/%5E/g,Qd=/%60/g,gu=/%7B/g,tp=/%7C/g,mu=/%7D/g,ep=/%20/g;function xr(e){return e==null?"":encodeURI(""+e).replace(tp,"|").replace(Jd,"[").replace(Zd,"]")}function np(e){return xr(e).replace(gu,"{").replace(mu,"}").replace(pu,"^")}function zo(e){return xr(e).replace(du,"%2B").replace(ep,"+").replace(fu,"%23").replace(Kd,"%26").replace(Qd,"`").replace(gu,"{").replace(mu,"}").replace(pu,"^")}function ip(e){return zo(e).replace(Xd,"%3D")}function sp(e){return xr(e).replace(fu,"%23").replace(qd,"%3F")}function op(e){return sp(e).replace(Gd,"%2F")}function Ai(e){if(e==null)return null;try{return decodeURIComponent(""+e)}catch{}return""+e}const rp=/\/$/,ap=e=>e.replace(rp,"");function uo(e,t,n="/"){let i,s={},o="",r="";const a=t.indexOf("#");let l=t.indexOf("?");return l=a>=0&&l>a?-1:l,l>=0&&(i=t.slice(0,l),o=t.slice(l,a>0?a:t.length),s=e(o.slice(1))),a>=0&&(i=i||t.slice(0,a),r=t.slice(a,t.length)),i=hp(i??t,n),{fullPath:i+o+r,path:i,query:s,hash:Ai(r)}}function lp(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function ya(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function cp(e,t,n){const i=t.matched.length-1,s=n.matched.length-1;return i>-1&&i===s&&jn(t.matched[i],n.matched[s])&&bu(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function jn(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function bu(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!up(e[n],t[n]))return!1;return!0}function up(e,t){return me(e)?xa(e,t):me(t)?xa(t,e):e===t}function xa(e,t){return me(t)?e.length===t.length&&e.every((n,i)=>n===t[i]):e.length===1&&e[0]===t}function hp(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),i=e.split("/"),s=i[i.length-1];(s===".."||s===".")&&i.push("");let o=n.length-1,r,a;for(r=0;r<i.length;r++)if(a=i[r],a!==".")if(a==="..")o>1&&o--;else break;return n.slice(0,o).join("/")+"/"+i.slice(r).join("/")}const Ue={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};let Ho=(function(e){return e.pop="pop",e.push="push",e})({}),ho=(function(e){return e.back="back",e.forward="forward",e.unknown="",e})({});function fp(e){if(!e)if(Rn){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),ap(e)}const dp=/^[^#]+#/;function pp(e,t){return e.replace(dp,"#")+t}function gp(e,t){const n=document.documentElement.getBoundingClientRect(),i=e.getBoundingClientRect();return{behavior:t.behavior,left:i.left-n.left-(t.left||0),top:i.top-n.top-(t.top||0)}}const js=()=>({left:window.scrollX,top:window.scrollY});function mp(e){let t;if("el"in e){const n=e.el,i=typeof n=="string"&&n.startsWith("#"),s=typeof n=="string"?i?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!s)return;t=gp(s,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function va(e,t){return(history.state?history.state.position-t:-1)+e}const Wo=new Map;function bp(e,t){Wo.set(e,t)}function _p(e){const t=Wo.get(e);return Wo.delete(e),t}function yp(e){return typeof e=="string"||e&&typeof e=="object"}function _u(e){return typeof e=="string"||typeof e=="symbol"}let Pt=(function(e){return e[e.MATCHER_NOT_FOUND=1]="MATCHER_NOT_FOUND",e[e.NAVIGATION_GUARD_REDIRECT=2]="NAVIGATION_GUARD_REDIRECT",e[e.NAVIGATION_ABORTED=4]="NAVIGATION_ABORTED",e[e.NAVIGATION_CANCELLED=8]="NAVIGATION_CANCELLED",e[e.NAVIGATION_DUPLICATED=16]="NAVIGATION_DUPLICATED",e})({});const yu=Symbol("");Pt.MATCHER_NOT_FOUND+"",Pt.NAVIGATION_GUARD_REDIRECT+"",Pt.NAVIGATION_ABORTED+"",Pt.NAVIGATION_CANCELLED+"",Pt.NAVIGATION_DUPLICATED+"";function $n(e,t){return ft(new Error,{type:e,[yu]:!0},t)}function De(e,t){return e instanceof Error&&yu in e&&(t==null||!!(e.type&t))}const xp=["params","query","hash"];function vp(e){if(typeof e=="string")return e;if(e.path!=null)return e.path;const t={};for(const n of xp)n in e&&(t[n]=e[n]);return JSON.stringify(t,null,2)}function wp(e){const t={};if(e===""||e==="?")return t;const n=(e[0]==="?"?e.slice(1):e).split("&");for(let i=0;i<n.length;++i){const s=n[i].replace(du," "),o=s.indexOf("="),r=Ai(o<0?s:s.slice(0,o)),a=o<0?null:Ai(s.slice(o+1));if(r in t){let l=t[r];me(l)||(l=t[r]=[l]),l.push(a)}else t[r]=a}return t}function wa(e){let t="";for(let n in e){const i=e[n];if(n=ip(n),i==null){i!==void 0&&(t+=(t.length?"&":"")+n);continue}(me(i)?i.map(s=>s&&zo(s)):[i&&zo(i)]).forEach(s=>{s!==void 0&&(t+=(t.length?"&":"")+n,s!=null&&(t+="="+s))})}return t}function Sp(e){const t={};for(const n in e){const i=e[n];i!==void 0&&(t[n]=me(i)?i.map(s=>s==null?null:""+s):i==null?i:""+i)}return t}const Mp=Symbol(""),Sa=Symbol(""),$s=Symbol(""),vr=Symbol(""),jo=Symbol("");function Qn(){let e=[];function t(i){return e.push(i),()=>{const s=e.indexOf(i);s>-1&&e.splice(s,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function Ge(e,t,n,i,s,o=r=>r()){const r=i&&(i.enterCallbacks[s]=i.enterCallbacks[s]||[]);return()=>new Promise((a,l)=>{const c=f=>{f===!1?l($n(Pt.NAVIGATION_ABORTED,{from:n,to:t})):f instanceof Error?l(f):yp(f)?l($n(Pt.NAVIGATION_GUARD_REDIRECT,{from:t,to:f})):(r&&i.enterCallbacks[s]===r&&typeof f=="function"&&r.push(f),a())},u=o(()=>e.call(i&&i.instances[s],t,n,c));let h=Promise.resolve(u);e.length<3&&(h=h.then(c)),h.catch(f=>l(f))})}function fo(e,t,n,i,s=o=>o()){const o=[];for(const r of e)for(const a in r.components){let l=r.components[a];if(!(t!=="beforeRouteEnter"&&!r.instances[a]))if(hu(l)){const c=(l.__vccOpts||l)[t];c&&o.push(Ge(c,n,i,r,a,s))}else{let c=l();o.push(()=>c.then(u=>{if(!u)throw new Error(`Couldn't resolve component "${a}" at "${r.path}"`);const h=Yd(u)?u.default:u;r.mods[a]=u,r.components[a]=h;const f=(h.__vccOpts||h)[t];return f&&Ge(f,n,i,r,a,s)()}))}}return o}function Cp(e,t){const n=[],i=[],s=[],o=Math.max(t.matched.length,e.matched.length);for(let r=0;r<o;r++){const a=t.matched[r];a&&(e.matched.find(c=>jn(c,a))?i.push(a):n.push(a));const l=e.matched[r];l&&(t.matched.find(c=>jn(c,l))||s.push(l))}return[n,i,s]}let Pp=()=>location.protocol+"//"+location.host;function xu(e,t){const{pathname:n,search:i,hash:s}=t,o=e.indexOf("#");if(o>-1){let r=s.includes(e.slice(o))?e.slice(o).length:1,a=s.slice(r);return a[0]!=="/"&&(a="/"+a),ya(a,"")}return ya(n,e)+i+s}function Ap(e,t,n,i){let s=[],o=[],r=null;const a=({state:f})=>{const d=xu(e,location),g=n.value,p=t.value;let b=0;if(f){if(n.value=d,t.value=f,r&&r===g){r=null;return}b=p?f.position-p.position:0}else i(d);s.forEach(y=>{y(n.value,g,{delta:b,type:Ho.pop,direction:b?b>0?ho.forward:ho.back:ho.unknown})})};function l(){r=n.value}function c(f){s.push(f);const d=()=>{const g=s.indexOf(f);g>-1&&s.splice(g,1)};return o.push(d),d}function u(){if(document.visibilityState==="hidden"){const{history:f}=window;if(!f.state)return;f.replaceState(ft({},f.state,{scroll:js()}),"")}}function h(){for(const f of o)f();o=[],window.removeEventListener("popstate",a),window.removeEventListener("pagehide",u),document.removeEventListener("visibilitychange",u)}return window.addEventListener("popstate",a),window.addEventListener("pagehide",u),document.addEventListener("visibilitychange",u),{pauseListeners:l,listen:c,destroy:h}}function Ma(e,t,n,i=!1,s=!1){return{back:e,current:t,forward:n,replaced:i,position:window.history.length,scroll:s?js():null}}function kp(e){const{history:t,location:n}=window,i={value:xu(e,n)},s={value:t.state};s.value||o(i.value,{back:null,current:i.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function o(l,c,u){const h=e.indexOf("#"),f=h>-1?(n.host&&document.querySelector("base")?e:e.slice(h))+l:Pp()+e+l;try{t[u?"replaceState":"pushState"](c,"",f),s.value=c}catch(d){console.error(d),n[u?"replace":"assign"](f)}}function r(l,c){o(l,ft({},t.state,Ma(s.value.back,l,s.value.forward,!0),c,{position:s.value.position}),!0),i.value=l}function a(l,c){const u=ft({},s.value,t.state,{forward:l,scroll:js()});o(u.current,u,!0),o(l,ft({},Ma(i.value,l,null),{position:u.position+1},c),!1),i.value=l}return{location:i,state:s,push:a,replace:r}}function Op(e){e=fp(e);const t=kp(e),n=Ap(e,t.state,t.location,t.replace);function i(o,r=!0){r||n.pauseListeners(),history.go(o)}const s=ft({location:"",base:e,go:i,createHref:pp.bind(null,e)},t,n);return Object.defineProperty(s,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(s,"state",{enumerable:!0,get:()=>t.state.value}),s}let vn=(function(e){return e[e.Static=0]="Static",e[e.Param=1]="Param",e[e.Group=2]="Group",e})({});var Tt=(function(e){return e[e.Static=0]="Static",e[e.Param=1]="Param",e[e.ParamRegExp=2]="ParamRegExp",e[e.ParamRegExpEnd=3]="ParamRegExpEnd",e[e.EscapeNext=4]="EscapeNext",e})(Tt||{});const Dp={type:vn.Static,value:""},Ep=/[a-zA-Z0-9_]/;function Tp(e){if(!e)return[[]];if(e==="/")return[[Dp]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(d){throw new Error(`ERR (${n})/"${c}": ${d}`)}let n=Tt.Static,i=n;const s=[];let o;function r(){o&&s.push(o),o=[]}let a=0,l,c="",u="";function h(){c&&(n===Tt.Static?o.push({type:vn.Static,value:c}):n===Tt.Param||n===Tt.ParamRegExp||n===Tt.ParamRegExpEnd?(o.length>1&&(l==="*"||l==="+")&&t(`A repeatable param (${c}) must be alone in its segment. eg: '/:ids+.`),o.push({type:vn.Param,value:c,regexp:u,repeatable:l==="*"||l==="+",optional:l==="*"||l==="?"})):t("Invalid state to consume buffer"),c="")}function f(){c+=l}for(;a<e.length;){if(l=e[a++],l==="\\"&&n!==Tt.ParamRegExp){i=n,n=Tt.EscapeNext;continue}switch(n){case Tt.Static:l==="/"?(c&&h(),r()):l===":"?(h(),n=Tt.Param):f();break;case Tt.EscapeNext:f(),n=i;break;case Tt.Param:l==="("?n=Tt.ParamRegExp:Ep.test(l)?f():(h(),n=Tt.Static,l!=="*"&&l!=="?"&&l!=="+"&&a--);break;case Tt.ParamRegExp:l===")"?u[u.length-1]=="\\"?u=u.slice(0,-1)+l:n=Tt.ParamRegExpEnd:u+=l;break;case Tt.ParamRegExpEnd:h(),n=Tt.Static,l!=="*"&&l!=="?"&&l!=="+"&&a--,u="";break;default:t("Unknown state");break}}return n===Tt.ParamRegExp&&t(`Unfinished custom RegExp for param "${c}"`),h(),r(),s}const Ca="[^/]+?",Rp={sensitive:!1,strict:!1,start:!0,end:!0};var Kt=(function(e){return e[e._multiplier=10]="_multiplier",e[e.Root=90]="Root",e[e.Segment=40]="Segment",e[e.SubSegment=30]="SubSegment",e[e.Static=40]="Static",e[e.Dynamic=20]="Dynamic",e[e.BonusCustomRegExp=10]="BonusCustomRegExp",e[e.BonusWildcard=-50]="BonusWildcard",e[e.BonusRepeatable=-20]="BonusRepeatable",e[e.BonusOptional=-8]="BonusOptional",e[e.BonusStrict=.7000000000000001]="BonusStrict",e[e.BonusCaseSensitive=.25]="BonusCaseSensitive",e})(Kt||{});const Ip=/[.+*?^${}()[\]/\\]/g;function Lp(e,t){const n=ft({},Rp,t),i=[];let s=n.start?"^":"";const o=[];for(const c of e){const u=c.length?[]:[Kt.Root];n.strict&&!c.length&&(s+="/");for(let h=0;h<c.length;h++){const f=c[h];let d=Kt.Segment+(n.sensitive?Kt.BonusCaseSensitive:0);if(f.type===vn.Static)h||(s+="/"),s+=f.value.replace(Ip,"\\$&"),d+=Kt.Static;else if(f.type===vn.Param){const{value:g,repeatable:p,optional:b,regexp:y}=f;o.push({name:g,repeatable:p,optional:b});const _=y||Ca;if(_!==Ca){d+=Kt.BonusCustomRegExp;try{`${_}`}catch(v){throw new Error(`Invalid custom RegExp for param "${g}" (${_}): `+v.message)}}let M=p?`((?:${_})(?:/(?:${_}))*)`:`(${_})`;h||(M=b&&c.length<2?`(?:/${M})`:"/"+M),b&&(M+="?"),s+=M,d+=Kt.Dynamic,b&&(d+=Kt.BonusOptional),p&&(d+=Kt.BonusRepeatable),_===".*"&&(d+=Kt.BonusWildcard)}u.push(d)}i.push(u)}if(n.strict&&n.end){const c=i.length-1;i[c][i[c].length-1]+=Kt.BonusStrict}n.strict||(s+="/?"),n.end?s+="$":n.strict&&!s.endsWith("/")&&(s+="(?:/|$)");const r=new RegExp(s,n.sensitive?"":"i");function a(c){const u=c.match(r),h={};if(!u)return null;for(let f=1;f<u.length;f++){const d=u[f]||"",g=o[f-1];h[g.name]=d&&g.repeatable?d.split("/"):d}return h}function l(c){let u="",h=!1;for(const f of e){(!h||!u.endsWith("/"))&&(u+="/"),h=!1;for(const d of f)if(d.type===vn.Static)u+=d.value;else if(d.type===vn.Param){const{value:g,repeatable:p,optional:b}=d,y=g in c?c[g]:"";if(me(y)&&!p)throw new Error(`Provided param "${g}" is an array but it is not repeatable (* or + modifiers)`);const _=me(y)?y.join("/"):y;if(!_)if(b)f.length<2&&(u.endsWith("/")?u=u.slice(0,-1):h=!0);else throw new Error(`Missing required param "${g}"`);u+=_}}return u||"/"}return{re:r,score:i,keys:o,parse:a,stringify:l}}function Fp(e,t){let n=0;for(;n<e.length&&n<t.length;){const i=t[n]-e[n];if(i)return i;n++}return e.length<t.length?e.length===1&&e[0]===Kt.Static+Kt.Segment?-1:1:e.length>t.length?t.length===1&&t[0]===Kt.Static+Kt.Segment?1:-1:0}function vu(e,t){let n=0;const i=e.score,s=t.score;for(;n<i.length&&n<s.length;){const o=Fp(i[n],s[n]);if(o)return o;n++}if(Math.abs(s.length-i.length)===1){if(Pa(i))return 1;if(Pa(s))return-1}return s.length-i.length}function Pa(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const Np={strict:!1,end:!0,sensitive:!1};function Bp(e,t,n){const i=Lp(Tp(e.path),n),s=ft(i,{record:e,parent:t,children:[],alias:[]});return t&&!s.record.aliasOf==!t.record.aliasOf&&t.children.push(s),s}function Vp(e,t){const n=[],i=new Map;t=_a(Np,t);function s(h){return i.get(h)}function o(h,f,d){const g=!d,p=ka(h);p.aliasOf=d&&d.record;const b=_a(t,h),y=[p];if("alias"in h){const v=typeof h.alias=="string"?[h.alias]:h.alias;for(const S of v)y.push(ka(ft({},p,{components:d?d.record.components:p.components,path:S,aliasOf:d?d.record:p})))}let _,M;for(const v of y){const{path:S}=v;if(f&&S[0]!=="/"){const E=f.record.path,O=E[E.length-1]==="/"?"":"/";v.path=f.record.path+(S&&O+S)}if(_=Bp(v,f,b),d?d.alias.push(_):(M=M||_,M!==_&&M.alias.push(_),g&&h.name&&!Oa(_)&&r(h.name)),wu(_)&&l(_),p.children){const E=p.children;for(let O=0;O<E.length;O++)o(E[O],_,d&&d.children[O])}d=d||_}return M?()=>{r(M)}:bi}function r(h){if(_u(h)){const f=i.get(h);f&&(i.delete(h),n.splice(n.indexOf(f),1),f.children.forEach(r),f.alias.forEach(r))}else{const f=n.indexOf(h);f>-1&&(n.splice(f,1),h.record.name&&i.delete(h.record.name),h.children.forEach(r),h.alias.forEach(r))}}function a(){return n}function l(h){const f=Wp(h,n);n.splice(f,0,h),h.record.name&&!Oa(h)&&i.set(h.record.name,h)}function c(h,f){let d,g={},p,b;if("name"in h&&h.name){if(d=i.get(h.name),!d)throw $n(Pt.MATCHER_NOT_FOUND,{location:h});b=d.record.name,g=ft(Aa(f.params,d.keys.filter(M=>!M.optional).concat(d.parent?d.parent.keys.filter(M=>M.optional):[]).map(M=>M.name)),h.params&&Aa(h.params,d.keys.map(M=>M.name))),p=d.stringify(g)}else if(h.path!=null)p=h.path,d=n.find(M=>M.re.test(p)),d&&(g=d.parse(p),b=d.record.name);else{if(d=f.name?i.get(f.name):n.find(M=>M.re.test(f.path)),!d)throw $n(Pt.MATCHER_NOT_FOUND,{location:h,currentLocation:f});b=d.record.name,g=ft({},f.params,h.params),p=d.stringify(g)}const y=[];let _=d;for(;_;)y.unshift(_.record),_=_.parent;return{name:b,path:p,params:g,matched:y,meta:Hp(y)}}e.forEach(h=>o(h));function u(){n.length=0,i.clear()}return{addRoute:o,resolve:c,removeRoute:r,clearRoutes:u,getRoutes:a,getRecordMatcher:s}}function Aa(e,t){const n={};for(const i of t)i in e&&(n[i]=e[i]);return n}function ka(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:zp(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function zp(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const i in e.components)t[i]=typeof n=="object"?n[i]:n;return t}function Oa(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Hp(e){return e.reduce((t,n)=>ft(t,n.meta),{})}function Wp(e,t){let n=0,i=t.length;for(;n!==i;){const o=n+i>>1;vu(e,t[o])<0?i=o:n=o+1}const s=jp(e);return s&&(i=t.lastIndexOf(s,i-1)),i}function jp(e){let t=e;for(;t=t.parent;)if(wu(t)&&vu(e,t)===0)return t}function wu({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function Da(e){const t=ge($s),n=ge(vr),i=ue(()=>{const l=Sn(e.to);return t.resolve(l)}),s=ue(()=>{const{matched:l}=i.value,{length:c}=l,u=l[c-1],h=n.matched;if(!u||!h.length)return-1;const f=h.findIndex(jn.bind(null,u));if(f>-1)return f;const d=Ea(l[c-2]);return c>1&&Ea(u)===d&&h[h.length-1].path!==d?h.findIndex(jn.bind(null,l[c-2])):f}),o=ue(()=>s.value>-1&&Gp(n.params,i.value.params)),r=ue(()=>s.value>-1&&s.value===n.matched.length-1&&bu(n.params,i.value.params));function a(l={}){if(Kp(l)){const c=t[Sn(e.replace)?"replace":"push"](Sn(e.to)).catch(bi);return e.viewTransition&&typeof document<"u"&&"startViewTransition"in document&&document.startViewTransition(()=>c),c}return Promise.resolve()}return{route:i,href:ue(()=>i.value.href),isActive:o,isExactActive:r,navigate:a}}function $p(e){return e.length===1?e[0]:e}const Up=Bs({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"},viewTransition:Boolean},useLink:Da,setup(e,{slots:t}){const n=Fs(Da(e)),{options:i}=ge($s),s=ue(()=>({[Ta(e.activeClass,i.linkActiveClass,"router-link-active")]:n.isActive,[Ta(e.exactActiveClass,i.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const o=t.default&&$p(t.default(n));return e.custom?o:lu("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:s.value},o)}}}),Yp=Up;function Kp(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function Gp(e,t){for(const n in t){const i=t[n],s=e[n];if(typeof i=="string"){if(i!==s)return!1}else if(!me(s)||s.length!==i.length||i.some((o,r)=>o!==s[r]))return!1}return!0}function Ea(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const Ta=(e,t,n)=>e??t??n,Xp=Bs({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const i=ge(jo),s=ue(()=>e.route||i.value),o=ge(Sa,0),r=ue(()=>{let c=Sn(o);const{matched:u}=s.value;let h;for(;(h=u[c])&&!h.components;)c++;return c}),a=ue(()=>s.value.matched[r.value]);ss(Sa,ue(()=>r.value+1)),ss(Mp,a),ss(jo,s);const l=Yt();return os(()=>[l.value,a.value,e.name],([c,u,h],[f,d,g])=>{u&&(u.instances[h]=c,d&&d!==u&&c&&c===f&&(u.leaveGuards.size||(u.leaveGuards=d.leaveGuards),u.updateGuards.size||(u.updateGuards=d.updateGuards))),c&&u&&(!d||!jn(u,d)||!f)&&(u.enterCallbacks[h]||[]).forEach(p=>p(c))},{flush:"post"}),()=>{const c=s.value,u=e.name,h=a.value,f=h&&h.components[u];if(!f)return Ra(n.default,{Component:f,route:c});const d=h.props[u],g=d?d===!0?c.params:typeof d=="function"?d(c):d:null,b=lu(f,ft({},g,t,{onVnodeUnmounted:y=>{y.component.isUnmounted&&(h.instances[u]=null)},ref:l}));return Ra(n.default,{Component:b,route:c})||b}}});function Ra(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const Su=Xp;function qp(e){const t=Vp(e.routes,e),n=e.parseQuery||wp,i=e.stringifyQuery||wa,s=e.history,o=Qn(),r=Qn(),a=Qn(),l=nf(Ue);let c=Ue;Rn&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const u=co.bind(null,k=>""+k),h=co.bind(null,op),f=co.bind(null,Ai);function d(k,W){let V,K;return _u(k)?(V=t.getRecordMatcher(k),K=W):K=k,t.addRoute(K,V)}function g(k){const W=t.getRecordMatcher(k);W&&t.removeRoute(W)}function p(){return t.getRoutes().map(k=>k.record)}function b(k){return!!t.getRecordMatcher(k)}function y(k,W){if(W=ft({},W||l.value),typeof k=="string"){const w=uo(n,k,W.path),A=t.resolve({path:w.path},W),D=s.createHref(w.fullPath);return ft(w,A,{params:f(A.params),hash:Ai(w.hash),redirectedFrom:void 0,href:D})}let V;if(k.path!=null)V=ft({},k,{path:uo(n,k.path,W.path).path});else{const w=ft({},k.params);for(const A in w)w[A]==null&&delete w[A];V=ft({},k,{params:h(w)}),W.params=h(W.params)}const K=t.resolve(V,W),rt=k.hash||"";K.params=u(f(K.params));const m=lp(i,ft({},k,{hash:np(rt),path:K.path})),x=s.createHref(m);return ft({fullPath:m,hash:rt,query:i===wa?Sp(k.query):k.query||{}},K,{redirectedFrom:void 0,href:x})}function _(k){return typeof k=="string"?uo(n,k,l.value.path):ft({},k)}function M(k,W){if(c!==k)return $n(Pt.NAVIGATION_CANCELLED,{from:W,to:k})}function v(k){return O(k)}function S(k){return v(ft(_(k),{replace:!0}))}function E(k,W){const V=k.matched[k.matched.length-1];if(V&&V.redirect){const{redirect:K}=V;let rt=typeof K=="function"?K(k,W):K;return typeof rt=="string"&&(rt=rt.includes("?")||rt.includes("#")?rt=_(rt):{path:rt},rt.params={}),ft({query:k.query,hash:k.hash,params:rt.path!=null?{}:k.params},rt)}}function O(k,W){const V=c=y(k),K=l.value,rt=k.state,m=k.force,x=k.replace===!0,w=E(V,K);if(w)return O(ft(_(w),{state:typeof w=="object"?ft({},rt,w.state):rt,force:m,replace:x}),W||V);const A=V;A.redirectedFrom=W;let D;return!m&&cp(i,K,V)&&(D=$n(Pt.NAVIGATION_DUPLICATED,{to:A,from:K}),ot(K,K,!0,!1)),(D?Promise.resolve(D):U(A,K)).catch(C=>De(C)?De(C,Pt.NAVIGATION_GUARD_REDIRECT)?C:bt(C):Y(C,A,K)).then(C=>{if(C){if(De(C,Pt.NAVIGATION_GUARD_REDIRECT))return O(ft({replace:x},_(C.to),{state:typeof C.to=="object"?ft({},rt,C.to.state):rt,force:m}),W||A)}else C=Q(A,K,!0,x,rt);return X(A,K,C),C})}function I(k,W){const V=M(k,W);return V?Promise.reject(V):Promise.resolve()}function j(k){const W=Nt.values().next().value;return W&&typeof W.runWithContext=="function"?W.runWithContext(k):k()}function U(k,W){let V;const[K,rt,m]=Cp(k,W);V=fo(K.reverse(),"beforeRouteLeave",k,W);for(const w of K)w.leaveGuards.forEach(A=>{V.push(Ge(A,k,W))});const x=I.bind(null,k,W);return V.push(x),Dt(V).then(()=>{V=[];for(const w of o.list())V.push(Ge(w,k,W));return V.push(x),Dt(V)}).then(()=>{V=fo(rt,"beforeRouteUpdate",k,W);for(const w of rt)w.updateGuards.forEach(A=>{V.push(Ge(A,k,W))});return V.push(x),Dt(V)}).then(()=>{V=[];for(const w of m)if(w.beforeEnter)if(me(w.beforeEnter))for(const A of w.beforeEnter)V.push(Ge(A,k,W));else V.push(Ge(w.beforeEnter,k,W));return V.push(x),Dt(V)}).then(()=>(k.matched.forEach(w=>w.enterCallbacks={}),V=fo(m,"beforeRouteEnter",k,W,j),V.push(x),Dt(V))).then(()=>{V=[];for(const w of r.list())V.push(Ge(w,k,W));return V.push(x),Dt(V)}).catch(w=>De(w,Pt.NAVIGATION_CANCELLED)?w:Promise.reject(w))}function X(k,W,V){a.list().forEach(K=>j(()=>K(k,W,V)))}function Q(k,W,V,K,rt){const m=M(k,W);if(m)return m;const x=W===Ue,w=Rn?history.state:{};V&&(K||x?s.replace(k.fullPath,ft({scroll:x&&w&&w.scroll},rt)):s.push(k.fullPath,rt)),l.value=k,ot(k,W,V,x),bt()}let ut;function R(){ut||(ut=s.listen((k,W,V)=>{if(!ht.listening)return;const K=y(k),rt=E(K,ht.currentRoute.value);if(rt){O(ft(rt,{replace:!0,force:!0}),K).catch(bi);return}c=K;const m=l.value;Rn&&bp(va(m.fullPath,V.delta),js()),U(K,m).catch(x=>De(x,Pt.NAVIGATION_ABORTED|Pt.NAVIGATION_CANCELLED)?x:De(x,Pt.NAVIGATION_GUARD_REDIRECT)?(O(ft(_(x.to),{force:!0}),K).then(w=>{De(w,Pt.NAVIGATION_ABORTED|Pt.NAVIGATION_DUPLICATED)&&!V.delta&&V.type===Ho.pop&&s.go(-1,!1)}).catch(bi),Promise.reject()):(V.delta&&s.go(-V.delta,!1),Y(x,K,m))).then(x=>{x=x||Q(K,m,!1),x&&(V.delta&&!De(x,Pt.NAVIGATION_CANCELLED)?s.go(-V.delta,!1):V.type===Ho.pop&&De(x,Pt.NAVIGATION_ABORTED|Pt.NAVIGATION_DUPLICATED)&&s.go(-1,!1)),X(K,m,x)}).catch(bi)}))}let P=Qn(),L=Qn(),z;function Y(k,W,V){bt(k);const K=L.list();return K.length?K.forEach(rt=>rt(k,W,V)):console.error(k),Promise.reject(k)}function nt(){return z&&l.value!==Ue?Promise.resolve():new Promise((k,W)=>{P.add([k,W])})}function bt(k){return z||(z=!k,R(),P.list().forEach(([W,V])=>k?V(k):W()),P.reset()),k}function ot(k,W,V,K){const{scrollBehavior:rt}=e;if(!Rn||!rt)return Promise.resolve();const m=!V&&_p(va(k.fullPath,0))||(K||!V)&&history.state&&history.state.scroll||null;return Ec().then(()=>rt(k,W,m)).then(x=>x&&mp(x)).catch(x=>Y(x,k,W))}const lt=k=>s.go(k);let qt;const Nt=new Set,ht={currentRoute:l,listening:!0,addRoute:d,removeRoute:g,clearRoutes:t.clearRoutes,hasRoute:b,getRoutes:p,resolve:y,options:e,push:v,replace:S,go:lt,back:()=>lt(-1),forward:()=>lt(1),beforeEach:o.add,beforeResolve:r.add,afterEach:a.add,onError:L.add,isReady:nt,install(k){k.component("RouterLink",Yp),k.component("RouterView",Su),k.config.globalProperties.$router=ht,Object.defineProperty(k.config.globalProperties,"$route",{enumerable:!0,get:()=>Sn(l)}),Rn&&!qt&&l.value===Ue&&(qt=!0,v(s.location).catch(K=>{}));const W={};for(const K in Ue)Object.defineProperty(W,K,{get:()=>l.value[K],enumerable:!0});k.provide($s,ht),k.provide(vr,Ac(W)),k.provide(jo,l);const V=k.unmount;Nt.add(k),k.unmount=function(){Nt.delete(k),Nt.size<1&&(c=Ue,ut&&ut(),ut=null,l.value=Ue,qt=!1,z=!1),V()}}};function Dt(k){return k.reduce((W,V)=>W.then(()=>j(V)),Promise.resolve())}return ht}function Jp(){return ge($s)}function Zp(e){return ge(vr)}const Qp=Bs({__name:"App",setup(e){return(t,n)=>(kt(),su(Sn(Su)))}}),tg={class:"users-page"},eg={class:"users-list"},ng=["onClick","onKeyup"],ig={class:"user-name"},sg={class:"user-dob"},og=Bs({__name:"UsersView",setup(e){const t=Yt([]);mr(async()=>{try{const s=await fetch("/api/users");if(!s.ok)throw new Error("failure getting users from backend");const o=await s.json();t.value=o.sort((r,a)=>r.name.localeCompare(a.name))}catch(s){console.error("user load error:",s)}});const n=Jp();function i(s){n.push(`/dashboard/${s}`)}return(s,o)=>(kt(),Rt("div",tg,[o[0]||(o[0]=$("h1",null,"Users",-1)),$("ul",eg,[(kt(!0),Rt(ce,null,Ro(t.value,r=>(kt(),Rt("li",{key:r.id,onClick:a=>i(r.id),class:"user-item",role:"button",tabindex:"0",onKeyup:zd(a=>i(r.id),["enter"])},[$("p",ig,se(r.name),1),$("p",sg,"Patient Creation Timestamp: "+se(new Date(r.creation_timestamp).toLocaleString()),1)],40,ng))),128))])]))}}),Mu=(e,t)=>{const n=e.__vccOpts||e;for(const[i,s]of t)n[i]=s;return n},rg=Mu(og,[["__scopeId","data-v-feb2fd58"]]);function Bi(e){return e+.5|0}const Xe=(e,t,n)=>Math.max(Math.min(e,n),t);function ri(e){return Xe(Bi(e*2.55),0,255)}function tn(e){return Xe(Bi(e*255),0,255)}function Le(e){return Xe(Bi(e/2.55)/100,0,1)}function Ia(e){return Xe(Bi(e*100),0,100)}const le={0:0,1:1,2:2,3:3,4:4,5:5,6:6,7:7,8:8,9:9,A:10,B:11,C:12,D:13,E:14,F:15,a:10,b:11,c:12,d:13,e:14,f:15},$o=[..."0123456789ABCDEF"],ag=e=>$o[e&15],lg=e=>$o[(e&240)>>4]+$o[e&15],$i=e=>(e&240)>>4===(e&15),cg=e=>$i(e.r)&&$i(e.g)&&$i(e.b)&&$i(e.a);function ug(e){var t=e.length,n;return e[0]==="#"&&(t===4||t===5?n={r:255&le[e[1]]*17,g:255&le[e[2]]*17,b:255&le[e[3]]*17,a:t===5?le[e[4]]*17:255}:(t===7||t===9)&&(n={r:le[e[1]]<<4|le[e[2]],g:le[e[3]]<<4|le[e[4]],b:le[e[5]]<<4|le[e[6]],a:t===9?le[e[7]]<<4|le[e[8]]:255})),n}const hg=(e,t)=>e<255?t(e):"";function fg(e){var t=cg(e)?ag:lg;return e?"#"+t(e.r)+t(e.g)+t(e.b)+hg(e.a,t):void 0}const dg=/^(hsla?|hwb|hsv)\(\s*([-+.e\d]+)(?:deg)?[\s,]+([-+.e\d]+)%[\s,]+([-+.e\d]+)%(?:[\s,]+([-+.e\d]+)(%)?)?\s*\)$/;function Cu(e,t,n){const i=t*Math.min(n,1-n),s=(o,r=(o+e/30)%12)=>n-i*Math.max(Math.min(r-3,9-r,1),-1);return[s(0),s(8),s(4)]}function pg(e,t,n){const i=(s,o=(s+e/60)%6)=>n-n*t*Math.max(Math.min(o,4-o,1),0);return[i(5),i(3),i(1)]}function gg(e,t,n){const i=Cu(e,1,.5);let s;for(t+n>1&&(s=1/(t+n),t*=s,n*=s),s=0;s<3;s++)i[s]*=1-t-n,i[s]+=t;return i}function mg(e,t,n,i,s){return e===s?(t-n)/i+(t<n?6:0):t===s?(n-e)/i+2:(e-t)/i+4}function wr(e){const n=e.r/255,i=e.g/255,s=e.b/255,o=Math.max(n,i,s),r=Math.min(n,i,s),a=(o+r)/2;let l,c,u;return o!==r&&(u=o-r,c=a>.5?u/(2-o-r):u/(o+r),l=mg(n,i,s,u,o),l=l*60+.5),[l|0,c||0,a]}function Sr(e,t,n,i){return(Array.isArray(t)?e(t[0],t[1],t[2]):e(t,n,i)).map(tn)}function Mr(e,t,n){return Sr(Cu,e,t,n)}function bg(e,t,n){return Sr(gg,e,t,n)}function _g(e,t,n){return Sr(pg,e,t,n)}function Pu(e){return(e%360+360)%360}function yg(e){const t=dg.exec(e);let n=255,i;if(!t)return;t[5]!==i&&(n=t[6]?ri(+t[5]):tn(+t[5]));const s=Pu(+t[2]),o=+t[3]/100,r=+t[4]/100;return t[1]==="hwb"?i=bg(s,o,r):t[1]==="hsv"?i=_g(s,o,r):i=Mr(s,o,r),{r:i[0],g:i[1],b:i[2],a:n}}function xg(e,t){var n=wr(e);n[0]=Pu(n[0]+t),n=Mr(n),e.r=n[0],e.g=n[1],e.b=n[2]}function vg(e){if(!e)return;const t=wr(e),n=t[0],i=Ia(t[1]),s=Ia(t[2]);return e.a<255?`hsla(${n}, ${i}%, ${s}%, ${Le(e.a)})`:`hsl(${n}, ${i}%, ${s}%)`}const La={x:"dark",Z:"light",Y:"re",X:"blu",W:"gr",V:"medium",U:"slate",A:"ee",T:"ol",S:"or",B:"ra",C:"lateg",D:"ights",R:"in",Q:"turquois",E:"hi",P:"ro",O:"al",N:"le",M:"de",L:"yello",F:"en",K:"ch",G:"arks",H:"ea",I:"ightg",J:"wh"},Fa={OiceXe:"f0f8ff",antiquewEte:"faebd7",aqua:"ffff",aquamarRe:"7fffd4",azuY:"f0ffff",beige:"f5f5dc",bisque:"ffe4c4",black:"0",blanKedOmond:"ffebcd",Xe:"ff",XeviTet:"8a2be2",bPwn:"a52a2a",burlywood:"deb887",caMtXe:"5f9ea0",KartYuse:"7fff00",KocTate:"d2691e",cSO:"ff7f50",cSnflowerXe:"6495ed",cSnsilk:"fff8dc",crimson:"dc143c",cyan:"ffff",xXe:"8b",xcyan:"8b8b",xgTMnPd:"b8860b",xWay:"a9a9a9",xgYF:"6400",xgYy:"a9a9a9",xkhaki:"bdb76b",xmagFta:"8b008b",xTivegYF:"556b2f",xSange:"ff8c00",xScEd:"9932cc",xYd:"8b0000",xsOmon:"e9967a",xsHgYF:"8fbc8f",xUXe:"483d8b",xUWay:"2f4f4f",xUgYy:"2f4f4f",xQe:"ced1",xviTet:"9400d3",dAppRk:"ff1493",dApskyXe:"bfff",dimWay:"696969",dimgYy:"696969",dodgerXe:"1e90ff",fiYbrick:"b22222",flSOwEte:"fffaf0",foYstWAn:"228b22",fuKsia:"ff00ff",gaRsbSo:"dcdcdc",ghostwEte:"f8f8ff",gTd:"ffd700",gTMnPd:"daa520",Way:"808080",gYF:"8000",gYFLw:"adff2f",gYy:"808080",honeyMw:"f0fff0",hotpRk:"ff69b4",RdianYd:"cd5c5c",Rdigo:"4b0082",ivSy:"fffff0",khaki:"f0e68c",lavFMr:"e6e6fa",lavFMrXsh:"fff0f5",lawngYF:"7cfc00",NmoncEffon:"fffacd",ZXe:"add8e6",ZcSO:"f08080",Zcyan:"e0ffff",ZgTMnPdLw:"fafad2",ZWay:"d3d3d3",ZgYF:"90ee90",ZgYy:"d3d3d3",ZpRk:"ffb6c1",ZsOmon:"ffa07a",ZsHgYF:"20b2aa",ZskyXe:"87cefa",ZUWay:"778899",ZUgYy:"778899",ZstAlXe:"b0c4de",ZLw:"ffffe0",lime:"ff00",limegYF:"32cd32",lRF:"faf0e6",magFta:"ff00ff",maPon:"800000",VaquamarRe:"66cdaa",VXe:"cd",VScEd:"ba55d3",VpurpN:"9370db",VsHgYF:"3cb371",VUXe:"7b68ee",VsprRggYF:"fa9a",VQe:"48d1cc",VviTetYd:"c71585",midnightXe:"191970",mRtcYam:"f5fffa",mistyPse:"ffe4e1",moccasR:"ffe4b5",navajowEte:"ffdead",navy:"80",Tdlace:"fdf5e6",Tive:"808000",TivedBb:"6b8e23",Sange:"ffa500",SangeYd:"ff4500",ScEd:"da70d6",pOegTMnPd:"eee8aa",pOegYF:"98fb98",pOeQe:"afeeee",pOeviTetYd:"db7093",papayawEp:"ffefd5",pHKpuff:"ffdab9",peru:"cd853f",pRk:"ffc0cb",plum:"dda0dd",powMrXe:"b0e0e6",purpN:"800080",YbeccapurpN:"663399",Yd:"ff0000",Psybrown:"bc8f8f",PyOXe:"4169e1",saddNbPwn:"8b4513",sOmon:"fa8072",sandybPwn:"f4a460",sHgYF:"2e8b57",sHshell:"fff5ee",siFna:"a0522d",silver:"c0c0c0",skyXe:"87ceeb",UXe:"6a5acd",UWay:"708090",UgYy:"708090",snow:"fffafa",sprRggYF:"ff7f",stAlXe:"4682b4",tan:"d2b48c",teO:"8080",tEstN:"d8bfd8",tomato:"ff6347",Qe:"40e0d0",viTet:"ee82ee",JHt:"f5deb3",wEte:"ffffff",wEtesmoke:"f5f5f5",Lw:"ffff00",LwgYF:"9acd32"};function wg(){const e={},t=Object.keys(Fa),n=Object.keys(La);let i,s,o,r,a;for(i=0;i<t.length;i++){for(r=a=t[i],s=0;s<n.length;s++)o=n[s],a=a.replace(o,La[o]);o=parseInt(Fa[r],16),e[a]=[o>>16&255,o>>8&255,o&255]}return e}let Ui;function Sg(e){Ui||(Ui=wg(),Ui.transparent=[0,0,0,0]);const t=Ui[e.toLowerCase()];return t&&{r:t[0],g:t[1],b:t[2],a:t.length===4?t[3]:255}}const Mg=/^rgba?\(\s*([-+.\d]+)(%)?[\s,]+([-+.e\d]+)(%)?[\s,]+([-+.e\d]+)(%)?(?:[\s,/]+([-+.e\d]+)(%)?)?\s*\)$/;function Cg(e){const t=Mg.exec(e);let n=255,i,s,o;if(t){if(t[7]!==i){const r=+t[7];n=t[8]?ri(r):Xe(r*255,0,255)}return i=+t[1],s=+t[3],o=+t[5],i=255&(t[2]?ri(i):Xe(i,0,255)),s=255&(t[4]?ri(s):Xe(s,0,255)),o=255&(t[6]?ri(o):Xe(o,0,255)),{r:i,g:s,b:o,a:n}}}function Pg(e){return e&&(e.a<255?`rgba(${e.r}, ${e.g}, ${e.b}, ${Le(e.a)})`:`rgb(${e.r}, ${e.g}, ${e.b})`)}const po=e=>e<=.0031308?e*12.92:Math.pow(e,1/2.4)*1.055-.055,Dn=e=>e<=.04045?e/12.92:Math.pow((e+.055)/1.055,2.4);function Ag(e,t,n){const i=Dn(Le(e.r)),s=Dn(Le(e.g)),o=Dn(Le(e.b));return{r:tn(po(i+n*(Dn(Le(t.r))-i))),g:tn(po(s+n*(Dn(Le(t.g))-s))),b:tn(po(o+n*(Dn(Le(t.b))-o))),a:e.a+n*(t.a-e.a)}}function Yi(e,t,n){if(e){let i=wr(e);i[t]=Math.max(0,Math.min(i[t]+i[t]*n,t===0?360:1)),i=Mr(i),e.r=i[0],e.g=i[1],e.b=i[2]}}function Au(e,t){return e&&Object.assign(t||{},e)}function Na(e){var t={r:0,g:0,b:0,a:255};return Array.isArray(e)?e.length>=3&&(t={r:e[0],g:e[1],b:e[2],a:255},e.length>3&&(t.a=tn(e[3]))):(t=Au(e,{r:0,g:0,b:0,a:1}),t.a=tn(t.a)),t}function kg(e){return e.charAt(0)==="r"?Cg(e):yg(e)}class ki{constructor(t){if(t instanceof ki)return t;const n=typeof t;let i;n==="object"?i=Na(t):n==="string"&&(i=ug(t)||Sg(t)||kg(t)),this._rgb=i,this._valid=!!i}get valid(){return this._valid}get rgb(){var t=Au(this._rgb);return t&&(t.a=Le(t.a)),t}set rgb(t){this._rgb=Na(t)}rgbString(){return this._valid?Pg(this._rgb):void 0}hexString(){return this._valid?fg(this._rgb):void 0}hslString(){return this._valid?vg(this._rgb):void 0}mix(t,n){if(t){const i=this.rgb,s=t.rgb;let o;const r=n===o?.5:n,a=2*r-1,l=i.a-s.a,c=((a*l===-1?a:(a+l)/(1+a*l))+1)/2;o=1-c,i.r=255&c*i.r+o*s.r+.5,i.g=255&c*i.g+o*s.g+.5,i.b=255&c*i.b+o*s.b+.5,i.a=r*i.a+(1-r)*s.a,this.rgb=i}return this}interpolate(t,n){return t&&(this._rgb=Ag(this._rgb,t._rgb,n)),this}clone(){return new ki(this.rgb)}alpha(t){return this._rgb.a=tn(t),this}clearer(t){const n=this._rgb;return n.a*=1-t,this}greyscale(){const t=this._rgb,n=Bi(t.r*.3+t.g*.59+t.b*.11);return t.r=t.g=t.b=n,this}opaquer(t){const n=this._rgb;return n.a*=1+t,this}negate(){const t=this._rgb;return t.r=255-t.r,t.g=255-t.g,t.b=255-t.b,this}lighten(t){return Yi(this._rgb,2,t),this}darken(t){return Yi(this._rgb,2,-t),this}saturate(t){return Yi(this._rgb,1,t),this}desaturate(t){return Yi(this._rgb,1,-t),this}rotate(t){return xg(this._rgb,t),this}}function Ee(){}const Og=(()=>{let e=0;return()=>e++})();function it(e){return e==null}function Mt(e){if(Array.isArray&&Array.isArray(e))return!0;const t=Object.prototype.toString.call(e);return t.slice(0,7)==="[object"&&t.slice(-6)==="Array]"}function st(e){return e!==null&&Object.prototype.toString.call(e)==="[object Object]"}function At(e){return(typeof e=="number"||e instanceof Number)&&isFinite(+e)}function oe(e,t){return At(e)?e:t}function tt(e,t){return typeof e>"u"?t:e}const Dg=(e,t)=>typeof e=="string"&&e.endsWith("%")?parseFloat(e)/100:+e/t,ku=(e,t)=>typeof e=="string"&&e.endsWith("%")?parseFloat(e)/100*t:+e;function wt(e,t,n){if(e&&typeof e.call=="function")return e.apply(n,t)}function mt(e,t,n,i){let s,o,r;if(Mt(e))for(o=e.length,s=0;s<o;s++)t.call(n,e[s],s);else if(st(e))for(r=Object.keys(e),o=r.length,s=0;s<o;s++)t.call(n,e[r[s]],r[s])}function Ss(e,t){let n,i,s,o;if(!e||!t||e.length!==t.length)return!1;for(n=0,i=e.length;n<i;++n)if(s=e[n],o=t[n],s.datasetIndex!==o.datasetIndex||s.index!==o.index)return!1;return!0}function Ms(e){if(Mt(e))return e.map(Ms);if(st(e)){const t=Object.create(null),n=Object.keys(e),i=n.length;let s=0;for(;s<i;++s)t[n[s]]=Ms(e[n[s]]);return t}return e}function Ou(e){return["__proto__","prototype","constructor"].indexOf(e)===-1}function Eg(e,t,n,i){if(!Ou(e))return;const s=t[e],o=n[e];st(s)&&st(o)?Oi(s,o,i):t[e]=Ms(o)}function Oi(e,t,n){const i=Mt(t)?t:[t],s=i.length;if(!st(e))return e;n=n||{};const o=n.merger||Eg;let r;for(let a=0;a<s;++a){if(r=i[a],!st(r))continue;const l=Object.keys(r);for(let c=0,u=l.length;c<u;++c)o(l[c],e,r,n)}return e}function _i(e,t){return Oi(e,t,{merger:Tg})}function Tg(e,t,n){if(!Ou(e))return;const i=t[e],s=n[e];st(i)&&st(s)?_i(i,s):Object.prototype.hasOwnProperty.call(t,e)||(t[e]=Ms(s))}const Ba={"":e=>e,x:e=>e.x,y:e=>e.y};function Rg(e){const t=e.split("."),n=[];let i="";for(const s of t)i+=s,i.endsWith("\\")?i=i.slice(0,-1)+".":(n.push(i),i="");return n}function Ig(e){const t=Rg(e);return n=>{for(const i of t){if(i==="")break;n=n&&n[i]}return n}}function on(e,t){return(Ba[t]||(Ba[t]=Ig(t)))(e)}function Cr(e){return e.charAt(0).toUpperCase()+e.slice(1)}const Di=e=>typeof e<"u",rn=e=>typeof e=="function",Va=(e,t)=>{if(e.size!==t.size)return!1;for(const n of e)if(!t.has(n))return!1;return!0};function Lg(e){return e.type==="mouseup"||e.type==="click"||e.type==="contextmenu"}const ct=Math.PI,St=2*ct,Fg=St+ct,Cs=Number.POSITIVE_INFINITY,Ng=ct/180,Ot=ct/2,dn=ct/4,za=ct*2/3,qe=Math.log10,Pe=Math.sign;function yi(e,t,n){return Math.abs(e-t)<n}function Ha(e){const t=Math.round(e);e=yi(e,t,e/1e3)?t:e;const n=Math.pow(10,Math.floor(qe(e))),i=e/n;return(i<=1?1:i<=2?2:i<=5?5:10)*n}function Bg(e){const t=[],n=Math.sqrt(e);let i;for(i=1;i<n;i++)e%i===0&&(t.push(i),t.push(e/i));return n===(n|0)&&t.push(n),t.sort((s,o)=>s-o).pop(),t}function Vg(e){return typeof e=="symbol"||typeof e=="object"&&e!==null&&!(Symbol.toPrimitive in e||"toString"in e||"valueOf"in e)}function Un(e){return!Vg(e)&&!isNaN(parseFloat(e))&&isFinite(e)}function zg(e,t){const n=Math.round(e);return n-t<=e&&n+t>=e}function Du(e,t,n){let i,s,o;for(i=0,s=e.length;i<s;i++)o=e[i][n],isNaN(o)||(t.min=Math.min(t.min,o),t.max=Math.max(t.max,o))}function de(e){return e*(ct/180)}function Pr(e){return e*(180/ct)}function Wa(e){if(!At(e))return;let t=1,n=0;for(;Math.round(e*t)/t!==e;)t*=10,n++;return n}function Eu(e,t){const n=t.x-e.x,i=t.y-e.y,s=Math.sqrt(n*n+i*i);let o=Math.atan2(i,n);return o<-.5*ct&&(o+=St),{angle:o,distance:s}}function Uo(e,t){return Math.sqrt(Math.pow(t.x-e.x,2)+Math.pow(t.y-e.y,2))}function Hg(e,t){return(e-t+Fg)%St-ct}function Vt(e){return(e%St+St)%St}function Ei(e,t,n,i){const s=Vt(e),o=Vt(t),r=Vt(n),a=Vt(o-s),l=Vt(r-s),c=Vt(s-o),u=Vt(s-r);return s===o||s===r||i&&o===r||a>l&&c<u}function Lt(e,t,n){return Math.max(t,Math.min(n,e))}function Wg(e){return Lt(e,-32768,32767)}function Be(e,t,n,i=1e-6){return e>=Math.min(t,n)-i&&e<=Math.max(t,n)+i}function Ar(e,t,n){n=n||(r=>e[r]<t);let i=e.length-1,s=0,o;for(;i-s>1;)o=s+i>>1,n(o)?s=o:i=o;return{lo:s,hi:i}}const Ve=(e,t,n,i)=>Ar(e,n,i?s=>{const o=e[s][t];return o<n||o===n&&e[s+1][t]===n}:s=>e[s][t]<n),jg=(e,t,n)=>Ar(e,n,i=>e[i][t]>=n);function $g(e,t,n){let i=0,s=e.length;for(;i<s&&e[i]<t;)i++;for(;s>i&&e[s-1]>n;)s--;return i>0||s<e.length?e.slice(i,s):e}const Tu=["push","pop","shift","splice","unshift"];function Ug(e,t){if(e._chartjs){e._chartjs.listeners.push(t);return}Object.defineProperty(e,"_chartjs",{configurable:!0,enumerable:!1,value:{listeners:[t]}}),Tu.forEach(n=>{const i="_onData"+Cr(n),s=e[n];Object.defineProperty(e,n,{configurable:!0,enumerable:!1,value(...o){const r=s.apply(this,o);return e._chartjs.listeners.forEach(a=>{typeof a[i]=="function"&&a[i](...o)}),r}})})}function ja(e,t){const n=e._chartjs;if(!n)return;const i=n.listeners,s=i.indexOf(t);s!==-1&&i.splice(s,1),!(i.length>0)&&(Tu.forEach(o=>{delete e[o]}),delete e._chartjs)}function Ru(e){const t=new Set(e);return t.size===e.length?e:Array.from(t)}const Iu=(function(){return typeof window>"u"?function(e){return e()}:window.requestAnimationFrame})();function Lu(e,t){let n=[],i=!1;return function(...s){n=s,i||(i=!0,Iu.call(window,()=>{i=!1,e.apply(t,n)}))}}function Yg(e,t){let n;return function(...i){return t?(clearTimeout(n),n=setTimeout(e,t,i)):e.apply(this,i),t}}const kr=e=>e==="start"?"left":e==="end"?"right":"center",Bt=(e,t,n)=>e==="start"?t:e==="end"?n:(t+n)/2,Kg=(e,t,n,i)=>e===(i?"left":"right")?n:e==="center"?(t+n)/2:t;function Fu(e,t,n){const i=t.length;let s=0,o=i;if(e._sorted){const{iScale:r,vScale:a,_parsed:l}=e,c=e.dataset&&e.dataset.options?e.dataset.options.spanGaps:null,u=r.axis,{min:h,max:f,minDefined:d,maxDefined:g}=r.getUserBounds();if(d){if(s=Math.min(Ve(l,u,h).lo,n?i:Ve(t,u,r.getPixelForValue(h)).lo),c){const p=l.slice(0,s+1).reverse().findIndex(b=>!it(b[a.axis]));s-=Math.max(0,p)}s=Lt(s,0,i-1)}if(g){let p=Math.max(Ve(l,r.axis,f,!0).hi+1,n?0:Ve(t,u,r.getPixelForValue(f),!0).hi+1);if(c){const b=l.slice(p-1).findIndex(y=>!it(y[a.axis]));p+=Math.max(0,b)}o=Lt(p,s,i)-s}else o=i-s}return{start:s,count:o}}function Nu(e){const{xScale:t,yScale:n,_scaleRanges:i}=e,s={xmin:t.min,xmax:t.max,ymin:n.min,ymax:n.max};if(!i)return e._scaleRanges=s,!0;const o=i.xmin!==t.min||i.xmax!==t.max||i.ymin!==n.min||i.ymax!==n.max;return Object.assign(i,s),o}const Ki=e=>e===0||e===1,$a=(e,t,n)=>-(Math.pow(2,10*(e-=1))*Math.sin((e-t)*St/n)),Ua=(e,t,n)=>Math.pow(2,-10*e)*Math.sin((e-t)*St/n)+1,xi={linear:e=>e,easeInQuad:e=>e*e,easeOutQuad:e=>-e*(e-2),easeInOutQuad:e=>(e/=.5)<1?.5*e*e:-.5*(--e*(e-2)-1),easeInCubic:e=>e*e*e,easeOutCubic:e=>(e-=1)*e*e+1,easeInOutCubic:e=>(e/=.5)<1?.5*e*e*e:.5*((e-=2)*e*e+2),easeInQuart:e=>e*e*e*e,easeOutQuart:e=>-((e-=1)*e*e*e-1),easeInOutQuart:e=>(e/=.5)<1?.5*e*e*e*e:-.5*((e-=2)*e*e*e-2),easeInQuint:e=>e*e*e*e*e,easeOutQuint:e=>(e-=1)*e*e*e*e+1,easeInOutQuint:e=>(e/=.5)<1?.5*e*e*e*e*e:.5*((e-=2)*e*e*e*e+2),easeInSine:e=>-Math.cos(e*Ot)+1,easeOutSine:e=>Math.sin(e*Ot),easeInOutSine:e=>-.5*(Math.cos(ct*e)-1),easeInExpo:e=>e===0?0:Math.pow(2,10*(e-1)),easeOutExpo:e=>e===1?1:-Math.pow(2,-10*e)+1,easeInOutExpo:e=>Ki(e)?e:e<.5?.5*Math.pow(2,10*(e*2-1)):.5*(-Math.pow(2,-10*(e*2-1))+2),easeInCirc:e=>e>=1?e:-(Math.sqrt(1-e*e)-1),easeOutCirc:e=>Math.sqrt(1-(e-=1)*e),easeInOutCirc:e=>(e/=.5)<1?-.5*(Math.sqrt(1-e*e)-1):.5*(Math.sqrt(1-(e-=2)*e)+1),easeInElastic:e=>Ki(e)?e:$a(e,.075,.3),easeOutElastic:e=>Ki(e)?e:Ua(e,.075,.3),easeInOutElastic(e){return Ki(e)?e:e<.5?.5*$a(e*2,.1125,.45):.5+.5*Ua(e*2-1,.1125,.45)},easeInBack(e){return e*e*((1.70158+1)*e-1.70158)},easeOutBack(e){return(e-=1)*e*((1.70158+1)*e+1.70158)+1},easeInOutBack(e){let t=1.70158;return(e/=.5)<1?.5*(e*e*(((t*=1.525)+1)*e-t)):.5*((e-=2)*e*(((t*=1.525)+1)*e+t)+2)},easeInBounce:e=>1-xi.easeOutBounce(1-e),easeOutBounce(e){return e<1/2.75?7.5625*e*e:e<2/2.75?7.5625*(e-=1.5/2.75)*e+.75:e<2.5/2.75?7.5625*(e-=2.25/2.75)*e+.9375:7.5625*(e-=2.625/2.75)*e+.984375},easeInOutBounce:e=>e<.5?xi.easeInBounce(e*2)*.5:xi.easeOutBounce(e*2-1)*.5+.5};function Or(e){if(e&&typeof e=="object"){const t=e.toString();return t==="[object CanvasPattern]"||t==="[object CanvasGradient]"}return!1}function Ya(e){return Or(e)?e:new ki(e)}function go(e){return Or(e)?e:new ki(e).saturate(.5).darken(.1).hexString()}const Gg=["x","y","borderWidth","radius","tension"],Xg=["color","borderColor","backgroundColor"];function qg(e){e.set("animation",{delay:void 0,duration:1e3,easing:"easeOutQuart",fn:void 0,from:void 0,loop:void 0,to:void 0,type:void 0}),e.describe("animation",{_fallback:!1,_indexable:!1,_scriptable:t=>t!=="onProgress"&&t!=="onComplete"&&t!=="fn"}),e.set("animations",{colors:{type:"color",properties:Xg},numbers:{type:"number",properties:Gg}}),e.describe("animations",{_fallback:"animation"}),e.set("transitions",{active:{animation:{duration:400}},resize:{animation:{duration:0}},show:{animations:{colors:{from:"transparent"},visible:{type:"boolean",duration:0}}},hide:{animations:{colors:{to:"transparent"},visible:{type:"boolean",easing:"linear",fn:t=>t|0}}}})}function Jg(e){e.set("layout",{autoPadding:!0,padding:{top:0,right:0,bottom:0,left:0}})}const Ka=new Map;function Zg(e,t){t=t||{};const n=e+JSON.stringify(t);let i=Ka.get(n);return i||(i=new Intl.NumberFormat(e,t),Ka.set(n,i)),i}function Vi(e,t,n){return Zg(t,n).format(e)}const Bu={values(e){return Mt(e)?e:""+e},numeric(e,t,n){if(e===0)return"0";const i=this.chart.options.locale;let s,o=e;if(n.length>1){const c=Math.max(Math.abs(n[0].value),Math.abs(n[n.length-1].value));(c<1e-4||c>1e15)&&(s="scientific"),o=Qg(e,n)}const r=qe(Math.abs(o)),a=isNaN(r)?1:Math.max(Math.min(-1*Math.floor(r),20),0),l={notation:s,minimumFractionDigits:a,maximumFractionDigits:a};return Object.assign(l,this.options.ticks.format),Vi(e,i,l)},logarithmic(e,t,n){if(e===0)return"0";const i=n[t].significand||e/Math.pow(10,Math.floor(qe(e)));return[1,2,3,5,10,15].includes(i)||t>.8*n.length?Bu.numeric.call(this,e,t,n):""}};function Qg(e,t){let n=t.length>3?t[2].value-t[1].value:t[1].value-t[0].value;return Math.abs(n)>=1&&e!==Math.floor(e)&&(n=e-Math.floor(e)),n}var Us={formatters:Bu};function tm(e){e.set("scale",{display:!0,offset:!1,reverse:!1,beginAtZero:!1,bounds:"ticks",clip:!0,grace:0,grid:{display:!0,lineWidth:1,drawOnChartArea:!0,drawTicks:!0,tickLength:8,tickWidth:(t,n)=>n.lineWidth,tickColor:(t,n)=>n.color,offset:!1},border:{display:!0,dash:[],dashOffset:0,width:1},title:{display:!1,text:"",padding:{top:4,bottom:4}},ticks:{minRotation:0,maxRotation:50,mirror:!1,textStrokeWidth:0,textStrokeColor:"",padding:3,display:!0,autoSkip:!0,autoSkipPadding:3,labelOffset:0,callback:Us.formatters.values,minor:{},major:{},align:"center",crossAlign:"near",showLabelBackdrop:!1,backdropColor:"rgba(255, 255, 255, 0.75)",backdropPadding:2}}),e.route("scale.ticks","color","","color"),e.route("scale.grid","color","","borderColor"),e.route("scale.border","color","","borderColor"),e.route("scale.title","color","","color"),e.describe("scale",{_fallback:!1,_scriptable:t=>!t.startsWith("before")&&!t.startsWith("after")&&t!=="callback"&&t!=="parser",_indexable:t=>t!=="borderDash"&&t!=="tickBorderDash"&&t!=="dash"}),e.describe("scales",{_fallback:"scale"}),e.describe("scale.ticks",{_scriptable:t=>t!=="backdropPadding"&&t!=="callback",_indexable:t=>t!=="backdropPadding"})}const Pn=Object.create(null),Yo=Object.create(null);function vi(e,t){if(!t)return e;const n=t.split(".");for(let i=0,s=n.length;i<s;++i){const o=n[i];e=e[o]||(e[o]=Object.create(null))}return e}function mo(e,t,n){return typeof t=="string"?Oi(vi(e,t),n):Oi(vi(e,""),t)}class em{constructor(t,n){this.animation=void 0,this.backgroundColor="rgba(0,0,0,0.1)",this.borderColor="rgba(0,0,0,0.1)",this.color="#666",this.datasets={},this.devicePixelRatio=i=>i.chart.platform.getDevicePixelRatio(),this.elements={},this.events=["mousemove","mouseout","click","touchstart","touchmove"],this.font={family:"'Helvetica Neue', 'Helvetica', 'Arial', sans-serif",size:12,style:"normal",lineHeight:1.2,weight:null},this.hover={},this.hoverBackgroundColor=(i,s)=>go(s.backgroundColor),this.hoverBorderColor=(i,s)=>go(s.borderColor),this.hoverColor=(i,s)=>go(s.color),this.indexAxis="x",this.interaction={mode:"nearest",intersect:!0,includeInvisible:!1},this.maintainAspectRatio=!0,this.onHover=null,this.onClick=null,this.parsing=!0,this.plugins={},this.responsive=!0,this.scale=void 0,this.scales={},this.showLine=!0,this.drawActiveElementsOnTop=!0,this.describe(t),this.apply(n)}set(t,n){return mo(this,t,n)}get(t){return vi(this,t)}describe(t,n){return mo(Yo,t,n)}override(t,n){return mo(Pn,t,n)}route(t,n,i,s){const o=vi(this,t),r=vi(this,i),a="_"+n;Object.defineProperties(o,{[a]:{value:o[n],writable:!0},[n]:{enumerable:!0,get(){const l=this[a],c=r[s];return st(l)?Object.assign({},c,l):tt(l,c)},set(l){this[a]=l}}})}apply(t){t.forEach(n=>n(this))}}var Ct=new em({_scriptable:e=>!e.startsWith("on"),_indexable:e=>e!=="events",hover:{_fallback:"interaction"},interaction:{_scriptable:!1,_indexable:!1}},[qg,Jg,tm]);function nm(e){return!e||it(e.size)||it(e.family)?null:(e.style?e.style+" ":"")+(e.weight?e.weight+" ":"")+e.size+"px "+e.family}function Ps(e,t,n,i,s){let o=t[s];return o||(o=t[s]=e.measureText(s).width,n.push(s)),o>i&&(i=o),i}function im(e,t,n,i){i=i||{};let s=i.data=i.data||{},o=i.garbageCollect=i.garbageCollect||[];i.font!==t&&(s=i.data={},o=i.garbageCollect=[],i.font=t),e.save(),e.font=t;let r=0;const a=n.length;let l,c,u,h,f;for(l=0;l<a;l++)if(h=n[l],h!=null&&!Mt(h))r=Ps(e,s,o,r,h);else if(Mt(h))for(c=0,u=h.length;c<u;c++)f=h[c],f!=null&&!Mt(f)&&(r=Ps(e,s,o,r,f));e.restore();const d=o.length/2;if(d>n.length){for(l=0;l<d;l++)delete s[o[l]];o.splice(0,d)}return r}function pn(e,t,n){const i=e.currentDevicePixelRatio,s=n!==0?Math.max(n/2,.5):0;return Math.round((t-s)*i)/i+s}function Ga(e,t){!t&&!e||(t=t||e.getContext("2d"),t.save(),t.resetTransform(),t.clearRect(0,0,e.width,e.height),t.restore())}function Ko(e,t,n,i){Vu(e,t,n,i,null)}function Vu(e,t,n,i,s){let o,r,a,l,c,u,h,f;const d=t.pointStyle,g=t.rotation,p=t.radius;let b=(g||0)*Ng;if(d&&typeof d=="object"&&(o=d.toString(),o==="[object HTMLImageElement]"||o==="[object HTMLCanvasElement]")){e.save(),e.translate(n,i),e.rotate(b),e.drawImage(d,-d.width/2,-d.height/2,d.width,d.height),e.restore();return}if(!(isNaN(p)||p<=0)){switch(e.beginPath(),d){default:s?e.ellipse(n,i,s/2,p,0,0,St):e.arc(n,i,p,0,St),e.closePath();break;case"triangle":u=s?s/2:p,e.moveTo(n+Math.sin(b)*u,i-Math.cos(b)*p),b+=za,e.lineTo(n+Math.sin(b)*u,i-Math.cos(b)*p),b+=za,e.lineTo(n+Math.sin(b)*u,i-Math.cos(b)*p),e.closePath();break;case"rectRounded":c=p*.516,l=p-c,r=Math.cos(b+dn)*l,h=Math.cos(b+dn)*(s?s/2-c:l),a=Math.sin(b+dn)*l,f=Math.sin(b+dn)*(s?s/2-c:l),e.arc(n-h,i-a,c,b-ct,b-Ot),e.arc(n+f,i-r,c,b-Ot,b),e.arc(n+h,i+a,c,b,b+Ot),e.arc(n-f,i+r,c,b+Ot,b+ct),e.closePath();break;case"rect":if(!g){l=Math.SQRT1_2*p,u=s?s/2:l,e.rect(n-u,i-l,2*u,2*l);break}b+=dn;case"rectRot":h=Math.cos(b)*(s?s/2:p),r=Math.cos(b)*p,a=Math.sin(b)*p,f=Math.sin(b)*(s?s/2:p),e.moveTo(n-h,i-a),e.lineTo(n+f,i-r),e.lineTo(n+h,i+a),e.lineTo(n-f,i+r),e.closePath();break;case"crossRot":b+=dn;case"cross":h=Math.cos(b)*(s?s/2:p),r=Math.cos(b)*p,a=Math.sin(b)*p,f=Math.sin(b)*(s?s/2:p),e.moveTo(n-h,i-a),e.lineTo(n+h,i+a),e.moveTo(n+f,i-r),e.lineTo(n-f,i+r);break;case"star":h=Math.cos(b)*(s?s/2:p),r=Math.cos(b)*p,a=Math.sin(b)*p,f=Math.sin(b)*(s?s/2:p),e.moveTo(n-h,i-a),e.lineTo(n+h,i+a),e.moveTo(n+f,i-r),e.lineTo(n-f,i+r),b+=dn,h=Math.cos(b)*(s?s/2:p),r=Math.cos(b)*p,a=Math.sin(b)*p,f=Math.sin(b)*(s?s/2:p),e.moveTo(n-h,i-a),e.lineTo(n+h,i+a),e.moveTo(n+f,i-r),e.lineTo(n-f,i+r);break;case"line":r=s?s/2:Math.cos(b)*p,a=Math.sin(b)*p,e.moveTo(n-r,i-a),e.lineTo(n+r,i+a);break;case"dash":e.moveTo(n,i),e.lineTo(n+Math.cos(b)*(s?s/2:p),i+Math.sin(b)*p);break;case!1:e.closePath();break}e.fill(),t.borderWidth>0&&e.stroke()}}function ze(e,t,n){return n=n||.5,!t||e&&e.x>t.left-n&&e.x<t.right+n&&e.y>t.top-n&&e.y<t.bottom+n}function Ys(e,t){e.save(),e.beginPath(),e.rect(t.left,t.top,t.right-t.left,t.bottom-t.top),e.clip()}function Ks(e){e.restore()}function sm(e,t,n,i,s){if(!t)return e.lineTo(n.x,n.y);if(s==="middle"){const o=(t.x+n.x)/2;e.lineTo(o,t.y),e.lineTo(o,n.y)}else s==="after"!=!!i?e.lineTo(t.x,n.y):e.lineTo(n.x,t.y);e.lineTo(n.x,n.y)}function om(e,t,n,i){if(!t)return e.lineTo(n.x,n.y);e.bezierCurveTo(i?t.cp1x:t.cp2x,i?t.cp1y:t.cp2y,i?n.cp2x:n.cp1x,i?n.cp2y:n.cp1y,n.x,n.y)}function rm(e,t){t.translation&&e.translate(t.translation[0],t.translation[1]),it(t.rotation)||e.rotate(t.rotation),t.color&&(e.fillStyle=t.color),t.textAlign&&(e.textAlign=t.textAlign),t.textBaseline&&(e.textBaseline=t.textBaseline)}function am(e,t,n,i,s){if(s.strikethrough||s.underline){const o=e.measureText(i),r=t-o.actualBoundingBoxLeft,a=t+o.actualBoundingBoxRight,l=n-o.actualBoundingBoxAscent,c=n+o.actualBoundingBoxDescent,u=s.strikethrough?(l+c)/2:c;e.strokeStyle=e.fillStyle,e.beginPath(),e.lineWidth=s.decorationWidth||2,e.moveTo(r,u),e.lineTo(a,u),e.stroke()}}function lm(e,t){const n=e.fillStyle;e.fillStyle=t.color,e.fillRect(t.left,t.top,t.width,t.height),e.fillStyle=n}function An(e,t,n,i,s,o={}){const r=Mt(t)?t:[t],a=o.strokeWidth>0&&o.strokeColor!=="";let l,c;for(e.save(),e.font=s.string,rm(e,o),l=0;l<r.length;++l)c=r[l],o.backdrop&&lm(e,o.backdrop),a&&(o.strokeColor&&(e.strokeStyle=o.strokeColor),it(o.strokeWidth)||(e.lineWidth=o.strokeWidth),e.strokeText(c,n,i,o.maxWidth)),e.fillText(c,n,i,o.maxWidth),am(e,n,i,c,o),i+=Number(s.lineHeight);e.restore()}function Ti(e,t){const{x:n,y:i,w:s,h:o,radius:r}=t;e.arc(n+r.topLeft,i+r.topLeft,r.topLeft,1.5*ct,ct,!0),e.lineTo(n,i+o-r.bottomLeft),e.arc(n+r.bottomLeft,i+o-r.bottomLeft,r.bottomLeft,ct,Ot,!0),e.lineTo(n+s-r.bottomRight,i+o),e.arc(n+s-r.bottomRight,i+o-r.bottomRight,r.bottomRight,Ot,0,!0),e.lineTo(n+s,i+r.topRight),e.arc(n+s-r.topRight,i+r.topRight,r.topRight,0,-Ot,!0),e.lineTo(n+r.topLeft,i)}const cm=/^(normal|(\d+(?:\.\d+)?)(px|em|%)?)$/,um=/^(normal|italic|initial|inherit|unset|(oblique( -?[0-9]?[0-9]deg)?))$/;function hm(e,t){const n=(""+e).match(cm);if(!n||n[1]==="normal")return t*1.2;switch(e=+n[2],n[3]){case"px":return e;case"%":e/=100;break}return t*e}const fm=e=>+e||0;function Dr(e,t){const n={},i=st(t),s=i?Object.keys(t):t,o=st(e)?i?r=>tt(e[r],e[t[r]]):r=>e[r]:()=>e;for(const r of s)n[r]=fm(o(r));return n}function zu(e){return Dr(e,{top:"y",right:"x",bottom:"y",left:"x"})}function Mn(e){return Dr(e,["topLeft","topRight","bottomLeft","bottomRight"])}function $t(e){const t=zu(e);return t.width=t.left+t.right,t.height=t.top+t.bottom,t}function It(e,t){e=e||{},t=t||Ct.font;let n=tt(e.size,t.size);typeof n=="string"&&(n=parseInt(n,10));let i=tt(e.style,t.style);i&&!(""+i).match(um)&&(console.warn('Invalid font style specified: "'+i+'"'),i=void 0);const s={family:tt(e.family,t.family),lineHeight:hm(tt(e.lineHeight,t.lineHeight),n),size:n,style:i,weight:tt(e.weight,t.weight),string:""};return s.string=nm(s),s}function ai(e,t,n,i){let s,o,r;for(s=0,o=e.length;s<o;++s)if(r=e[s],r!==void 0&&r!==void 0)return r}function dm(e,t,n){const{min:i,max:s}=e,o=ku(t,(s-i)/2),r=(a,l)=>n&&a===0?0:a+l;return{min:r(i,-Math.abs(o)),max:r(s,o)}}function ln(e,t){return Object.assign(Object.create(e),t)}function Er(e,t=[""],n,i,s=()=>e[0]){const o=n||e;typeof i>"u"&&(i=$u("_fallback",e));const r={[Symbol.toStringTag]:"Object",_cacheable:!0,_scopes:e,_rootScopes:o,_fallback:i,_getTarget:s,override:a=>Er([a,...e],t,o,i)};return new Proxy(r,{deleteProperty(a,l){return delete a[l],delete a._keys,delete e[0][l],!0},get(a,l){return Wu(a,l,()=>vm(l,t,e,a))},getOwnPropertyDescriptor(a,l){return Reflect.getOwnPropertyDescriptor(a._scopes[0],l)},getPrototypeOf(){return Reflect.getPrototypeOf(e[0])},has(a,l){return qa(a).includes(l)},ownKeys(a){return qa(a)},set(a,l,c){const u=a._storage||(a._storage=s());return a[l]=u[l]=c,delete a._keys,!0}})}function Yn(e,t,n,i){const s={_cacheable:!1,_proxy:e,_context:t,_subProxy:n,_stack:new Set,_descriptors:Hu(e,i),setContext:o=>Yn(e,o,n,i),override:o=>Yn(e.override(o),t,n,i)};return new Proxy(s,{deleteProperty(o,r){return delete o[r],delete e[r],!0},get(o,r,a){return Wu(o,r,()=>gm(o,r,a))},getOwnPropertyDescriptor(o,r){return o._descriptors.allKeys?Reflect.has(e,r)?{enumerable:!0,configurable:!0}:void 0:Reflect.getOwnPropertyDescriptor(e,r)},getPrototypeOf(){return Reflect.getPrototypeOf(e)},has(o,r){return Reflect.has(e,r)},ownKeys(){return Reflect.ownKeys(e)},set(o,r,a){return e[r]=a,delete o[r],!0}})}function Hu(e,t={scriptable:!0,indexable:!0}){const{_scriptable:n=t.scriptable,_indexable:i=t.indexable,_allKeys:s=t.allKeys}=e;return{allKeys:s,scriptable:n,indexable:i,isScriptable:rn(n)?n:()=>n,isIndexable:rn(i)?i:()=>i}}const pm=(e,t)=>e?e+Cr(t):t,Tr=(e,t)=>st(t)&&e!=="adapters"&&(Object.getPrototypeOf(t)===null||t.constructor===Object);function Wu(e,t,n){if(Object.prototype.hasOwnProperty.call(e,t)||t==="constructor")return e[t];const i=n();return e[t]=i,i}function gm(e,t,n){const{_proxy:i,_context:s,_subProxy:o,_descriptors:r}=e;let a=i[t];return rn(a)&&r.isScriptable(t)&&(a=mm(t,a,e,n)),Mt(a)&&a.length&&(a=bm(t,a,e,r.isIndexable)),Tr(t,a)&&(a=Yn(a,s,o&&o[t],r)),a}function mm(e,t,n,i){const{_proxy:s,_context:o,_subProxy:r,_stack:a}=n;if(a.has(e))throw new Error("Recursion detected: "+Array.from(a).join("->")+"->"+e);a.add(e);let l=t(o,r||i);return a.delete(e),Tr(e,l)&&(l=Rr(s._scopes,s,e,l)),l}function bm(e,t,n,i){const{_proxy:s,_context:o,_subProxy:r,_descriptors:a}=n;if(typeof o.index<"u"&&i(e))return t[o.index%t.length];if(st(t[0])){const l=t,c=s._scopes.filter(u=>u!==l);t=[];for(const u of l){const h=Rr(c,s,e,u);t.push(Yn(h,o,r&&r[e],a))}}return t}function ju(e,t,n){return rn(e)?e(t,n):e}const _m=(e,t)=>e===!0?t:typeof e=="string"?on(t,e):void 0;function ym(e,t,n,i,s){for(const o of t){const r=_m(n,o);if(r){e.add(r);const a=ju(r._fallback,n,s);if(typeof a<"u"&&a!==n&&a!==i)return a}else if(r===!1&&typeof i<"u"&&n!==i)return null}return!1}function Rr(e,t,n,i){const s=t._rootScopes,o=ju(t._fallback,n,i),r=[...e,...s],a=new Set;a.add(i);let l=Xa(a,r,n,o||n,i);return l===null||typeof o<"u"&&o!==n&&(l=Xa(a,r,o,l,i),l===null)?!1:Er(Array.from(a),[""],s,o,()=>xm(t,n,i))}function Xa(e,t,n,i,s){for(;n;)n=ym(e,t,n,i,s);return n}function xm(e,t,n){const i=e._getTarget();t in i||(i[t]={});const s=i[t];return Mt(s)&&st(n)?n:s||{}}function vm(e,t,n,i){let s;for(const o of t)if(s=$u(pm(o,e),n),typeof s<"u")return Tr(e,s)?Rr(n,i,e,s):s}function $u(e,t){for(const n of t){if(!n)continue;const i=n[e];if(typeof i<"u")return i}}function qa(e){let t=e._keys;return t||(t=e._keys=wm(e._scopes)),t}function wm(e){const t=new Set;for(const n of e)for(const i of Object.keys(n).filter(s=>!s.startsWith("_")))t.add(i);return Array.from(t)}function Uu(e,t,n,i){const{iScale:s}=e,{key:o="r"}=this._parsing,r=new Array(i);let a,l,c,u;for(a=0,l=i;a<l;++a)c=a+n,u=t[c],r[a]={r:s.parse(on(u,o),c)};return r}const Sm=Number.EPSILON||1e-14,Kn=(e,t)=>t<e.length&&!e[t].skip&&e[t],Yu=e=>e==="x"?"y":"x";function Mm(e,t,n,i){const s=e.skip?t:e,o=t,r=n.skip?t:n,a=Uo(o,s),l=Uo(r,o);let c=a/(a+l),u=l/(a+l);c=isNaN(c)?0:c,u=isNaN(u)?0:u;const h=i*c,f=i*u;return{previous:{x:o.x-h*(r.x-s.x),y:o.y-h*(r.y-s.y)},next:{x:o.x+f*(r.x-s.x),y:o.y+f*(r.y-s.y)}}}function Cm(e,t,n){const i=e.length;let s,o,r,a,l,c=Kn(e,0);for(let u=0;u<i-1;++u)if(l=c,c=Kn(e,u+1),!(!l||!c)){if(yi(t[u],0,Sm)){n[u]=n[u+1]=0;continue}s=n[u]/t[u],o=n[u+1]/t[u],a=Math.pow(s,2)+Math.pow(o,2),!(a<=9)&&(r=3/Math.sqrt(a),n[u]=s*r*t[u],n[u+1]=o*r*t[u])}}function Pm(e,t,n="x"){const i=Yu(n),s=e.length;let o,r,a,l=Kn(e,0);for(let c=0;c<s;++c){if(r=a,a=l,l=Kn(e,c+1),!a)continue;const u=a[n],h=a[i];r&&(o=(u-r[n])/3,a[`cp1${n}`]=u-o,a[`cp1${i}`]=h-o*t[c]),l&&(o=(l[n]-u)/3,a[`cp2${n}`]=u+o,a[`cp2${i}`]=h+o*t[c])}}function Am(e,t="x"){const n=Yu(t),i=e.length,s=Array(i).fill(0),o=Array(i);let r,a,l,c=Kn(e,0);for(r=0;r<i;++r)if(a=l,l=c,c=Kn(e,r+1),!!l){if(c){const u=c[t]-l[t];s[r]=u!==0?(c[n]-l[n])/u:0}o[r]=a?c?Pe(s[r-1])!==Pe(s[r])?0:(s[r-1]+s[r])/2:s[r-1]:s[r]}Cm(e,s,o),Pm(e,o,t)}function Gi(e,t,n){return Math.max(Math.min(e,n),t)}function km(e,t){let n,i,s,o,r,a=ze(e[0],t);for(n=0,i=e.length;n<i;++n)r=o,o=a,a=n<i-1&&ze(e[n+1],t),o&&(s=e[n],r&&(s.cp1x=Gi(s.cp1x,t.left,t.right),s.cp1y=Gi(s.cp1y,t.top,t.bottom)),a&&(s.cp2x=Gi(s.cp2x,t.left,t.right),s.cp2y=Gi(s.cp2y,t.top,t.bottom)))}function Om(e,t,n,i,s){let o,r,a,l;if(t.spanGaps&&(e=e.filter(c=>!c.skip)),t.cubicInterpolationMode==="monotone")Am(e,s);else{let c=i?e[e.length-1]:e[0];for(o=0,r=e.length;o<r;++o)a=e[o],l=Mm(c,a,e[Math.min(o+1,r-(i?0:1))%r],t.tension),a.cp1x=l.previous.x,a.cp1y=l.previous.y,a.cp2x=l.next.x,a.cp2y=l.next.y,c=a}t.capBezierPoints&&km(e,n)}function Ir(){return typeof window<"u"&&typeof document<"u"}function Lr(e){let t=e.parentNode;return t&&t.toString()==="[object ShadowRoot]"&&(t=t.host),t}function As(e,t,n){let i;return typeof e=="string"?(i=parseInt(e,10),e.indexOf("%")!==-1&&(i=i/100*t.parentNode[n])):i=e,i}const Gs=e=>e.ownerDocument.defaultView.getComputedStyle(e,null);function Dm(e,t){return Gs(e).getPropertyValue(t)}const Em=["top","right","bottom","left"];function Cn(e,t,n){const i={};n=n?"-"+n:"";for(let s=0;s<4;s++){const o=Em[s];i[o]=parseFloat(e[t+"-"+o+n])||0}return i.width=i.left+i.right,i.height=i.top+i.bottom,i}const Tm=(e,t,n)=>(e>0||t>0)&&(!n||!n.shadowRoot);function Rm(e,t){const n=e.touches,i=n&&n.length?n[0]:e,{offsetX:s,offsetY:o}=i;let r=!1,a,l;if(Tm(s,o,e.target))a=s,l=o;else{const c=t.getBoundingClientRect();a=i.clientX-c.left,l=i.clientY-c.top,r=!0}return{x:a,y:l,box:r}}function _n(e,t){if("native"in e)return e;const{canvas:n,currentDevicePixelRatio:i}=t,s=Gs(n),o=s.boxSizing==="border-box",r=Cn(s,"padding"),a=Cn(s,"border","width"),{x:l,y:c,box:u}=Rm(e,n),h=r.left+(u&&a.left),f=r.top+(u&&a.top);let{width:d,height:g}=t;return o&&(d-=r.width+a.width,g-=r.height+a.height),{x:Math.round((l-h)/d*n.width/i),y:Math.round((c-f)/g*n.height/i)}}function Im(e,t,n){let i,s;if(t===void 0||n===void 0){const o=e&&Lr(e);if(!o)t=e.clientWidth,n=e.clientHeight;else{const r=o.getBoundingClientRect(),a=Gs(o),l=Cn(a,"border","width"),c=Cn(a,"padding");t=r.width-c.width-l.width,n=r.height-c.height-l.height,i=As(a.maxWidth,o,"clientWidth"),s=As(a.maxHeight,o,"clientHeight")}}return{width:t,height:n,maxWidth:i||Cs,maxHeight:s||Cs}}const Je=e=>Math.round(e*10)/10;function Lm(e,t,n,i){const s=Gs(e),o=Cn(s,"margin"),r=As(s.maxWidth,e,"clientWidth")||Cs,a=As(s.maxHeight,e,"clientHeight")||Cs,l=Im(e,t,n);let{width:c,height:u}=l;if(s.boxSizing==="content-box"){const f=Cn(s,"border","width"),d=Cn(s,"padding");c-=d.width+f.width,u-=d.height+f.height}return c=Math.max(0,c-o.width),u=Math.max(0,i?c/i:u-o.height),c=Je(Math.min(c,r,l.maxWidth)),u=Je(Math.min(u,a,l.maxHeight)),c&&!u&&(u=Je(c/2)),(t!==void 0||n!==void 0)&&i&&l.height&&u>l.height&&(u=l.height,c=Je(Math.floor(u*i))),{width:c,height:u}}function Ja(e,t,n){const i=t||1,s=Je(e.height*i),o=Je(e.width*i);e.height=Je(e.height),e.width=Je(e.width);const r=e.canvas;return r.style&&(n||!r.style.height&&!r.style.width)&&(r.style.height=`${e.height}px`,r.style.width=`${e.width}px`),e.currentDevicePixelRatio!==i||r.height!==s||r.width!==o?(e.currentDevicePixelRatio=i,r.height=s,r.width=o,e.ctx.setTransform(i,0,0,i,0,0),!0):!1}const Fm=(function(){let e=!1;try{const t={get passive(){return e=!0,!1}};Ir()&&(window.addEventListener("test",null,t),window.removeEventListener("test",null,t))}catch{}return e})();function Za(e,t){const n=Dm(e,t),i=n&&n.match(/^(\d+)(\.\d+)?px$/);return i?+i[1]:void 0}function yn(e,t,n,i){return{x:e.x+n*(t.x-e.x),y:e.y+n*(t.y-e.y)}}function Nm(e,t,n,i){return{x:e.x+n*(t.x-e.x),y:i==="middle"?n<.5?e.y:t.y:i==="after"?n<1?e.y:t.y:n>0?t.y:e.y}}function Bm(e,t,n,i){const s={x:e.cp2x,y:e.cp2y},o={x:t.cp1x,y:t.cp1y},r=yn(e,s,n),a=yn(s,o,n),l=yn(o,t,n),c=yn(r,a,n),u=yn(a,l,n);return yn(c,u,n)}const Vm=function(e,t){return{x(n){return e+e+t-n},setWidth(n){t=n},textAlign(n){return n==="center"?n:n==="right"?"left":"right"},xPlus(n,i){return n-i},leftForLtr(n,i){return n-i}}},zm=function(){return{x(e){return e},setWidth(e){},textAlign(e){return e},xPlus(e,t){return e+t},leftForLtr(e,t){return e}}};function Hn(e,t,n){return e?Vm(t,n):zm()}function Ku(e,t){let n,i;(t==="ltr"||t==="rtl")&&(n=e.canvas.style,i=[n.getPropertyValue("direction"),n.getPropertyPriority("direction")],n.setProperty("direction",t,"important"),e.prevTextDirection=i)}function Gu(e,t){t!==void 0&&(delete e.prevTextDirection,e.canvas.style.setProperty("direction",t[0],t[1]))}function Xu(e){return e==="angle"?{between:Ei,compare:Hg,normalize:Vt}:{between:Be,compare:(t,n)=>t-n,normalize:t=>t}}function Qa({start:e,end:t,count:n,loop:i,style:s}){return{start:e%n,end:t%n,loop:i&&(t-e+1)%n===0,style:s}}function Hm(e,t,n){const{property:i,start:s,end:o}=n,{between:r,normalize:a}=Xu(i),l=t.length;let{start:c,end:u,loop:h}=e,f,d;if(h){for(c+=l,u+=l,f=0,d=l;f<d&&r(a(t[c%l][i]),s,o);++f)c--,u--;c%=l,u%=l}return u<c&&(u+=l),{start:c,end:u,loop:h,style:e.style}}function qu(e,t,n){if(!n)return[e];const{property:i,start:s,end:o}=n,r=t.length,{compare:a,between:l,normalize:c}=Xu(i),{start:u,end:h,loop:f,style:d}=Hm(e,t,n),g=[];let p=!1,b=null,y,_,M;const v=()=>l(s,M,y)&&a(s,M)!==0,S=()=>a(o,y)===0||l(o,M,y),E=()=>p||v(),O=()=>!p||S();for(let I=u,j=u;I<=h;++I)_=t[I%r],!_.skip&&(y=c(_[i]),y!==M&&(p=l(y,s,o),b===null&&E()&&(b=a(y,s)===0?I:j),b!==null&&O()&&(g.push(Qa({start:b,end:I,loop:f,count:r,style:d})),b=null),j=I,M=y));return b!==null&&g.push(Qa({start:b,end:h,loop:f,count:r,style:d})),g}function Ju(e,t){const n=[],i=e.segments;for(let s=0;s<i.length;s++){const o=qu(i[s],e.points,t);o.length&&n.push(...o)}return n}function Wm(e,t,n,i){let s=0,o=t-1;if(n&&!i)for(;s<t&&!e[s].skip;)s++;for(;s<t&&e[s].skip;)s++;for(s%=t,n&&(o+=s);o>s&&e[o%t].skip;)o--;return o%=t,{start:s,end:o}}function jm(e,t,n,i){const s=e.length,o=[];let r=t,a=e[t],l;for(l=t+1;l<=n;++l){const c=e[l%s];c.skip||c.stop?a.skip||(i=!1,o.push({start:t%s,end:(l-1)%s,loop:i}),t=r=c.stop?l:null):(r=l,a.skip&&(t=l)),a=c}return r!==null&&o.push({start:t%s,end:r%s,loop:i}),o}function $m(e,t){const n=e.points,i=e.options.spanGaps,s=n.length;if(!s)return[];const o=!!e._loop,{start:r,end:a}=Wm(n,s,o,i);if(i===!0)return tl(e,[{start:r,end:a,loop:o}],n,t);const l=a<r?a+s:a,c=!!e._fullLoop&&r===0&&a===s-1;return tl(e,jm(n,r,l,c),n,t)}function tl(e,t,n,i){return!i||!i.setContext||!n?t:Um(e,t,n,i)}function Um(e,t,n,i){const s=e._chart.getContext(),o=el(e.options),{_datasetIndex:r,options:{spanGaps:a}}=e,l=n.length,c=[];let u=o,h=t[0].start,f=h;function d(g,p,b,y){const _=a?-1:1;if(g!==p){for(g+=l;n[g%l].skip;)g-=_;for(;n[p%l].skip;)p+=_;g%l!==p%l&&(c.push({start:g%l,end:p%l,loop:b,style:y}),u=y,h=p%l)}}for(const g of t){h=a?h:g.start;let p=n[h%l],b;for(f=h+1;f<=g.end;f++){const y=n[f%l];b=el(i.setContext(ln(s,{type:"segment",p0:p,p1:y,p0DataIndex:(f-1)%l,p1DataIndex:f%l,datasetIndex:r}))),Ym(b,u)&&d(h,f-1,g.loop,u),p=y,u=b}h<f-1&&d(h,f-1,g.loop,u)}return c}function el(e){return{backgroundColor:e.backgroundColor,borderCapStyle:e.borderCapStyle,borderDash:e.borderDash,borderDashOffset:e.borderDashOffset,borderJoinStyle:e.borderJoinStyle,borderWidth:e.borderWidth,borderColor:e.borderColor}}function Ym(e,t){if(!t)return!1;const n=[],i=function(s,o){return Or(o)?(n.includes(o)||n.push(o),n.indexOf(o)):o};return JSON.stringify(e,i)!==JSON.stringify(t,i)}function Xi(e,t,n){return e.options.clip?e[n]:t[n]}function Km(e,t){const{xScale:n,yScale:i}=e;return n&&i?{left:Xi(n,t,"left"),right:Xi(n,t,"right"),top:Xi(i,t,"top"),bottom:Xi(i,t,"bottom")}:t}function Zu(e,t){const n=t._clip;if(n.disabled)return!1;const i=Km(t,e.chartArea);return{left:n.left===!1?0:i.left-(n.left===!0?0:n.left),right:n.right===!1?e.width:i.right+(n.right===!0?0:n.right),top:n.top===!1?0:i.top-(n.top===!0?0:n.top),bottom:n.bottom===!1?e.height:i.bottom+(n.bottom===!0?0:n.bottom)}}class Gm{constructor(){this._request=null,this._charts=new Map,this._running=!1,this._lastDate=void 0}_notify(t,n,i,s){const o=n.listeners[s],r=n.duration;o.forEach(a=>a({chart:t,initial:n.initial,numSteps:r,currentStep:Math.min(i-n.start,r)}))}_refresh(){this._request||(this._running=!0,this._request=Iu.call(window,()=>{this._update(),this._request=null,this._running&&this._refresh()}))}_update(t=Date.now()){let n=0;this._charts.forEach((i,s)=>{if(!i.running||!i.items.length)return;const o=i.items;let r=o.length-1,a=!1,l;for(;r>=0;--r)l=o[r],l._active?(l._total>i.duration&&(i.duration=l._total),l.tick(t),a=!0):(o[r]=o[o.length-1],o.pop());a&&(s.draw(),this._notify(s,i,t,"progress")),o.length||(i.running=!1,this._notify(s,i,t,"complete"),i.initial=!1),n+=o.length}),this._lastDate=t,n===0&&(this._running=!1)}_getAnims(t){const n=this._charts;let i=n.get(t);return i||(i={running:!1,initial:!0,items:[],listeners:{complete:[],progress:[]}},n.set(t,i)),i}listen(t,n,i){this._getAnims(t).listeners[n].push(i)}add(t,n){!n||!n.length||this._getAnims(t).items.push(...n)}has(t){return this._getAnims(t).items.length>0}start(t){const n=this._charts.get(t);n&&(n.running=!0,n.start=Date.now(),n.duration=n.items.reduce((i,s)=>Math.max(i,s._duration),0),this._refresh())}running(t){if(!this._running)return!1;const n=this._charts.get(t);return!(!n||!n.running||!n.items.length)}stop(t){const n=this._charts.get(t);if(!n||!n.items.length)return;const i=n.items;let s=i.length-1;for(;s>=0;--s)i[s].cancel();n.items=[],this._notify(t,n,Date.now(),"complete")}remove(t){return this._charts.delete(t)}}var Te=new Gm;const nl="transparent",Xm={boolean(e,t,n){return n>.5?t:e},color(e,t,n){const i=Ya(e||nl),s=i.valid&&Ya(t||nl);return s&&s.valid?s.mix(i,n).hexString():t},number(e,t,n){return e+(t-e)*n}};class qm{constructor(t,n,i,s){const o=n[i];s=ai([t.to,s,o,t.from]);const r=ai([t.from,o,s]);this._active=!0,this._fn=t.fn||Xm[t.type||typeof r],this._easing=xi[t.easing]||xi.linear,this._start=Math.floor(Date.now()+(t.delay||0)),this._duration=this._total=Math.floor(t.duration),this._loop=!!t.loop,this._target=n,this._prop=i,this._from=r,this._to=s,this._promises=void 0}active(){return this._active}update(t,n,i){if(this._active){this._notify(!1);const s=this._target[this._prop],o=i-this._start,r=this._duration-o;this._start=i,this._duration=Math.floor(Math.max(r,t.duration)),this._total+=o,this._loop=!!t.loop,this._to=ai([t.to,n,s,t.from]),this._from=ai([t.from,s,n])}}cancel(){this._active&&(this.tick(Date.now()),this._active=!1,this._notify(!1))}tick(t){const n=t-this._start,i=this._duration,s=this._prop,o=this._from,r=this._loop,a=this._to;let l;if(this._active=o!==a&&(r||n<i),!this._active){this._target[s]=a,this._notify(!0);return}if(n<0){this._target[s]=o;return}l=n/i%2,l=r&&l>1?2-l:l,l=this._easing(Math.min(1,Math.max(0,l))),this._target[s]=this._fn(o,a,l)}wait(){const t=this._promises||(this._promises=[]);return new Promise((n,i)=>{t.push({res:n,rej:i})})}_notify(t){const n=t?"res":"rej",i=this._promises||[];for(let s=0;s<i.length;s++)i[s][n]()}}class Qu{constructor(t,n){this._chart=t,this._properties=new Map,this.configure(n)}configure(t){if(!st(t))return;const n=Object.keys(Ct.animation),i=this._properties;Object.getOwnPropertyNames(t).forEach(s=>{const o=t[s];if(!st(o))return;const r={};for(const a of n)r[a]=o[a];(Mt(o.properties)&&o.properties||[s]).forEach(a=>{(a===s||!i.has(a))&&i.set(a,r)})})}_animateOptions(t,n){const i=n.options,s=Zm(t,i);if(!s)return[];const o=this._createAnimations(s,i);return i.$shared&&Jm(t.options.$animations,i).then(()=>{t.options=i},()=>{}),o}_createAnimations(t,n){const i=this._properties,s=[],o=t.$animations||(t.$animations={}),r=Object.keys(n),a=Date.now();let l;for(l=r.length-1;l>=0;--l){const c=r[l];if(c.charAt(0)==="$")continue;if(c==="options"){s.push(...this._animateOptions(t,n));continue}const u=n[c];let h=o[c];const f=i.get(c);if(h)if(f&&h.active()){h.update(f,u,a);continue}else h.cancel();if(!f||!f.duration){t[c]=u;continue}o[c]=h=new qm(f,t,c,u),s.push(h)}return s}update(t,n){if(this._properties.size===0){Object.assign(t,n);return}const i=this._createAnimations(t,n);if(i.length)return Te.add(this._chart,i),!0}}function Jm(e,t){const n=[],i=Object.keys(t);for(let s=0;s<i.length;s++){const o=e[i[s]];o&&o.active()&&n.push(o.wait())}return Promise.all(n)}function Zm(e,t){if(!t)return;let n=e.options;if(!n){e.options=t;return}return n.$shared&&(e.options=n=Object.assign({},n,{$shared:!1,$animations:{}})),n}function il(e,t){const n=e&&e.options||{},i=n.reverse,s=n.min===void 0?t:0,o=n.max===void 0?t:0;return{start:i?o:s,end:i?s:o}}function Qm(e,t,n){if(n===!1)return!1;const i=il(e,n),s=il(t,n);return{top:s.end,right:i.end,bottom:s.start,left:i.start}}function tb(e){let t,n,i,s;return st(e)?(t=e.top,n=e.right,i=e.bottom,s=e.left):t=n=i=s=e,{top:t,right:n,bottom:i,left:s,disabled:e===!1}}function th(e,t){const n=[],i=e._getSortedDatasetMetas(t);let s,o;for(s=0,o=i.length;s<o;++s)n.push(i[s].index);return n}function sl(e,t,n,i={}){const s=e.keys,o=i.mode==="single";let r,a,l,c;if(t===null)return;let u=!1;for(r=0,a=s.length;r<a;++r){if(l=+s[r],l===n){if(u=!0,i.all)continue;break}c=e.values[l],At(c)&&(o||t===0||Pe(t)===Pe(c))&&(t+=c)}return!u&&!i.all?0:t}function eb(e,t){const{iScale:n,vScale:i}=t,s=n.axis==="x"?"x":"y",o=i.axis==="x"?"x":"y",r=Object.keys(e),a=new Array(r.length);let l,c,u;for(l=0,c=r.length;l<c;++l)u=r[l],a[l]={[s]:u,[o]:e[u]};return a}function bo(e,t){const n=e&&e.options.stacked;return n||n===void 0&&t.stack!==void 0}function nb(e,t,n){return`${e.id}.${t.id}.${n.stack||n.type}`}function ib(e){const{min:t,max:n,minDefined:i,maxDefined:s}=e.getUserBounds();return{min:i?t:Number.NEGATIVE_INFINITY,max:s?n:Number.POSITIVE_INFINITY}}function sb(e,t,n){const i=e[t]||(e[t]={});return i[n]||(i[n]={})}function ol(e,t,n,i){for(const s of t.getMatchingVisibleMetas(i).reverse()){const o=e[s.index];if(n&&o>0||!n&&o<0)return s.index}return null}function rl(e,t){const{chart:n,_cachedMeta:i}=e,s=n._stacks||(n._stacks={}),{iScale:o,vScale:r,index:a}=i,l=o.axis,c=r.axis,u=nb(o,r,i),h=t.length;let f;for(let d=0;d<h;++d){const g=t[d],{[l]:p,[c]:b}=g,y=g._stacks||(g._stacks={});f=y[c]=sb(s,u,p),f[a]=b,f._top=ol(f,r,!0,i.type),f._bottom=ol(f,r,!1,i.type);const _=f._visualValues||(f._visualValues={});_[a]=b}}function _o(e,t){const n=e.scales;return Object.keys(n).filter(i=>n[i].axis===t).shift()}function ob(e,t){return ln(e,{active:!1,dataset:void 0,datasetIndex:t,index:t,mode:"default",type:"dataset"})}function rb(e,t,n){return ln(e,{active:!1,dataIndex:t,parsed:void 0,raw:void 0,element:n,index:t,mode:"default",type:"data"})}function ti(e,t){const n=e.controller.index,i=e.vScale&&e.vScale.axis;if(i){t=t||e._parsed;for(const s of t){const o=s._stacks;if(!o||o[i]===void 0||o[i][n]===void 0)return;delete o[i][n],o[i]._visualValues!==void 0&&o[i]._visualValues[n]!==void 0&&delete o[i]._visualValues[n]}}}const yo=e=>e==="reset"||e==="none",al=(e,t)=>t?e:Object.assign({},e),ab=(e,t,n)=>e&&!t.hidden&&t._stacked&&{keys:th(n,!0),values:null};class cn{static defaults={};static datasetElementType=null;static dataElementType=null;constructor(t,n){this.chart=t,this._ctx=t.ctx,this.index=n,this._cachedDataOpts={},this._cachedMeta=this.getMeta(),this._type=this._cachedMeta.type,this.options=void 0,this._parsing=!1,this._data=void 0,this._objectData=void 0,this._sharedOptions=void 0,this._drawStart=void 0,this._drawCount=void 0,this.enableOptionSharing=!1,this.supportsDecimation=!1,this.$context=void 0,this._syncList=[],this.datasetElementType=new.target.datasetElementType,this.dataElementType=new.target.dataElementType,this.initialize()}initialize(){const t=this._cachedMeta;this.configure(),this.linkScales(),t._stacked=bo(t.vScale,t),this.addElements(),this.options.fill&&!this.chart.isPluginEnabled("filler")&&console.warn("Tried to use the 'fill' option without the 'Filler' plugin enabled. Please import and register the 'Filler' plugin and make sure it is not disabled in the options")}updateIndex(t){this.index!==t&&ti(this._cachedMeta),this.index=t}linkScales(){const t=this.chart,n=this._cachedMeta,i=this.getDataset(),s=(h,f,d,g)=>h==="x"?f:h==="r"?g:d,o=n.xAxisID=tt(i.xAxisID,_o(t,"x")),r=n.yAxisID=tt(i.yAxisID,_o(t,"y")),a=n.rAxisID=tt(i.rAxisID,_o(t,"r")),l=n.indexAxis,c=n.iAxisID=s(l,o,r,a),u=n.vAxisID=s(l,r,o,a);n.xScale=this.getScaleForId(o),n.yScale=this.getScaleForId(r),n.rScale=this.getScaleForId(a),n.iScale=this.getScaleForId(c),n.vScale=this.getScaleForId(u)}getDataset(){return this.chart.data.datasets[this.index]}getMeta(){return this.chart.getDatasetMeta(this.index)}getScaleForId(t){return this.chart.scales[t]}_getOtherScale(t){const n=this._cachedMeta;return t===n.iScale?n.vScale:n.iScale}reset(){this._update("reset")}_destroy(){const t=this._cachedMeta;this._data&&ja(this._data,this),t._stacked&&ti(t)}_dataCheck(){const t=this.getDataset(),n=t.data||(t.data=[]),i=this._data;if(st(n)){const s=this._cachedMeta;this._data=eb(n,s)}else if(i!==n){if(i){ja(i,this);const s=this._cachedMeta;ti(s),s._parsed=[]}n&&Object.isExtensible(n)&&Ug(n,this),this._syncList=[],this._data=n}}addElements(){const t=this._cachedMeta;this._dataCheck(),this.datasetElementType&&(t.dataset=new this.datasetElementType)}buildOrUpdateElements(t){const n=this._cachedMeta,i=this.getDataset();let s=!1;this._dataCheck();const o=n._stacked;n._stacked=bo(n.vScale,n),n.stack!==i.stack&&(s=!0,ti(n),n.stack=i.stack),this._resyncElements(t),(s||o!==n._stacked)&&(rl(this,n._parsed),n._stacked=bo(n.vScale,n))}configure(){const t=this.chart.config,n=t.datasetScopeKeys(this._type),i=t.getOptionScopes(this.getDataset(),n,!0);this.options=t.createResolver(i,this.getContext()),this._parsing=this.options.parsing,this._cachedDataOpts={}}parse(t,n){const{_cachedMeta:i,_data:s}=this,{iScale:o,_stacked:r}=i,a=o.axis;let l=t===0&&n===s.length?!0:i._sorted,c=t>0&&i._parsed[t-1],u,h,f;if(this._parsing===!1)i._parsed=s,i._sorted=!0,f=s;else{Mt(s[t])?f=this.parseArrayData(i,s,t,n):st(s[t])?f=this.parseObjectData(i,s,t,n):f=this.parsePrimitiveData(i,s,t,n);const d=()=>h[a]===null||c&&h[a]<c[a];for(u=0;u<n;++u)i._parsed[u+t]=h=f[u],l&&(d()&&(l=!1),c=h);i._sorted=l}r&&rl(this,f)}parsePrimitiveData(t,n,i,s){const{iScale:o,vScale:r}=t,a=o.axis,l=r.axis,c=o.getLabels(),u=o===r,h=new Array(s);let f,d,g;for(f=0,d=s;f<d;++f)g=f+i,h[f]={[a]:u||o.parse(c[g],g),[l]:r.parse(n[g],g)};return h}parseArrayData(t,n,i,s){const{xScale:o,yScale:r}=t,a=new Array(s);let l,c,u,h;for(l=0,c=s;l<c;++l)u=l+i,h=n[u],a[l]={x:o.parse(h[0],u),y:r.parse(h[1],u)};return a}parseObjectData(t,n,i,s){const{xScale:o,yScale:r}=t,{xAxisKey:a="x",yAxisKey:l="y"}=this._parsing,c=new Array(s);let u,h,f,d;for(u=0,h=s;u<h;++u)f=u+i,d=n[f],c[u]={x:o.parse(on(d,a),f),y:r.parse(on(d,l),f)};return c}getParsed(t){return this._cachedMeta._parsed[t]}getDataElement(t){return this._cachedMeta.data[t]}applyStack(t,n,i){const s=this.chart,o=this._cachedMeta,r=n[t.axis],a={keys:th(s,!0),values:n._stacks[t.axis]._visualValues};return sl(a,r,o.index,{mode:i})}updateRangeFromParsed(t,n,i,s){const o=i[n.axis];let r=o===null?NaN:o;const a=s&&i._stacks[n.axis];s&&a&&(s.values=a,r=sl(s,o,this._cachedMeta.index)),t.min=Math.min(t.min,r),t.max=Math.max(t.max,r)}getMinMax(t,n){const i=this._cachedMeta,s=i._parsed,o=i._sorted&&t===i.iScale,r=s.length,a=this._getOtherScale(t),l=ab(n,i,this.chart),c={min:Number.POSITIVE_INFINITY,max:Number.NEGATIVE_INFINITY},{min:u,max:h}=ib(a);let f,d;function g(){d=s[f];const p=d[a.axis];return!At(d[t.axis])||u>p||h<p}for(f=0;f<r&&!(!g()&&(this.updateRangeFromParsed(c,t,d,l),o));++f);if(o){for(f=r-1;f>=0;--f)if(!g()){this.updateRangeFromParsed(c,t,d,l);break}}return c}getAllParsedValues(t){const n=this._cachedMeta._parsed,i=[];let s,o,r;for(s=0,o=n.length;s<o;++s)r=n[s][t.axis],At(r)&&i.push(r);return i}getMaxOverflow(){return!1}getLabelAndValue(t){const n=this._cachedMeta,i=n.iScale,s=n.vScale,o=this.getParsed(t);return{label:i?""+i.getLabelForValue(o[i.axis]):"",value:s?""+s.getLabelForValue(o[s.axis]):""}}_update(t){const n=this._cachedMeta;this.update(t||"default"),n._clip=tb(tt(this.options.clip,Qm(n.xScale,n.yScale,this.getMaxOverflow())))}update(t){}draw(){const t=this._ctx,n=this.chart,i=this._cachedMeta,s=i.data||[],o=n.chartArea,r=[],a=this._drawStart||0,l=this._drawCount||s.length-a,c=this.options.drawActiveElementsOnTop;let u;for(i.dataset&&i.dataset.draw(t,o,a,l),u=a;u<a+l;++u){const h=s[u];h.hidden||(h.active&&c?r.push(h):h.draw(t,o))}for(u=0;u<r.length;++u)r[u].draw(t,o)}getStyle(t,n){const i=n?"active":"default";return t===void 0&&this._cachedMeta.dataset?this.resolveDatasetElementOptions(i):this.resolveDataElementOptions(t||0,i)}getContext(t,n,i){const s=this.getDataset();let o;if(t>=0&&t<this._cachedMeta.data.length){const r=this._cachedMeta.data[t];o=r.$context||(r.$context=rb(this.getContext(),t,r)),o.parsed=this.getParsed(t),o.raw=s.data[t],o.index=o.dataIndex=t}else o=this.$context||(this.$context=ob(this.chart.getContext(),this.index)),o.dataset=s,o.index=o.datasetIndex=this.index;return o.active=!!n,o.mode=i,o}resolveDatasetElementOptions(t){return this._resolveElementOptions(this.datasetElementType.id,t)}resolveDataElementOptions(t,n){return this._resolveElementOptions(this.dataElementType.id,n,t)}_resolveElementOptions(t,n="default",i){const s=n==="active",o=this._cachedDataOpts,r=t+"-"+n,a=o[r],l=this.enableOptionSharing&&Di(i);if(a)return al(a,l);const c=this.chart.config,u=c.datasetElementScopeKeys(this._type,t),h=s?[`${t}Hover`,"hover",t,""]:[t,""],f=c.getOptionScopes(this.getDataset(),u),d=Object.keys(Ct.elements[t]),g=()=>this.getContext(i,s,n),p=c.resolveNamedOptions(f,d,g,h);return p.$shared&&(p.$shared=l,o[r]=Object.freeze(al(p,l))),p}_resolveAnimations(t,n,i){const s=this.chart,o=this._cachedDataOpts,r=`animation-${n}`,a=o[r];if(a)return a;let l;if(s.options.animation!==!1){const u=this.chart.config,h=u.datasetAnimationScopeKeys(this._type,n),f=u.getOptionScopes(this.getDataset(),h);l=u.createResolver(f,this.getContext(t,i,n))}const c=new Qu(s,l&&l.animations);return l&&l._cacheable&&(o[r]=Object.freeze(c)),c}getSharedOptions(t){if(t.$shared)return this._sharedOptions||(this._sharedOptions=Object.assign({},t))}includeOptions(t,n){return!n||yo(t)||this.chart._animationsDisabled}_getSharedOptions(t,n){const i=this.resolveDataElementOptions(t,n),s=this._sharedOptions,o=this.getSharedOptions(i),r=this.includeOptions(n,o)||o!==s;return this.updateSharedOptions(o,n,i),{sharedOptions:o,includeOptions:r}}updateElement(t,n,i,s){yo(s)?Object.assign(t,i):this._resolveAnimations(n,s).update(t,i)}updateSharedOptions(t,n,i){t&&!yo(n)&&this._resolveAnimations(void 0,n).update(t,i)}_setStyle(t,n,i,s){t.active=s;const o=this.getStyle(n,s);this._resolveAnimations(n,i,s).update(t,{options:!s&&this.getSharedOptions(o)||o})}removeHoverStyle(t,n,i){this._setStyle(t,i,"active",!1)}setHoverStyle(t,n,i){this._setStyle(t,i,"active",!0)}_removeDatasetHoverStyle(){const t=this._cachedMeta.dataset;t&&this._setStyle(t,void 0,"active",!1)}_setDatasetHoverStyle(){const t=this._cachedMeta.dataset;t&&this._setStyle(t,void 0,"active",!0)}_resyncElements(t){const n=this._data,i=this._cachedMeta.data;for(const[a,l,c]of this._syncList)this[a](l,c);this._syncList=[];const s=i.length,o=n.length,r=Math.min(o,s);r&&this.parse(0,r),o>s?this._insertElements(s,o-s,t):o<s&&this._removeElements(o,s-o)}_insertElements(t,n,i=!0){const s=this._cachedMeta,o=s.data,r=t+n;let a;const l=c=>{for(c.length+=n,a=c.length-1;a>=r;a--)c[a]=c[a-n]};for(l(o),a=t;a<r;++a)o[a]=new this.dataElementType;this._parsing&&l(s._parsed),this.parse(t,n),i&&this.updateElements(o,t,n,"reset")}updateElements(t,n,i,s){}_removeElements(t,n){const i=this._cachedMeta;if(this._parsing){const s=i._parsed.splice(t,n);i._stacked&&ti(i,s)}i.data.splice(t,n)}_sync(t){if(this._parsing)this._syncList.push(t);else{const[n,i,s]=t;this[n](i,s)}this.chart._dataChanges.push([this.index,...t])}_onDataPush(){const t=arguments.length;this._sync(["_insertElements",this.getDataset().data.length-t,t])}_onDataPop(){this._sync(["_removeElements",this._cachedMeta.data.length-1,1])}_onDataShift(){this._sync(["_removeElements",0,1])}_onDataSplice(t,n){n&&this._sync(["_removeElements",t,n]);const i=arguments.length-2;i&&this._sync(["_insertElements",t,i])}_onDataUnshift(){this._sync(["_insertElements",0,arguments.length])}}function lb(e,t){if(!e._cache.$bar){const n=e.getMatchingVisibleMetas(t);let i=[];for(let s=0,o=n.length;s<o;s++)i=i.concat(n[s].controller.getAllParsedValues(e));e._cache.$bar=Ru(i.sort((s,o)=>s-o))}return e._cache.$bar}function cb(e){const t=e.iScale,n=lb(t,e.type);let i=t._length,s,o,r,a;const l=()=>{r===32767||r===-32768||(Di(a)&&(i=Math.min(i,Math.abs(r-a)||i)),a=r)};for(s=0,o=n.length;s<o;++s)r=t.getPixelForValue(n[s]),l();for(a=void 0,s=0,o=t.ticks.length;s<o;++s)r=t.getPixelForTick(s),l();return i}function ub(e,t,n,i){const s=n.barThickness;let o,r;return it(s)?(o=t.min*n.categoryPercentage,r=n.barPercentage):(o=s*i,r=1),{chunk:o/i,ratio:r,start:t.pixels[e]-o/2}}function hb(e,t,n,i){const s=t.pixels,o=s[e];let r=e>0?s[e-1]:null,a=e<s.length-1?s[e+1]:null;const l=n.categoryPercentage;r===null&&(r=o-(a===null?t.end-t.start:a-o)),a===null&&(a=o+o-r);const c=o-(o-Math.min(r,a))/2*l;return{chunk:Math.abs(a-r)/2*l/i,ratio:n.barPercentage,start:c}}function fb(e,t,n,i){const s=n.parse(e[0],i),o=n.parse(e[1],i),r=Math.min(s,o),a=Math.max(s,o);let l=r,c=a;Math.abs(r)>Math.abs(a)&&(l=a,c=r),t[n.axis]=c,t._custom={barStart:l,barEnd:c,start:s,end:o,min:r,max:a}}function eh(e,t,n,i){return Mt(e)?fb(e,t,n,i):t[n.axis]=n.parse(e,i),t}function ll(e,t,n,i){const s=e.iScale,o=e.vScale,r=s.getLabels(),a=s===o,l=[];let c,u,h,f;for(c=n,u=n+i;c<u;++c)f=t[c],h={},h[s.axis]=a||s.parse(r[c],c),l.push(eh(f,h,o,c));return l}function xo(e){return e&&e.barStart!==void 0&&e.barEnd!==void 0}function db(e,t,n){return e!==0?Pe(e):(t.isHorizontal()?1:-1)*(t.min>=n?1:-1)}function pb(e){let t,n,i,s,o;return e.horizontal?(t=e.base>e.x,n="left",i="right"):(t=e.base<e.y,n="bottom",i="top"),t?(s="end",o="start"):(s="start",o="end"),{start:n,end:i,reverse:t,top:s,bottom:o}}function gb(e,t,n,i){let s=t.borderSkipped;const o={};if(!s){e.borderSkipped=o;return}if(s===!0){e.borderSkipped={top:!0,right:!0,bottom:!0,left:!0};return}const{start:r,end:a,reverse:l,top:c,bottom:u}=pb(e);s==="middle"&&n&&(e.enableBorderRadius=!0,(n._top||0)===i?s=c:(n._bottom||0)===i?s=u:(o[cl(u,r,a,l)]=!0,s=c)),o[cl(s,r,a,l)]=!0,e.borderSkipped=o}function cl(e,t,n,i){return i?(e=mb(e,t,n),e=ul(e,n,t)):e=ul(e,t,n),e}function mb(e,t,n){return e===t?n:e===n?t:e}function ul(e,t,n){return e==="start"?t:e==="end"?n:e}function bb(e,{inflateAmount:t},n){e.inflateAmount=t==="auto"?n===1?.33:0:t}class _b extends cn{static id="bar";static defaults={datasetElementType:!1,dataElementType:"bar",categoryPercentage:.8,barPercentage:.9,grouped:!0,animations:{numbers:{type:"number",properties:["x","y","base","width","height"]}}};static overrides={scales:{_index_:{type:"category",offset:!0,grid:{offset:!0}},_value_:{type:"linear",beginAtZero:!0}}};parsePrimitiveData(t,n,i,s){return ll(t,n,i,s)}parseArrayData(t,n,i,s){return ll(t,n,i,s)}parseObjectData(t,n,i,s){const{iScale:o,vScale:r}=t,{xAxisKey:a="x",yAxisKey:l="y"}=this._parsing,c=o.axis==="x"?a:l,u=r.axis==="x"?a:l,h=[];let f,d,g,p;for(f=i,d=i+s;f<d;++f)p=n[f],g={},g[o.axis]=o.parse(on(p,c),f),h.push(eh(on(p,u),g,r,f));return h}updateRangeFromParsed(t,n,i,s){super.updateRangeFromParsed(t,n,i,s);const o=i._custom;o&&n===this._cachedMeta.vScale&&(t.min=Math.min(t.min,o.min),t.max=Math.max(t.max,o.max))}getMaxOverflow(){return 0}getLabelAndValue(t){const n=this._cachedMeta,{iScale:i,vScale:s}=n,o=this.getParsed(t),r=o._custom,a=xo(r)?"["+r.start+", "+r.end+"]":""+s.getLabelForValue(o[s.axis]);return{label:""+i.getLabelForValue(o[i.axis]),value:a}}initialize(){this.enableOptionSharing=!0,super.initialize();const t=this._cachedMeta;t.stack=this.getDataset().stack}update(t){const n=this._cachedMeta;this.updateElements(n.data,0,n.data.length,t)}updateElements(t,n,i,s){const o=s==="reset",{index:r,_cachedMeta:{vScale:a}}=this,l=a.getBasePixel(),c=a.isHorizontal(),u=this._getRuler(),{sharedOptions:h,includeOptions:f}=this._getSharedOptions(n,s);for(let d=n;d<n+i;d++){const g=this.getParsed(d),p=o||it(g[a.axis])?{base:l,head:l}:this._calculateBarValuePixels(d),b=this._calculateBarIndexPixels(d,u),y=(g._stacks||{})[a.axis],_={horizontal:c,base:p.base,enableBorderRadius:!y||xo(g._custom)||r===y._top||r===y._bottom,x:c?p.head:b.center,y:c?b.center:p.head,height:c?b.size:Math.abs(p.size),width:c?Math.abs(p.size):b.size};f&&(_.options=h||this.resolveDataElementOptions(d,t[d].active?"active":s));const M=_.options||t[d].options;gb(_,M,y,r),bb(_,M,u.ratio),this.updateElement(t[d],d,_,s)}}_getStacks(t,n){const{iScale:i}=this._cachedMeta,s=i.getMatchingVisibleMetas(this._type).filter(u=>u.controller.options.grouped),o=i.options.stacked,r=[],a=this._cachedMeta.controller.getParsed(n),l=a&&a[i.axis],c=u=>{const h=u._parsed.find(d=>d[i.axis]===l),f=h&&h[u.vScale.axis];if(it(f)||isNaN(f))return!0};for(const u of s)if(!(n!==void 0&&c(u))&&((o===!1||r.indexOf(u.stack)===-1||o===void 0&&u.stack===void 0)&&r.push(u.stack),u.index===t))break;return r.length||r.push(void 0),r}_getStackCount(t){return this._getStacks(void 0,t).length}_getAxisCount(){return this._getAxis().length}getFirstScaleIdForIndexAxis(){const t=this.chart.scales,n=this.chart.options.indexAxis;return Object.keys(t).filter(i=>t[i].axis===n).shift()}_getAxis(){const t={},n=this.getFirstScaleIdForIndexAxis();for(const i of this.chart.data.datasets)t[tt(this.chart.options.indexAxis==="x"?i.xAxisID:i.yAxisID,n)]=!0;return Object.keys(t)}_getStackIndex(t,n,i){const s=this._getStacks(t,i),o=n!==void 0?s.indexOf(n):-1;return o===-1?s.length-1:o}_getRuler(){const t=this.options,n=this._cachedMeta,i=n.iScale,s=[];let o,r;for(o=0,r=n.data.length;o<r;++o)s.push(i.getPixelForValue(this.getParsed(o)[i.axis],o));const a=t.barThickness;return{min:a||cb(n),pixels:s,start:i._startPixel,end:i._endPixel,stackCount:this._getStackCount(),scale:i,grouped:t.grouped,ratio:a?1:t.categoryPercentage*t.barPercentage}}_calculateBarValuePixels(t){const{_cachedMeta:{vScale:n,_stacked:i,index:s},options:{base:o,minBarLength:r}}=this,a=o||0,l=this.getParsed(t),c=l._custom,u=xo(c);let h=l[n.axis],f=0,d=i?this.applyStack(n,l,i):h,g,p;d!==h&&(f=d-h,d=h),u&&(h=c.barStart,d=c.barEnd-c.barStart,h!==0&&Pe(h)!==Pe(c.barEnd)&&(f=0),f+=h);const b=!it(o)&&!u?o:f;let y=n.getPixelForValue(b);if(this.chart.getDataVisibility(t)?g=n.getPixelForValue(f+d):g=y,p=g-y,Math.abs(p)<r){p=db(p,n,a)*r,h===a&&(y-=p/2);const _=n.getPixelForDecimal(0),M=n.getPixelForDecimal(1),v=Math.min(_,M),S=Math.max(_,M);y=Math.max(Math.min(y,S),v),g=y+p,i&&!u&&(l._stacks[n.axis]._visualValues[s]=n.getValueForPixel(g)-n.getValueForPixel(y))}if(y===n.getPixelForValue(a)){const _=Pe(p)*n.getLineWidthForValue(a)/2;y+=_,p-=_}return{size:p,base:y,head:g,center:g+p/2}}_calculateBarIndexPixels(t,n){const i=n.scale,s=this.options,o=s.skipNull,r=tt(s.maxBarThickness,1/0);let a,l;const c=this._getAxisCount();if(n.grouped){const u=o?this._getStackCount(t):n.stackCount,h=s.barThickness==="flex"?hb(t,n,s,u*c):ub(t,n,s,u*c),f=this.chart.options.indexAxis==="x"?this.getDataset().xAxisID:this.getDataset().yAxisID,d=this._getAxis().indexOf(tt(f,this.getFirstScaleIdForIndexAxis())),g=this._getStackIndex(this.index,this._cachedMeta.stack,o?t:void 0)+d;a=h.start+h.chunk*g+h.chunk/2,l=Math.min(r,h.chunk*h.ratio)}else a=i.getPixelForValue(this.getParsed(t)[i.axis],t),l=Math.min(r,n.min*n.ratio);return{base:a-l/2,head:a+l/2,center:a,size:l}}draw(){const t=this._cachedMeta,n=t.vScale,i=t.data,s=i.length;let o=0;for(;o<s;++o)this.getParsed(o)[n.axis]!==null&&!i[o].hidden&&i[o].draw(this._ctx)}}class yb extends cn{static id="bubble";static defaults={datasetElementType:!1,dataElementType:"point",animations:{numbers:{type:"number",properties:["x","y","borderWidth","radius"]}}};static overrides={scales:{x:{type:"linear"},y:{type:"linear"}}};initialize(){this.enableOptionSharing=!0,super.initialize()}parsePrimitiveData(t,n,i,s){const o=super.parsePrimitiveData(t,n,i,s);for(let r=0;r<o.length;r++)o[r]._custom=this.resolveDataElementOptions(r+i).radius;return o}parseArrayData(t,n,i,s){const o=super.parseArrayData(t,n,i,s);for(let r=0;r<o.length;r++){const a=n[i+r];o[r]._custom=tt(a[2],this.resolveDataElementOptions(r+i).radius)}return o}parseObjectData(t,n,i,s){const o=super.parseObjectData(t,n,i,s);for(let r=0;r<o.length;r++){const a=n[i+r];o[r]._custom=tt(a&&a.r&&+a.r,this.resolveDataElementOptions(r+i).radius)}return o}getMaxOverflow(){const t=this._cachedMeta.data;let n=0;for(let i=t.length-1;i>=0;--i)n=Math.max(n,t[i].size(this.resolveDataElementOptions(i))/2);return n>0&&n}getLabelAndValue(t){const n=this._cachedMeta,i=this.chart.data.labels||[],{xScale:s,yScale:o}=n,r=this.getParsed(t),a=s.getLabelForValue(r.x),l=o.getLabelForValue(r.y),c=r._custom;return{label:i[t]||"",value:"("+a+", "+l+(c?", "+c:"")+")"}}update(t){const n=this._cachedMeta.data;this.updateElements(n,0,n.length,t)}updateElements(t,n,i,s){const o=s==="reset",{iScale:r,vScale:a}=this._cachedMeta,{sharedOptions:l,includeOptions:c}=this._getSharedOptions(n,s),u=r.axis,h=a.axis;for(let f=n;f<n+i;f++){const d=t[f],g=!o&&this.getParsed(f),p={},b=p[u]=o?r.getPixelForDecimal(.5):r.getPixelForValue(g[u]),y=p[h]=o?a.getBasePixel():a.getPixelForValue(g[h]);p.skip=isNaN(b)||isNaN(y),c&&(p.options=l||this.resolveDataElementOptions(f,d.active?"active":s),o&&(p.options.radius=0)),this.updateElement(d,f,p,s)}}resolveDataElementOptions(t,n){const i=this.getParsed(t);let s=super.resolveDataElementOptions(t,n);s.$shared&&(s=Object.assign({},s,{$shared:!1}));const o=s.radius;return n!=="active"&&(s.radius=0),s.radius+=tt(i&&i._custom,o),s}}function xb(e,t,n){let i=1,s=1,o=0,r=0;if(t<St){const a=e,l=a+t,c=Math.cos(a),u=Math.sin(a),h=Math.cos(l),f=Math.sin(l),d=(M,v,S)=>Ei(M,a,l,!0)?1:Math.max(v,v*n,S,S*n),g=(M,v,S)=>Ei(M,a,l,!0)?-1:Math.min(v,v*n,S,S*n),p=d(0,c,h),b=d(Ot,u,f),y=g(ct,c,h),_=g(ct+Ot,u,f);i=(p-y)/2,s=(b-_)/2,o=-(p+y)/2,r=-(b+_)/2}return{ratioX:i,ratioY:s,offsetX:o,offsetY:r}}class Fr extends cn{static id="doughnut";static defaults={datasetElementType:!1,dataElementType:"arc",animation:{animateRotate:!0,animateScale:!1},animations:{numbers:{type:"number",properties:["circumference","endAngle","innerRadius","outerRadius","startAngle","x","y","offset","borderWidth","spacing"]}},cutout:"50%",rotation:0,circumference:360,radius:"100%",spacing:0,indexAxis:"r"};static descriptors={_scriptable:t=>t!=="spacing",_indexable:t=>t!=="spacing"&&!t.startsWith("borderDash")&&!t.startsWith("hoverBorderDash")};static overrides={aspectRatio:1,plugins:{legend:{labels:{generateLabels(t){const n=t.data,{labels:{pointStyle:i,textAlign:s,color:o,useBorderRadius:r,borderRadius:a}}=t.legend.options;return n.labels.length&&n.datasets.length?n.labels.map((l,c)=>{const h=t.getDatasetMeta(0).controller.getStyle(c);return{text:l,fillStyle:h.backgroundColor,fontColor:o,hidden:!t.getDataVisibility(c),lineDash:h.borderDash,lineDashOffset:h.borderDashOffset,lineJoin:h.borderJoinStyle,lineWidth:h.borderWidth,strokeStyle:h.borderColor,textAlign:s,pointStyle:i,borderRadius:r&&(a||h.borderRadius),index:c}}):[]}},onClick(t,n,i){i.chart.toggleDataVisibility(n.index),i.chart.update()}}}};constructor(t,n){super(t,n),this.enableOptionSharing=!0,this.innerRadius=void 0,this.outerRadius=void 0,this.offsetX=void 0,this.offsetY=void 0}linkScales(){}parse(t,n){const i=this.getDataset().data,s=this._cachedMeta;if(this._parsing===!1)s._parsed=i;else{let o=l=>+i[l];if(st(i[t])){const{key:l="value"}=this._parsing;o=c=>+on(i[c],l)}let r,a;for(r=t,a=t+n;r<a;++r)s._parsed[r]=o(r)}}_getRotation(){return de(this.options.rotation-90)}_getCircumference(){return de(this.options.circumference)}_getRotationExtents(){let t=St,n=-St;for(let i=0;i<this.chart.data.datasets.length;++i)if(this.chart.isDatasetVisible(i)&&this.chart.getDatasetMeta(i).type===this._type){const s=this.chart.getDatasetMeta(i).controller,o=s._getRotation(),r=s._getCircumference();t=Math.min(t,o),n=Math.max(n,o+r)}return{rotation:t,circumference:n-t}}update(t){const n=this.chart,{chartArea:i}=n,s=this._cachedMeta,o=s.data,r=this.getMaxBorderWidth()+this.getMaxOffset(o)+this.options.spacing,a=Math.max((Math.min(i.width,i.height)-r)/2,0),l=Math.min(Dg(this.options.cutout,a),1),c=this._getRingWeight(this.index),{circumference:u,rotation:h}=this._getRotationExtents(),{ratioX:f,ratioY:d,offsetX:g,offsetY:p}=xb(h,u,l),b=(i.width-r)/f,y=(i.height-r)/d,_=Math.max(Math.min(b,y)/2,0),M=ku(this.options.radius,_),v=Math.max(M*l,0),S=(M-v)/this._getVisibleDatasetWeightTotal();this.offsetX=g*M,this.offsetY=p*M,s.total=this.calculateTotal(),this.outerRadius=M-S*this._getRingWeightOffset(this.index),this.innerRadius=Math.max(this.outerRadius-S*c,0),this.updateElements(o,0,o.length,t)}_circumference(t,n){const i=this.options,s=this._cachedMeta,o=this._getCircumference();return n&&i.animation.animateRotate||!this.chart.getDataVisibility(t)||s._parsed[t]===null||s.data[t].hidden?0:this.calculateCircumference(s._parsed[t]*o/St)}updateElements(t,n,i,s){const o=s==="reset",r=this.chart,a=r.chartArea,c=r.options.animation,u=(a.left+a.right)/2,h=(a.top+a.bottom)/2,f=o&&c.animateScale,d=f?0:this.innerRadius,g=f?0:this.outerRadius,{sharedOptions:p,includeOptions:b}=this._getSharedOptions(n,s);let y=this._getRotation(),_;for(_=0;_<n;++_)y+=this._circumference(_,o);for(_=n;_<n+i;++_){const M=this._circumference(_,o),v=t[_],S={x:u+this.offsetX,y:h+this.offsetY,startAngle:y,endAngle:y+M,circumference:M,outerRadius:g,innerRadius:d};b&&(S.options=p||this.resolveDataElementOptions(_,v.active?"active":s)),y+=M,this.updateElement(v,_,S,s)}}calculateTotal(){const t=this._cachedMeta,n=t.data;let i=0,s;for(s=0;s<n.length;s++){const o=t._parsed[s];o!==null&&!isNaN(o)&&this.chart.getDataVisibility(s)&&!n[s].hidden&&(i+=Math.abs(o))}return i}calculateCircumference(t){const n=this._cachedMeta.total;return n>0&&!isNaN(t)?St*(Math.abs(t)/n):0}getLabelAndValue(t){const n=this._cachedMeta,i=this.chart,s=i.data.labels||[],o=Vi(n._parsed[t],i.options.locale);return{label:s[t]||"",value:o}}getMaxBorderWidth(t){let n=0;const i=this.chart;let s,o,r,a,l;if(!t){for(s=0,o=i.data.datasets.length;s<o;++s)if(i.isDatasetVisible(s)){r=i.getDatasetMeta(s),t=r.data,a=r.controller;break}}if(!t)return 0;for(s=0,o=t.length;s<o;++s)l=a.resolveDataElementOptions(s),l.borderAlign!=="inner"&&(n=Math.max(n,l.borderWidth||0,l.hoverBorderWidth||0));return n}getMaxOffset(t){let n=0;for(let i=0,s=t.length;i<s;++i){const o=this.resolveDataElementOptions(i);n=Math.max(n,o.offset||0,o.hoverOffset||0)}return n}_getRingWeightOffset(t){let n=0;for(let i=0;i<t;++i)this.chart.isDatasetVisible(i)&&(n+=this._getRingWeight(i));return n}_getRingWeight(t){return Math.max(tt(this.chart.data.datasets[t].weight,1),0)}_getVisibleDatasetWeightTotal(){return this._getRingWeightOffset(this.chart.data.datasets.length)||1}}class vb extends cn{static id="line";static defaults={datasetElementType:"line",dataElementType:"point",showLine:!0,spanGaps:!1};static overrides={scales:{_index_:{type:"category"},_value_:{type:"linear"}}};initialize(){this.enableOptionSharing=!0,this.supportsDecimation=!0,super.initialize()}update(t){const n=this._cachedMeta,{dataset:i,data:s=[],_dataset:o}=n,r=this.chart._animationsDisabled;let{start:a,count:l}=Fu(n,s,r);this._drawStart=a,this._drawCount=l,Nu(n)&&(a=0,l=s.length),i._chart=this.chart,i._datasetIndex=this.index,i._decimated=!!o._decimated,i.points=s;const c=this.resolveDatasetElementOptions(t);this.options.showLine||(c.borderWidth=0),c.segment=this.options.segment,this.updateElement(i,void 0,{animated:!r,options:c},t),this.updateElements(s,a,l,t)}updateElements(t,n,i,s){const o=s==="reset",{iScale:r,vScale:a,_stacked:l,_dataset:c}=this._cachedMeta,{sharedOptions:u,includeOptions:h}=this._getSharedOptions(n,s),f=r.axis,d=a.axis,{spanGaps:g,segment:p}=this.options,b=Un(g)?g:Number.POSITIVE_INFINITY,y=this.chart._animationsDisabled||o||s==="none",_=n+i,M=t.length;let v=n>0&&this.getParsed(n-1);for(let S=0;S<M;++S){const E=t[S],O=y?E:{};if(S<n||S>=_){O.skip=!0;continue}const I=this.getParsed(S),j=it(I[d]),U=O[f]=r.getPixelForValue(I[f],S),X=O[d]=o||j?a.getBasePixel():a.getPixelForValue(l?this.applyStack(a,I,l):I[d],S);O.skip=isNaN(U)||isNaN(X)||j,O.stop=S>0&&Math.abs(I[f]-v[f])>b,p&&(O.parsed=I,O.raw=c.data[S]),h&&(O.options=u||this.resolveDataElementOptions(S,E.active?"active":s)),y||this.updateElement(E,S,O,s),v=I}}getMaxOverflow(){const t=this._cachedMeta,n=t.dataset,i=n.options&&n.options.borderWidth||0,s=t.data||[];if(!s.length)return i;const o=s[0].size(this.resolveDataElementOptions(0)),r=s[s.length-1].size(this.resolveDataElementOptions(s.length-1));return Math.max(i,o,r)/2}draw(){const t=this._cachedMeta;t.dataset.updateControlPoints(this.chart.chartArea,t.iScale.axis),super.draw()}}class nh extends cn{static id="polarArea";static defaults={dataElementType:"arc",animation:{animateRotate:!0,animateScale:!0},animations:{numbers:{type:"number",properties:["x","y","startAngle","endAngle","innerRadius","outerRadius"]}},indexAxis:"r",startAngle:0};static overrides={aspectRatio:1,plugins:{legend:{labels:{generateLabels(t){const n=t.data;if(n.labels.length&&n.datasets.length){const{labels:{pointStyle:i,color:s}}=t.legend.options;return n.labels.map((o,r)=>{const l=t.getDatasetMeta(0).controller.getStyle(r);return{text:o,fillStyle:l.backgroundColor,strokeStyle:l.borderColor,fontColor:s,lineWidth:l.borderWidth,pointStyle:i,hidden:!t.getDataVisibility(r),index:r}})}return[]}},onClick(t,n,i){i.chart.toggleDataVisibility(n.index),i.chart.update()}}},scales:{r:{type:"radialLinear",angleLines:{display:!1},beginAtZero:!0,grid:{circular:!0},pointLabels:{display:!1},startAngle:0}}};constructor(t,n){super(t,n),this.innerRadius=void 0,this.outerRadius=void 0}getLabelAndValue(t){const n=this._cachedMeta,i=this.chart,s=i.data.labels||[],o=Vi(n._parsed[t].r,i.options.locale);return{label:s[t]||"",value:o}}parseObjectData(t,n,i,s){return Uu.bind(this)(t,n,i,s)}update(t){const n=this._cachedMeta.data;this._updateRadius(),this.updateElements(n,0,n.length,t)}getMinMax(){const t=this._cachedMeta,n={min:Number.POSITIVE_INFINITY,max:Number.NEGATIVE_INFINITY};return t.data.forEach((i,s)=>{const o=this.getParsed(s).r;!isNaN(o)&&this.chart.getDataVisibility(s)&&(o<n.min&&(n.min=o),o>n.max&&(n.max=o))}),n}_updateRadius(){const t=this.chart,n=t.chartArea,i=t.options,s=Math.min(n.right-n.left,n.bottom-n.top),o=Math.max(s/2,0),r=Math.max(i.cutoutPercentage?o/100*i.cutoutPercentage:1,0),a=(o-r)/t.getVisibleDatasetCount();this.outerRadius=o-a*this.index,this.innerRadius=this.outerRadius-a}updateElements(t,n,i,s){const o=s==="reset",r=this.chart,l=r.options.animation,c=this._cachedMeta.rScale,u=c.xCenter,h=c.yCenter,f=c.getIndexAngle(0)-.5*ct;let d=f,g;const p=360/this.countVisibleElements();for(g=0;g<n;++g)d+=this._computeAngle(g,s,p);for(g=n;g<n+i;g++){const b=t[g];let y=d,_=d+this._computeAngle(g,s,p),M=r.getDataVisibility(g)?c.getDistanceFromCenterForValue(this.getParsed(g).r):0;d=_,o&&(l.animateScale&&(M=0),l.animateRotate&&(y=_=f));const v={x:u,y:h,innerRadius:0,outerRadius:M,startAngle:y,endAngle:_,options:this.resolveDataElementOptions(g,b.active?"active":s)};this.updateElement(b,g,v,s)}}countVisibleElements(){const t=this._cachedMeta;let n=0;return t.data.forEach((i,s)=>{!isNaN(this.getParsed(s).r)&&this.chart.getDataVisibility(s)&&n++}),n}_computeAngle(t,n,i){return this.chart.getDataVisibility(t)?de(this.resolveDataElementOptions(t,n).angle||i):0}}class wb extends Fr{static id="pie";static defaults={cutout:0,rotation:0,circumference:360,radius:"100%"}}class Sb extends cn{static id="radar";static defaults={datasetElementType:"line",dataElementType:"point",indexAxis:"r",showLine:!0,elements:{line:{fill:"start"}}};static overrides={aspectRatio:1,scales:{r:{type:"radialLinear"}}};getLabelAndValue(t){const n=this._cachedMeta.vScale,i=this.getParsed(t);return{label:n.getLabels()[t],value:""+n.getLabelForValue(i[n.axis])}}parseObjectData(t,n,i,s){return Uu.bind(this)(t,n,i,s)}update(t){const n=this._cachedMeta,i=n.dataset,s=n.data||[],o=n.iScale.getLabels();if(i.points=s,t!=="resize"){const r=this.resolveDatasetElementOptions(t);this.options.showLine||(r.borderWidth=0);const a={_loop:!0,_fullLoop:o.length===s.length,options:r};this.updateElement(i,void 0,a,t)}this.updateElements(s,0,s.length,t)}updateElements(t,n,i,s){const o=this._cachedMeta.rScale,r=s==="reset";for(let a=n;a<n+i;a++){const l=t[a],c=this.resolveDataElementOptions(a,l.active?"active":s),u=o.getPointPositionForValue(a,this.getParsed(a).r),h=r?o.xCenter:u.x,f=r?o.yCenter:u.y,d={x:h,y:f,angle:u.angle,skip:isNaN(h)||isNaN(f),options:c};this.updateElement(l,a,d,s)}}}class Mb extends cn{static id="scatter";static defaults={datasetElementType:!1,dataElementType:"point",showLine:!1,fill:!1};static overrides={interaction:{mode:"point"},scales:{x:{type:"linear"},y:{type:"linear"}}};getLabelAndValue(t){const n=this._cachedMeta,i=this.chart.data.labels||[],{xScale:s,yScale:o}=n,r=this.getParsed(t),a=s.getLabelForValue(r.x),l=o.getLabelForValue(r.y);return{label:i[t]||"",value:"("+a+", "+l+")"}}update(t){const n=this._cachedMeta,{data:i=[]}=n,s=this.chart._animationsDisabled;let{start:o,count:r}=Fu(n,i,s);if(this._drawStart=o,this._drawCount=r,Nu(n)&&(o=0,r=i.length),this.options.showLine){this.datasetElementType||this.addElements();const{dataset:a,_dataset:l}=n;a._chart=this.chart,a._datasetIndex=this.index,a._decimated=!!l._decimated,a.points=i;const c=this.resolveDatasetElementOptions(t);c.segment=this.options.segment,this.updateElement(a,void 0,{animated:!s,options:c},t)}else this.datasetElementType&&(delete n.dataset,this.datasetElementType=!1);this.updateElements(i,o,r,t)}addElements(){const{showLine:t}=this.options;!this.datasetElementType&&t&&(this.datasetElementType=this.chart.registry.getElement("line")),super.addElements()}updateElements(t,n,i,s){const o=s==="reset",{iScale:r,vScale:a,_stacked:l,_dataset:c}=this._cachedMeta,u=this.resolveDataElementOptions(n,s),h=this.getSharedOptions(u),f=this.includeOptions(s,h),d=r.axis,g=a.axis,{spanGaps:p,segment:b}=this.options,y=Un(p)?p:Number.POSITIVE_INFINITY,_=this.chart._animationsDisabled||o||s==="none";let M=n>0&&this.getParsed(n-1);for(let v=n;v<n+i;++v){const S=t[v],E=this.getParsed(v),O=_?S:{},I=it(E[g]),j=O[d]=r.getPixelForValue(E[d],v),U=O[g]=o||I?a.getBasePixel():a.getPixelForValue(l?this.applyStack(a,E,l):E[g],v);O.skip=isNaN(j)||isNaN(U)||I,O.stop=v>0&&Math.abs(E[d]-M[d])>y,b&&(O.parsed=E,O.raw=c.data[v]),f&&(O.options=h||this.resolveDataElementOptions(v,S.active?"active":s)),_||this.updateElement(S,v,O,s),M=E}this.updateSharedOptions(h,s,u)}getMaxOverflow(){const t=this._cachedMeta,n=t.data||[];if(!this.options.showLine){let a=0;for(let l=n.length-1;l>=0;--l)a=Math.max(a,n[l].size(this.resolveDataElementOptions(l))/2);return a>0&&a}const i=t.dataset,s=i.options&&i.options.borderWidth||0;if(!n.length)return s;const o=n[0].size(this.resolveDataElementOptions(0)),r=n[n.length-1].size(this.resolveDataElementOptions(n.length-1));return Math.max(s,o,r)/2}}var Cb=Object.freeze({__proto__:null,BarController:_b,BubbleController:yb,DoughnutController:Fr,LineController:vb,PieController:wb,PolarAreaController:nh,RadarController:Sb,ScatterController:Mb});function gn(){throw new Error("This method is not implemented: Check that a complete date adapter is provided.")}class Nr{static override(t){Object.assign(Nr.prototype,t)}options;constructor(t){this.options=t||{}}init(){}formats(){return gn()}parse(){return gn()}format(){return gn()}add(){return gn()}diff(){return gn()}startOf(){return gn()}endOf(){return gn()}}var Pb={_date:Nr};function Ab(e,t,n,i){const{controller:s,data:o,_sorted:r}=e,a=s._cachedMeta.iScale,l=e.dataset&&e.dataset.options?e.dataset.options.spanGaps:null;if(a&&t===a.axis&&t!=="r"&&r&&o.length){const c=a._reversePixels?jg:Ve;if(i){if(s._sharedOptions){const u=o[0],h=typeof u.getRange=="function"&&u.getRange(t);if(h){const f=c(o,t,n-h),d=c(o,t,n+h);return{lo:f.lo,hi:d.hi}}}}else{const u=c(o,t,n);if(l){const{vScale:h}=s._cachedMeta,{_parsed:f}=e,d=f.slice(0,u.lo+1).reverse().findIndex(p=>!it(p[h.axis]));u.lo-=Math.max(0,d);const g=f.slice(u.hi).findIndex(p=>!it(p[h.axis]));u.hi+=Math.max(0,g)}return u}}return{lo:0,hi:o.length-1}}function Xs(e,t,n,i,s){const o=e.getSortedVisibleDatasetMetas(),r=n[t];for(let a=0,l=o.length;a<l;++a){const{index:c,data:u}=o[a],{lo:h,hi:f}=Ab(o[a],t,r,s);for(let d=h;d<=f;++d){const g=u[d];g.skip||i(g,c,d)}}}function kb(e){const t=e.indexOf("x")!==-1,n=e.indexOf("y")!==-1;return function(i,s){const o=t?Math.abs(i.x-s.x):0,r=n?Math.abs(i.y-s.y):0;return Math.sqrt(Math.pow(o,2)+Math.pow(r,2))}}function vo(e,t,n,i,s){const o=[];return!s&&!e.isPointInArea(t)||Xs(e,n,t,function(a,l,c){!s&&!ze(a,e.chartArea,0)||a.inRange(t.x,t.y,i)&&o.push({element:a,datasetIndex:l,index:c})},!0),o}function Ob(e,t,n,i){let s=[];function o(r,a,l){const{startAngle:c,endAngle:u}=r.getProps(["startAngle","endAngle"],i),{angle:h}=Eu(r,{x:t.x,y:t.y});Ei(h,c,u)&&s.push({element:r,datasetIndex:a,index:l})}return Xs(e,n,t,o),s}function Db(e,t,n,i,s,o){let r=[];const a=kb(n);let l=Number.POSITIVE_INFINITY;function c(u,h,f){const d=u.inRange(t.x,t.y,s);if(i&&!d)return;const g=u.getCenterPoint(s);if(!(!!o||e.isPointInArea(g))&&!d)return;const b=a(t,g);b<l?(r=[{element:u,datasetIndex:h,index:f}],l=b):b===l&&r.push({element:u,datasetIndex:h,index:f})}return Xs(e,n,t,c),r}function wo(e,t,n,i,s,o){return!o&&!e.isPointInArea(t)?[]:n==="r"&&!i?Ob(e,t,n,s):Db(e,t,n,i,s,o)}function hl(e,t,n,i,s){const o=[],r=n==="x"?"inXRange":"inYRange";let a=!1;return Xs(e,n,t,(l,c,u)=>{l[r]&&l[r](t[n],s)&&(o.push({element:l,datasetIndex:c,index:u}),a=a||l.inRange(t.x,t.y,s))}),i&&!a?[]:o}var Eb={modes:{index(e,t,n,i){const s=_n(t,e),o=n.axis||"x",r=n.includeInvisible||!1,a=n.intersect?vo(e,s,o,i,r):wo(e,s,o,!1,i,r),l=[];return a.length?(e.getSortedVisibleDatasetMetas().forEach(c=>{const u=a[0].index,h=c.data[u];h&&!h.skip&&l.push({element:h,datasetIndex:c.index,index:u})}),l):[]},dataset(e,t,n,i){const s=_n(t,e),o=n.axis||"xy",r=n.includeInvisible||!1;let a=n.intersect?vo(e,s,o,i,r):wo(e,s,o,!1,i,r);if(a.length>0){const l=a[0].datasetIndex,c=e.getDatasetMeta(l).data;a=[];for(let u=0;u<c.length;++u)a.push({element:c[u],datasetIndex:l,index:u})}return a},point(e,t,n,i){const s=_n(t,e),o=n.axis||"xy",r=n.includeInvisible||!1;return vo(e,s,o,i,r)},nearest(e,t,n,i){const s=_n(t,e),o=n.axis||"xy",r=n.includeInvisible||!1;return wo(e,s,o,n.intersect,i,r)},x(e,t,n,i){const s=_n(t,e);return hl(e,s,"x",n.intersect,i)},y(e,t,n,i){const s=_n(t,e);return hl(e,s,"y",n.intersect,i)}}};const ih=["left","top","right","bottom"];function ei(e,t){return e.filter(n=>n.pos===t)}function fl(e,t){return e.filter(n=>ih.indexOf(n.pos)===-1&&n.box.axis===t)}function ni(e,t){return e.sort((n,i)=>{const s=t?i:n,o=t?n:i;return s.weight===o.weight?s.index-o.index:s.weight-o.weight})}function Tb(e){const t=[];let n,i,s,o,r,a;for(n=0,i=(e||[]).length;n<i;++n)s=e[n],{position:o,options:{stack:r,stackWeight:a=1}}=s,t.push({index:n,box:s,pos:o,horizontal:s.isHorizontal(),weight:s.weight,stack:r&&o+r,stackWeight:a});return t}function Rb(e){const t={};for(const n of e){const{stack:i,pos:s,stackWeight:o}=n;if(!i||!ih.includes(s))continue;const r=t[i]||(t[i]={count:0,placed:0,weight:0,size:0});r.count++,r.weight+=o}return t}function Ib(e,t){const n=Rb(e),{vBoxMaxWidth:i,hBoxMaxHeight:s}=t;let o,r,a;for(o=0,r=e.length;o<r;++o){a=e[o];const{fullSize:l}=a.box,c=n[a.stack],u=c&&a.stackWeight/c.weight;a.horizontal?(a.width=u?u*i:l&&t.availableWidth,a.height=s):(a.width=i,a.height=u?u*s:l&&t.availableHeight)}return n}function Lb(e){const t=Tb(e),n=ni(t.filter(c=>c.box.fullSize),!0),i=ni(ei(t,"left"),!0),s=ni(ei(t,"right")),o=ni(ei(t,"top"),!0),r=ni(ei(t,"bottom")),a=fl(t,"x"),l=fl(t,"y");return{fullSize:n,leftAndTop:i.concat(o),rightAndBottom:s.concat(l).concat(r).concat(a),chartArea:ei(t,"chartArea"),vertical:i.concat(s).concat(l),horizontal:o.concat(r).concat(a)}}function dl(e,t,n,i){return Math.max(e[n],t[n])+Math.max(e[i],t[i])}function sh(e,t){e.top=Math.max(e.top,t.top),e.left=Math.max(e.left,t.left),e.bottom=Math.max(e.bottom,t.bottom),e.right=Math.max(e.right,t.right)}function Fb(e,t,n,i){const{pos:s,box:o}=n,r=e.maxPadding;if(!st(s)){n.size&&(e[s]-=n.size);const h=i[n.stack]||{size:0,count:1};h.size=Math.max(h.size,n.horizontal?o.height:o.width),n.size=h.size/h.count,e[s]+=n.size}o.getPadding&&sh(r,o.getPadding());const a=Math.max(0,t.outerWidth-dl(r,e,"left","right")),l=Math.max(0,t.outerHeight-dl(r,e,"top","bottom")),c=a!==e.w,u=l!==e.h;return e.w=a,e.h=l,n.horizontal?{same:c,other:u}:{same:u,other:c}}function Nb(e){const t=e.maxPadding;function n(i){const s=Math.max(t[i]-e[i],0);return e[i]+=s,s}e.y+=n("top"),e.x+=n("left"),n("right"),n("bottom")}function Bb(e,t){const n=t.maxPadding;function i(s){const o={left:0,top:0,right:0,bottom:0};return s.forEach(r=>{o[r]=Math.max(t[r],n[r])}),o}return i(e?["left","right"]:["top","bottom"])}function li(e,t,n,i){const s=[];let o,r,a,l,c,u;for(o=0,r=e.length,c=0;o<r;++o){a=e[o],l=a.box,l.update(a.width||t.w,a.height||t.h,Bb(a.horizontal,t));const{same:h,other:f}=Fb(t,n,a,i);c|=h&&s.length,u=u||f,l.fullSize||s.push(a)}return c&&li(s,t,n,i)||u}function qi(e,t,n,i,s){e.top=n,e.left=t,e.right=t+i,e.bottom=n+s,e.width=i,e.height=s}function pl(e,t,n,i){const s=n.padding;let{x:o,y:r}=t;for(const a of e){const l=a.box,c=i[a.stack]||{placed:0,weight:1},u=a.stackWeight/c.weight||1;if(a.horizontal){const h=t.w*u,f=c.size||l.height;Di(c.start)&&(r=c.start),l.fullSize?qi(l,s.left,r,n.outerWidth-s.right-s.left,f):qi(l,t.left+c.placed,r,h,f),c.start=r,c.placed+=h,r=l.bottom}else{const h=t.h*u,f=c.size||l.width;Di(c.start)&&(o=c.start),l.fullSize?qi(l,o,s.top,f,n.outerHeight-s.bottom-s.top):qi(l,o,t.top+c.placed,f,h),c.start=o,c.placed+=h,o=l.right}}t.x=o,t.y=r}var Ht={addBox(e,t){e.boxes||(e.boxes=[]),t.fullSize=t.fullSize||!1,t.position=t.position||"top",t.weight=t.weight||0,t._layers=t._layers||function(){return[{z:0,draw(n){t.draw(n)}}]},e.boxes.push(t)},removeBox(e,t){const n=e.boxes?e.boxes.indexOf(t):-1;n!==-1&&e.boxes.splice(n,1)},configure(e,t,n){t.fullSize=n.fullSize,t.position=n.position,t.weight=n.weight},update(e,t,n,i){if(!e)return;const s=$t(e.options.layout.padding),o=Math.max(t-s.width,0),r=Math.max(n-s.height,0),a=Lb(e.boxes),l=a.vertical,c=a.horizontal;mt(e.boxes,p=>{typeof p.beforeLayout=="function"&&p.beforeLayout()});const u=l.reduce((p,b)=>b.box.options&&b.box.options.display===!1?p:p+1,0)||1,h=Object.freeze({outerWidth:t,outerHeight:n,padding:s,availableWidth:o,availableHeight:r,vBoxMaxWidth:o/2/u,hBoxMaxHeight:r/2}),f=Object.assign({},s);sh(f,$t(i));const d=Object.assign({maxPadding:f,w:o,h:r,x:s.left,y:s.top},s),g=Ib(l.concat(c),h);li(a.fullSize,d,h,g),li(l,d,h,g),li(c,d,h,g)&&li(l,d,h,g),Nb(d),pl(a.leftAndTop,d,h,g),d.x+=d.w,d.y+=d.h,pl(a.rightAndBottom,d,h,g),e.chartArea={left:d.left,top:d.top,right:d.left+d.w,bottom:d.top+d.h,height:d.h,width:d.w},mt(a.chartArea,p=>{const b=p.box;Object.assign(b,e.chartArea),b.update(d.w,d.h,{left:0,top:0,right:0,bottom:0})})}};class oh{acquireContext(t,n){}releaseContext(t){return!1}addEventListener(t,n,i){}removeEventListener(t,n,i){}getDevicePixelRatio(){return 1}getMaximumSize(t,n,i,s){return n=Math.max(0,n||t.width),i=i||t.height,{width:n,height:Math.max(0,s?Math.floor(n/s):i)}}isAttached(t){return!0}updateConfig(t){}}class Vb extends oh{acquireContext(t){return t&&t.getContext&&t.getContext("2d")||null}updateConfig(t){t.options.animation=!1}}const cs="$chartjs",zb={touchstart:"mousedown",touchmove:"mousemove",touchend:"mouseup",pointerenter:"mouseenter",pointerdown:"mousedown",pointermove:"mousemove",pointerup:"mouseup",pointerleave:"mouseout",pointerout:"mouseout"},gl=e=>e===null||e==="";function Hb(e,t){const n=e.style,i=e.getAttribute("height"),s=e.getAttribute("width");if(e[cs]={initial:{height:i,width:s,style:{display:n.display,height:n.height,width:n.width}}},n.display=n.display||"block",n.boxSizing=n.boxSizing||"border-box",gl(s)){const o=Za(e,"width");o!==void 0&&(e.width=o)}if(gl(i))if(e.style.height==="")e.height=e.width/(t||2);else{const o=Za(e,"height");o!==void 0&&(e.height=o)}return e}const rh=Fm?{passive:!0}:!1;function Wb(e,t,n){e&&e.addEventListener(t,n,rh)}function jb(e,t,n){e&&e.canvas&&e.canvas.removeEventListener(t,n,rh)}function $b(e,t){const n=zb[e.type]||e.type,{x:i,y:s}=_n(e,t);return{type:n,chart:t,native:e,x:i!==void 0?i:null,y:s!==void 0?s:null}}function ks(e,t){for(const n of e)if(n===t||n.contains(t))return!0}function Ub(e,t,n){const i=e.canvas,s=new MutationObserver(o=>{let r=!1;for(const a of o)r=r||ks(a.addedNodes,i),r=r&&!ks(a.removedNodes,i);r&&n()});return s.observe(document,{childList:!0,subtree:!0}),s}function Yb(e,t,n){const i=e.canvas,s=new MutationObserver(o=>{let r=!1;for(const a of o)r=r||ks(a.removedNodes,i),r=r&&!ks(a.addedNodes,i);r&&n()});return s.observe(document,{childList:!0,subtree:!0}),s}const Ri=new Map;let ml=0;function ah(){const e=window.devicePixelRatio;e!==ml&&(ml=e,Ri.forEach((t,n)=>{n.currentDevicePixelRatio!==e&&t()}))}function Kb(e,t){Ri.size||window.addEventListener("resize",ah),Ri.set(e,t)}function Gb(e){Ri.delete(e),Ri.size||window.removeEventListener("resize",ah)}function Xb(e,t,n){const i=e.canvas,s=i&&Lr(i);if(!s)return;const o=Lu((a,l)=>{const c=s.clientWidth;n(a,l),c<s.clientWidth&&n()},window),r=new ResizeObserver(a=>{const l=a[0],c=l.contentRect.width,u=l.contentRect.height;c===0&&u===0||o(c,u)});return r.observe(s),Kb(e,o),r}function So(e,t,n){n&&n.disconnect(),t==="resize"&&Gb(e)}function qb(e,t,n){const i=e.canvas,s=Lu(o=>{e.ctx!==null&&n($b(o,e))},e);return Wb(i,t,s),s}class Jb extends oh{acquireContext(t,n){const i=t&&t.getContext&&t.getContext("2d");return i&&i.canvas===t?(Hb(t,n),i):null}releaseContext(t){const n=t.canvas;if(!n[cs])return!1;const i=n[cs].initial;["height","width"].forEach(o=>{const r=i[o];it(r)?n.removeAttribute(o):n.setAttribute(o,r)});const s=i.style||{};return Object.keys(s).forEach(o=>{n.style[o]=s[o]}),n.width=n.width,delete n[cs],!0}addEventListener(t,n,i){this.removeEventListener(t,n);const s=t.$proxies||(t.$proxies={}),r={attach:Ub,detach:Yb,resize:Xb}[n]||qb;s[n]=r(t,n,i)}removeEventListener(t,n){const i=t.$proxies||(t.$proxies={}),s=i[n];if(!s)return;({attach:So,detach:So,resize:So}[n]||jb)(t,n,s),i[n]=void 0}getDevicePixelRatio(){return window.devicePixelRatio}getMaximumSize(t,n,i,s){return Lm(t,n,i,s)}isAttached(t){const n=t&&Lr(t);return!!(n&&n.isConnected)}}function Zb(e){return!Ir()||typeof OffscreenCanvas<"u"&&e instanceof OffscreenCanvas?Vb:Jb}let $e=class{static defaults={};static defaultRoutes=void 0;x;y;active=!1;options;$animations;tooltipPosition(t){const{x:n,y:i}=this.getProps(["x","y"],t);return{x:n,y:i}}hasValue(){return Un(this.x)&&Un(this.y)}getProps(t,n){const i=this.$animations;if(!n||!i)return this;const s={};return t.forEach(o=>{s[o]=i[o]&&i[o].active()?i[o]._to:this[o]}),s}};function Qb(e,t){const n=e.options.ticks,i=t_(e),s=Math.min(n.maxTicksLimit||i,i),o=n.major.enabled?n_(t):[],r=o.length,a=o[0],l=o[r-1],c=[];if(r>s)return i_(t,c,o,r/s),c;const u=e_(o,t,s);if(r>0){let h,f;const d=r>1?Math.round((l-a)/(r-1)):null;for(Ji(t,c,u,it(d)?0:a-d,a),h=0,f=r-1;h<f;h++)Ji(t,c,u,o[h],o[h+1]);return Ji(t,c,u,l,it(d)?t.length:l+d),c}return Ji(t,c,u),c}function t_(e){const t=e.options.offset,n=e._tickSize(),i=e._length/n+(t?0:1),s=e._maxLength/n;return Math.floor(Math.min(i,s))}function e_(e,t,n){const i=s_(e),s=t.length/n;if(!i)return Math.max(s,1);const o=Bg(i);for(let r=0,a=o.length-1;r<a;r++){const l=o[r];if(l>s)return l}return Math.max(s,1)}function n_(e){const t=[];let n,i;for(n=0,i=e.length;n<i;n++)e[n].major&&t.push(n);return t}function i_(e,t,n,i){let s=0,o=n[0],r;for(i=Math.ceil(i),r=0;r<e.length;r++)r===o&&(t.push(e[r]),s++,o=n[s*i])}function Ji(e,t,n,i,s){const o=tt(i,0),r=Math.min(tt(s,e.length),e.length);let a=0,l,c,u;for(n=Math.ceil(n),s&&(l=s-i,n=l/Math.floor(l/n)),u=o;u<0;)a++,u=Math.round(o+a*n);for(c=Math.max(o,0);c<r;c++)c===u&&(t.push(e[c]),a++,u=Math.round(o+a*n))}function s_(e){const t=e.length;let n,i;if(t<2)return!1;for(i=e[0],n=1;n<t;++n)if(e[n]-e[n-1]!==i)return!1;return i}const o_=e=>e==="left"?"right":e==="right"?"left":e,bl=(e,t,n)=>t==="top"||t==="left"?e[t]+n:e[t]-n,_l=(e,t)=>Math.min(t||e,e);function yl(e,t){const n=[],i=e.length/t,s=e.length;let o=0;for(;o<s;o+=i)n.push(e[Math.floor(o)]);return n}function r_(e,t,n){const i=e.ticks.length,s=Math.min(t,i-1),o=e._startPixel,r=e._endPixel,a=1e-6;let l=e.getPixelForTick(s),c;if(!(n&&(i===1?c=Math.max(l-o,r-l):t===0?c=(e.getPixelForTick(1)-l)/2:c=(l-e.getPixelForTick(s-1))/2,l+=s<t?c:-c,l<o-a||l>r+a)))return l}function a_(e,t){mt(e,n=>{const i=n.gc,s=i.length/2;let o;if(s>t){for(o=0;o<s;++o)delete n.data[i[o]];i.splice(0,s)}})}function ii(e){return e.drawTicks?e.tickLength:0}function xl(e,t){if(!e.display)return 0;const n=It(e.font,t),i=$t(e.padding);return(Mt(e.text)?e.text.length:1)*n.lineHeight+i.height}function l_(e,t){return ln(e,{scale:t,type:"scale"})}function c_(e,t,n){return ln(e,{tick:n,index:t,type:"tick"})}function u_(e,t,n){let i=kr(e);return(n&&t!=="right"||!n&&t==="right")&&(i=o_(i)),i}function h_(e,t,n,i){const{top:s,left:o,bottom:r,right:a,chart:l}=e,{chartArea:c,scales:u}=l;let h=0,f,d,g;const p=r-s,b=a-o;if(e.isHorizontal()){if(d=Bt(i,o,a),st(n)){const y=Object.keys(n)[0],_=n[y];g=u[y].getPixelForValue(_)+p-t}else n==="center"?g=(c.bottom+c.top)/2+p-t:g=bl(e,n,t);f=a-o}else{if(st(n)){const y=Object.keys(n)[0],_=n[y];d=u[y].getPixelForValue(_)-b+t}else n==="center"?d=(c.left+c.right)/2-b+t:d=bl(e,n,t);g=Bt(i,r,s),h=n==="left"?-Ot:Ot}return{titleX:d,titleY:g,maxWidth:f,rotation:h}}class kn extends $e{constructor(t){super(),this.id=t.id,this.type=t.type,this.options=void 0,this.ctx=t.ctx,this.chart=t.chart,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this._margins={left:0,right:0,top:0,bottom:0},this.maxWidth=void 0,this.maxHeight=void 0,this.paddingTop=void 0,this.paddingBottom=void 0,this.paddingLeft=void 0,this.paddingRight=void 0,this.axis=void 0,this.labelRotation=void 0,this.min=void 0,this.max=void 0,this._range=void 0,this.ticks=[],this._gridLineItems=null,this._labelItems=null,this._labelSizes=null,this._length=0,this._maxLength=0,this._longestTextCache={},this._startPixel=void 0,this._endPixel=void 0,this._reversePixels=!1,this._userMax=void 0,this._userMin=void 0,this._suggestedMax=void 0,this._suggestedMin=void 0,this._ticksLength=0,this._borderValue=0,this._cache={},this._dataLimitsCached=!1,this.$context=void 0}init(t){this.options=t.setContext(this.getContext()),this.axis=t.axis,this._userMin=this.parse(t.min),this._userMax=this.parse(t.max),this._suggestedMin=this.parse(t.suggestedMin),this._suggestedMax=this.parse(t.suggestedMax)}parse(t,n){return t}getUserBounds(){let{_userMin:t,_userMax:n,_suggestedMin:i,_suggestedMax:s}=this;return t=oe(t,Number.POSITIVE_INFINITY),n=oe(n,Number.NEGATIVE_INFINITY),i=oe(i,Number.POSITIVE_INFINITY),s=oe(s,Number.NEGATIVE_INFINITY),{min:oe(t,i),max:oe(n,s),minDefined:At(t),maxDefined:At(n)}}getMinMax(t){let{min:n,max:i,minDefined:s,maxDefined:o}=this.getUserBounds(),r;if(s&&o)return{min:n,max:i};const a=this.getMatchingVisibleMetas();for(let l=0,c=a.length;l<c;++l)r=a[l].controller.getMinMax(this,t),s||(n=Math.min(n,r.min)),o||(i=Math.max(i,r.max));return n=o&&n>i?i:n,i=s&&n>i?n:i,{min:oe(n,oe(i,n)),max:oe(i,oe(n,i))}}getPadding(){return{left:this.paddingLeft||0,top:this.paddingTop||0,right:this.paddingRight||0,bottom:this.paddingBottom||0}}getTicks(){return this.ticks}getLabels(){const t=this.chart.data;return this.options.labels||(this.isHorizontal()?t.xLabels:t.yLabels)||t.labels||[]}getLabelItems(t=this.chart.chartArea){return this._labelItems||(this._labelItems=this._computeLabelItems(t))}beforeLayout(){this._cache={},this._dataLimitsCached=!1}beforeUpdate(){wt(this.options.beforeUpdate,[this])}update(t,n,i){const{beginAtZero:s,grace:o,ticks:r}=this.options,a=r.sampleSize;this.beforeUpdate(),this.maxWidth=t,this.maxHeight=n,this._margins=i=Object.assign({left:0,right:0,top:0,bottom:0},i),this.ticks=null,this._labelSizes=null,this._gridLineItems=null,this._labelItems=null,this.beforeSetDimensions(),this.setDimensions(),this.afterSetDimensions(),this._maxLength=this.isHorizontal()?this.width+i.left+i.right:this.height+i.top+i.bottom,this._dataLimitsCached||(this.beforeDataLimits(),this.determineDataLimits(),this.afterDataLimits(),this._range=dm(this,o,s),this._dataLimitsCached=!0),this.beforeBuildTicks(),this.ticks=this.buildTicks()||[],this.afterBuildTicks();const l=a<this.ticks.length;this._convertTicksToLabels(l?yl(this.ticks,a):this.ticks),this.configure(),this.beforeCalculateLabelRotation(),this.calculateLabelRotation(),this.afterCalculateLabelRotation(),r.display&&(r.autoSkip||r.source==="auto")&&(this.ticks=Qb(this,this.ticks),this._labelSizes=null,this.afterAutoSkip()),l&&this._convertTicksToLabels(this.ticks),this.beforeFit(),this.fit(),this.afterFit(),this.afterUpdate()}configure(){let t=this.options.reverse,n,i;this.isHorizontal()?(n=this.left,i=this.right):(n=this.top,i=this.bottom,t=!t),this._startPixel=n,this._endPixel=i,this._reversePixels=t,this._length=i-n,this._alignToPixels=this.options.alignToPixels}afterUpdate(){wt(this.options.afterUpdate,[this])}beforeSetDimensions(){wt(this.options.beforeSetDimensions,[this])}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=0,this.right=this.width):(this.height=this.maxHeight,this.top=0,this.bottom=this.height),this.paddingLeft=0,this.paddingTop=0,this.paddingRight=0,this.paddingBottom=0}afterSetDimensions(){wt(this.options.afterSetDimensions,[this])}_callHooks(t){this.chart.notifyPlugins(t,this.getContext()),wt(this.options[t],[this])}beforeDataLimits(){this._callHooks("beforeDataLimits")}determineDataLimits(){}afterDataLimits(){this._callHooks("afterDataLimits")}beforeBuildTicks(){this._callHooks("beforeBuildTicks")}buildTicks(){return[]}afterBuildTicks(){this._callHooks("afterBuildTicks")}beforeTickToLabelConversion(){wt(this.options.beforeTickToLabelConversion,[this])}generateTickLabels(t){const n=this.options.ticks;let i,s,o;for(i=0,s=t.length;i<s;i++)o=t[i],o.label=wt(n.callback,[o.value,i,t],this)}afterTickToLabelConversion(){wt(this.options.afterTickToLabelConversion,[this])}beforeCalculateLabelRotation(){wt(this.options.beforeCalculateLabelRotation,[this])}calculateLabelRotation(){const t=this.options,n=t.ticks,i=_l(this.ticks.length,t.ticks.maxTicksLimit),s=n.minRotation||0,o=n.maxRotation;let r=s,a,l,c;if(!this._isVisible()||!n.display||s>=o||i<=1||!this.isHorizontal()){this.labelRotation=s;return}const u=this._getLabelSizes(),h=u.widest.width,f=u.highest.height,d=Lt(this.chart.width-h,0,this.maxWidth);a=t.offset?this.maxWidth/i:d/(i-1),h+6>a&&(a=d/(i-(t.offset?.5:1)),l=this.maxHeight-ii(t.grid)-n.padding-xl(t.title,this.chart.options.font),c=Math.sqrt(h*h+f*f),r=Pr(Math.min(Math.asin(Lt((u.highest.height+6)/a,-1,1)),Math.asin(Lt(l/c,-1,1))-Math.asin(Lt(f/c,-1,1)))),r=Math.max(s,Math.min(o,r))),this.labelRotation=r}afterCalculateLabelRotation(){wt(this.options.afterCalculateLabelRotation,[this])}afterAutoSkip(){}beforeFit(){wt(this.options.beforeFit,[this])}fit(){const t={width:0,height:0},{chart:n,options:{ticks:i,title:s,grid:o}}=this,r=this._isVisible(),a=this.isHorizontal();if(r){const l=xl(s,n.options.font);if(a?(t.width=this.maxWidth,t.height=ii(o)+l):(t.height=this.maxHeight,t.width=ii(o)+l),i.display&&this.ticks.length){const{first:c,last:u,widest:h,highest:f}=this._getLabelSizes(),d=i.padding*2,g=de(this.labelRotation),p=Math.cos(g),b=Math.sin(g);if(a){const y=i.mirror?0:b*h.width+p*f.height;t.height=Math.min(this.maxHeight,t.height+y+d)}else{const y=i.mirror?0:p*h.width+b*f.height;t.width=Math.min(this.maxWidth,t.width+y+d)}this._calculatePadding(c,u,b,p)}}this._handleMargins(),a?(this.width=this._length=n.width-this._margins.left-this._margins.right,this.height=t.height):(this.width=t.width,this.height=this._length=n.height-this._margins.top-this._margins.bottom)}_calculatePadding(t,n,i,s){const{ticks:{align:o,padding:r},position:a}=this.options,l=this.labelRotation!==0,c=a!=="top"&&this.axis==="x";if(this.isHorizontal()){const u=this.getPixelForTick(0)-this.left,h=this.right-this.getPixelForTick(this.ticks.length-1);let f=0,d=0;l?c?(f=s*t.width,d=i*n.height):(f=i*t.height,d=s*n.width):o==="start"?d=n.width:o==="end"?f=t.width:o!=="inner"&&(f=t.width/2,d=n.width/2),this.paddingLeft=Math.max((f-u+r)*this.width/(this.width-u),0),this.paddingRight=Math.max((d-h+r)*this.width/(this.width-h),0)}else{let u=n.height/2,h=t.height/2;o==="start"?(u=0,h=t.height):o==="end"&&(u=n.height,h=0),this.paddingTop=u+r,this.paddingBottom=h+r}}_handleMargins(){this._margins&&(this._margins.left=Math.max(this.paddingLeft,this._margins.left),this._margins.top=Math.max(this.paddingTop,this._margins.top),this._margins.right=Math.max(this.paddingRight,this._margins.right),this._margins.bottom=Math.max(this.paddingBottom,this._margins.bottom))}afterFit(){wt(this.options.afterFit,[this])}isHorizontal(){const{axis:t,position:n}=this.options;return n==="top"||n==="bottom"||t==="x"}isFullSize(){return this.options.fullSize}_convertTicksToLabels(t){this.beforeTickToLabelConversion(),this.generateTickLabels(t);let n,i;for(n=0,i=t.length;n<i;n++)it(t[n].label)&&(t.splice(n,1),i--,n--);this.afterTickToLabelConversion()}_getLabelSizes(){let t=this._labelSizes;if(!t){const n=this.options.ticks.sampleSize;let i=this.ticks;n<i.length&&(i=yl(i,n)),this._labelSizes=t=this._computeLabelSizes(i,i.length,this.options.ticks.maxTicksLimit)}return t}_computeLabelSizes(t,n,i){const{ctx:s,_longestTextCache:o}=this,r=[],a=[],l=Math.floor(n/_l(n,i));let c=0,u=0,h,f,d,g,p,b,y,_,M,v,S;for(h=0;h<n;h+=l){if(g=t[h].label,p=this._resolveTickFontOptions(h),s.font=b=p.string,y=o[b]=o[b]||{data:{},gc:[]},_=p.lineHeight,M=v=0,!it(g)&&!Mt(g))M=Ps(s,y.data,y.gc,M,g),v=_;else if(Mt(g))for(f=0,d=g.length;f<d;++f)S=g[f],!it(S)&&!Mt(S)&&(M=Ps(s,y.data,y.gc,M,S),v+=_);r.push(M),a.push(v),c=Math.max(M,c),u=Math.max(v,u)}a_(o,n);const E=r.indexOf(c),O=a.indexOf(u),I=j=>({width:r[j]||0,height:a[j]||0});return{first:I(0),last:I(n-1),widest:I(E),highest:I(O),widths:r,heights:a}}getLabelForValue(t){return t}getPixelForValue(t,n){return NaN}getValueForPixel(t){}getPixelForTick(t){const n=this.ticks;return t<0||t>n.length-1?null:this.getPixelForValue(n[t].value)}getPixelForDecimal(t){this._reversePixels&&(t=1-t);const n=this._startPixel+t*this._length;return Wg(this._alignToPixels?pn(this.chart,n,0):n)}getDecimalForPixel(t){const n=(t-this._startPixel)/this._length;return this._reversePixels?1-n:n}getBasePixel(){return this.getPixelForValue(this.getBaseValue())}getBaseValue(){const{min:t,max:n}=this;return t<0&&n<0?n:t>0&&n>0?t:0}getContext(t){const n=this.ticks||[];if(t>=0&&t<n.length){const i=n[t];return i.$context||(i.$context=c_(this.getContext(),t,i))}return this.$context||(this.$context=l_(this.chart.getContext(),this))}_tickSize(){const t=this.options.ticks,n=de(this.labelRotation),i=Math.abs(Math.cos(n)),s=Math.abs(Math.sin(n)),o=this._getLabelSizes(),r=t.autoSkipPadding||0,a=o?o.widest.width+r:0,l=o?o.highest.height+r:0;return this.isHorizontal()?l*i>a*s?a/i:l/s:l*s<a*i?l/i:a/s}_isVisible(){const t=this.options.display;return t!=="auto"?!!t:this.getMatchingVisibleMetas().length>0}_computeGridLineItems(t){const n=this.axis,i=this.chart,s=this.options,{grid:o,position:r,border:a}=s,l=o.offset,c=this.isHorizontal(),h=this.ticks.length+(l?1:0),f=ii(o),d=[],g=a.setContext(this.getContext()),p=g.display?g.width:0,b=p/2,y=function(L){return pn(i,L,p)};let _,M,v,S,E,O,I,j,U,X,Q,ut;if(r==="top")_=y(this.bottom),O=this.bottom-f,j=_-b,X=y(t.top)+b,ut=t.bottom;else if(r==="bottom")_=y(this.top),X=t.top,ut=y(t.bottom)-b,O=_+b,j=this.top+f;else if(r==="left")_=y(this.right),E=this.right-f,I=_-b,U=y(t.left)+b,Q=t.right;else if(r==="right")_=y(this.left),U=t.left,Q=y(t.right)-b,E=_+b,I=this.left+f;else if(n==="x"){if(r==="center")_=y((t.top+t.bottom)/2+.5);else if(st(r)){const L=Object.keys(r)[0],z=r[L];_=y(this.chart.scales[L].getPixelForValue(z))}X=t.top,ut=t.bottom,O=_+b,j=O+f}else if(n==="y"){if(r==="center")_=y((t.left+t.right)/2);else if(st(r)){const L=Object.keys(r)[0],z=r[L];_=y(this.chart.scales[L].getPixelForValue(z))}E=_-b,I=E-f,U=t.left,Q=t.right}const R=tt(s.ticks.maxTicksLimit,h),P=Math.max(1,Math.ceil(h/R));for(M=0;M<h;M+=P){const L=this.getContext(M),z=o.setContext(L),Y=a.setContext(L),nt=z.lineWidth,bt=z.color,ot=Y.dash||[],lt=Y.dashOffset,qt=z.tickWidth,Nt=z.tickColor,ht=z.tickBorderDash||[],Dt=z.tickBorderDashOffset;v=r_(this,M,l),v!==void 0&&(S=pn(i,v,nt),c?E=I=U=Q=S:O=j=X=ut=S,d.push({tx1:E,ty1:O,tx2:I,ty2:j,x1:U,y1:X,x2:Q,y2:ut,width:nt,color:bt,borderDash:ot,borderDashOffset:lt,tickWidth:qt,tickColor:Nt,tickBorderDash:ht,tickBorderDashOffset:Dt}))}return this._ticksLength=h,this._borderValue=_,d}_computeLabelItems(t){const n=this.axis,i=this.options,{position:s,ticks:o}=i,r=this.isHorizontal(),a=this.ticks,{align:l,crossAlign:c,padding:u,mirror:h}=o,f=ii(i.grid),d=f+u,g=h?-u:d,p=-de(this.labelRotation),b=[];let y,_,M,v,S,E,O,I,j,U,X,Q,ut="middle";if(s==="top")E=this.bottom-g,O=this._getXAxisLabelAlignment();else if(s==="bottom")E=this.top+g,O=this._getXAxisLabelAlignment();else if(s==="left"){const P=this._getYAxisLabelAlignment(f);O=P.textAlign,S=P.x}else if(s==="right"){const P=this._getYAxisLabelAlignment(f);O=P.textAlign,S=P.x}else if(n==="x"){if(s==="center")E=(t.top+t.bottom)/2+d;else if(st(s)){const P=Object.keys(s)[0],L=s[P];E=this.chart.scales[P].getPixelForValue(L)+d}O=this._getXAxisLabelAlignment()}else if(n==="y"){if(s==="center")S=(t.left+t.right)/2-d;else if(st(s)){const P=Object.keys(s)[0],L=s[P];S=this.chart.scales[P].getPixelForValue(L)}O=this._getYAxisLabelAlignment(f).textAlign}n==="y"&&(l==="start"?ut="top":l==="end"&&(ut="bottom"));const R=this._getLabelSizes();for(y=0,_=a.length;y<_;++y){M=a[y],v=M.label;const P=o.setContext(this.getContext(y));I=this.getPixelForTick(y)+o.labelOffset,j=this._resolveTickFontOptions(y),U=j.lineHeight,X=Mt(v)?v.length:1;const L=X/2,z=P.color,Y=P.textStrokeColor,nt=P.textStrokeWidth;let bt=O;r?(S=I,O==="inner"&&(y===_-1?bt=this.options.reverse?"left":"right":y===0?bt=this.options.reverse?"right":"left":bt="center"),s==="top"?c==="near"||p!==0?Q=-X*U+U/2:c==="center"?Q=-R.highest.height/2-L*U+U:Q=-R.highest.height+U/2:c==="near"||p!==0?Q=U/2:c==="center"?Q=R.highest.height/2-L*U:Q=R.highest.height-X*U,h&&(Q*=-1),p!==0&&!P.showLabelBackdrop&&(S+=U/2*Math.sin(p))):(E=I,Q=(1-X)*U/2);let ot;if(P.showLabelBackdrop){const lt=$t(P.backdropPadding),qt=R.heights[y],Nt=R.widths[y];let ht=Q-lt.top,Dt=0-lt.left;switch(ut){case"middle":ht-=qt/2;break;case"bottom":ht-=qt;break}switch(O){case"center":Dt-=Nt/2;break;case"right":Dt-=Nt;break;case"inner":y===_-1?Dt-=Nt:y>0&&(Dt-=Nt/2);break}ot={left:Dt,top:ht,width:Nt+lt.width,height:qt+lt.height,color:P.backdropColor}}b.push({label:v,font:j,textOffset:Q,options:{rotation:p,color:z,strokeColor:Y,strokeWidth:nt,textAlign:bt,textBaseline:ut,translation:[S,E],backdrop:ot}})}return b}_getXAxisLabelAlignment(){const{position:t,ticks:n}=this.options;if(-de(this.labelRotation))return t==="top"?"left":"right";let s="center";return n.align==="start"?s="left":n.align==="end"?s="right":n.align==="inner"&&(s="inner"),s}_getYAxisLabelAlignment(t){const{position:n,ticks:{crossAlign:i,mirror:s,padding:o}}=this.options,r=this._getLabelSizes(),a=t+o,l=r.widest.width;let c,u;return n==="left"?s?(u=this.right+o,i==="near"?c="left":i==="center"?(c="center",u+=l/2):(c="right",u+=l)):(u=this.right-a,i==="near"?c="right":i==="center"?(c="center",u-=l/2):(c="left",u=this.left)):n==="right"?s?(u=this.left+o,i==="near"?c="right":i==="center"?(c="center",u-=l/2):(c="left",u-=l)):(u=this.left+a,i==="near"?c="left":i==="center"?(c="center",u+=l/2):(c="right",u=this.right)):c="right",{textAlign:c,x:u}}_computeLabelArea(){if(this.options.ticks.mirror)return;const t=this.chart,n=this.options.position;if(n==="left"||n==="right")return{top:0,left:this.left,bottom:t.height,right:this.right};if(n==="top"||n==="bottom")return{top:this.top,left:0,bottom:this.bottom,right:t.width}}drawBackground(){const{ctx:t,options:{backgroundColor:n},left:i,top:s,width:o,height:r}=this;n&&(t.save(),t.fillStyle=n,t.fillRect(i,s,o,r),t.restore())}getLineWidthForValue(t){const n=this.options.grid;if(!this._isVisible()||!n.display)return 0;const s=this.ticks.findIndex(o=>o.value===t);return s>=0?n.setContext(this.getContext(s)).lineWidth:0}drawGrid(t){const n=this.options.grid,i=this.ctx,s=this._gridLineItems||(this._gridLineItems=this._computeGridLineItems(t));let o,r;const a=(l,c,u)=>{!u.width||!u.color||(i.save(),i.lineWidth=u.width,i.strokeStyle=u.color,i.setLineDash(u.borderDash||[]),i.lineDashOffset=u.borderDashOffset,i.beginPath(),i.moveTo(l.x,l.y),i.lineTo(c.x,c.y),i.stroke(),i.restore())};if(n.display)for(o=0,r=s.length;o<r;++o){const l=s[o];n.drawOnChartArea&&a({x:l.x1,y:l.y1},{x:l.x2,y:l.y2},l),n.drawTicks&&a({x:l.tx1,y:l.ty1},{x:l.tx2,y:l.ty2},{color:l.tickColor,width:l.tickWidth,borderDash:l.tickBorderDash,borderDashOffset:l.tickBorderDashOffset})}}drawBorder(){const{chart:t,ctx:n,options:{border:i,grid:s}}=this,o=i.setContext(this.getContext()),r=i.display?o.width:0;if(!r)return;const a=s.setContext(this.getContext(0)).lineWidth,l=this._borderValue;let c,u,h,f;this.isHorizontal()?(c=pn(t,this.left,r)-r/2,u=pn(t,this.right,a)+a/2,h=f=l):(h=pn(t,this.top,r)-r/2,f=pn(t,this.bottom,a)+a/2,c=u=l),n.save(),n.lineWidth=o.width,n.strokeStyle=o.color,n.beginPath(),n.moveTo(c,h),n.lineTo(u,f),n.stroke(),n.restore()}drawLabels(t){if(!this.options.ticks.display)return;const i=this.ctx,s=this._computeLabelArea();s&&Ys(i,s);const o=this.getLabelItems(t);for(const r of o){const a=r.options,l=r.font,c=r.label,u=r.textOffset;An(i,c,0,u,l,a)}s&&Ks(i)}drawTitle(){const{ctx:t,options:{position:n,title:i,reverse:s}}=this;if(!i.display)return;const o=It(i.font),r=$t(i.padding),a=i.align;let l=o.lineHeight/2;n==="bottom"||n==="center"||st(n)?(l+=r.bottom,Mt(i.text)&&(l+=o.lineHeight*(i.text.length-1))):l+=r.top;const{titleX:c,titleY:u,maxWidth:h,rotation:f}=h_(this,l,n,a);An(t,i.text,0,0,o,{color:i.color,maxWidth:h,rotation:f,textAlign:u_(a,n,s),textBaseline:"middle",translation:[c,u]})}draw(t){this._isVisible()&&(this.drawBackground(),this.drawGrid(t),this.drawBorder(),this.drawTitle(),this.drawLabels(t))}_layers(){const t=this.options,n=t.ticks&&t.ticks.z||0,i=tt(t.grid&&t.grid.z,-1),s=tt(t.border&&t.border.z,0);return!this._isVisible()||this.draw!==kn.prototype.draw?[{z:n,draw:o=>{this.draw(o)}}]:[{z:i,draw:o=>{this.drawBackground(),this.drawGrid(o),this.drawTitle()}},{z:s,draw:()=>{this.drawBorder()}},{z:n,draw:o=>{this.drawLabels(o)}}]}getMatchingVisibleMetas(t){const n=this.chart.getSortedVisibleDatasetMetas(),i=this.axis+"AxisID",s=[];let o,r;for(o=0,r=n.length;o<r;++o){const a=n[o];a[i]===this.id&&(!t||a.type===t)&&s.push(a)}return s}_resolveTickFontOptions(t){const n=this.options.ticks.setContext(this.getContext(t));return It(n.font)}_maxDigits(){const t=this._resolveTickFontOptions(0).lineHeight;return(this.isHorizontal()?this.width:this.height)/t}}class Zi{constructor(t,n,i){this.type=t,this.scope=n,this.override=i,this.items=Object.create(null)}isForType(t){return Object.prototype.isPrototypeOf.call(this.type.prototype,t.prototype)}register(t){const n=Object.getPrototypeOf(t);let i;p_(n)&&(i=this.register(n));const s=this.items,o=t.id,r=this.scope+"."+o;if(!o)throw new Error("class does not have id: "+t);return o in s||(s[o]=t,f_(t,r,i),this.override&&Ct.override(t.id,t.overrides)),r}get(t){return this.items[t]}unregister(t){const n=this.items,i=t.id,s=this.scope;i in n&&delete n[i],s&&i in Ct[s]&&(delete Ct[s][i],this.override&&delete Pn[i])}}function f_(e,t,n){const i=Oi(Object.create(null),[n?Ct.get(n):{},Ct.get(t),e.defaults]);Ct.set(t,i),e.defaultRoutes&&d_(t,e.defaultRoutes),e.descriptors&&Ct.describe(t,e.descriptors)}function d_(e,t){Object.keys(t).forEach(n=>{const i=n.split("."),s=i.pop(),o=[e].concat(i).join("."),r=t[n].split("."),a=r.pop(),l=r.join(".");Ct.route(o,s,l,a)})}function p_(e){return"id"in e&&"defaults"in e}class g_{constructor(){this.controllers=new Zi(cn,"datasets",!0),this.elements=new Zi($e,"elements"),this.plugins=new Zi(Object,"plugins"),this.scales=new Zi(kn,"scales"),this._typedRegistries=[this.controllers,this.scales,this.elements]}add(...t){this._each("register",t)}remove(...t){this._each("unregister",t)}addControllers(...t){this._each("register",t,this.controllers)}addElements(...t){this._each("register",t,this.elements)}addPlugins(...t){this._each("register",t,this.plugins)}addScales(...t){this._each("register",t,this.scales)}getController(t){return this._get(t,this.controllers,"controller")}getElement(t){return this._get(t,this.elements,"element")}getPlugin(t){return this._get(t,this.plugins,"plugin")}getScale(t){return this._get(t,this.scales,"scale")}removeControllers(...t){this._each("unregister",t,this.controllers)}removeElements(...t){this._each("unregister",t,this.elements)}removePlugins(...t){this._each("unregister",t,this.plugins)}removeScales(...t){this._each("unregister",t,this.scales)}_each(t,n,i){[...n].forEach(s=>{const o=i||this._getRegistryForType(s);i||o.isForType(s)||o===this.plugins&&s.id?this._exec(t,o,s):mt(s,r=>{const a=i||this._getRegistryForType(r);this._exec(t,a,r)})})}_exec(t,n,i){const s=Cr(t);wt(i["before"+s],[],i),n[t](i),wt(i["after"+s],[],i)}_getRegistryForType(t){for(let n=0;n<this._typedRegistries.length;n++){const i=this._typedRegistries[n];if(i.isForType(t))return i}return this.plugins}_get(t,n,i){const s=n.get(t);if(s===void 0)throw new Error('"'+t+'" is not a registered '+i+".");return s}}var Se=new g_;class m_{constructor(){this._init=void 0}notify(t,n,i,s){if(n==="beforeInit"&&(this._init=this._createDescriptors(t,!0),this._notify(this._init,t,"install")),this._init===void 0)return;const o=s?this._descriptors(t).filter(s):this._descriptors(t),r=this._notify(o,t,n,i);return n==="afterDestroy"&&(this._notify(o,t,"stop"),this._notify(this._init,t,"uninstall"),this._init=void 0),r}_notify(t,n,i,s){s=s||{};for(const o of t){const r=o.plugin,a=r[i],l=[n,s,o.options];if(wt(a,l,r)===!1&&s.cancelable)return!1}return!0}invalidate(){it(this._cache)||(this._oldCache=this._cache,this._cache=void 0)}_descriptors(t){if(this._cache)return this._cache;const n=this._cache=this._createDescriptors(t);return this._notifyStateChanges(t),n}_createDescriptors(t,n){const i=t&&t.config,s=tt(i.options&&i.options.plugins,{}),o=b_(i);return s===!1&&!n?[]:y_(t,o,s,n)}_notifyStateChanges(t){const n=this._oldCache||[],i=this._cache,s=(o,r)=>o.filter(a=>!r.some(l=>a.plugin.id===l.plugin.id));this._notify(s(n,i),t,"stop"),this._notify(s(i,n),t,"start")}}function b_(e){const t={},n=[],i=Object.keys(Se.plugins.items);for(let o=0;o<i.length;o++)n.push(Se.getPlugin(i[o]));const s=e.plugins||[];for(let o=0;o<s.length;o++){const r=s[o];n.indexOf(r)===-1&&(n.push(r),t[r.id]=!0)}return{plugins:n,localIds:t}}function __(e,t){return!t&&e===!1?null:e===!0?{}:e}function y_(e,{plugins:t,localIds:n},i,s){const o=[],r=e.getContext();for(const a of t){const l=a.id,c=__(i[l],s);c!==null&&o.push({plugin:a,options:x_(e.config,{plugin:a,local:n[l]},c,r)})}return o}function x_(e,{plugin:t,local:n},i,s){const o=e.pluginScopeKeys(t),r=e.getOptionScopes(i,o);return n&&t.defaults&&r.push(t.defaults),e.createResolver(r,s,[""],{scriptable:!1,indexable:!1,allKeys:!0})}function Go(e,t){const n=Ct.datasets[e]||{};return((t.datasets||{})[e]||{}).indexAxis||t.indexAxis||n.indexAxis||"x"}function v_(e,t){let n=e;return e==="_index_"?n=t:e==="_value_"&&(n=t==="x"?"y":"x"),n}function w_(e,t){return e===t?"_index_":"_value_"}function vl(e){if(e==="x"||e==="y"||e==="r")return e}function S_(e){if(e==="top"||e==="bottom")return"x";if(e==="left"||e==="right")return"y"}function Xo(e,...t){if(vl(e))return e;for(const n of t){const i=n.axis||S_(n.position)||e.length>1&&vl(e[0].toLowerCase());if(i)return i}throw new Error(`Cannot determine type of '${e}' axis. Please provide 'axis' or 'position' option.`)}function wl(e,t,n){if(n[t+"AxisID"]===e)return{axis:t}}function M_(e,t){if(t.data&&t.data.datasets){const n=t.data.datasets.filter(i=>i.xAxisID===e||i.yAxisID===e);if(n.length)return wl(e,"x",n[0])||wl(e,"y",n[0])}return{}}function C_(e,t){const n=Pn[e.type]||{scales:{}},i=t.scales||{},s=Go(e.type,t),o=Object.create(null);return Object.keys(i).forEach(r=>{const a=i[r];if(!st(a))return console.error(`Invalid scale configuration for scale: ${r}`);if(a._proxy)return console.warn(`Ignoring resolver passed as options for scale: ${r}`);const l=Xo(r,a,M_(r,e),Ct.scales[a.type]),c=w_(l,s),u=n.scales||{};o[r]=_i(Object.create(null),[{axis:l},a,u[l],u[c]])}),e.data.datasets.forEach(r=>{const a=r.type||e.type,l=r.indexAxis||Go(a,t),u=(Pn[a]||{}).scales||{};Object.keys(u).forEach(h=>{const f=v_(h,l),d=r[f+"AxisID"]||f;o[d]=o[d]||Object.create(null),_i(o[d],[{axis:f},i[d],u[h]])})}),Object.keys(o).forEach(r=>{const a=o[r];_i(a,[Ct.scales[a.type],Ct.scale])}),o}function lh(e){const t=e.options||(e.options={});t.plugins=tt(t.plugins,{}),t.scales=C_(e,t)}function ch(e){return e=e||{},e.datasets=e.datasets||[],e.labels=e.labels||[],e}function P_(e){return e=e||{},e.data=ch(e.data),lh(e),e}const Sl=new Map,uh=new Set;function Qi(e,t){let n=Sl.get(e);return n||(n=t(),Sl.set(e,n),uh.add(n)),n}const si=(e,t,n)=>{const i=on(t,n);i!==void 0&&e.add(i)};class A_{constructor(t){this._config=P_(t),this._scopeCache=new Map,this._resolverCache=new Map}get platform(){return this._config.platform}get type(){return this._config.type}set type(t){this._config.type=t}get data(){return this._config.data}set data(t){this._config.data=ch(t)}get options(){return this._config.options}set options(t){this._config.options=t}get plugins(){return this._config.plugins}update(){const t=this._config;this.clearCache(),lh(t)}clearCache(){this._scopeCache.clear(),this._resolverCache.clear()}datasetScopeKeys(t){return Qi(t,()=>[[`datasets.${t}`,""]])}datasetAnimationScopeKeys(t,n){return Qi(`${t}.transition.${n}`,()=>[[`datasets.${t}.transitions.${n}`,`transitions.${n}`],[`datasets.${t}`,""]])}datasetElementScopeKeys(t,n){return Qi(`${t}-${n}`,()=>[[`datasets.${t}.elements.${n}`,`datasets.${t}`,`elements.${n}`,""]])}pluginScopeKeys(t){const n=t.id,i=this.type;return Qi(`${i}-plugin-${n}`,()=>[[`plugins.${n}`,...t.additionalOptionScopes||[]]])}_cachedScopes(t,n){const i=this._scopeCache;let s=i.get(t);return(!s||n)&&(s=new Map,i.set(t,s)),s}getOptionScopes(t,n,i){const{options:s,type:o}=this,r=this._cachedScopes(t,i),a=r.get(n);if(a)return a;const l=new Set;n.forEach(u=>{t&&(l.add(t),u.forEach(h=>si(l,t,h))),u.forEach(h=>si(l,s,h)),u.forEach(h=>si(l,Pn[o]||{},h)),u.forEach(h=>si(l,Ct,h)),u.forEach(h=>si(l,Yo,h))});const c=Array.from(l);return c.length===0&&c.push(Object.create(null)),uh.has(n)&&r.set(n,c),c}chartOptionScopes(){const{options:t,type:n}=this;return[t,Pn[n]||{},Ct.datasets[n]||{},{type:n},Ct,Yo]}resolveNamedOptions(t,n,i,s=[""]){const o={$shared:!0},{resolver:r,subPrefixes:a}=Ml(this._resolverCache,t,s);let l=r;if(O_(r,n)){o.$shared=!1,i=rn(i)?i():i;const c=this.createResolver(t,i,a);l=Yn(r,i,c)}for(const c of n)o[c]=l[c];return o}createResolver(t,n,i=[""],s){const{resolver:o}=Ml(this._resolverCache,t,i);return st(n)?Yn(o,n,void 0,s):o}}function Ml(e,t,n){let i=e.get(t);i||(i=new Map,e.set(t,i));const s=n.join();let o=i.get(s);return o||(o={resolver:Er(t,n),subPrefixes:n.filter(a=>!a.toLowerCase().includes("hover"))},i.set(s,o)),o}const k_=e=>st(e)&&Object.getOwnPropertyNames(e).some(t=>rn(e[t]));function O_(e,t){const{isScriptable:n,isIndexable:i}=Hu(e);for(const s of t){const o=n(s),r=i(s),a=(r||o)&&e[s];if(o&&(rn(a)||k_(a))||r&&Mt(a))return!0}return!1}var D_="4.5.1";const E_=["top","bottom","left","right","chartArea"];function Cl(e,t){return e==="top"||e==="bottom"||E_.indexOf(e)===-1&&t==="x"}function Pl(e,t){return function(n,i){return n[e]===i[e]?n[t]-i[t]:n[e]-i[e]}}function Al(e){const t=e.chart,n=t.options.animation;t.notifyPlugins("afterRender"),wt(n&&n.onComplete,[e],t)}function T_(e){const t=e.chart,n=t.options.animation;wt(n&&n.onProgress,[e],t)}function hh(e){return Ir()&&typeof e=="string"?e=document.getElementById(e):e&&e.length&&(e=e[0]),e&&e.canvas&&(e=e.canvas),e}const us={},kl=e=>{const t=hh(e);return Object.values(us).filter(n=>n.canvas===t).pop()};function R_(e,t,n){const i=Object.keys(e);for(const s of i){const o=+s;if(o>=t){const r=e[s];delete e[s],(n>0||o>t)&&(e[o+n]=r)}}}function I_(e,t,n,i){return!n||e.type==="mouseout"?null:i?t:e}class Os{static defaults=Ct;static instances=us;static overrides=Pn;static registry=Se;static version=D_;static getChart=kl;static register(...t){Se.add(...t),Ol()}static unregister(...t){Se.remove(...t),Ol()}constructor(t,n){const i=this.config=new A_(n),s=hh(t),o=kl(s);if(o)throw new Error("Canvas is already in use. Chart with ID '"+o.id+"' must be destroyed before the canvas with ID '"+o.canvas.id+"' can be reused.");const r=i.createResolver(i.chartOptionScopes(),this.getContext());this.platform=new(i.platform||Zb(s)),this.platform.updateConfig(i);const a=this.platform.acquireContext(s,r.aspectRatio),l=a&&a.canvas,c=l&&l.height,u=l&&l.width;if(this.id=Og(),this.ctx=a,this.canvas=l,this.width=u,this.height=c,this._options=r,this._aspectRatio=this.aspectRatio,this._layers=[],this._metasets=[],this._stacks=void 0,this.boxes=[],this.currentDevicePixelRatio=void 0,this.chartArea=void 0,this._active=[],this._lastEvent=void 0,this._listeners={},this._responsiveListeners=void 0,this._sortedMetasets=[],this.scales={},this._plugins=new m_,this.$proxies={},this._hiddenIndices={},this.attached=!1,this._animationsDisabled=void 0,this.$context=void 0,this._doResize=Yg(h=>this.update(h),r.resizeDelay||0),this._dataChanges=[],us[this.id]=this,!a||!l){console.error("Failed to create chart: can't acquire context from the given item");return}Te.listen(this,"complete",Al),Te.listen(this,"progress",T_),this._initialize(),this.attached&&this.update()}get aspectRatio(){const{options:{aspectRatio:t,maintainAspectRatio:n},width:i,height:s,_aspectRatio:o}=this;return it(t)?n&&o?o:s?i/s:null:t}get data(){return this.config.data}set data(t){this.config.data=t}get options(){return this._options}set options(t){this.config.options=t}get registry(){return Se}_initialize(){return this.notifyPlugins("beforeInit"),this.options.responsive?this.resize():Ja(this,this.options.devicePixelRatio),this.bindEvents(),this.notifyPlugins("afterInit"),this}clear(){return Ga(this.canvas,this.ctx),this}stop(){return Te.stop(this),this}resize(t,n){Te.running(this)?this._resizeBeforeDraw={width:t,height:n}:this._resize(t,n)}_resize(t,n){const i=this.options,s=this.canvas,o=i.maintainAspectRatio&&this.aspectRatio,r=this.platform.getMaximumSize(s,t,n,o),a=i.devicePixelRatio||this.platform.getDevicePixelRatio(),l=this.width?"resize":"attach";this.width=r.width,this.height=r.height,this._aspectRatio=this.aspectRatio,Ja(this,a,!0)&&(this.notifyPlugins("resize",{size:r}),wt(i.onResize,[this,r],this),this.attached&&this._doResize(l)&&this.render())}ensureScalesHaveIDs(){const n=this.options.scales||{};mt(n,(i,s)=>{i.id=s})}buildOrUpdateScales(){const t=this.options,n=t.scales,i=this.scales,s=Object.keys(i).reduce((r,a)=>(r[a]=!1,r),{});let o=[];n&&(o=o.concat(Object.keys(n).map(r=>{const a=n[r],l=Xo(r,a),c=l==="r",u=l==="x";return{options:a,dposition:c?"chartArea":u?"bottom":"left",dtype:c?"radialLinear":u?"category":"linear"}}))),mt(o,r=>{const a=r.options,l=a.id,c=Xo(l,a),u=tt(a.type,r.dtype);(a.position===void 0||Cl(a.position,c)!==Cl(r.dposition))&&(a.position=r.dposition),s[l]=!0;let h=null;if(l in i&&i[l].type===u)h=i[l];else{const f=Se.getScale(u);h=new f({id:l,type:u,ctx:this.ctx,chart:this}),i[h.id]=h}h.init(a,t)}),mt(s,(r,a)=>{r||delete i[a]}),mt(i,r=>{Ht.configure(this,r,r.options),Ht.addBox(this,r)})}_updateMetasets(){const t=this._metasets,n=this.data.datasets.length,i=t.length;if(t.sort((s,o)=>s.index-o.index),i>n){for(let s=n;s<i;++s)this._destroyDatasetMeta(s);t.splice(n,i-n)}this._sortedMetasets=t.slice(0).sort(Pl("order","index"))}_removeUnreferencedMetasets(){const{_metasets:t,data:{datasets:n}}=this;t.length>n.length&&delete this._stacks,t.forEach((i,s)=>{n.filter(o=>o===i._dataset).length===0&&this._destroyDatasetMeta(s)})}buildOrUpdateControllers(){const t=[],n=this.data.datasets;let i,s;for(this._removeUnreferencedMetasets(),i=0,s=n.length;i<s;i++){const o=n[i];let r=this.getDatasetMeta(i);const a=o.type||this.config.type;if(r.type&&r.type!==a&&(this._destroyDatasetMeta(i),r=this.getDatasetMeta(i)),r.type=a,r.indexAxis=o.indexAxis||Go(a,this.options),r.order=o.order||0,r.index=i,r.label=""+o.label,r.visible=this.isDatasetVisible(i),r.controller)r.controller.updateIndex(i),r.controller.linkScales();else{const l=Se.getController(a),{datasetElementType:c,dataElementType:u}=Ct.datasets[a];Object.assign(l,{dataElementType:Se.getElement(u),datasetElementType:c&&Se.getElement(c)}),r.controller=new l(this,i),t.push(r.controller)}}return this._updateMetasets(),t}_resetElements(){mt(this.data.datasets,(t,n)=>{this.getDatasetMeta(n).controller.reset()},this)}reset(){this._resetElements(),this.notifyPlugins("reset")}update(t){const n=this.config;n.update();const i=this._options=n.createResolver(n.chartOptionScopes(),this.getContext()),s=this._animationsDisabled=!i.animation;if(this._updateScales(),this._checkEventBindings(),this._updateHiddenIndices(),this._plugins.invalidate(),this.notifyPlugins("beforeUpdate",{mode:t,cancelable:!0})===!1)return;const o=this.buildOrUpdateControllers();this.notifyPlugins("beforeElementsUpdate");let r=0;for(let c=0,u=this.data.datasets.length;c<u;c++){const{controller:h}=this.getDatasetMeta(c),f=!s&&o.indexOf(h)===-1;h.buildOrUpdateElements(f),r=Math.max(+h.getMaxOverflow(),r)}r=this._minPadding=i.layout.autoPadding?r:0,this._updateLayout(r),s||mt(o,c=>{c.reset()}),this._updateDatasets(t),this.notifyPlugins("afterUpdate",{mode:t}),this._layers.sort(Pl("z","_idx"));const{_active:a,_lastEvent:l}=this;l?this._eventHandler(l,!0):a.length&&this._updateHoverStyles(a,a,!0),this.render()}_updateScales(){mt(this.scales,t=>{Ht.removeBox(this,t)}),this.ensureScalesHaveIDs(),this.buildOrUpdateScales()}_checkEventBindings(){const t=this.options,n=new Set(Object.keys(this._listeners)),i=new Set(t.events);(!Va(n,i)||!!this._responsiveListeners!==t.responsive)&&(this.unbindEvents(),this.bindEvents())}_updateHiddenIndices(){const{_hiddenIndices:t}=this,n=this._getUniformDataChanges()||[];for(const{method:i,start:s,count:o}of n){const r=i==="_removeElements"?-o:o;R_(t,s,r)}}_getUniformDataChanges(){const t=this._dataChanges;if(!t||!t.length)return;this._dataChanges=[];const n=this.data.datasets.length,i=o=>new Set(t.filter(r=>r[0]===o).map((r,a)=>a+","+r.splice(1).join(","))),s=i(0);for(let o=1;o<n;o++)if(!Va(s,i(o)))return;return Array.from(s).map(o=>o.split(",")).map(o=>({method:o[1],start:+o[2],count:+o[3]}))}_updateLayout(t){if(this.notifyPlugins("beforeLayout",{cancelable:!0})===!1)return;Ht.update(this,this.width,this.height,t);const n=this.chartArea,i=n.width<=0||n.height<=0;this._layers=[],mt(this.boxes,s=>{i&&s.position==="chartArea"||(s.configure&&s.configure(),this._layers.push(...s._layers()))},this),this._layers.forEach((s,o)=>{s._idx=o}),this.notifyPlugins("afterLayout")}_updateDatasets(t){if(this.notifyPlugins("beforeDatasetsUpdate",{mode:t,cancelable:!0})!==!1){for(let n=0,i=this.data.datasets.length;n<i;++n)this.getDatasetMeta(n).controller.configure();for(let n=0,i=this.data.datasets.length;n<i;++n)this._updateDataset(n,rn(t)?t({datasetIndex:n}):t);this.notifyPlugins("afterDatasetsUpdate",{mode:t})}}_updateDataset(t,n){const i=this.getDatasetMeta(t),s={meta:i,index:t,mode:n,cancelable:!0};this.notifyPlugins("beforeDatasetUpdate",s)!==!1&&(i.controller._update(n),s.cancelable=!1,this.notifyPlugins("afterDatasetUpdate",s))}render(){this.notifyPlugins("beforeRender",{cancelable:!0})!==!1&&(Te.has(this)?this.attached&&!Te.running(this)&&Te.start(this):(this.draw(),Al({chart:this})))}draw(){let t;if(this._resizeBeforeDraw){const{width:i,height:s}=this._resizeBeforeDraw;this._resizeBeforeDraw=null,this._resize(i,s)}if(this.clear(),this.width<=0||this.height<=0||this.notifyPlugins("beforeDraw",{cancelable:!0})===!1)return;const n=this._layers;for(t=0;t<n.length&&n[t].z<=0;++t)n[t].draw(this.chartArea);for(this._drawDatasets();t<n.length;++t)n[t].draw(this.chartArea);this.notifyPlugins("afterDraw")}_getSortedDatasetMetas(t){const n=this._sortedMetasets,i=[];let s,o;for(s=0,o=n.length;s<o;++s){const r=n[s];(!t||r.visible)&&i.push(r)}return i}getSortedVisibleDatasetMetas(){return this._getSortedDatasetMetas(!0)}_drawDatasets(){if(this.notifyPlugins("beforeDatasetsDraw",{cancelable:!0})===!1)return;const t=this.getSortedVisibleDatasetMetas();for(let n=t.length-1;n>=0;--n)this._drawDataset(t[n]);this.notifyPlugins("afterDatasetsDraw")}_drawDataset(t){const n=this.ctx,i={meta:t,index:t.index,cancelable:!0},s=Zu(this,t);this.notifyPlugins("beforeDatasetDraw",i)!==!1&&(s&&Ys(n,s),t.controller.draw(),s&&Ks(n),i.cancelable=!1,this.notifyPlugins("afterDatasetDraw",i))}isPointInArea(t){return ze(t,this.chartArea,this._minPadding)}getElementsAtEventForMode(t,n,i,s){const o=Eb.modes[n];return typeof o=="function"?o(this,t,i,s):[]}getDatasetMeta(t){const n=this.data.datasets[t],i=this._metasets;let s=i.filter(o=>o&&o._dataset===n).pop();return s||(s={type:null,data:[],dataset:null,controller:null,hidden:null,xAxisID:null,yAxisID:null,order:n&&n.order||0,index:t,_dataset:n,_parsed:[],_sorted:!1},i.push(s)),s}getContext(){return this.$context||(this.$context=ln(null,{chart:this,type:"chart"}))}getVisibleDatasetCount(){return this.getSortedVisibleDatasetMetas().length}isDatasetVisible(t){const n=this.data.datasets[t];if(!n)return!1;const i=this.getDatasetMeta(t);return typeof i.hidden=="boolean"?!i.hidden:!n.hidden}setDatasetVisibility(t,n){const i=this.getDatasetMeta(t);i.hidden=!n}toggleDataVisibility(t){this._hiddenIndices[t]=!this._hiddenIndices[t]}getDataVisibility(t){return!this._hiddenIndices[t]}_updateVisibility(t,n,i){const s=i?"show":"hide",o=this.getDatasetMeta(t),r=o.controller._resolveAnimations(void 0,s);Di(n)?(o.data[n].hidden=!i,this.update()):(this.setDatasetVisibility(t,i),r.update(o,{visible:i}),this.update(a=>a.datasetIndex===t?s:void 0))}hide(t,n){this._updateVisibility(t,n,!1)}show(t,n){this._updateVisibility(t,n,!0)}_destroyDatasetMeta(t){const n=this._metasets[t];n&&n.controller&&n.controller._destroy(),delete this._metasets[t]}_stop(){let t,n;for(this.stop(),Te.remove(this),t=0,n=this.data.datasets.length;t<n;++t)this._destroyDatasetMeta(t)}destroy(){this.notifyPlugins("beforeDestroy");const{canvas:t,ctx:n}=this;this._stop(),this.config.clearCache(),t&&(this.unbindEvents(),Ga(t,n),this.platform.releaseContext(n),this.canvas=null,this.ctx=null),delete us[this.id],this.notifyPlugins("afterDestroy")}toBase64Image(...t){return this.canvas.toDataURL(...t)}bindEvents(){this.bindUserEvents(),this.options.responsive?this.bindResponsiveEvents():this.attached=!0}bindUserEvents(){const t=this._listeners,n=this.platform,i=(o,r)=>{n.addEventListener(this,o,r),t[o]=r},s=(o,r,a)=>{o.offsetX=r,o.offsetY=a,this._eventHandler(o)};mt(this.options.events,o=>i(o,s))}bindResponsiveEvents(){this._responsiveListeners||(this._responsiveListeners={});const t=this._responsiveListeners,n=this.platform,i=(l,c)=>{n.addEventListener(this,l,c),t[l]=c},s=(l,c)=>{t[l]&&(n.removeEventListener(this,l,c),delete t[l])},o=(l,c)=>{this.canvas&&this.resize(l,c)};let r;const a=()=>{s("attach",a),this.attached=!0,this.resize(),i("resize",o),i("detach",r)};r=()=>{this.attached=!1,s("resize",o),this._stop(),this._resize(0,0),i("attach",a)},n.isAttached(this.canvas)?a():r()}unbindEvents(){mt(this._listeners,(t,n)=>{this.platform.removeEventListener(this,n,t)}),this._listeners={},mt(this._responsiveListeners,(t,n)=>{this.platform.removeEventListener(this,n,t)}),this._responsiveListeners=void 0}updateHoverStyle(t,n,i){const s=i?"set":"remove";let o,r,a,l;for(n==="dataset"&&(o=this.getDatasetMeta(t[0].datasetIndex),o.controller["_"+s+"DatasetHoverStyle"]()),a=0,l=t.length;a<l;++a){r=t[a];const c=r&&this.getDatasetMeta(r.datasetIndex).controller;c&&c[s+"HoverStyle"](r.element,r.datasetIndex,r.index)}}getActiveElements(){return this._active||[]}setActiveElements(t){const n=this._active||[],i=t.map(({datasetIndex:o,index:r})=>{const a=this.getDatasetMeta(o);if(!a)throw new Error("No dataset found at index "+o);return{datasetIndex:o,element:a.data[r],index:r}});!Ss(i,n)&&(this._active=i,this._lastEvent=null,this._updateHoverStyles(i,n))}notifyPlugins(t,n,i){return this._plugins.notify(this,t,n,i)}isPluginEnabled(t){return this._plugins._cache.filter(n=>n.plugin.id===t).length===1}_updateHoverStyles(t,n,i){const s=this.options.hover,o=(l,c)=>l.filter(u=>!c.some(h=>u.datasetIndex===h.datasetIndex&&u.index===h.index)),r=o(n,t),a=i?t:o(t,n);r.length&&this.updateHoverStyle(r,s.mode,!1),a.length&&s.mode&&this.updateHoverStyle(a,s.mode,!0)}_eventHandler(t,n){const i={event:t,replay:n,cancelable:!0,inChartArea:this.isPointInArea(t)},s=r=>(r.options.events||this.options.events).includes(t.native.type);if(this.notifyPlugins("beforeEvent",i,s)===!1)return;const o=this._handleEvent(t,n,i.inChartArea);return i.cancelable=!1,this.notifyPlugins("afterEvent",i,s),(o||i.changed)&&this.render(),this}_handleEvent(t,n,i){const{_active:s=[],options:o}=this,r=n,a=this._getActiveElements(t,s,i,r),l=Lg(t),c=I_(t,this._lastEvent,i,l);i&&(this._lastEvent=null,wt(o.onHover,[t,a,this],this),l&&wt(o.onClick,[t,a,this],this));const u=!Ss(a,s);return(u||n)&&(this._active=a,this._updateHoverStyles(a,s,n)),this._lastEvent=c,u}_getActiveElements(t,n,i,s){if(t.type==="mouseout")return[];if(!i)return n;const o=this.options.hover;return this.getElementsAtEventForMode(t,o.mode,o,s)}}function Ol(){return mt(Os.instances,e=>e._plugins.invalidate())}function L_(e,t,n){const{startAngle:i,x:s,y:o,outerRadius:r,innerRadius:a,options:l}=t,{borderWidth:c,borderJoinStyle:u}=l,h=Math.min(c/r,Vt(i-n));if(e.beginPath(),e.arc(s,o,r-c/2,i+h/2,n-h/2),a>0){const f=Math.min(c/a,Vt(i-n));e.arc(s,o,a+c/2,n-f/2,i+f/2,!0)}else{const f=Math.min(c/2,r*Vt(i-n));if(u==="round")e.arc(s,o,f,n-ct/2,i+ct/2,!0);else if(u==="bevel"){const d=2*f*f,g=-d*Math.cos(n+ct/2)+s,p=-d*Math.sin(n+ct/2)+o,b=d*Math.cos(i+ct/2)+s,y=d*Math.sin(i+ct/2)+o;e.lineTo(g,p),e.lineTo(b,y)}}e.closePath(),e.moveTo(0,0),e.rect(0,0,e.canvas.width,e.canvas.height),e.clip("evenodd")}function F_(e,t,n){const{startAngle:i,pixelMargin:s,x:o,y:r,outerRadius:a,innerRadius:l}=t;let c=s/a;e.beginPath(),e.arc(o,r,a,i-c,n+c),l>s?(c=s/l,e.arc(o,r,l,n+c,i-c,!0)):e.arc(o,r,s,n+Ot,i-Ot),e.closePath(),e.clip()}function N_(e){return Dr(e,["outerStart","outerEnd","innerStart","innerEnd"])}function B_(e,t,n,i){const s=N_(e.options.borderRadius),o=(n-t)/2,r=Math.min(o,i*t/2),a=l=>{const c=(n-Math.min(o,l))*i/2;return Lt(l,0,Math.min(o,c))};return{outerStart:a(s.outerStart),outerEnd:a(s.outerEnd),innerStart:Lt(s.innerStart,0,r),innerEnd:Lt(s.innerEnd,0,r)}}function En(e,t,n,i){return{x:n+e*Math.cos(t),y:i+e*Math.sin(t)}}function Ds(e,t,n,i,s,o){const{x:r,y:a,startAngle:l,pixelMargin:c,innerRadius:u}=t,h=Math.max(t.outerRadius+i+n-c,0),f=u>0?u+i+n+c:0;let d=0;const g=s-l;if(i){const P=u>0?u-i:0,L=h>0?h-i:0,z=(P+L)/2,Y=z!==0?g*z/(z+i):g;d=(g-Y)/2}const p=Math.max(.001,g*h-n/ct)/h,b=(g-p)/2,y=l+b+d,_=s-b-d,{outerStart:M,outerEnd:v,innerStart:S,innerEnd:E}=B_(t,f,h,_-y),O=h-M,I=h-v,j=y+M/O,U=_-v/I,X=f+S,Q=f+E,ut=y+S/X,R=_-E/Q;if(e.beginPath(),o){const P=(j+U)/2;if(e.arc(r,a,h,j,P),e.arc(r,a,h,P,U),v>0){const nt=En(I,U,r,a);e.arc(nt.x,nt.y,v,U,_+Ot)}const L=En(Q,_,r,a);if(e.lineTo(L.x,L.y),E>0){const nt=En(Q,R,r,a);e.arc(nt.x,nt.y,E,_+Ot,R+Math.PI)}const z=(_-E/f+(y+S/f))/2;if(e.arc(r,a,f,_-E/f,z,!0),e.arc(r,a,f,z,y+S/f,!0),S>0){const nt=En(X,ut,r,a);e.arc(nt.x,nt.y,S,ut+Math.PI,y-Ot)}const Y=En(O,y,r,a);if(e.lineTo(Y.x,Y.y),M>0){const nt=En(O,j,r,a);e.arc(nt.x,nt.y,M,y-Ot,j)}}else{e.moveTo(r,a);const P=Math.cos(j)*h+r,L=Math.sin(j)*h+a;e.lineTo(P,L);const z=Math.cos(U)*h+r,Y=Math.sin(U)*h+a;e.lineTo(z,Y)}e.closePath()}function V_(e,t,n,i,s){const{fullCircles:o,startAngle:r,circumference:a}=t;let l=t.endAngle;if(o){Ds(e,t,n,i,l,s);for(let c=0;c<o;++c)e.fill();isNaN(a)||(l=r+(a%St||St))}return Ds(e,t,n,i,l,s),e.fill(),l}function z_(e,t,n,i,s){const{fullCircles:o,startAngle:r,circumference:a,options:l}=t,{borderWidth:c,borderJoinStyle:u,borderDash:h,borderDashOffset:f,borderRadius:d}=l,g=l.borderAlign==="inner";if(!c)return;e.setLineDash(h||[]),e.lineDashOffset=f,g?(e.lineWidth=c*2,e.lineJoin=u||"round"):(e.lineWidth=c,e.lineJoin=u||"bevel");let p=t.endAngle;if(o){Ds(e,t,n,i,p,s);for(let b=0;b<o;++b)e.stroke();isNaN(a)||(p=r+(a%St||St))}g&&F_(e,t,p),l.selfJoin&&p-r>=ct&&d===0&&u!=="miter"&&L_(e,t,p),o||(Ds(e,t,n,i,p,s),e.stroke())}class H_ extends $e{static id="arc";static defaults={borderAlign:"center",borderColor:"#fff",borderDash:[],borderDashOffset:0,borderJoinStyle:void 0,borderRadius:0,borderWidth:2,offset:0,spacing:0,angle:void 0,circular:!0,selfJoin:!1};static defaultRoutes={backgroundColor:"backgroundColor"};static descriptors={_scriptable:!0,_indexable:t=>t!=="borderDash"};circumference;endAngle;fullCircles;innerRadius;outerRadius;pixelMargin;startAngle;constructor(t){super(),this.options=void 0,this.circumference=void 0,this.startAngle=void 0,this.endAngle=void 0,this.innerRadius=void 0,this.outerRadius=void 0,this.pixelMargin=0,this.fullCircles=0,t&&Object.assign(this,t)}inRange(t,n,i){const s=this.getProps(["x","y"],i),{angle:o,distance:r}=Eu(s,{x:t,y:n}),{startAngle:a,endAngle:l,innerRadius:c,outerRadius:u,circumference:h}=this.getProps(["startAngle","endAngle","innerRadius","outerRadius","circumference"],i),f=(this.options.spacing+this.options.borderWidth)/2,d=tt(h,l-a),g=Ei(o,a,l)&&a!==l,p=d>=St||g,b=Be(r,c+f,u+f);return p&&b}getCenterPoint(t){const{x:n,y:i,startAngle:s,endAngle:o,innerRadius:r,outerRadius:a}=this.getProps(["x","y","startAngle","endAngle","innerRadius","outerRadius"],t),{offset:l,spacing:c}=this.options,u=(s+o)/2,h=(r+a+c+l)/2;return{x:n+Math.cos(u)*h,y:i+Math.sin(u)*h}}tooltipPosition(t){return this.getCenterPoint(t)}draw(t){const{options:n,circumference:i}=this,s=(n.offset||0)/4,o=(n.spacing||0)/2,r=n.circular;if(this.pixelMargin=n.borderAlign==="inner"?.33:0,this.fullCircles=i>St?Math.floor(i/St):0,i===0||this.innerRadius<0||this.outerRadius<0)return;t.save();const a=(this.startAngle+this.endAngle)/2;t.translate(Math.cos(a)*s,Math.sin(a)*s);const l=1-Math.sin(Math.min(ct,i||0)),c=s*l;t.fillStyle=n.backgroundColor,t.strokeStyle=n.borderColor,V_(t,this,c,o,r),z_(t,this,c,o,r),t.restore()}}function fh(e,t,n=t){e.lineCap=tt(n.borderCapStyle,t.borderCapStyle),e.setLineDash(tt(n.borderDash,t.borderDash)),e.lineDashOffset=tt(n.borderDashOffset,t.borderDashOffset),e.lineJoin=tt(n.borderJoinStyle,t.borderJoinStyle),e.lineWidth=tt(n.borderWidth,t.borderWidth),e.strokeStyle=tt(n.borderColor,t.borderColor)}function W_(e,t,n){e.lineTo(n.x,n.y)}function j_(e){return e.stepped?sm:e.tension||e.cubicInterpolationMode==="monotone"?om:W_}function dh(e,t,n={}){const i=e.length,{start:s=0,end:o=i-1}=n,{start:r,end:a}=t,l=Math.max(s,r),c=Math.min(o,a),u=s<r&&o<r||s>a&&o>a;return{count:i,start:l,loop:t.loop,ilen:c<l&&!u?i+c-l:c-l}}function $_(e,t,n,i){const{points:s,options:o}=t,{count:r,start:a,loop:l,ilen:c}=dh(s,n,i),u=j_(o);let{move:h=!0,reverse:f}=i||{},d,g,p;for(d=0;d<=c;++d)g=s[(a+(f?c-d:d))%r],!g.skip&&(h?(e.moveTo(g.x,g.y),h=!1):u(e,p,g,f,o.stepped),p=g);return l&&(g=s[(a+(f?c:0))%r],u(e,p,g,f,o.stepped)),!!l}function U_(e,t,n,i){const s=t.points,{count:o,start:r,ilen:a}=dh(s,n,i),{move:l=!0,reverse:c}=i||{};let u=0,h=0,f,d,g,p,b,y;const _=v=>(r+(c?a-v:v))%o,M=()=>{p!==b&&(e.lineTo(u,b),e.lineTo(u,p),e.lineTo(u,y))};for(l&&(d=s[_(0)],e.moveTo(d.x,d.y)),f=0;f<=a;++f){if(d=s[_(f)],d.skip)continue;const v=d.x,S=d.y,E=v|0;E===g?(S<p?p=S:S>b&&(b=S),u=(h*u+v)/++h):(M(),e.lineTo(v,S),g=E,h=0,p=b=S),y=S}M()}function qo(e){const t=e.options,n=t.borderDash&&t.borderDash.length;return!e._decimated&&!e._loop&&!t.tension&&t.cubicInterpolationMode!=="monotone"&&!t.stepped&&!n?U_:$_}function Y_(e){return e.stepped?Nm:e.tension||e.cubicInterpolationMode==="monotone"?Bm:yn}function K_(e,t,n,i){let s=t._path;s||(s=t._path=new Path2D,t.path(s,n,i)&&s.closePath()),fh(e,t.options),e.stroke(s)}function G_(e,t,n,i){const{segments:s,options:o}=t,r=qo(t);for(const a of s)fh(e,o,a.style),e.beginPath(),r(e,t,a,{start:n,end:n+i-1})&&e.closePath(),e.stroke()}const X_=typeof Path2D=="function";function q_(e,t,n,i){X_&&!t.options.segment?K_(e,t,n,i):G_(e,t,n,i)}class qs extends $e{static id="line";static defaults={borderCapStyle:"butt",borderDash:[],borderDashOffset:0,borderJoinStyle:"miter",borderWidth:3,capBezierPoints:!0,cubicInterpolationMode:"default",fill:!1,spanGaps:!1,stepped:!1,tension:0};static defaultRoutes={backgroundColor:"backgroundColor",borderColor:"borderColor"};static descriptors={_scriptable:!0,_indexable:t=>t!=="borderDash"&&t!=="fill"};constructor(t){super(),this.animated=!0,this.options=void 0,this._chart=void 0,this._loop=void 0,this._fullLoop=void 0,this._path=void 0,this._points=void 0,this._segments=void 0,this._decimated=!1,this._pointsUpdated=!1,this._datasetIndex=void 0,t&&Object.assign(this,t)}updateControlPoints(t,n){const i=this.options;if((i.tension||i.cubicInterpolationMode==="monotone")&&!i.stepped&&!this._pointsUpdated){const s=i.spanGaps?this._loop:this._fullLoop;Om(this._points,i,t,s,n),this._pointsUpdated=!0}}set points(t){this._points=t,delete this._segments,delete this._path,this._pointsUpdated=!1}get points(){return this._points}get segments(){return this._segments||(this._segments=$m(this,this.options.segment))}first(){const t=this.segments,n=this.points;return t.length&&n[t[0].start]}last(){const t=this.segments,n=this.points,i=t.length;return i&&n[t[i-1].end]}interpolate(t,n){const i=this.options,s=t[n],o=this.points,r=Ju(this,{property:n,start:s,end:s});if(!r.length)return;const a=[],l=Y_(i);let c,u;for(c=0,u=r.length;c<u;++c){const{start:h,end:f}=r[c],d=o[h],g=o[f];if(d===g){a.push(d);continue}const p=Math.abs((s-d[n])/(g[n]-d[n])),b=l(d,g,p,i.stepped);b[n]=t[n],a.push(b)}return a.length===1?a[0]:a}pathSegment(t,n,i){return qo(this)(t,this,n,i)}path(t,n,i){const s=this.segments,o=qo(this);let r=this._loop;n=n||0,i=i||this.points.length-n;for(const a of s)r&=o(t,this,a,{start:n,end:n+i-1});return!!r}draw(t,n,i,s){const o=this.options||{};(this.points||[]).length&&o.borderWidth&&(t.save(),q_(t,this,i,s),t.restore()),this.animated&&(this._pointsUpdated=!1,this._path=void 0)}}function Dl(e,t,n,i){const s=e.options,{[n]:o}=e.getProps([n],i);return Math.abs(t-o)<s.radius+s.hitRadius}class J_ extends $e{static id="point";parsed;skip;stop;static defaults={borderWidth:1,hitRadius:1,hoverBorderWidth:1,hoverRadius:4,pointStyle:"circle",radius:3,rotation:0};static defaultRoutes={backgroundColor:"backgroundColor",borderColor:"borderColor"};constructor(t){super(),this.options=void 0,this.parsed=void 0,this.skip=void 0,this.stop=void 0,t&&Object.assign(this,t)}inRange(t,n,i){const s=this.options,{x:o,y:r}=this.getProps(["x","y"],i);return Math.pow(t-o,2)+Math.pow(n-r,2)<Math.pow(s.hitRadius+s.radius,2)}inXRange(t,n){return Dl(this,t,"x",n)}inYRange(t,n){return Dl(this,t,"y",n)}getCenterPoint(t){const{x:n,y:i}=this.getProps(["x","y"],t);return{x:n,y:i}}size(t){t=t||this.options||{};let n=t.radius||0;n=Math.max(n,n&&t.hoverRadius||0);const i=n&&t.borderWidth||0;return(n+i)*2}draw(t,n){const i=this.options;this.skip||i.radius<.1||!ze(this,n,this.size(i)/2)||(t.strokeStyle=i.borderColor,t.lineWidth=i.borderWidth,t.fillStyle=i.backgroundColor,Ko(t,i,this.x,this.y))}getRange(){const t=this.options||{};return t.radius+t.hitRadius}}function ph(e,t){const{x:n,y:i,base:s,width:o,height:r}=e.getProps(["x","y","base","width","height"],t);let a,l,c,u,h;return e.horizontal?(h=r/2,a=Math.min(n,s),l=Math.max(n,s),c=i-h,u=i+h):(h=o/2,a=n-h,l=n+h,c=Math.min(i,s),u=Math.max(i,s)),{left:a,top:c,right:l,bottom:u}}function Ze(e,t,n,i){return e?0:Lt(t,n,i)}function Z_(e,t,n){const i=e.options.borderWidth,s=e.borderSkipped,o=zu(i);return{t:Ze(s.top,o.top,0,n),r:Ze(s.right,o.right,0,t),b:Ze(s.bottom,o.bottom,0,n),l:Ze(s.left,o.left,0,t)}}function Q_(e,t,n){const{enableBorderRadius:i}=e.getProps(["enableBorderRadius"]),s=e.options.borderRadius,o=Mn(s),r=Math.min(t,n),a=e.borderSkipped,l=i||st(s);return{topLeft:Ze(!l||a.top||a.left,o.topLeft,0,r),topRight:Ze(!l||a.top||a.right,o.topRight,0,r),bottomLeft:Ze(!l||a.bottom||a.left,o.bottomLeft,0,r),bottomRight:Ze(!l||a.bottom||a.right,o.bottomRight,0,r)}}function ty(e){const t=ph(e),n=t.right-t.left,i=t.bottom-t.top,s=Z_(e,n/2,i/2),o=Q_(e,n/2,i/2);return{outer:{x:t.left,y:t.top,w:n,h:i,radius:o},inner:{x:t.left+s.l,y:t.top+s.t,w:n-s.l-s.r,h:i-s.t-s.b,radius:{topLeft:Math.max(0,o.topLeft-Math.max(s.t,s.l)),topRight:Math.max(0,o.topRight-Math.max(s.t,s.r)),bottomLeft:Math.max(0,o.bottomLeft-Math.max(s.b,s.l)),bottomRight:Math.max(0,o.bottomRight-Math.max(s.b,s.r))}}}}function Mo(e,t,n,i){const s=t===null,o=n===null,a=e&&!(s&&o)&&ph(e,i);return a&&(s||Be(t,a.left,a.right))&&(o||Be(n,a.top,a.bottom))}function ey(e){return e.topLeft||e.topRight||e.bottomLeft||e.bottomRight}function ny(e,t){e.rect(t.x,t.y,t.w,t.h)}function Co(e,t,n={}){const i=e.x!==n.x?-t:0,s=e.y!==n.y?-t:0,o=(e.x+e.w!==n.x+n.w?t:0)-i,r=(e.y+e.h!==n.y+n.h?t:0)-s;return{x:e.x+i,y:e.y+s,w:e.w+o,h:e.h+r,radius:e.radius}}class iy extends $e{static id="bar";static defaults={borderSkipped:"start",borderWidth:0,borderRadius:0,inflateAmount:"auto",pointStyle:void 0};static defaultRoutes={backgroundColor:"backgroundColor",borderColor:"borderColor"};constructor(t){super(),this.options=void 0,this.horizontal=void 0,this.base=void 0,this.width=void 0,this.height=void 0,this.inflateAmount=void 0,t&&Object.assign(this,t)}draw(t){const{inflateAmount:n,options:{borderColor:i,backgroundColor:s}}=this,{inner:o,outer:r}=ty(this),a=ey(r.radius)?Ti:ny;t.save(),(r.w!==o.w||r.h!==o.h)&&(t.beginPath(),a(t,Co(r,n,o)),t.clip(),a(t,Co(o,-n,r)),t.fillStyle=i,t.fill("evenodd")),t.beginPath(),a(t,Co(o,n)),t.fillStyle=s,t.fill(),t.restore()}inRange(t,n,i){return Mo(this,t,n,i)}inXRange(t,n){return Mo(this,t,null,n)}inYRange(t,n){return Mo(this,null,t,n)}getCenterPoint(t){const{x:n,y:i,base:s,horizontal:o}=this.getProps(["x","y","base","horizontal"],t);return{x:o?(n+s)/2:n,y:o?i:(i+s)/2}}getRange(t){return t==="x"?this.width/2:this.height/2}}var sy=Object.freeze({__proto__:null,ArcElement:H_,BarElement:iy,LineElement:qs,PointElement:J_});const Jo=["rgb(54, 162, 235)","rgb(255, 99, 132)","rgb(255, 159, 64)","rgb(255, 205, 86)","rgb(75, 192, 192)","rgb(153, 102, 255)","rgb(201, 203, 207)"],El=Jo.map(e=>e.replace("rgb(","rgba(").replace(")",", 0.5)"));function gh(e){return Jo[e%Jo.length]}function mh(e){return El[e%El.length]}function oy(e,t){return e.borderColor=gh(t),e.backgroundColor=mh(t),++t}function ry(e,t){return e.backgroundColor=e.data.map(()=>gh(t++)),t}function ay(e,t){return e.backgroundColor=e.data.map(()=>mh(t++)),t}function ly(e){let t=0;return(n,i)=>{const s=e.getDatasetMeta(i).controller;s instanceof Fr?t=ry(n,t):s instanceof nh?t=ay(n,t):s&&(t=oy(n,t))}}function Tl(e){let t;for(t in e)if(e[t].borderColor||e[t].backgroundColor)return!0;return!1}function cy(e){return e&&(e.borderColor||e.backgroundColor)}function uy(){return Ct.borderColor!=="rgba(0,0,0,0.1)"||Ct.backgroundColor!=="rgba(0,0,0,0.1)"}var hy={id:"colors",defaults:{enabled:!0,forceOverride:!1},beforeLayout(e,t,n){if(!n.enabled)return;const{data:{datasets:i},options:s}=e.config,{elements:o}=s,r=Tl(i)||cy(s)||o&&Tl(o)||uy();if(!n.forceOverride&&r)return;const a=ly(e);i.forEach(a)}};function fy(e,t,n,i,s){const o=s.samples||i;if(o>=n)return e.slice(t,t+n);const r=[],a=(n-2)/(o-2);let l=0;const c=t+n-1;let u=t,h,f,d,g,p;for(r[l++]=e[u],h=0;h<o-2;h++){let b=0,y=0,_;const M=Math.floor((h+1)*a)+1+t,v=Math.min(Math.floor((h+2)*a)+1,n)+t,S=v-M;for(_=M;_<v;_++)b+=e[_].x,y+=e[_].y;b/=S,y/=S;const E=Math.floor(h*a)+1+t,O=Math.min(Math.floor((h+1)*a)+1,n)+t,{x:I,y:j}=e[u];for(d=g=-1,_=E;_<O;_++)g=.5*Math.abs((I-b)*(e[_].y-j)-(I-e[_].x)*(y-j)),g>d&&(d=g,f=e[_],p=_);r[l++]=f,u=p}return r[l++]=e[c],r}function dy(e,t,n,i){let s=0,o=0,r,a,l,c,u,h,f,d,g,p;const b=[],y=t+n-1,_=e[t].x,v=e[y].x-_;for(r=t;r<t+n;++r){a=e[r],l=(a.x-_)/v*i,c=a.y;const S=l|0;if(S===u)c<g?(g=c,h=r):c>p&&(p=c,f=r),s=(o*s+a.x)/++o;else{const E=r-1;if(!it(h)&&!it(f)){const O=Math.min(h,f),I=Math.max(h,f);O!==d&&O!==E&&b.push({...e[O],x:s}),I!==d&&I!==E&&b.push({...e[I],x:s})}r>0&&E!==d&&b.push(e[E]),b.push(a),u=S,o=0,g=p=c,h=f=d=r}}return b}function bh(e){if(e._decimated){const t=e._data;delete e._decimated,delete e._data,Object.defineProperty(e,"data",{configurable:!0,enumerable:!0,writable:!0,value:t})}}function Rl(e){e.data.datasets.forEach(t=>{bh(t)})}function py(e,t){const n=t.length;let i=0,s;const{iScale:o}=e,{min:r,max:a,minDefined:l,maxDefined:c}=o.getUserBounds();return l&&(i=Lt(Ve(t,o.axis,r).lo,0,n-1)),c?s=Lt(Ve(t,o.axis,a).hi+1,i,n)-i:s=n-i,{start:i,count:s}}var gy={id:"decimation",defaults:{algorithm:"min-max",enabled:!1},beforeElementsUpdate:(e,t,n)=>{if(!n.enabled){Rl(e);return}const i=e.width;e.data.datasets.forEach((s,o)=>{const{_data:r,indexAxis:a}=s,l=e.getDatasetMeta(o),c=r||s.data;if(ai([a,e.options.indexAxis])==="y"||!l.controller.supportsDecimation)return;const u=e.scales[l.xAxisID];if(u.type!=="linear"&&u.type!=="time"||e.options.parsing)return;let{start:h,count:f}=py(l,c);const d=n.threshold||4*i;if(f<=d){bh(s);return}it(r)&&(s._data=c,delete s.data,Object.defineProperty(s,"data",{configurable:!0,enumerable:!0,get:function(){return this._decimated},set:function(p){this._data=p}}));let g;switch(n.algorithm){case"lttb":g=fy(c,h,f,i,n);break;case"min-max":g=dy(c,h,f,i);break;default:throw new Error(`Unsupported decimation algorithm '${n.algorithm}'`)}s._decimated=g})},destroy(e){Rl(e)}};function my(e,t,n){const i=e.segments,s=e.points,o=t.points,r=[];for(const a of i){let{start:l,end:c}=a;c=Js(l,c,s);const u=Zo(n,s[l],s[c],a.loop);if(!t.segments){r.push({source:a,target:u,start:s[l],end:s[c]});continue}const h=Ju(t,u);for(const f of h){const d=Zo(n,o[f.start],o[f.end],f.loop),g=qu(a,s,d);for(const p of g)r.push({source:p,target:f,start:{[n]:Il(u,d,"start",Math.max)},end:{[n]:Il(u,d,"end",Math.min)}})}}return r}function Zo(e,t,n,i){if(i)return;let s=t[e],o=n[e];return e==="angle"&&(s=Vt(s),o=Vt(o)),{property:e,start:s,end:o}}function by(e,t){const{x:n=null,y:i=null}=e||{},s=t.points,o=[];return t.segments.forEach(({start:r,end:a})=>{a=Js(r,a,s);const l=s[r],c=s[a];i!==null?(o.push({x:l.x,y:i}),o.push({x:c.x,y:i})):n!==null&&(o.push({x:n,y:l.y}),o.push({x:n,y:c.y}))}),o}function Js(e,t,n){for(;t>e;t--){const i=n[t];if(!isNaN(i.x)&&!isNaN(i.y))break}return t}function Il(e,t,n,i){return e&&t?i(e[n],t[n]):e?e[n]:t?t[n]:0}function _h(e,t){let n=[],i=!1;return Mt(e)?(i=!0,n=e):n=by(e,t),n.length?new qs({points:n,options:{tension:0},_loop:i,_fullLoop:i}):null}function Ll(e){return e&&e.fill!==!1}function _y(e,t,n){let s=e[t].fill;const o=[t];let r;if(!n)return s;for(;s!==!1&&o.indexOf(s)===-1;){if(!At(s))return s;if(r=e[s],!r)return!1;if(r.visible)return s;o.push(s),s=r.fill}return!1}function yy(e,t,n){const i=Sy(e);if(st(i))return isNaN(i.value)?!1:i;let s=parseFloat(i);return At(s)&&Math.floor(s)===s?xy(i[0],t,s,n):["origin","start","end","stack","shape"].indexOf(i)>=0&&i}function xy(e,t,n,i){return(e==="-"||e==="+")&&(n=t+n),n===t||n<0||n>=i?!1:n}function vy(e,t){let n=null;return e==="start"?n=t.bottom:e==="end"?n=t.top:st(e)?n=t.getPixelForValue(e.value):t.getBasePixel&&(n=t.getBasePixel()),n}function wy(e,t,n){let i;return e==="start"?i=n:e==="end"?i=t.options.reverse?t.min:t.max:st(e)?i=e.value:i=t.getBaseValue(),i}function Sy(e){const t=e.options,n=t.fill;let i=tt(n&&n.target,n);return i===void 0&&(i=!!t.backgroundColor),i===!1||i===null?!1:i===!0?"origin":i}function My(e){const{scale:t,index:n,line:i}=e,s=[],o=i.segments,r=i.points,a=Cy(t,n);a.push(_h({x:null,y:t.bottom},i));for(let l=0;l<o.length;l++){const c=o[l];for(let u=c.start;u<=c.end;u++)Py(s,r[u],a)}return new qs({points:s,options:{}})}function Cy(e,t){const n=[],i=e.getMatchingVisibleMetas("line");for(let s=0;s<i.length;s++){const o=i[s];if(o.index===t)break;o.hidden||n.unshift(o.dataset)}return n}function Py(e,t,n){const i=[];for(let s=0;s<n.length;s++){const o=n[s],{first:r,last:a,point:l}=Ay(o,t,"x");if(!(!l||r&&a)){if(r)i.unshift(l);else if(e.push(l),!a)break}}e.push(...i)}function Ay(e,t,n){const i=e.interpolate(t,n);if(!i)return{};const s=i[n],o=e.segments,r=e.points;let a=!1,l=!1;for(let c=0;c<o.length;c++){const u=o[c],h=r[u.start][n],f=r[u.end][n];if(Be(s,h,f)){a=s===h,l=s===f;break}}return{first:a,last:l,point:i}}class yh{constructor(t){this.x=t.x,this.y=t.y,this.radius=t.radius}pathSegment(t,n,i){const{x:s,y:o,radius:r}=this;return n=n||{start:0,end:St},t.arc(s,o,r,n.end,n.start,!0),!i.bounds}interpolate(t){const{x:n,y:i,radius:s}=this,o=t.angle;return{x:n+Math.cos(o)*s,y:i+Math.sin(o)*s,angle:o}}}function ky(e){const{chart:t,fill:n,line:i}=e;if(At(n))return Oy(t,n);if(n==="stack")return My(e);if(n==="shape")return!0;const s=Dy(e);return s instanceof yh?s:_h(s,i)}function Oy(e,t){const n=e.getDatasetMeta(t);return n&&e.isDatasetVisible(t)?n.dataset:null}function Dy(e){return(e.scale||{}).getPointPositionForValue?Ty(e):Ey(e)}function Ey(e){const{scale:t={},fill:n}=e,i=vy(n,t);if(At(i)){const s=t.isHorizontal();return{x:s?i:null,y:s?null:i}}return null}function Ty(e){const{scale:t,fill:n}=e,i=t.options,s=t.getLabels().length,o=i.reverse?t.max:t.min,r=wy(n,t,o),a=[];if(i.grid.circular){const l=t.getPointPositionForValue(0,o);return new yh({x:l.x,y:l.y,radius:t.getDistanceFromCenterForValue(r)})}for(let l=0;l<s;++l)a.push(t.getPointPositionForValue(l,r));return a}function Po(e,t,n){const i=ky(t),{chart:s,index:o,line:r,scale:a,axis:l}=t,c=r.options,u=c.fill,h=c.backgroundColor,{above:f=h,below:d=h}=u||{},g=s.getDatasetMeta(o),p=Zu(s,g);i&&r.points.length&&(Ys(e,n),Ry(e,{line:r,target:i,above:f,below:d,area:n,scale:a,axis:l,clip:p}),Ks(e))}function Ry(e,t){const{line:n,target:i,above:s,below:o,area:r,scale:a,clip:l}=t,c=n._loop?"angle":t.axis;e.save();let u=o;o!==s&&(c==="x"?(Fl(e,i,r.top),Ao(e,{line:n,target:i,color:s,scale:a,property:c,clip:l}),e.restore(),e.save(),Fl(e,i,r.bottom)):c==="y"&&(Nl(e,i,r.left),Ao(e,{line:n,target:i,color:o,scale:a,property:c,clip:l}),e.restore(),e.save(),Nl(e,i,r.right),u=s)),Ao(e,{line:n,target:i,color:u,scale:a,property:c,clip:l}),e.restore()}function Fl(e,t,n){const{segments:i,points:s}=t;let o=!0,r=!1;e.beginPath();for(const a of i){const{start:l,end:c}=a,u=s[l],h=s[Js(l,c,s)];o?(e.moveTo(u.x,u.y),o=!1):(e.lineTo(u.x,n),e.lineTo(u.x,u.y)),r=!!t.pathSegment(e,a,{move:r}),r?e.closePath():e.lineTo(h.x,n)}e.lineTo(t.first().x,n),e.closePath(),e.clip()}function Nl(e,t,n){const{segments:i,points:s}=t;let o=!0,r=!1;e.beginPath();for(const a of i){const{start:l,end:c}=a,u=s[l],h=s[Js(l,c,s)];o?(e.moveTo(u.x,u.y),o=!1):(e.lineTo(n,u.y),e.lineTo(u.x,u.y)),r=!!t.pathSegment(e,a,{move:r}),r?e.closePath():e.lineTo(n,h.y)}e.lineTo(n,t.first().y),e.closePath(),e.clip()}function Ao(e,t){const{line:n,target:i,property:s,color:o,scale:r,clip:a}=t,l=my(n,i,s);for(const{source:c,target:u,start:h,end:f}of l){const{style:{backgroundColor:d=o}={}}=c,g=i!==!0;e.save(),e.fillStyle=d,Iy(e,r,a,g&&Zo(s,h,f)),e.beginPath();const p=!!n.pathSegment(e,c);let b;if(g){p?e.closePath():Bl(e,i,f,s);const y=!!i.pathSegment(e,u,{move:p,reverse:!0});b=p&&y,b||Bl(e,i,h,s)}e.closePath(),e.fill(b?"evenodd":"nonzero"),e.restore()}}function Iy(e,t,n,i){const s=t.chart.chartArea,{property:o,start:r,end:a}=i||{};if(o==="x"||o==="y"){let l,c,u,h;o==="x"?(l=r,c=s.top,u=a,h=s.bottom):(l=s.left,c=r,u=s.right,h=a),e.beginPath(),n&&(l=Math.max(l,n.left),u=Math.min(u,n.right),c=Math.max(c,n.top),h=Math.min(h,n.bottom)),e.rect(l,c,u-l,h-c),e.clip()}}function Bl(e,t,n,i){const s=t.interpolate(n,i);s&&e.lineTo(s.x,s.y)}var Ly={id:"filler",afterDatasetsUpdate(e,t,n){const i=(e.data.datasets||[]).length,s=[];let o,r,a,l;for(r=0;r<i;++r)o=e.getDatasetMeta(r),a=o.dataset,l=null,a&&a.options&&a instanceof qs&&(l={visible:e.isDatasetVisible(r),index:r,fill:yy(a,r,i),chart:e,axis:o.controller.options.indexAxis,scale:o.vScale,line:a}),o.$filler=l,s.push(l);for(r=0;r<i;++r)l=s[r],!(!l||l.fill===!1)&&(l.fill=_y(s,r,n.propagate))},beforeDraw(e,t,n){const i=n.drawTime==="beforeDraw",s=e.getSortedVisibleDatasetMetas(),o=e.chartArea;for(let r=s.length-1;r>=0;--r){const a=s[r].$filler;a&&(a.line.updateControlPoints(o,a.axis),i&&a.fill&&Po(e.ctx,a,o))}},beforeDatasetsDraw(e,t,n){if(n.drawTime!=="beforeDatasetsDraw")return;const i=e.getSortedVisibleDatasetMetas();for(let s=i.length-1;s>=0;--s){const o=i[s].$filler;Ll(o)&&Po(e.ctx,o,e.chartArea)}},beforeDatasetDraw(e,t,n){const i=t.meta.$filler;!Ll(i)||n.drawTime!=="beforeDatasetDraw"||Po(e.ctx,i,e.chartArea)},defaults:{propagate:!0,drawTime:"beforeDatasetDraw"}};const Vl=(e,t)=>{let{boxHeight:n=t,boxWidth:i=t}=e;return e.usePointStyle&&(n=Math.min(n,t),i=e.pointStyleWidth||Math.min(i,t)),{boxWidth:i,boxHeight:n,itemHeight:Math.max(t,n)}},Fy=(e,t)=>e!==null&&t!==null&&e.datasetIndex===t.datasetIndex&&e.index===t.index;class zl extends $e{constructor(t){super(),this._added=!1,this.legendHitBoxes=[],this._hoveredItem=null,this.doughnutMode=!1,this.chart=t.chart,this.options=t.options,this.ctx=t.ctx,this.legendItems=void 0,this.columnSizes=void 0,this.lineWidths=void 0,this.maxHeight=void 0,this.maxWidth=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.height=void 0,this.width=void 0,this._margins=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(t,n,i){this.maxWidth=t,this.maxHeight=n,this._margins=i,this.setDimensions(),this.buildLabels(),this.fit()}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=this._margins.left,this.right=this.width):(this.height=this.maxHeight,this.top=this._margins.top,this.bottom=this.height)}buildLabels(){const t=this.options.labels||{};let n=wt(t.generateLabels,[this.chart],this)||[];t.filter&&(n=n.filter(i=>t.filter(i,this.chart.data))),t.sort&&(n=n.sort((i,s)=>t.sort(i,s,this.chart.data))),this.options.reverse&&n.reverse(),this.legendItems=n}fit(){const{options:t,ctx:n}=this;if(!t.display){this.width=this.height=0;return}const i=t.labels,s=It(i.font),o=s.size,r=this._computeTitleHeight(),{boxWidth:a,itemHeight:l}=Vl(i,o);let c,u;n.font=s.string,this.isHorizontal()?(c=this.maxWidth,u=this._fitRows(r,o,a,l)+10):(u=this.maxHeight,c=this._fitCols(r,s,a,l)+10),this.width=Math.min(c,t.maxWidth||this.maxWidth),this.height=Math.min(u,t.maxHeight||this.maxHeight)}_fitRows(t,n,i,s){const{ctx:o,maxWidth:r,options:{labels:{padding:a}}}=this,l=this.legendHitBoxes=[],c=this.lineWidths=[0],u=s+a;let h=t;o.textAlign="left",o.textBaseline="middle";let f=-1,d=-u;return this.legendItems.forEach((g,p)=>{const b=i+n/2+o.measureText(g.text).width;(p===0||c[c.length-1]+b+2*a>r)&&(h+=u,c[c.length-(p>0?0:1)]=0,d+=u,f++),l[p]={left:0,top:d,row:f,width:b,height:s},c[c.length-1]+=b+a}),h}_fitCols(t,n,i,s){const{ctx:o,maxHeight:r,options:{labels:{padding:a}}}=this,l=this.legendHitBoxes=[],c=this.columnSizes=[],u=r-t;let h=a,f=0,d=0,g=0,p=0;return this.legendItems.forEach((b,y)=>{const{itemWidth:_,itemHeight:M}=Ny(i,n,o,b,s);y>0&&d+M+2*a>u&&(h+=f+a,c.push({width:f,height:d}),g+=f+a,p++,f=d=0),l[y]={left:g,top:d,col:p,width:_,height:M},f=Math.max(f,_),d+=M+a}),h+=f,c.push({width:f,height:d}),h}adjustHitBoxes(){if(!this.options.display)return;const t=this._computeTitleHeight(),{legendHitBoxes:n,options:{align:i,labels:{padding:s},rtl:o}}=this,r=Hn(o,this.left,this.width);if(this.isHorizontal()){let a=0,l=Bt(i,this.left+s,this.right-this.lineWidths[a]);for(const c of n)a!==c.row&&(a=c.row,l=Bt(i,this.left+s,this.right-this.lineWidths[a])),c.top+=this.top+t+s,c.left=r.leftForLtr(r.x(l),c.width),l+=c.width+s}else{let a=0,l=Bt(i,this.top+t+s,this.bottom-this.columnSizes[a].height);for(const c of n)c.col!==a&&(a=c.col,l=Bt(i,this.top+t+s,this.bottom-this.columnSizes[a].height)),c.top=l,c.left+=this.left+s,c.left=r.leftForLtr(r.x(c.left),c.width),l+=c.height+s}}isHorizontal(){return this.options.position==="top"||this.options.position==="bottom"}draw(){if(this.options.display){const t=this.ctx;Ys(t,this),this._draw(),Ks(t)}}_draw(){const{options:t,columnSizes:n,lineWidths:i,ctx:s}=this,{align:o,labels:r}=t,a=Ct.color,l=Hn(t.rtl,this.left,this.width),c=It(r.font),{padding:u}=r,h=c.size,f=h/2;let d;this.drawTitle(),s.textAlign=l.textAlign("left"),s.textBaseline="middle",s.lineWidth=.5,s.font=c.string;const{boxWidth:g,boxHeight:p,itemHeight:b}=Vl(r,h),y=function(E,O,I){if(isNaN(g)||g<=0||isNaN(p)||p<0)return;s.save();const j=tt(I.lineWidth,1);if(s.fillStyle=tt(I.fillStyle,a),s.lineCap=tt(I.lineCap,"butt"),s.lineDashOffset=tt(I.lineDashOffset,0),s.lineJoin=tt(I.lineJoin,"miter"),s.lineWidth=j,s.strokeStyle=tt(I.strokeStyle,a),s.setLineDash(tt(I.lineDash,[])),r.usePointStyle){const U={radius:p*Math.SQRT2/2,pointStyle:I.pointStyle,rotation:I.rotation,borderWidth:j},X=l.xPlus(E,g/2),Q=O+f;Vu(s,U,X,Q,r.pointStyleWidth&&g)}else{const U=O+Math.max((h-p)/2,0),X=l.leftForLtr(E,g),Q=Mn(I.borderRadius);s.beginPath(),Object.values(Q).some(ut=>ut!==0)?Ti(s,{x:X,y:U,w:g,h:p,radius:Q}):s.rect(X,U,g,p),s.fill(),j!==0&&s.stroke()}s.restore()},_=function(E,O,I){An(s,I.text,E,O+b/2,c,{strikethrough:I.hidden,textAlign:l.textAlign(I.textAlign)})},M=this.isHorizontal(),v=this._computeTitleHeight();M?d={x:Bt(o,this.left+u,this.right-i[0]),y:this.top+u+v,line:0}:d={x:this.left+u,y:Bt(o,this.top+v+u,this.bottom-n[0].height),line:0},Ku(this.ctx,t.textDirection);const S=b+u;this.legendItems.forEach((E,O)=>{s.strokeStyle=E.fontColor,s.fillStyle=E.fontColor;const I=s.measureText(E.text).width,j=l.textAlign(E.textAlign||(E.textAlign=r.textAlign)),U=g+f+I;let X=d.x,Q=d.y;l.setWidth(this.width),M?O>0&&X+U+u>this.right&&(Q=d.y+=S,d.line++,X=d.x=Bt(o,this.left+u,this.right-i[d.line])):O>0&&Q+S>this.bottom&&(X=d.x=X+n[d.line].width+u,d.line++,Q=d.y=Bt(o,this.top+v+u,this.bottom-n[d.line].height));const ut=l.x(X);if(y(ut,Q,E),X=Kg(j,X+g+f,M?X+U:this.right,t.rtl),_(l.x(X),Q,E),M)d.x+=U+u;else if(typeof E.text!="string"){const R=c.lineHeight;d.y+=xh(E,R)+u}else d.y+=S}),Gu(this.ctx,t.textDirection)}drawTitle(){const t=this.options,n=t.title,i=It(n.font),s=$t(n.padding);if(!n.display)return;const o=Hn(t.rtl,this.left,this.width),r=this.ctx,a=n.position,l=i.size/2,c=s.top+l;let u,h=this.left,f=this.width;if(this.isHorizontal())f=Math.max(...this.lineWidths),u=this.top+c,h=Bt(t.align,h,this.right-f);else{const g=this.columnSizes.reduce((p,b)=>Math.max(p,b.height),0);u=c+Bt(t.align,this.top,this.bottom-g-t.labels.padding-this._computeTitleHeight())}const d=Bt(a,h,h+f);r.textAlign=o.textAlign(kr(a)),r.textBaseline="middle",r.strokeStyle=n.color,r.fillStyle=n.color,r.font=i.string,An(r,n.text,d,u,i)}_computeTitleHeight(){const t=this.options.title,n=It(t.font),i=$t(t.padding);return t.display?n.lineHeight+i.height:0}_getLegendItemAt(t,n){let i,s,o;if(Be(t,this.left,this.right)&&Be(n,this.top,this.bottom)){for(o=this.legendHitBoxes,i=0;i<o.length;++i)if(s=o[i],Be(t,s.left,s.left+s.width)&&Be(n,s.top,s.top+s.height))return this.legendItems[i]}return null}handleEvent(t){const n=this.options;if(!zy(t.type,n))return;const i=this._getLegendItemAt(t.x,t.y);if(t.type==="mousemove"||t.type==="mouseout"){const s=this._hoveredItem,o=Fy(s,i);s&&!o&&wt(n.onLeave,[t,s,this],this),this._hoveredItem=i,i&&!o&&wt(n.onHover,[t,i,this],this)}else i&&wt(n.onClick,[t,i,this],this)}}function Ny(e,t,n,i,s){const o=By(i,e,t,n),r=Vy(s,i,t.lineHeight);return{itemWidth:o,itemHeight:r}}function By(e,t,n,i){let s=e.text;return s&&typeof s!="string"&&(s=s.reduce((o,r)=>o.length>r.length?o:r)),t+n.size/2+i.measureText(s).width}function Vy(e,t,n){let i=e;return typeof t.text!="string"&&(i=xh(t,n)),i}function xh(e,t){const n=e.text?e.text.length:0;return t*n}function zy(e,t){return!!((e==="mousemove"||e==="mouseout")&&(t.onHover||t.onLeave)||t.onClick&&(e==="click"||e==="mouseup"))}var Hy={id:"legend",_element:zl,start(e,t,n){const i=e.legend=new zl({ctx:e.ctx,options:n,chart:e});Ht.configure(e,i,n),Ht.addBox(e,i)},stop(e){Ht.removeBox(e,e.legend),delete e.legend},beforeUpdate(e,t,n){const i=e.legend;Ht.configure(e,i,n),i.options=n},afterUpdate(e){const t=e.legend;t.buildLabels(),t.adjustHitBoxes()},afterEvent(e,t){t.replay||e.legend.handleEvent(t.event)},defaults:{display:!0,position:"top",align:"center",fullSize:!0,reverse:!1,weight:1e3,onClick(e,t,n){const i=t.datasetIndex,s=n.chart;s.isDatasetVisible(i)?(s.hide(i),t.hidden=!0):(s.show(i),t.hidden=!1)},onHover:null,onLeave:null,labels:{color:e=>e.chart.options.color,boxWidth:40,padding:10,generateLabels(e){const t=e.data.datasets,{labels:{usePointStyle:n,pointStyle:i,textAlign:s,color:o,useBorderRadius:r,borderRadius:a}}=e.legend.options;return e._getSortedDatasetMetas().map(l=>{const c=l.controller.getStyle(n?0:void 0),u=$t(c.borderWidth);return{text:t[l.index].label,fillStyle:c.backgroundColor,fontColor:o,hidden:!l.visible,lineCap:c.borderCapStyle,lineDash:c.borderDash,lineDashOffset:c.borderDashOffset,lineJoin:c.borderJoinStyle,lineWidth:(u.width+u.height)/4,strokeStyle:c.borderColor,pointStyle:i||c.pointStyle,rotation:c.rotation,textAlign:s||c.textAlign,borderRadius:r&&(a||c.borderRadius),datasetIndex:l.index}},this)}},title:{color:e=>e.chart.options.color,display:!1,position:"center",text:""}},descriptors:{_scriptable:e=>!e.startsWith("on"),labels:{_scriptable:e=>!["generateLabels","filter","sort"].includes(e)}}};class Br extends $e{constructor(t){super(),this.chart=t.chart,this.options=t.options,this.ctx=t.ctx,this._padding=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(t,n){const i=this.options;if(this.left=0,this.top=0,!i.display){this.width=this.height=this.right=this.bottom=0;return}this.width=this.right=t,this.height=this.bottom=n;const s=Mt(i.text)?i.text.length:1;this._padding=$t(i.padding);const o=s*It(i.font).lineHeight+this._padding.height;this.isHorizontal()?this.height=o:this.width=o}isHorizontal(){const t=this.options.position;return t==="top"||t==="bottom"}_drawArgs(t){const{top:n,left:i,bottom:s,right:o,options:r}=this,a=r.align;let l=0,c,u,h;return this.isHorizontal()?(u=Bt(a,i,o),h=n+t,c=o-i):(r.position==="left"?(u=i+t,h=Bt(a,s,n),l=ct*-.5):(u=o-t,h=Bt(a,n,s),l=ct*.5),c=s-n),{titleX:u,titleY:h,maxWidth:c,rotation:l}}draw(){const t=this.ctx,n=this.options;if(!n.display)return;const i=It(n.font),o=i.lineHeight/2+this._padding.top,{titleX:r,titleY:a,maxWidth:l,rotation:c}=this._drawArgs(o);An(t,n.text,0,0,i,{color:n.color,maxWidth:l,rotation:c,textAlign:kr(n.align),textBaseline:"middle",translation:[r,a]})}}function Wy(e,t){const n=new Br({ctx:e.ctx,options:t,chart:e});Ht.configure(e,n,t),Ht.addBox(e,n),e.titleBlock=n}var jy={id:"title",_element:Br,start(e,t,n){Wy(e,n)},stop(e){const t=e.titleBlock;Ht.removeBox(e,t),delete e.titleBlock},beforeUpdate(e,t,n){const i=e.titleBlock;Ht.configure(e,i,n),i.options=n},defaults:{align:"center",display:!1,font:{weight:"bold"},fullSize:!0,padding:10,position:"top",text:"",weight:2e3},defaultRoutes:{color:"color"},descriptors:{_scriptable:!0,_indexable:!1}};const ts=new WeakMap;var $y={id:"subtitle",start(e,t,n){const i=new Br({ctx:e.ctx,options:n,chart:e});Ht.configure(e,i,n),Ht.addBox(e,i),ts.set(e,i)},stop(e){Ht.removeBox(e,ts.get(e)),ts.delete(e)},beforeUpdate(e,t,n){const i=ts.get(e);Ht.configure(e,i,n),i.options=n},defaults:{align:"center",display:!1,font:{weight:"normal"},fullSize:!0,padding:0,position:"top",text:"",weight:1500},defaultRoutes:{color:"color"},descriptors:{_scriptable:!0,_indexable:!1}};const ci={average(e){if(!e.length)return!1;let t,n,i=new Set,s=0,o=0;for(t=0,n=e.length;t<n;++t){const a=e[t].element;if(a&&a.hasValue()){const l=a.tooltipPosition();i.add(l.x),s+=l.y,++o}}return o===0||i.size===0?!1:{x:[...i].reduce((a,l)=>a+l)/i.size,y:s/o}},nearest(e,t){if(!e.length)return!1;let n=t.x,i=t.y,s=Number.POSITIVE_INFINITY,o,r,a;for(o=0,r=e.length;o<r;++o){const l=e[o].element;if(l&&l.hasValue()){const c=l.getCenterPoint(),u=Uo(t,c);u<s&&(s=u,a=l)}}if(a){const l=a.tooltipPosition();n=l.x,i=l.y}return{x:n,y:i}}};function ve(e,t){return t&&(Mt(t)?Array.prototype.push.apply(e,t):e.push(t)),e}function Re(e){return(typeof e=="string"||e instanceof String)&&e.indexOf(`
-`)>-1?e.split(`
-`):e}function Uy(e,t){const{element:n,datasetIndex:i,index:s}=t,o=e.getDatasetMeta(i).controller,{label:r,value:a}=o.getLabelAndValue(s);return{chart:e,label:r,parsed:o.getParsed(s),raw:e.data.datasets[i].data[s],formattedValue:a,dataset:o.getDataset(),dataIndex:s,datasetIndex:i,element:n}}function Hl(e,t){const n=e.chart.ctx,{body:i,footer:s,title:o}=e,{boxWidth:r,boxHeight:a}=t,l=It(t.bodyFont),c=It(t.titleFont),u=It(t.footerFont),h=o.length,f=s.length,d=i.length,g=$t(t.padding);let p=g.height,b=0,y=i.reduce((v,S)=>v+S.before.length+S.lines.length+S.after.length,0);if(y+=e.beforeBody.length+e.afterBody.length,h&&(p+=h*c.lineHeight+(h-1)*t.titleSpacing+t.titleMarginBottom),y){const v=t.displayColors?Math.max(a,l.lineHeight):l.lineHeight;p+=d*v+(y-d)*l.lineHeight+(y-1)*t.bodySpacing}f&&(p+=t.footerMarginTop+f*u.lineHeight+(f-1)*t.footerSpacing);let _=0;const M=function(v){b=Math.max(b,n.measureText(v).width+_)};return n.save(),n.font=c.string,mt(e.title,M),n.font=l.string,mt(e.beforeBody.concat(e.afterBody),M),_=t.displayColors?r+2+t.boxPadding:0,mt(i,v=>{mt(v.before,M),mt(v.lines,M),mt(v.after,M)}),_=0,n.font=u.string,mt(e.footer,M),n.restore(),b+=g.width,{width:b,height:p}}function Yy(e,t){const{y:n,height:i}=t;return n<i/2?"top":n>e.height-i/2?"bottom":"center"}function Ky(e,t,n,i){const{x:s,width:o}=i,r=n.caretSize+n.caretPadding;if(e==="left"&&s+o+r>t.width||e==="right"&&s-o-r<0)return!0}function Gy(e,t,n,i){const{x:s,width:o}=n,{width:r,chartArea:{left:a,right:l}}=e;let c="center";return i==="center"?c=s<=(a+l)/2?"left":"right":s<=o/2?c="left":s>=r-o/2&&(c="right"),Ky(c,e,t,n)&&(c="center"),c}function Wl(e,t,n){const i=n.yAlign||t.yAlign||Yy(e,n);return{xAlign:n.xAlign||t.xAlign||Gy(e,t,n,i),yAlign:i}}function Xy(e,t){let{x:n,width:i}=e;return t==="right"?n-=i:t==="center"&&(n-=i/2),n}function qy(e,t,n){let{y:i,height:s}=e;return t==="top"?i+=n:t==="bottom"?i-=s+n:i-=s/2,i}function jl(e,t,n,i){const{caretSize:s,caretPadding:o,cornerRadius:r}=e,{xAlign:a,yAlign:l}=n,c=s+o,{topLeft:u,topRight:h,bottomLeft:f,bottomRight:d}=Mn(r);let g=Xy(t,a);const p=qy(t,l,c);return l==="center"?a==="left"?g+=c:a==="right"&&(g-=c):a==="left"?g-=Math.max(u,f)+s:a==="right"&&(g+=Math.max(h,d)+s),{x:Lt(g,0,i.width-t.width),y:Lt(p,0,i.height-t.height)}}function es(e,t,n){const i=$t(n.padding);return t==="center"?e.x+e.width/2:t==="right"?e.x+e.width-i.right:e.x+i.left}function $l(e){return ve([],Re(e))}function Jy(e,t,n){return ln(e,{tooltip:t,tooltipItems:n,type:"tooltip"})}function Ul(e,t){const n=t&&t.dataset&&t.dataset.tooltip&&t.dataset.tooltip.callbacks;return n?e.override(n):e}const vh={beforeTitle:Ee,title(e){if(e.length>0){const t=e[0],n=t.chart.data.labels,i=n?n.length:0;if(this&&this.options&&this.options.mode==="dataset")return t.dataset.label||"";if(t.label)return t.label;if(i>0&&t.dataIndex<i)return n[t.dataIndex]}return""},afterTitle:Ee,beforeBody:Ee,beforeLabel:Ee,label(e){if(this&&this.options&&this.options.mode==="dataset")return e.label+": "+e.formattedValue||e.formattedValue;let t=e.dataset.label||"";t&&(t+=": ");const n=e.formattedValue;return it(n)||(t+=n),t},labelColor(e){const n=e.chart.getDatasetMeta(e.datasetIndex).controller.getStyle(e.dataIndex);return{borderColor:n.borderColor,backgroundColor:n.backgroundColor,borderWidth:n.borderWidth,borderDash:n.borderDash,borderDashOffset:n.borderDashOffset,borderRadius:0}},labelTextColor(){return this.options.bodyColor},labelPointStyle(e){const n=e.chart.getDatasetMeta(e.datasetIndex).controller.getStyle(e.dataIndex);return{pointStyle:n.pointStyle,rotation:n.rotation}},afterLabel:Ee,afterBody:Ee,beforeFooter:Ee,footer:Ee,afterFooter:Ee};function Qt(e,t,n,i){const s=e[t].call(n,i);return typeof s>"u"?vh[t].call(n,i):s}class Yl extends $e{static positioners=ci;constructor(t){super(),this.opacity=0,this._active=[],this._eventPosition=void 0,this._size=void 0,this._cachedAnimations=void 0,this._tooltipItems=[],this.$animations=void 0,this.$context=void 0,this.chart=t.chart,this.options=t.options,this.dataPoints=void 0,this.title=void 0,this.beforeBody=void 0,this.body=void 0,this.afterBody=void 0,this.footer=void 0,this.xAlign=void 0,this.yAlign=void 0,this.x=void 0,this.y=void 0,this.height=void 0,this.width=void 0,this.caretX=void 0,this.caretY=void 0,this.labelColors=void 0,this.labelPointStyles=void 0,this.labelTextColors=void 0}initialize(t){this.options=t,this._cachedAnimations=void 0,this.$context=void 0}_resolveAnimations(){const t=this._cachedAnimations;if(t)return t;const n=this.chart,i=this.options.setContext(this.getContext()),s=i.enabled&&n.options.animation&&i.animations,o=new Qu(this.chart,s);return s._cacheable&&(this._cachedAnimations=Object.freeze(o)),o}getContext(){return this.$context||(this.$context=Jy(this.chart.getContext(),this,this._tooltipItems))}getTitle(t,n){const{callbacks:i}=n,s=Qt(i,"beforeTitle",this,t),o=Qt(i,"title",this,t),r=Qt(i,"afterTitle",this,t);let a=[];return a=ve(a,Re(s)),a=ve(a,Re(o)),a=ve(a,Re(r)),a}getBeforeBody(t,n){return $l(Qt(n.callbacks,"beforeBody",this,t))}getBody(t,n){const{callbacks:i}=n,s=[];return mt(t,o=>{const r={before:[],lines:[],after:[]},a=Ul(i,o);ve(r.before,Re(Qt(a,"beforeLabel",this,o))),ve(r.lines,Qt(a,"label",this,o)),ve(r.after,Re(Qt(a,"afterLabel",this,o))),s.push(r)}),s}getAfterBody(t,n){return $l(Qt(n.callbacks,"afterBody",this,t))}getFooter(t,n){const{callbacks:i}=n,s=Qt(i,"beforeFooter",this,t),o=Qt(i,"footer",this,t),r=Qt(i,"afterFooter",this,t);let a=[];return a=ve(a,Re(s)),a=ve(a,Re(o)),a=ve(a,Re(r)),a}_createItems(t){const n=this._active,i=this.chart.data,s=[],o=[],r=[];let a=[],l,c;for(l=0,c=n.length;l<c;++l)a.push(Uy(this.chart,n[l]));return t.filter&&(a=a.filter((u,h,f)=>t.filter(u,h,f,i))),t.itemSort&&(a=a.sort((u,h)=>t.itemSort(u,h,i))),mt(a,u=>{const h=Ul(t.callbacks,u);s.push(Qt(h,"labelColor",this,u)),o.push(Qt(h,"labelPointStyle",this,u)),r.push(Qt(h,"labelTextColor",this,u))}),this.labelColors=s,this.labelPointStyles=o,this.labelTextColors=r,this.dataPoints=a,a}update(t,n){const i=this.options.setContext(this.getContext()),s=this._active;let o,r=[];if(!s.length)this.opacity!==0&&(o={opacity:0});else{const a=ci[i.position].call(this,s,this._eventPosition);r=this._createItems(i),this.title=this.getTitle(r,i),this.beforeBody=this.getBeforeBody(r,i),this.body=this.getBody(r,i),this.afterBody=this.getAfterBody(r,i),this.footer=this.getFooter(r,i);const l=this._size=Hl(this,i),c=Object.assign({},a,l),u=Wl(this.chart,i,c),h=jl(i,c,u,this.chart);this.xAlign=u.xAlign,this.yAlign=u.yAlign,o={opacity:1,x:h.x,y:h.y,width:l.width,height:l.height,caretX:a.x,caretY:a.y}}this._tooltipItems=r,this.$context=void 0,o&&this._resolveAnimations().update(this,o),t&&i.external&&i.external.call(this,{chart:this.chart,tooltip:this,replay:n})}drawCaret(t,n,i,s){const o=this.getCaretPosition(t,i,s);n.lineTo(o.x1,o.y1),n.lineTo(o.x2,o.y2),n.lineTo(o.x3,o.y3)}getCaretPosition(t,n,i){const{xAlign:s,yAlign:o}=this,{caretSize:r,cornerRadius:a}=i,{topLeft:l,topRight:c,bottomLeft:u,bottomRight:h}=Mn(a),{x:f,y:d}=t,{width:g,height:p}=n;let b,y,_,M,v,S;return o==="center"?(v=d+p/2,s==="left"?(b=f,y=b-r,M=v+r,S=v-r):(b=f+g,y=b+r,M=v-r,S=v+r),_=b):(s==="left"?y=f+Math.max(l,u)+r:s==="right"?y=f+g-Math.max(c,h)-r:y=this.caretX,o==="top"?(M=d,v=M-r,b=y-r,_=y+r):(M=d+p,v=M+r,b=y+r,_=y-r),S=M),{x1:b,x2:y,x3:_,y1:M,y2:v,y3:S}}drawTitle(t,n,i){const s=this.title,o=s.length;let r,a,l;if(o){const c=Hn(i.rtl,this.x,this.width);for(t.x=es(this,i.titleAlign,i),n.textAlign=c.textAlign(i.titleAlign),n.textBaseline="middle",r=It(i.titleFont),a=i.titleSpacing,n.fillStyle=i.titleColor,n.font=r.string,l=0;l<o;++l)n.fillText(s[l],c.x(t.x),t.y+r.lineHeight/2),t.y+=r.lineHeight+a,l+1===o&&(t.y+=i.titleMarginBottom-a)}}_drawColorBox(t,n,i,s,o){const r=this.labelColors[i],a=this.labelPointStyles[i],{boxHeight:l,boxWidth:c}=o,u=It(o.bodyFont),h=es(this,"left",o),f=s.x(h),d=l<u.lineHeight?(u.lineHeight-l)/2:0,g=n.y+d;if(o.usePointStyle){const p={radius:Math.min(c,l)/2,pointStyle:a.pointStyle,rotation:a.rotation,borderWidth:1},b=s.leftForLtr(f,c)+c/2,y=g+l/2;t.strokeStyle=o.multiKeyBackground,t.fillStyle=o.multiKeyBackground,Ko(t,p,b,y),t.strokeStyle=r.borderColor,t.fillStyle=r.backgroundColor,Ko(t,p,b,y)}else{t.lineWidth=st(r.borderWidth)?Math.max(...Object.values(r.borderWidth)):r.borderWidth||1,t.strokeStyle=r.borderColor,t.setLineDash(r.borderDash||[]),t.lineDashOffset=r.borderDashOffset||0;const p=s.leftForLtr(f,c),b=s.leftForLtr(s.xPlus(f,1),c-2),y=Mn(r.borderRadius);Object.values(y).some(_=>_!==0)?(t.beginPath(),t.fillStyle=o.multiKeyBackground,Ti(t,{x:p,y:g,w:c,h:l,radius:y}),t.fill(),t.stroke(),t.fillStyle=r.backgroundColor,t.beginPath(),Ti(t,{x:b,y:g+1,w:c-2,h:l-2,radius:y}),t.fill()):(t.fillStyle=o.multiKeyBackground,t.fillRect(p,g,c,l),t.strokeRect(p,g,c,l),t.fillStyle=r.backgroundColor,t.fillRect(b,g+1,c-2,l-2))}t.fillStyle=this.labelTextColors[i]}drawBody(t,n,i){const{body:s}=this,{bodySpacing:o,bodyAlign:r,displayColors:a,boxHeight:l,boxWidth:c,boxPadding:u}=i,h=It(i.bodyFont);let f=h.lineHeight,d=0;const g=Hn(i.rtl,this.x,this.width),p=function(I){n.fillText(I,g.x(t.x+d),t.y+f/2),t.y+=f+o},b=g.textAlign(r);let y,_,M,v,S,E,O;for(n.textAlign=r,n.textBaseline="middle",n.font=h.string,t.x=es(this,b,i),n.fillStyle=i.bodyColor,mt(this.beforeBody,p),d=a&&b!=="right"?r==="center"?c/2+u:c+2+u:0,v=0,E=s.length;v<E;++v){for(y=s[v],_=this.labelTextColors[v],n.fillStyle=_,mt(y.before,p),M=y.lines,a&&M.length&&(this._drawColorBox(n,t,v,g,i),f=Math.max(h.lineHeight,l)),S=0,O=M.length;S<O;++S)p(M[S]),f=h.lineHeight;mt(y.after,p)}d=0,f=h.lineHeight,mt(this.afterBody,p),t.y-=o}drawFooter(t,n,i){const s=this.footer,o=s.length;let r,a;if(o){const l=Hn(i.rtl,this.x,this.width);for(t.x=es(this,i.footerAlign,i),t.y+=i.footerMarginTop,n.textAlign=l.textAlign(i.footerAlign),n.textBaseline="middle",r=It(i.footerFont),n.fillStyle=i.footerColor,n.font=r.string,a=0;a<o;++a)n.fillText(s[a],l.x(t.x),t.y+r.lineHeight/2),t.y+=r.lineHeight+i.footerSpacing}}drawBackground(t,n,i,s){const{xAlign:o,yAlign:r}=this,{x:a,y:l}=t,{width:c,height:u}=i,{topLeft:h,topRight:f,bottomLeft:d,bottomRight:g}=Mn(s.cornerRadius);n.fillStyle=s.backgroundColor,n.strokeStyle=s.borderColor,n.lineWidth=s.borderWidth,n.beginPath(),n.moveTo(a+h,l),r==="top"&&this.drawCaret(t,n,i,s),n.lineTo(a+c-f,l),n.quadraticCurveTo(a+c,l,a+c,l+f),r==="center"&&o==="right"&&this.drawCaret(t,n,i,s),n.lineTo(a+c,l+u-g),n.quadraticCurveTo(a+c,l+u,a+c-g,l+u),r==="bottom"&&this.drawCaret(t,n,i,s),n.lineTo(a+d,l+u),n.quadraticCurveTo(a,l+u,a,l+u-d),r==="center"&&o==="left"&&this.drawCaret(t,n,i,s),n.lineTo(a,l+h),n.quadraticCurveTo(a,l,a+h,l),n.closePath(),n.fill(),s.borderWidth>0&&n.stroke()}_updateAnimationTarget(t){const n=this.chart,i=this.$animations,s=i&&i.x,o=i&&i.y;if(s||o){const r=ci[t.position].call(this,this._active,this._eventPosition);if(!r)return;const a=this._size=Hl(this,t),l=Object.assign({},r,this._size),c=Wl(n,t,l),u=jl(t,l,c,n);(s._to!==u.x||o._to!==u.y)&&(this.xAlign=c.xAlign,this.yAlign=c.yAlign,this.width=a.width,this.height=a.height,this.caretX=r.x,this.caretY=r.y,this._resolveAnimations().update(this,u))}}_willRender(){return!!this.opacity}draw(t){const n=this.options.setContext(this.getContext());let i=this.opacity;if(!i)return;this._updateAnimationTarget(n);const s={width:this.width,height:this.height},o={x:this.x,y:this.y};i=Math.abs(i)<.001?0:i;const r=$t(n.padding),a=this.title.length||this.beforeBody.length||this.body.length||this.afterBody.length||this.footer.length;n.enabled&&a&&(t.save(),t.globalAlpha=i,this.drawBackground(o,t,s,n),Ku(t,n.textDirection),o.y+=r.top,this.drawTitle(o,t,n),this.drawBody(o,t,n),this.drawFooter(o,t,n),Gu(t,n.textDirection),t.restore())}getActiveElements(){return this._active||[]}setActiveElements(t,n){const i=this._active,s=t.map(({datasetIndex:a,index:l})=>{const c=this.chart.getDatasetMeta(a);if(!c)throw new Error("Cannot find a dataset at index "+a);return{datasetIndex:a,element:c.data[l],index:l}}),o=!Ss(i,s),r=this._positionChanged(s,n);(o||r)&&(this._active=s,this._eventPosition=n,this._ignoreReplayEvents=!0,this.update(!0))}handleEvent(t,n,i=!0){if(n&&this._ignoreReplayEvents)return!1;this._ignoreReplayEvents=!1;const s=this.options,o=this._active||[],r=this._getActiveElements(t,o,n,i),a=this._positionChanged(r,t),l=n||!Ss(r,o)||a;return l&&(this._active=r,(s.enabled||s.external)&&(this._eventPosition={x:t.x,y:t.y},this.update(!0,n))),l}_getActiveElements(t,n,i,s){const o=this.options;if(t.type==="mouseout")return[];if(!s)return n.filter(a=>this.chart.data.datasets[a.datasetIndex]&&this.chart.getDatasetMeta(a.datasetIndex).controller.getParsed(a.index)!==void 0);const r=this.chart.getElementsAtEventForMode(t,o.mode,o,i);return o.reverse&&r.reverse(),r}_positionChanged(t,n){const{caretX:i,caretY:s,options:o}=this,r=ci[o.position].call(this,t,n);return r!==!1&&(i!==r.x||s!==r.y)}}var Zy={id:"tooltip",_element:Yl,positioners:ci,afterInit(e,t,n){n&&(e.tooltip=new Yl({chart:e,options:n}))},beforeUpdate(e,t,n){e.tooltip&&e.tooltip.initialize(n)},reset(e,t,n){e.tooltip&&e.tooltip.initialize(n)},afterDraw(e){const t=e.tooltip;if(t&&t._willRender()){const n={tooltip:t};if(e.notifyPlugins("beforeTooltipDraw",{...n,cancelable:!0})===!1)return;t.draw(e.ctx),e.notifyPlugins("afterTooltipDraw",n)}},afterEvent(e,t){if(e.tooltip){const n=t.replay;e.tooltip.handleEvent(t.event,n,t.inChartArea)&&(t.changed=!0)}},defaults:{enabled:!0,external:null,position:"average",backgroundColor:"rgba(0,0,0,0.8)",titleColor:"#fff",titleFont:{weight:"bold"},titleSpacing:2,titleMarginBottom:6,titleAlign:"left",bodyColor:"#fff",bodySpacing:2,bodyFont:{},bodyAlign:"left",footerColor:"#fff",footerSpacing:2,footerMarginTop:6,footerFont:{weight:"bold"},footerAlign:"left",padding:6,caretPadding:2,caretSize:5,cornerRadius:6,boxHeight:(e,t)=>t.bodyFont.size,boxWidth:(e,t)=>t.bodyFont.size,multiKeyBackground:"#fff",displayColors:!0,boxPadding:0,borderColor:"rgba(0,0,0,0)",borderWidth:0,animation:{duration:400,easing:"easeOutQuart"},animations:{numbers:{type:"number",properties:["x","y","width","height","caretX","caretY"]},opacity:{easing:"linear",duration:200}},callbacks:vh},defaultRoutes:{bodyFont:"font",footerFont:"font",titleFont:"font"},descriptors:{_scriptable:e=>e!=="filter"&&e!=="itemSort"&&e!=="external",_indexable:!1,callbacks:{_scriptable:!1,_indexable:!1},animation:{_fallback:!1},animations:{_fallback:"animation"}},additionalOptionScopes:["interaction"]},Qy=Object.freeze({__proto__:null,Colors:hy,Decimation:gy,Filler:Ly,Legend:Hy,SubTitle:$y,Title:jy,Tooltip:Zy});const tx=(e,t,n,i)=>(typeof t=="string"?(n=e.push(t)-1,i.unshift({index:n,label:t})):isNaN(t)&&(n=null),n);function ex(e,t,n,i){const s=e.indexOf(t);if(s===-1)return tx(e,t,n,i);const o=e.lastIndexOf(t);return s!==o?n:s}const nx=(e,t)=>e===null?null:Lt(Math.round(e),0,t);function Kl(e){const t=this.getLabels();return e>=0&&e<t.length?t[e]:e}class ix extends kn{static id="category";static defaults={ticks:{callback:Kl}};constructor(t){super(t),this._startValue=void 0,this._valueRange=0,this._addedLabels=[]}init(t){const n=this._addedLabels;if(n.length){const i=this.getLabels();for(const{index:s,label:o}of n)i[s]===o&&i.splice(s,1);this._addedLabels=[]}super.init(t)}parse(t,n){if(it(t))return null;const i=this.getLabels();return n=isFinite(n)&&i[n]===t?n:ex(i,t,tt(n,t),this._addedLabels),nx(n,i.length-1)}determineDataLimits(){const{minDefined:t,maxDefined:n}=this.getUserBounds();let{min:i,max:s}=this.getMinMax(!0);this.options.bounds==="ticks"&&(t||(i=0),n||(s=this.getLabels().length-1)),this.min=i,this.max=s}buildTicks(){const t=this.min,n=this.max,i=this.options.offset,s=[];let o=this.getLabels();o=t===0&&n===o.length-1?o:o.slice(t,n+1),this._valueRange=Math.max(o.length-(i?0:1),1),this._startValue=this.min-(i?.5:0);for(let r=t;r<=n;r++)s.push({value:r});return s}getLabelForValue(t){return Kl.call(this,t)}configure(){super.configure(),this.isHorizontal()||(this._reversePixels=!this._reversePixels)}getPixelForValue(t){return typeof t!="number"&&(t=this.parse(t)),t===null?NaN:this.getPixelForDecimal((t-this._startValue)/this._valueRange)}getPixelForTick(t){const n=this.ticks;return t<0||t>n.length-1?null:this.getPixelForValue(n[t].value)}getValueForPixel(t){return Math.round(this._startValue+this.getDecimalForPixel(t)*this._valueRange)}getBasePixel(){return this.bottom}}function sx(e,t){const n=[],{bounds:s,step:o,min:r,max:a,precision:l,count:c,maxTicks:u,maxDigits:h,includeBounds:f}=e,d=o||1,g=u-1,{min:p,max:b}=t,y=!it(r),_=!it(a),M=!it(c),v=(b-p)/(h+1);let S=Ha((b-p)/g/d)*d,E,O,I,j;if(S<1e-14&&!y&&!_)return[{value:p},{value:b}];j=Math.ceil(b/S)-Math.floor(p/S),j>g&&(S=Ha(j*S/g/d)*d),it(l)||(E=Math.pow(10,l),S=Math.ceil(S*E)/E),s==="ticks"?(O=Math.floor(p/S)*S,I=Math.ceil(b/S)*S):(O=p,I=b),y&&_&&o&&zg((a-r)/o,S/1e3)?(j=Math.round(Math.min((a-r)/S,u)),S=(a-r)/j,O=r,I=a):M?(O=y?r:O,I=_?a:I,j=c-1,S=(I-O)/j):(j=(I-O)/S,yi(j,Math.round(j),S/1e3)?j=Math.round(j):j=Math.ceil(j));const U=Math.max(Wa(S),Wa(O));E=Math.pow(10,it(l)?U:l),O=Math.round(O*E)/E,I=Math.round(I*E)/E;let X=0;for(y&&(f&&O!==r?(n.push({value:r}),O<r&&X++,yi(Math.round((O+X*S)*E)/E,r,Gl(r,v,e))&&X++):O<r&&X++);X<j;++X){const Q=Math.round((O+X*S)*E)/E;if(_&&Q>a)break;n.push({value:Q})}return _&&f&&I!==a?n.length&&yi(n[n.length-1].value,a,Gl(a,v,e))?n[n.length-1].value=a:n.push({value:a}):(!_||I===a)&&n.push({value:I}),n}function Gl(e,t,{horizontal:n,minRotation:i}){const s=de(i),o=(n?Math.sin(s):Math.cos(s))||.001,r=.75*t*(""+e).length;return Math.min(t/o,r)}class Es extends kn{constructor(t){super(t),this.start=void 0,this.end=void 0,this._startValue=void 0,this._endValue=void 0,this._valueRange=0}parse(t,n){return it(t)||(typeof t=="number"||t instanceof Number)&&!isFinite(+t)?null:+t}handleTickRangeOptions(){const{beginAtZero:t}=this.options,{minDefined:n,maxDefined:i}=this.getUserBounds();let{min:s,max:o}=this;const r=l=>s=n?s:l,a=l=>o=i?o:l;if(t){const l=Pe(s),c=Pe(o);l<0&&c<0?a(0):l>0&&c>0&&r(0)}if(s===o){let l=o===0?1:Math.abs(o*.05);a(o+l),t||r(s-l)}this.min=s,this.max=o}getTickLimit(){const t=this.options.ticks;let{maxTicksLimit:n,stepSize:i}=t,s;return i?(s=Math.ceil(this.max/i)-Math.floor(this.min/i)+1,s>1e3&&(console.warn(`scales.${this.id}.ticks.stepSize: ${i} would result generating up to ${s} ticks. Limiting to 1000.`),s=1e3)):(s=this.computeTickLimit(),n=n||11),n&&(s=Math.min(n,s)),s}computeTickLimit(){return Number.POSITIVE_INFINITY}buildTicks(){const t=this.options,n=t.ticks;let i=this.getTickLimit();i=Math.max(2,i);const s={maxTicks:i,bounds:t.bounds,min:t.min,max:t.max,precision:n.precision,step:n.stepSize,count:n.count,maxDigits:this._maxDigits(),horizontal:this.isHorizontal(),minRotation:n.minRotation||0,includeBounds:n.includeBounds!==!1},o=this._range||this,r=sx(s,o);return t.bounds==="ticks"&&Du(r,this,"value"),t.reverse?(r.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),r}configure(){const t=this.ticks;let n=this.min,i=this.max;if(super.configure(),this.options.offset&&t.length){const s=(i-n)/Math.max(t.length-1,1)/2;n-=s,i+=s}this._startValue=n,this._endValue=i,this._valueRange=i-n}getLabelForValue(t){return Vi(t,this.chart.options.locale,this.options.ticks.format)}}class ox extends Es{static id="linear";static defaults={ticks:{callback:Us.formatters.numeric}};determineDataLimits(){const{min:t,max:n}=this.getMinMax(!0);this.min=At(t)?t:0,this.max=At(n)?n:1,this.handleTickRangeOptions()}computeTickLimit(){const t=this.isHorizontal(),n=t?this.width:this.height,i=de(this.options.ticks.minRotation),s=(t?Math.sin(i):Math.cos(i))||.001,o=this._resolveTickFontOptions(0);return Math.ceil(n/Math.min(40,o.lineHeight/s))}getPixelForValue(t){return t===null?NaN:this.getPixelForDecimal((t-this._startValue)/this._valueRange)}getValueForPixel(t){return this._startValue+this.getDecimalForPixel(t)*this._valueRange}}const Ii=e=>Math.floor(qe(e)),mn=(e,t)=>Math.pow(10,Ii(e)+t);function Xl(e){return e/Math.pow(10,Ii(e))===1}function ql(e,t,n){const i=Math.pow(10,n),s=Math.floor(e/i);return Math.ceil(t/i)-s}function rx(e,t){const n=t-e;let i=Ii(n);for(;ql(e,t,i)>10;)i++;for(;ql(e,t,i)<10;)i--;return Math.min(i,Ii(e))}function ax(e,{min:t,max:n}){t=oe(e.min,t);const i=[],s=Ii(t);let o=rx(t,n),r=o<0?Math.pow(10,Math.abs(o)):1;const a=Math.pow(10,o),l=s>o?Math.pow(10,s):0,c=Math.round((t-l)*r)/r,u=Math.floor((t-l)/a/10)*a*10;let h=Math.floor((c-u)/Math.pow(10,o)),f=oe(e.min,Math.round((l+u+h*Math.pow(10,o))*r)/r);for(;f<n;)i.push({value:f,major:Xl(f),significand:h}),h>=10?h=h<15?15:20:h++,h>=20&&(o++,h=2,r=o>=0?1:r),f=Math.round((l+u+h*Math.pow(10,o))*r)/r;const d=oe(e.max,f);return i.push({value:d,major:Xl(d),significand:h}),i}class lx extends kn{static id="logarithmic";static defaults={ticks:{callback:Us.formatters.logarithmic,major:{enabled:!0}}};constructor(t){super(t),this.start=void 0,this.end=void 0,this._startValue=void 0,this._valueRange=0}parse(t,n){const i=Es.prototype.parse.apply(this,[t,n]);if(i===0){this._zero=!0;return}return At(i)&&i>0?i:null}determineDataLimits(){const{min:t,max:n}=this.getMinMax(!0);this.min=At(t)?Math.max(0,t):null,this.max=At(n)?Math.max(0,n):null,this.options.beginAtZero&&(this._zero=!0),this._zero&&this.min!==this._suggestedMin&&!At(this._userMin)&&(this.min=t===mn(this.min,0)?mn(this.min,-1):mn(this.min,0)),this.handleTickRangeOptions()}handleTickRangeOptions(){const{minDefined:t,maxDefined:n}=this.getUserBounds();let i=this.min,s=this.max;const o=a=>i=t?i:a,r=a=>s=n?s:a;i===s&&(i<=0?(o(1),r(10)):(o(mn(i,-1)),r(mn(s,1)))),i<=0&&o(mn(s,-1)),s<=0&&r(mn(i,1)),this.min=i,this.max=s}buildTicks(){const t=this.options,n={min:this._userMin,max:this._userMax},i=ax(n,this);return t.bounds==="ticks"&&Du(i,this,"value"),t.reverse?(i.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),i}getLabelForValue(t){return t===void 0?"0":Vi(t,this.chart.options.locale,this.options.ticks.format)}configure(){const t=this.min;super.configure(),this._startValue=qe(t),this._valueRange=qe(this.max)-qe(t)}getPixelForValue(t){return(t===void 0||t===0)&&(t=this.min),t===null||isNaN(t)?NaN:this.getPixelForDecimal(t===this.min?0:(qe(t)-this._startValue)/this._valueRange)}getValueForPixel(t){const n=this.getDecimalForPixel(t);return Math.pow(10,this._startValue+n*this._valueRange)}}function Qo(e){const t=e.ticks;if(t.display&&e.display){const n=$t(t.backdropPadding);return tt(t.font&&t.font.size,Ct.font.size)+n.height}return 0}function cx(e,t,n){return n=Mt(n)?n:[n],{w:im(e,t.string,n),h:n.length*t.lineHeight}}function Jl(e,t,n,i,s){return e===i||e===s?{start:t-n/2,end:t+n/2}:e<i||e>s?{start:t-n,end:t}:{start:t,end:t+n}}function ux(e){const t={l:e.left+e._padding.left,r:e.right-e._padding.right,t:e.top+e._padding.top,b:e.bottom-e._padding.bottom},n=Object.assign({},t),i=[],s=[],o=e._pointLabels.length,r=e.options.pointLabels,a=r.centerPointLabels?ct/o:0;for(let l=0;l<o;l++){const c=r.setContext(e.getPointLabelContext(l));s[l]=c.padding;const u=e.getPointPosition(l,e.drawingArea+s[l],a),h=It(c.font),f=cx(e.ctx,h,e._pointLabels[l]);i[l]=f;const d=Vt(e.getIndexAngle(l)+a),g=Math.round(Pr(d)),p=Jl(g,u.x,f.w,0,180),b=Jl(g,u.y,f.h,90,270);hx(n,t,d,p,b)}e.setCenterPoint(t.l-n.l,n.r-t.r,t.t-n.t,n.b-t.b),e._pointLabelItems=px(e,i,s)}function hx(e,t,n,i,s){const o=Math.abs(Math.sin(n)),r=Math.abs(Math.cos(n));let a=0,l=0;i.start<t.l?(a=(t.l-i.start)/o,e.l=Math.min(e.l,t.l-a)):i.end>t.r&&(a=(i.end-t.r)/o,e.r=Math.max(e.r,t.r+a)),s.start<t.t?(l=(t.t-s.start)/r,e.t=Math.min(e.t,t.t-l)):s.end>t.b&&(l=(s.end-t.b)/r,e.b=Math.max(e.b,t.b+l))}function fx(e,t,n){const i=e.drawingArea,{extra:s,additionalAngle:o,padding:r,size:a}=n,l=e.getPointPosition(t,i+s+r,o),c=Math.round(Pr(Vt(l.angle+Ot))),u=bx(l.y,a.h,c),h=gx(c),f=mx(l.x,a.w,h);return{visible:!0,x:l.x,y:u,textAlign:h,left:f,top:u,right:f+a.w,bottom:u+a.h}}function dx(e,t){if(!t)return!0;const{left:n,top:i,right:s,bottom:o}=e;return!(ze({x:n,y:i},t)||ze({x:n,y:o},t)||ze({x:s,y:i},t)||ze({x:s,y:o},t))}function px(e,t,n){const i=[],s=e._pointLabels.length,o=e.options,{centerPointLabels:r,display:a}=o.pointLabels,l={extra:Qo(o)/2,additionalAngle:r?ct/s:0};let c;for(let u=0;u<s;u++){l.padding=n[u],l.size=t[u];const h=fx(e,u,l);i.push(h),a==="auto"&&(h.visible=dx(h,c),h.visible&&(c=h))}return i}function gx(e){return e===0||e===180?"center":e<180?"left":"right"}function mx(e,t,n){return n==="right"?e-=t:n==="center"&&(e-=t/2),e}function bx(e,t,n){return n===90||n===270?e-=t/2:(n>270||n<90)&&(e-=t),e}function _x(e,t,n){const{left:i,top:s,right:o,bottom:r}=n,{backdropColor:a}=t;if(!it(a)){const l=Mn(t.borderRadius),c=$t(t.backdropPadding);e.fillStyle=a;const u=i-c.left,h=s-c.top,f=o-i+c.width,d=r-s+c.height;Object.values(l).some(g=>g!==0)?(e.beginPath(),Ti(e,{x:u,y:h,w:f,h:d,radius:l}),e.fill()):e.fillRect(u,h,f,d)}}function yx(e,t){const{ctx:n,options:{pointLabels:i}}=e;for(let s=t-1;s>=0;s--){const o=e._pointLabelItems[s];if(!o.visible)continue;const r=i.setContext(e.getPointLabelContext(s));_x(n,r,o);const a=It(r.font),{x:l,y:c,textAlign:u}=o;An(n,e._pointLabels[s],l,c+a.lineHeight/2,a,{color:r.color,textAlign:u,textBaseline:"middle"})}}function wh(e,t,n,i){const{ctx:s}=e;if(n)s.arc(e.xCenter,e.yCenter,t,0,St);else{let o=e.getPointPosition(0,t);s.moveTo(o.x,o.y);for(let r=1;r<i;r++)o=e.getPointPosition(r,t),s.lineTo(o.x,o.y)}}function xx(e,t,n,i,s){const o=e.ctx,r=t.circular,{color:a,lineWidth:l}=t;!r&&!i||!a||!l||n<0||(o.save(),o.strokeStyle=a,o.lineWidth=l,o.setLineDash(s.dash||[]),o.lineDashOffset=s.dashOffset,o.beginPath(),wh(e,n,r,i),o.closePath(),o.stroke(),o.restore())}function vx(e,t,n){return ln(e,{label:n,index:t,type:"pointLabel"})}class wx extends Es{static id="radialLinear";static defaults={display:!0,animate:!0,position:"chartArea",angleLines:{display:!0,lineWidth:1,borderDash:[],borderDashOffset:0},grid:{circular:!1},startAngle:0,ticks:{showLabelBackdrop:!0,callback:Us.formatters.numeric},pointLabels:{backdropColor:void 0,backdropPadding:2,display:!0,font:{size:10},callback(t){return t},padding:5,centerPointLabels:!1}};static defaultRoutes={"angleLines.color":"borderColor","pointLabels.color":"color","ticks.color":"color"};static descriptors={angleLines:{_fallback:"grid"}};constructor(t){super(t),this.xCenter=void 0,this.yCenter=void 0,this.drawingArea=void 0,this._pointLabels=[],this._pointLabelItems=[]}setDimensions(){const t=this._padding=$t(Qo(this.options)/2),n=this.width=this.maxWidth-t.width,i=this.height=this.maxHeight-t.height;this.xCenter=Math.floor(this.left+n/2+t.left),this.yCenter=Math.floor(this.top+i/2+t.top),this.drawingArea=Math.floor(Math.min(n,i)/2)}determineDataLimits(){const{min:t,max:n}=this.getMinMax(!1);this.min=At(t)&&!isNaN(t)?t:0,this.max=At(n)&&!isNaN(n)?n:0,this.handleTickRangeOptions()}computeTickLimit(){return Math.ceil(this.drawingArea/Qo(this.options))}generateTickLabels(t){Es.prototype.generateTickLabels.call(this,t),this._pointLabels=this.getLabels().map((n,i)=>{const s=wt(this.options.pointLabels.callback,[n,i],this);return s||s===0?s:""}).filter((n,i)=>this.chart.getDataVisibility(i))}fit(){const t=this.options;t.display&&t.pointLabels.display?ux(this):this.setCenterPoint(0,0,0,0)}setCenterPoint(t,n,i,s){this.xCenter+=Math.floor((t-n)/2),this.yCenter+=Math.floor((i-s)/2),this.drawingArea-=Math.min(this.drawingArea/2,Math.max(t,n,i,s))}getIndexAngle(t){const n=St/(this._pointLabels.length||1),i=this.options.startAngle||0;return Vt(t*n+de(i))}getDistanceFromCenterForValue(t){if(it(t))return NaN;const n=this.drawingArea/(this.max-this.min);return this.options.reverse?(this.max-t)*n:(t-this.min)*n}getValueForDistanceFromCenter(t){if(it(t))return NaN;const n=t/(this.drawingArea/(this.max-this.min));return this.options.reverse?this.max-n:this.min+n}getPointLabelContext(t){const n=this._pointLabels||[];if(t>=0&&t<n.length){const i=n[t];return vx(this.getContext(),t,i)}}getPointPosition(t,n,i=0){const s=this.getIndexAngle(t)-Ot+i;return{x:Math.cos(s)*n+this.xCenter,y:Math.sin(s)*n+this.yCenter,angle:s}}getPointPositionForValue(t,n){return this.getPointPosition(t,this.getDistanceFromCenterForValue(n))}getBasePosition(t){return this.getPointPositionForValue(t||0,this.getBaseValue())}getPointLabelPosition(t){const{left:n,top:i,right:s,bottom:o}=this._pointLabelItems[t];return{left:n,top:i,right:s,bottom:o}}drawBackground(){const{backgroundColor:t,grid:{circular:n}}=this.options;if(t){const i=this.ctx;i.save(),i.beginPath(),wh(this,this.getDistanceFromCenterForValue(this._endValue),n,this._pointLabels.length),i.closePath(),i.fillStyle=t,i.fill(),i.restore()}}drawGrid(){const t=this.ctx,n=this.options,{angleLines:i,grid:s,border:o}=n,r=this._pointLabels.length;let a,l,c;if(n.pointLabels.display&&yx(this,r),s.display&&this.ticks.forEach((u,h)=>{if(h!==0||h===0&&this.min<0){l=this.getDistanceFromCenterForValue(u.value);const f=this.getContext(h),d=s.setContext(f),g=o.setContext(f);xx(this,d,l,r,g)}}),i.display){for(t.save(),a=r-1;a>=0;a--){const u=i.setContext(this.getPointLabelContext(a)),{color:h,lineWidth:f}=u;!f||!h||(t.lineWidth=f,t.strokeStyle=h,t.setLineDash(u.borderDash),t.lineDashOffset=u.borderDashOffset,l=this.getDistanceFromCenterForValue(n.reverse?this.min:this.max),c=this.getPointPosition(a,l),t.beginPath(),t.moveTo(this.xCenter,this.yCenter),t.lineTo(c.x,c.y),t.stroke())}t.restore()}}drawBorder(){}drawLabels(){const t=this.ctx,n=this.options,i=n.ticks;if(!i.display)return;const s=this.getIndexAngle(0);let o,r;t.save(),t.translate(this.xCenter,this.yCenter),t.rotate(s),t.textAlign="center",t.textBaseline="middle",this.ticks.forEach((a,l)=>{if(l===0&&this.min>=0&&!n.reverse)return;const c=i.setContext(this.getContext(l)),u=It(c.font);if(o=this.getDistanceFromCenterForValue(this.ticks[l].value),c.showLabelBackdrop){t.font=u.string,r=t.measureText(a.label).width,t.fillStyle=c.backdropColor;const h=$t(c.backdropPadding);t.fillRect(-r/2-h.left,-o-u.size/2-h.top,r+h.width,u.size+h.height)}An(t,a.label,0,-o,u,{color:c.color,strokeColor:c.textStrokeColor,strokeWidth:c.textStrokeWidth})}),t.restore()}drawTitle(){}}const Zs={millisecond:{common:!0,size:1,steps:1e3},second:{common:!0,size:1e3,steps:60},minute:{common:!0,size:6e4,steps:60},hour:{common:!0,size:36e5,steps:24},day:{common:!0,size:864e5,steps:30},week:{common:!1,size:6048e5,steps:4},month:{common:!0,size:2628e6,steps:12},quarter:{common:!1,size:7884e6,steps:4},year:{common:!0,size:3154e7}},ee=Object.keys(Zs);function Zl(e,t){return e-t}function Ql(e,t){if(it(t))return null;const n=e._adapter,{parser:i,round:s,isoWeekday:o}=e._parseOpts;let r=t;return typeof i=="function"&&(r=i(r)),At(r)||(r=typeof i=="string"?n.parse(r,i):n.parse(r)),r===null?null:(s&&(r=s==="week"&&(Un(o)||o===!0)?n.startOf(r,"isoWeek",o):n.startOf(r,s)),+r)}function tc(e,t,n,i){const s=ee.length;for(let o=ee.indexOf(e);o<s-1;++o){const r=Zs[ee[o]],a=r.steps?r.steps:Number.MAX_SAFE_INTEGER;if(r.common&&Math.ceil((n-t)/(a*r.size))<=i)return ee[o]}return ee[s-1]}function Sx(e,t,n,i,s){for(let o=ee.length-1;o>=ee.indexOf(n);o--){const r=ee[o];if(Zs[r].common&&e._adapter.diff(s,i,r)>=t-1)return r}return ee[n?ee.indexOf(n):0]}function Mx(e){for(let t=ee.indexOf(e)+1,n=ee.length;t<n;++t)if(Zs[ee[t]].common)return ee[t]}function ec(e,t,n){if(!n)e[t]=!0;else if(n.length){const{lo:i,hi:s}=Ar(n,t),o=n[i]>=t?n[i]:n[s];e[o]=!0}}function Cx(e,t,n,i){const s=e._adapter,o=+s.startOf(t[0].value,i),r=t[t.length-1].value;let a,l;for(a=o;a<=r;a=+s.add(a,1,i))l=n[a],l>=0&&(t[l].major=!0);return t}function nc(e,t,n){const i=[],s={},o=t.length;let r,a;for(r=0;r<o;++r)a=t[r],s[a]=r,i.push({value:a,major:!1});return o===0||!n?i:Cx(e,i,s,n)}class tr extends kn{static id="time";static defaults={bounds:"data",adapters:{},time:{parser:!1,unit:!1,round:!1,isoWeekday:!1,minUnit:"millisecond",displayFormats:{}},ticks:{source:"auto",callback:!1,major:{enabled:!1}}};constructor(t){super(t),this._cache={data:[],labels:[],all:[]},this._unit="day",this._majorUnit=void 0,this._offsets={},this._normalized=!1,this._parseOpts=void 0}init(t,n={}){const i=t.time||(t.time={}),s=this._adapter=new Pb._date(t.adapters.date);s.init(n),_i(i.displayFormats,s.formats()),this._parseOpts={parser:i.parser,round:i.round,isoWeekday:i.isoWeekday},super.init(t),this._normalized=n.normalized}parse(t,n){return t===void 0?null:Ql(this,t)}beforeLayout(){super.beforeLayout(),this._cache={data:[],labels:[],all:[]}}determineDataLimits(){const t=this.options,n=this._adapter,i=t.time.unit||"day";let{min:s,max:o,minDefined:r,maxDefined:a}=this.getUserBounds();function l(c){!r&&!isNaN(c.min)&&(s=Math.min(s,c.min)),!a&&!isNaN(c.max)&&(o=Math.max(o,c.max))}(!r||!a)&&(l(this._getLabelBounds()),(t.bounds!=="ticks"||t.ticks.source!=="labels")&&l(this.getMinMax(!1))),s=At(s)&&!isNaN(s)?s:+n.startOf(Date.now(),i),o=At(o)&&!isNaN(o)?o:+n.endOf(Date.now(),i)+1,this.min=Math.min(s,o-1),this.max=Math.max(s+1,o)}_getLabelBounds(){const t=this.getLabelTimestamps();let n=Number.POSITIVE_INFINITY,i=Number.NEGATIVE_INFINITY;return t.length&&(n=t[0],i=t[t.length-1]),{min:n,max:i}}buildTicks(){const t=this.options,n=t.time,i=t.ticks,s=i.source==="labels"?this.getLabelTimestamps():this._generate();t.bounds==="ticks"&&s.length&&(this.min=this._userMin||s[0],this.max=this._userMax||s[s.length-1]);const o=this.min,r=this.max,a=$g(s,o,r);return this._unit=n.unit||(i.autoSkip?tc(n.minUnit,this.min,this.max,this._getLabelCapacity(o)):Sx(this,a.length,n.minUnit,this.min,this.max)),this._majorUnit=!i.major.enabled||this._unit==="year"?void 0:Mx(this._unit),this.initOffsets(s),t.reverse&&a.reverse(),nc(this,a,this._majorUnit)}afterAutoSkip(){this.options.offsetAfterAutoskip&&this.initOffsets(this.ticks.map(t=>+t.value))}initOffsets(t=[]){let n=0,i=0,s,o;this.options.offset&&t.length&&(s=this.getDecimalForValue(t[0]),t.length===1?n=1-s:n=(this.getDecimalForValue(t[1])-s)/2,o=this.getDecimalForValue(t[t.length-1]),t.length===1?i=o:i=(o-this.getDecimalForValue(t[t.length-2]))/2);const r=t.length<3?.5:.25;n=Lt(n,0,r),i=Lt(i,0,r),this._offsets={start:n,end:i,factor:1/(n+1+i)}}_generate(){const t=this._adapter,n=this.min,i=this.max,s=this.options,o=s.time,r=o.unit||tc(o.minUnit,n,i,this._getLabelCapacity(n)),a=tt(s.ticks.stepSize,1),l=r==="week"?o.isoWeekday:!1,c=Un(l)||l===!0,u={};let h=n,f,d;if(c&&(h=+t.startOf(h,"isoWeek",l)),h=+t.startOf(h,c?"day":r),t.diff(i,n,r)>1e5*a)throw new Error(n+" and "+i+" are too far apart with stepSize of "+a+" "+r);const g=s.ticks.source==="data"&&this.getDataTimestamps();for(f=h,d=0;f<i;f=+t.add(f,a,r),d++)ec(u,f,g);return(f===i||s.bounds==="ticks"||d===1)&&ec(u,f,g),Object.keys(u).sort(Zl).map(p=>+p)}getLabelForValue(t){const n=this._adapter,i=this.options.time;return i.tooltipFormat?n.format(t,i.tooltipFormat):n.format(t,i.displayFormats.datetime)}format(t,n){const s=this.options.time.displayFormats,o=this._unit,r=n||s[o];return this._adapter.format(t,r)}_tickFormatFunction(t,n,i,s){const o=this.options,r=o.ticks.callback;if(r)return wt(r,[t,n,i],this);const a=o.time.displayFormats,l=this._unit,c=this._majorUnit,u=l&&a[l],h=c&&a[c],f=i[n],d=c&&h&&f&&f.major;return this._adapter.format(t,s||(d?h:u))}generateTickLabels(t){let n,i,s;for(n=0,i=t.length;n<i;++n)s=t[n],s.label=this._tickFormatFunction(s.value,n,t)}getDecimalForValue(t){return t===null?NaN:(t-this.min)/(this.max-this.min)}getPixelForValue(t){const n=this._offsets,i=this.getDecimalForValue(t);return this.getPixelForDecimal((n.start+i)*n.factor)}getValueForPixel(t){const n=this._offsets,i=this.getDecimalForPixel(t)/n.factor-n.end;return this.min+i*(this.max-this.min)}_getLabelSize(t){const n=this.options.ticks,i=this.ctx.measureText(t).width,s=de(this.isHorizontal()?n.maxRotation:n.minRotation),o=Math.cos(s),r=Math.sin(s),a=this._resolveTickFontOptions(0).size;return{w:i*o+a*r,h:i*r+a*o}}_getLabelCapacity(t){const n=this.options.time,i=n.displayFormats,s=i[n.unit]||i.millisecond,o=this._tickFormatFunction(t,0,nc(this,[t],this._majorUnit),s),r=this._getLabelSize(o),a=Math.floor(this.isHorizontal()?this.width/r.w:this.height/r.h)-1;return a>0?a:1}getDataTimestamps(){let t=this._cache.data||[],n,i;if(t.length)return t;const s=this.getMatchingVisibleMetas();if(this._normalized&&s.length)return this._cache.data=s[0].controller.getAllParsedValues(this);for(n=0,i=s.length;n<i;++n)t=t.concat(s[n].controller.getAllParsedValues(this));return this._cache.data=this.normalize(t)}getLabelTimestamps(){const t=this._cache.labels||[];let n,i;if(t.length)return t;const s=this.getLabels();for(n=0,i=s.length;n<i;++n)t.push(Ql(this,s[n]));return this._cache.labels=this._normalized?t:this.normalize(t)}normalize(t){return Ru(t.sort(Zl))}}function ns(e,t,n){let i=0,s=e.length-1,o,r,a,l;n?(t>=e[i].pos&&t<=e[s].pos&&({lo:i,hi:s}=Ve(e,"pos",t)),{pos:o,time:a}=e[i],{pos:r,time:l}=e[s]):(t>=e[i].time&&t<=e[s].time&&({lo:i,hi:s}=Ve(e,"time",t)),{time:o,pos:a}=e[i],{time:r,pos:l}=e[s]);const c=r-o;return c?a+(l-a)*(t-o)/c:a}class Px extends tr{static id="timeseries";static defaults=tr.defaults;constructor(t){super(t),this._table=[],this._minPos=void 0,this._tableRange=void 0}initOffsets(){const t=this._getTimestampsForTable(),n=this._table=this.buildLookupTable(t);this._minPos=ns(n,this.min),this._tableRange=ns(n,this.max)-this._minPos,super.initOffsets(t)}buildLookupTable(t){const{min:n,max:i}=this,s=[],o=[];let r,a,l,c,u;for(r=0,a=t.length;r<a;++r)c=t[r],c>=n&&c<=i&&s.push(c);if(s.length<2)return[{time:n,pos:0},{time:i,pos:1}];for(r=0,a=s.length;r<a;++r)u=s[r+1],l=s[r-1],c=s[r],Math.round((u+l)/2)!==c&&o.push({time:c,pos:r/(a-1)});return o}_generate(){const t=this.min,n=this.max;let i=super.getDataTimestamps();return(!i.includes(t)||!i.length)&&i.splice(0,0,t),(!i.includes(n)||i.length===1)&&i.push(n),i.sort((s,o)=>s-o)}_getTimestampsForTable(){let t=this._cache.all||[];if(t.length)return t;const n=this.getDataTimestamps(),i=this.getLabelTimestamps();return n.length&&i.length?t=this.normalize(n.concat(i)):t=n.length?n:i,t=this._cache.all=t,t}getDecimalForValue(t){return(ns(this._table,t)-this._minPos)/this._tableRange}getValueForPixel(t){const n=this._offsets,i=this.getDecimalForPixel(t)/n.factor-n.end;return ns(this._table,i*this._tableRange+this._minPos,!0)}}var Ax=Object.freeze({__proto__:null,CategoryScale:ix,LinearScale:ox,LogarithmicScale:lx,RadialLinearScale:wx,TimeScale:tr,TimeSeriesScale:Px});const kx=[Cb,sy,Qy,Ax];Os.register(...kx);const Ox={class:"dashboard"},Dx={class:"sidebar"},Ex={key:0,class:"user-info"},Tx={class:"details"},Rx={class:"name"},Ix={class:"email"},Lx={class:"dob"},Fx={key:1},Nx={key:2},Bx={class:"content"},Vx={class:"weekly-tip"},zx=["innerHTML"],Hx={class:"weekly-insights"},Wx={class:"insights-box"},jx={class:"tabs"},$x={class:"chart-placeholder"},Ux={key:0},Yx={class:"prevention-table"},Kx={class:"daily-record"},Gx={class:"record-box"},Xx={key:0},qx={key:0},Jx={key:1},Zx=["name","value"],Qx={key:2},t0=["placeholder"],e0={key:3},n0=["placeholder"],i0={key:4},s0=["placeholder"],o0={key:5},r0=["placeholder"],a0=["disabled"],l0={__name:"DashboardView",setup(e){const n=Zp().params.userId,i=Yt(null),s=Yt([]);Yt([]);const o=Yt(!0),r=Yt(null);function a(){_.value===p.value.length-1?l():M()}async function l(){try{const R=y.value;if(R[1]==="Yes"){const P=R[0],L=R[2];P&&L&&(R.migraine_datetime=`${P}T${L}`)}R[1]==="Yes"&&await fetch(`/api/event?user_id=${n}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({system:"LOINC",code:"LA15141-7",event_type:"migraine",severity:parseInt(R[3][0]),description:`Migraine at ${R.migraine_datetime}`,event_timestamp:R.migraine_datetime})}),R[4]&&await fetch(`/api/event?user_id=${n}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({system:"ICD-10",code:"Z73.3",event_type:"stress",severity:parseInt(R[4][0]),description:"Daily stress rating",event_timestamp:`${R[0]}T00:00:00`})}),R[5]&&await fetch(`/api/event?user_id=${n}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({system:"ICD-10",code:"Y93.84",event_type:"sleep",numerical_value:parseInt(R[5]),numerical_unit:"hours",description:"Hours slept",event_timestamp:`${R[0]}T00:00:00`})}),R[6]&&await fetch(`/api/event?user_id=${n}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({system:"ICD-10",code:"Y93.G1",event_type:"meal",numerical_value:parseInt(R[6]),numerical_unit:"number",description:"Meals eaten",event_timestamp:`${R[0]}T00:00:00`})}),R[7]==="Yes"&&await fetch(`/api/event?user_id=${n}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({system:"ICD-10",code:"Y93.A9",event_type:"exercise",description:"Exercise performed",event_timestamp:`${R[0]}T00:00:00`})}),R[8]==="Yes"&&await fetch(`/api/event?user_id=${n}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({system:"ICD-10",code:"Z79.899",event_type:"medication",description:"Took remedial medication",event_timestamp:`${R[0]}T00:00:00`})}),alert("Your daily record has been saved!"),_.value=0,y.value={0:new Date().toISOString().split("T")[0]}}catch(R){console.error(R),alert("Error saving your daily migraine record. Please try again.")}}const c=async()=>{try{const R=await fetch(`/api/export_patient_data_to_fhir/${n}`,{method:"POST"});if(!R.ok)throw new Error("Export to server failed");const P=await R.json();alert(`Exported to HAPI FHIR demo server. Patient ID: ${P.patient.id}`)}catch(R){console.error(R),alert("Error exporting to HAPI FHIR.")}};async function u(){try{const R=await fetch(`/api/users/${n}`);if(!R.ok)throw new Error("Failed to load user");i.value=await R.json();const P=await fetch(`/api/migraines?user_id=${n}`);P.ok&&(s.value=await P.json()),await g(),await E(),console.log("sleep grouped:",S.value.sleep),console.log("stress grouped:",S.value.stress),console.log("meals grouped:",S.value.meals)}catch(R){console.error(R),r.value="Error loading dashboard data."}finally{o.value=!1}}const h=Yt(""),f=Yt([]);async function d(){const R=await fetch(`/api/action-items?user_id=${n}&window_size=2&use_localtime=false&min_sleep_hours=7&min_meals_per_day=3&stress_severity_threshold=3`);if(!R.ok)return;const P=await R.json();if(f.value=P.action_items||[],!P.summary?.percent_changes)return;const L=P.summary.percent_changes,Y=[{key:"sleep",value:L.sleep},{key:"meals",value:L.meals},{key:"stress",value:L.stress_severity}].sort((bt,ot)=>(ot.value||0)-(bt.value||0))[0],nt=f.value.find(bt=>bt.title.toLowerCase().includes(Y.key));nt&&(h.value=`${nt.reason} <strong>${nt.title}!</strong>`)}mr(async()=>{await u(),await d()});async function g(){try{const R=await fetch(`/api/triggers?user_id=${n}`);if(!R.ok)throw new Error("Failed to fetch triggers");const P=await R.json();console.log("Fetched trigger data:",P);const L=[],z=[],Y=[],nt=[],bt=[];return P.forEach(ot=>{const lt=ot.event_timestamp?ot.event_timestamp.split("T")[0]:null;ot.event_type==="sleep"&&L.push({date:lt,hours:ot.numerical_value}),ot.event_type==="stress"&&z.push({date:lt,rating:ot.severity}),(ot.event_type==="meal"||ot.event_type==="meals")&&Y.push({date:lt,count:ot.numerical_value}),ot.event_type==="exercise"&&nt.push({date:lt}),ot.event_type==="medication"&&bt.push({date:lt})}),S.value.sleep=L,S.value.stress=z,S.value.meals=Y,S.value.exercise=nt,S.value.medication=bt,!0}catch(R){return console.error("Error parsing trigger data",R),!1}}Yt([!1,!1,!1,!1,!1,!1,!1]);const p=Yt([{text:"Please select the date you are logging",type:"date"},{text:"Did you experience a migraine today?",type:"radio",options:["Yes","No"]},{text:"What time did the migraine occur?",type:"time",condition:()=>y.value[1]==="Yes"},{text:"How would you rate your migraine intensity?",type:"radio",options:["1: Not at all severe","2: Somewhat severe","3: Moderately severe","4: Very severe","5: Extremely severe"],condition:()=>y.value[1]==="Yes"},{text:"How stressed were you today?",type:"radio",options:["1: Not at all stressed","2: Somewhat stressed","3: Moderately stressed","4: Very stressed","5: Extremely stressed"]},{text:"How many hours did you sleep?",type:"number",placeholder:"Enter number of hours"},{text:"How many meals did you eat today?",type:"number",placeholder:"Enter number of meals"},{text:"Did you exercise today?",type:"radio",options:["Yes","No"]},{text:"Did you take any remedial medication today? Eg: Aspirin, Excedrin, Prescribed Medications",type:"radio",options:["Yes","No"]}]),b=new Date().toISOString().split("T")[0],y=Yt({0:b}),_=Yt(0);function M(){if(_.value>0&&p.value[_.value].type==="time"&&p.value[_.value-1].type==="date"){const P=y.value[_.value-1],L=y.value[_.value];if(P&&L){const z=`${P}T${L}`;y.value.migraine_datetime=z,console.log("Migraine datetime:",z)}}if(_.value++,_.value>=p.value.length){l();return}const R=p.value[_.value];R.condition&&!R.condition()&&M()}const v=Yt("migraines"),S=Yt({migraines:{total:0,avg_intensity:0,morning:0,afternoon:0,night:0},sleep:[],stress:[],meals:[],exercise:[],medication:[]});async function E(){try{const R=await fetch(`/api/weekly/rolling?user_id=${n}&window_size=1&use_localtime=false`);if(!R.ok){console.error("Rolling migraine API failed:",R.status);return}const P=await R.json();if(!Array.isArray(P)||P.length===0){console.warn("Rolling migraine API returned empty array");return}const L=P[P.length-1];S.value.migraines={week:L.week_start_monday,events:L.moving_average_migraine_events,severity:L.moving_average_migraine_severity},I()}catch(R){console.error("Error in getRollingMigraines:",R)}}let O=null;function I(){if(v.value!=="migraines")return;const R=document.getElementById("migraineChart");if(!R)return;const P=S.value.migraines;if(!P||!P.week){console.warn("Migraine stats not ready");return}O&&(O.destroy(),O=null),O=new Os(R,{type:"bar",data:{labels:["Migraine Events","Avg Intensity"],datasets:[{label:"Migraine Stats",data:[P.events,P.severity],backgroundColor:["#008080","#4db6ac"]}]},options:{responsive:!0,plugins:{legend:{display:!1}},scales:{y:{beginAtZero:!0}}}})}function j(){const R=[],P=new Date,L=new Date(Date.UTC(P.getUTCFullYear(),P.getUTCMonth(),P.getUTCDate()));for(let z=6;z>=0;z--){const Y=new Date(L);Y.setUTCDate(L.getUTCDate()-z),R.push(Y.toISOString().split("T")[0])}return R}let U=null;function X(){if(v.value!=="triggers")return;const R=document.getElementById("triggerChart");if(!R)return;U&&(U.destroy(),U=null);const P=j(),L=Object.fromEntries(S.value.sleep.map(ht=>[ht.date,ht.hours])),z=Object.fromEntries(S.value.stress.map(ht=>[ht.date,ht.rating])),Y=Object.fromEntries(S.value.meals.map(ht=>[ht.date,ht.count])),nt=P.map(ht=>L[ht]??0),bt=P.map(ht=>z[ht]??0),ot=P.map(ht=>Y[ht]??0),lt=P.map(ht=>new Date(ht).toLocaleDateString("en-US",{month:"short",day:"numeric"})),qt=P.map(()=>7),Nt=P.map(()=>3);U=new Os(R,{type:"bar",data:{labels:lt,datasets:[{label:"Hours Slept",data:nt,backgroundColor:"#4db6ac"},{label:"Stress Level",data:bt,backgroundColor:"#ffab91"},{label:"Daily Meals",data:ot,backgroundColor:"#81d4fa"},{label:"Recommended Sleep",data:qt,type:"line",borderColor:"#00695c",borderWidth:2,pointRadius:0,borderDash:[6,6]},{label:"Recommended Daily Meals",data:Nt,type:"line",borderColor:"#0277bd",borderWidth:2,pointRadius:0,borderDash:[6,6]}]},options:{responsive:!0,maintainAspectRatio:!1,plugins:{legend:{display:!0,position:"top",align:"start"}},scales:{y:{beginAtZero:!0}}}})}const Q=ue(()=>{const R=new Date,P=R.getDay(),L=P===0?-6:1-P,z=new Date(R);z.setDate(R.getDate()+L);const Y=[];for(let nt=0;nt<7;nt++){const bt=new Date(z);bt.setDate(z.getDate()+nt);const ot=bt.toLocaleDateString("en-CA");Y.push({date:ot,exercise:S.value.exercise.some(lt=>lt.date===ot),medication:S.value.medication.some(lt=>lt.date===ot)})}return Y});async function ut(){try{const R=await fetch(`/api/get_patient_info_from_fhir/${n}`,{method:"GET",headers:{accept:"application/json"}});if(!R.ok)throw new Error("Failed to fetch FHIR data");const P=await R.json();alert(JSON.stringify(P,null,2))}catch(R){console.error(R),alert("Error fetching FHIR data.")}}return(R,P)=>(kt(),Rt("div",Ox,[$("aside",Dx,[P[9]||(P[9]=$("div",{class:"logo"},[$("span",{class:"icon"},"💊"),$("span",{class:"title"},[as("MyMigraine"),$("br"),as("Management")])],-1)),i.value?(kt(),Rt("div",Ex,[P[8]||(P[8]=$("div",{class:"avatar"},"👤",-1)),$("div",Tx,[$("p",Rx,se(i.value.name),1),$("p",Ix,se(i.value.id),1),$("p",Lx,"Member Since: "+se(new Date(i.value.creation_timestamp).toLocaleDateString()),1)]),$("button",{class:"exportRecords",onClick:c}," Send migraine history to my doctor "),$("button",{class:"exportRecords",onClick:ut}," See my health record ")])):o.value?(kt(),Rt("div",Fx,"Loading user dashboard...")):r.value?(kt(),Rt("div",Nx,se(r.value),1)):Jn("",!0)]),$("main",Bx,[$("section",Vx,[$("p",{innerHTML:h.value},null,8,zx)]),$("section",Hx,[P[14]||(P[14]=$("h2",null,"Your Weekly Insights",-1)),$("div",Wx,[$("div",jx,[$("button",{class:Fn({active:v.value==="migraines"}),onClick:P[0]||(P[0]=L=>v.value="migraines")},"Migraines",2),$("button",{class:Fn({active:v.value==="triggers"}),onClick:P[1]||(P[1]=()=>{v.value="triggers",X()})},"Triggers",2),$("button",{class:Fn({active:v.value==="preventions"}),onClick:P[2]||(P[2]=L=>v.value="preventions")},"Preventions",2)]),$("div",$x,[un($("div",null,[...P[10]||(P[10]=[$("h3",null,"Migraines This Week",-1),$("div",{class:"statCharts"},[$("canvas",{id:"migraineChart"})],-1)])],512),[[ra,v.value==="migraines"]]),un($("div",null,[...P[11]||(P[11]=[$("h3",null,"Trigger Summary",-1),$("div",{class:"statCharts"},[$("canvas",{id:"triggerChart"})],-1)])],512),[[ra,v.value==="triggers"]]),v.value==="preventions"?(kt(),Rt("div",Ux,[P[13]||(P[13]=$("h3",null,"Weekly Prevention Tracker",-1)),$("table",Yx,[P[12]||(P[12]=$("thead",null,[$("tr",null,[$("th",null,"Date"),$("th",null,"Exercise"),$("th",null,"Medication")])],-1)),$("tbody",null,[(kt(!0),Rt(ce,null,Ro(Q.value,L=>(kt(),Rt("tr",{key:L.date},[$("td",null,se(new Date(L.date).toLocaleDateString()),1),$("td",null,se(L.exercise?"✔️":"—"),1),$("td",null,se(L.medication?"✔️":"—"),1)]))),128))])])])):Jn("",!0)])])]),$("section",Kx,[$("div",Gx,[P[15]||(P[15]=$("h3",null,"Your Daily Record",-1)),p.value.length?(kt(),Rt("div",Xx,[!p.value[_.value].condition||p.value[_.value].condition()?(kt(),Rt("p",qx,se(p.value[_.value].text),1)):Jn("",!0),(!p.value[_.value].condition||p.value[_.value].condition())&&p.value[_.value].type=="radio"?(kt(),Rt("div",Jx,[(kt(!0),Rt(ce,null,Ro(p.value[_.value].options,L=>(kt(),Rt("label",{key:L},[un($("input",{type:"radio",name:"question-"+_.value,value:L,"onUpdate:modelValue":P[3]||(P[3]=z=>y.value[_.value]=z)},null,8,Zx),[[Nd,y.value[_.value]]]),as(" "+se(L),1)]))),128))])):(!p.value[_.value].condition||p.value[_.value].condition())&&p.value[_.value].type==="text"?(kt(),Rt("div",Qx,[un($("input",{type:"text","onUpdate:modelValue":P[4]||(P[4]=L=>y.value[_.value]=L),placeholder:p.value[_.value].placeholder},null,8,t0),[[ji,y.value[_.value]]])])):(!p.value[_.value].condition||p.value[_.value].condition())&&p.value[_.value].type==="number"?(kt(),Rt("div",e0,[un($("input",{type:"number","onUpdate:modelValue":P[5]||(P[5]=L=>y.value[_.value]=L),placeholder:p.value[_.value].placeholder},null,8,n0),[[ji,y.value[_.value]]])])):(!p.value[_.value].condition||p.value[_.value].condition())&&p.value[_.value].type==="date"?(kt(),Rt("div",i0,[un($("input",{type:"date","onUpdate:modelValue":P[6]||(P[6]=L=>y.value[_.value]=L),placeholder:p.value[_.value].placeholder},null,8,s0),[[ji,y.value[_.value]]])])):(!p.value[_.value].condition||p.value[_.value].condition())&&p.value[_.value].type==="time"?(kt(),Rt("div",o0,[un($("input",{type:"time","onUpdate:modelValue":P[7]||(P[7]=L=>y.value[_.value]=L),placeholder:p.value[_.value].placeholder},null,8,r0),[[ji,y.value[_.value]]])])):Jn("",!0),$("button",{class:"next-btn",disabled:!y.value[_.value],onClick:a},se(_.value<p.value.length-1?"Next":"Submit"),9,a0)])):Jn("",!0)])])])]))}},c0=Mu(l0,[["__scopeId","data-v-a8422181"]]),u0=qp({history:Op("/"),routes:[{path:"/users",name:"users",component:rg},{path:"/dashboard/:userId",name:"dashboard",component:c0,props:!0},{path:"/",redirect:"/users"}]}),Sh=jd(Qp);Sh.use(u0);Sh.mount("#app");
@@ -0,0 +1,171 @@
+"""
+Bulk FHIR export of every user to local NDJSON files, in the style of the
+FHIR Bulk Data `$export` operation.
+
+Users are split into contiguous ranges of ids holding about the same number
+of events (`partition`), and each range is written by its own worker process
+(`export_partition`) to `Patient.NNN.ndjson` and `Observation.NNN.ndjson`,
+plus `OperationOutcome.NNN.ndjson` for events that cannot be converted. A
+worker streams its rows through a server-side cursor and builds the JSON with
+fhir_resources.py, so it needs no FHIR server and little memory. Once every
+partition is written, `write_manifest` lists the files in `manifest.json`;
+a directory without one is an unfinished export.
+
+Resources are identified by the local ids: a Patient's id is the user id and
+an Observation's the event id, referring to its subject as Patient/<user id>.
+
+    python -m backend.fhir_bulk [output_dir]
+"""
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+import orjson
+from sqlalchemy import func, select
+
+from .database import SessionLocal
+from .models import Event, User
+from . import fhir_resources
+from .fhir_state import PENDING_COLUMNS
+
+FHIR_BULK_DIR = os.getenv("FHIR_BULK_DIR", "./fhir_bulk")
+FHIR_BULK_WORKERS = int(os.getenv("FHIR_BULK_WORKERS", str(os.cpu_count() or 1)))
+
+YIELD_PER = 2000
+
+# Event columns of an Observation, and its subject.
+OBSERVATION_COLUMNS = [*PENDING_COLUMNS, Event.user_id]
+
+
+def partition(count: int) -> List[Tuple[Any, Any]]:
+    """
+    Split the users, in id order, into at most `count` (first id, last id)
+    ranges with about the same number of users plus events each.
+    """
+    with SessionLocal() as db:
+        weights = db.execute(
+            select(User.id, func.count(Event.id))
+              .outerjoin(Event, Event.user_id == User.id)
+              .group_by(User.id)
+              .order_by(User.id)
+        ).all()
+    target = sum(1 + n for _, n in weights) / max(count, 1)
+    ranges, first, filled = [], None, 0
+    for user_id, n in weights:
+        first = user_id if first is None else first
+        filled += 1 + n
+        if filled >= target * (len(ranges) + 1) and len(ranges) < count - 1:
+            ranges.append((first, user_id))
+            first = None
+    if first is not None:
+        ranges.append((first, weights[-1][0]))
+    return ranges
+
+
+def _outcome(event_id, error: Exception) -> Dict[str, Any]:
+    return {
+        'resourceType': 'OperationOutcome',
+        'issue': [{'severity': 'error', 'code': 'processing', 'diagnostics': f"Event {event_id}: {error}"}],
+    }
+
+
+def export_partition(output_dir: str, index: int, first_id, last_id) -> Dict[str, Any]:
+    """
+    Write the users with ids in [first_id, last_id] and their events as
+    NDJSON files in `output_dir`. Runs in a worker process.
+    Returns the files' manifest entries as {'output': [...], 'error': [...]}.
+    """
+    paths = {kind: os.path.join(output_dir, f"{kind}.{index:03d}.ndjson")
+             for kind in ('Patient', 'Observation', 'OperationOutcome')}
+    counts = dict.fromkeys(paths, 0)
+    # A Session rather than a Connection, so rows are keyed by attribute
+    # (numerical_unit) as fhir_resources expects.
+    with SessionLocal() as db:
+        with open(paths['Patient'], 'wb') as out:
+            users = db.execute(
+                select(User.id, User.name).where(User.id.between(first_id, last_id)).order_by(User.id)
+                  .execution_options(yield_per=YIELD_PER)
+            )
+            for rows in users.partitions():
+                out.write(b''.join(
+                    orjson.dumps({**fhir_resources.patient(user), 'id': str(user.id)}) + b'\n' for user in rows
+                ))
+                counts['Patient'] += len(rows)
+
+        with open(paths['Observation'], 'wb') as out, open(paths['OperationOutcome'], 'wb') as errors:
+            events = db.execute(
+                select(*OBSERVATION_COLUMNS)
+                  .where(Event.user_id.between(first_id, last_id))
+                  .order_by(Event.user_id, Event.update_timestamp, Event.id)
+                  .execution_options(yield_per=YIELD_PER)
+            )
+            for rows in events.partitions():
+                lines = []
+                for row in rows:
+                    try:
+                        obs = fhir_resources.observation(row, str(row.user_id))
+                    except ValueError as e:
+                        errors.write(orjson.dumps(_outcome(row.id, e)) + b'\n')
+                        counts['OperationOutcome'] += 1
+                        continue
+                    obs['id'] = str(row.id)
+                    lines.append(orjson.dumps(obs) + b'\n')
+                out.write(b''.join(lines))
+                counts['Observation'] += len(lines)
+
+    if not counts['OperationOutcome']:
+        os.remove(paths['OperationOutcome'])
+
+    def entry(kind):
+        return {'type': kind, 'url': os.path.basename(paths[kind]), 'count': counts[kind]}
+
+    return {
+        'output': [entry('Patient'), entry('Observation')],
+        'error': [entry('OperationOutcome')] if counts['OperationOutcome'] else [],
+    }
+
+
+def new_pool(workers: int) -> ProcessPoolExecutor:
+    # Spawned rather than forked: a fork would inherit the parent's open
+    # database connections and, in the server, its event loop's threads.
+    return ProcessPoolExecutor(max_workers=max(workers, 1), mp_context=multiprocessing.get_context('spawn'))
+
+
+def transaction_time() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+
+def write_manifest(output_dir: str, started: str, request: str, parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Write manifest.json for the partitions' files, in partition order."""
+    manifest = {
+        'transactionTime': started,
+        'request': request,
+        'requiresAccessToken': False,
+        'output': [entry for part in parts for entry in part['output']],
+        'error': [entry for part in parts for entry in part['error']],
+    }
+    with open(os.path.join(output_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def export_all(output_dir: str, workers: int = FHIR_BULK_WORKERS, partitions: int | None = None) -> Dict[str, Any]:
+    """Export every user to `output_dir` on `workers` processes; returns the manifest."""
+    os.makedirs(output_dir, exist_ok=True)
+    started = transaction_time()
+    ranges = partition(partitions or workers)
+    with new_pool(workers) as pool:
+        futures = [pool.submit(export_partition, output_dir, i, first, last) for i, (first, last) in enumerate(ranges)]
+        parts = [future.result() for future in futures]
+    return write_manifest(output_dir, started, 'python -m backend.fhir_bulk', parts)
+
+
+if __name__ == '__main__':
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else FHIR_BULK_DIR
+    manifest = export_all(output_dir)
+    print(f"{sum(e['count'] for e in manifest['output'] if e['type'] == 'Observation')} Observations "
+          f"in {len(manifest['output']) // 2} partitions written to {output_dir}")
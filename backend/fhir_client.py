@@ -0,0 +1,359 @@
+"""
+The process-wide HTTP client for the FHIR server, and lookups shared by the
+FHIR routes and the export.
+
+`get_client` returns one httpx.AsyncClient per event loop, so every FHIR
+call reuses the same keep-alive connection pool instead of opening a new
+session. `patient_ids` remembers which server Patient belongs to a local
+user for FHIR_PATIENT_CACHE_TTL seconds, so repeat lookups skip the
+`Patient?identifier=` search.
+
+Every request goes through `GuardedTransport`, which
+- gives it a deadline for the whole call, including the wait for a pooled
+  connection and reading the body (FHIR_DEADLINE, FHIR_BATCH_DEADLINE for
+  batch Bundles), raising DeadlineExceeded past it;
+- consults `breaker`: after FHIR_BREAKER_FAILURES consecutive failures
+  (transport errors, timeouts, 5xx) calls fail at once with
+  CircuitOpenError for FHIR_BREAKER_RESET seconds, then one trial call
+  decides whether to close it again;
+- records each call's latency and outcome per operation in `metrics`.
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Dict, Hashable, List
+
+import httpx
+
+from . import versions
+
+FHIR_BASE_URL = os.getenv("FHIR_BASE_URL", "https://hapi.fhir.org/baseR4")
+# Seconds to wait for a response (FHIR_TIMEOUT) and to connect.
+FHIR_TIMEOUT = float(os.getenv("FHIR_TIMEOUT", "30"))
+FHIR_CONNECT_TIMEOUT = float(os.getenv("FHIR_CONNECT_TIMEOUT", "5"))
+FHIR_MAX_CONNECTIONS = int(os.getenv("FHIR_MAX_CONNECTIONS", "16"))
+FHIR_KEEPALIVE_EXPIRY = float(os.getenv("FHIR_KEEPALIVE_EXPIRY", "30"))
+FHIR_PATIENT_CACHE_TTL = float(os.getenv("FHIR_PATIENT_CACHE_TTL", "600"))
+FHIR_PATIENT_CACHE_SIZE = int(os.getenv("FHIR_PATIENT_CACHE_SIZE", "4096"))
+
+# Seconds one call may take end to end; batch Bundles carry many resources.
+FHIR_DEADLINE = float(os.getenv("FHIR_DEADLINE", "30"))
+FHIR_BATCH_DEADLINE = float(os.getenv("FHIR_BATCH_DEADLINE", "120"))
+FHIR_BREAKER_FAILURES = int(os.getenv("FHIR_BREAKER_FAILURES", "5"))
+FHIR_BREAKER_RESET = float(os.getenv("FHIR_BREAKER_RESET", "30"))
+# Latest calls per operation that the latency percentiles are taken over.
+FHIR_METRICS_WINDOW = int(os.getenv("FHIR_METRICS_WINDOW", "1000"))
+
+FHIR_JSON = "application/fhir+json"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """The call was not made: the FHIR server is failing (see CircuitBreaker)."""
+
+    def __init__(self, message: str, retry_after: float, request: httpx.Request | None = None):
+        super().__init__(message, request=request)
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """The call took longer than its deadline."""
+
+
+class CircuitBreaker:
+    """
+    Closed while calls succeed. `failure_threshold` consecutive failures
+    open it: `allow` refuses every call for `reset_timeout` seconds, then
+    lets a single trial call through (half open), whose outcome closes the
+    breaker or opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.times_opened = 0
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if self.retry_after() == 0 else "open"
+
+    def retry_after(self) -> float:
+        """Seconds until calls are tried again; 0 when they are."""
+        if self.opened_at is None:
+            return 0
+        return max(self.opened_at + self.reset_timeout - time.monotonic(), 0)
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if self._trial or self.retry_after() > 0:
+            return False
+        self._trial = True
+        return True
+
+    def record(self, ok: bool | None):
+        """Outcome of an allowed call; None if it ended without one (cancelled)."""
+        self._trial = False
+        if ok is None:
+            return
+        if ok:
+            self.failures, self.opened_at = 0, None
+            return
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                self.times_opened += 1
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self.failures, "times_opened": self.times_opened,
+                "retry_after_seconds": round(self.retry_after(), 3)}
+
+
+class OperationMetrics:
+    """Call counts, outcomes and latency of each FHIR operation (see `operation_name`)."""
+
+    OUTCOMES = ("ok", "error", "timeout", "rejected")
+
+    def __init__(self, window: int):
+        self.window = window
+        self._ops: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, operation: str, outcome: str, seconds: float | None = None):
+        op = self._ops.get(operation)
+        if op is None:
+            op = self._ops[operation] = {**dict.fromkeys(self.OUTCOMES, 0), "seconds": 0.0, "max": 0.0,
+                                         "recent": deque(maxlen=self.window)}
+        op[outcome] += 1
+        if seconds is not None:
+            op["seconds"] += seconds
+            op["max"] = max(op["max"], seconds)
+            op["recent"].append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        out = {}
+        for operation, op in sorted(self._ops.items()):
+            timed = op["ok"] + op["error"] + op["timeout"]
+            recent = sorted(op["recent"])
+
+            def percentile(p: float):
+                return round(recent[min(int(p * len(recent)), len(recent) - 1)] * 1000, 1) if recent else None
+
+            out[operation] = {
+                "calls": timed + op["rejected"],
+                **{outcome: op[outcome] for outcome in self.OUTCOMES},
+                "mean_ms": round(op["seconds"] / timed * 1000, 1) if timed else None,
+                "p50_ms": percentile(0.5),
+                "p95_ms": percentile(0.95),
+                "p99_ms": percentile(0.99),
+                "max_ms": round(op["max"] * 1000, 1) if timed else None,
+            }
+        return out
+
+
+breaker = CircuitBreaker(FHIR_BREAKER_FAILURES, FHIR_BREAKER_RESET)
+metrics = OperationMetrics(FHIR_METRICS_WINDOW)
+
+
+def operation_name(request: httpx.Request, base_path: str) -> str:
+    """The FHIR interaction of a request: 'read Patient', 'search Observation', 'batch', ..."""
+    path = request.url.path
+    if path.startswith(base_path):
+        path = path[len(base_path):]
+    parts = [part for part in path.split("/") if part]
+    method = request.method
+    if not parts:
+        # The base itself: a batch/transaction Bundle, or a search page link
+        return "batch" if method == "POST" else "search page"
+    resource_type = parts[0]
+    if method == "GET":
+        return f"read {resource_type}" if len(parts) > 1 else f"search {resource_type}"
+    if method == "POST":
+        return f"create {resource_type}"
+    if method == "PUT":
+        return f"update {resource_type}"
+    return f"{method.lower()} {resource_type}"
+
+
+class GuardedTransport(httpx.AsyncBaseTransport):
+    """Deadline, circuit breaker and metrics around another transport (see the module docstring)."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, base_path: str = "",
+                 breaker: CircuitBreaker = breaker, metrics: OperationMetrics = metrics):
+        self.transport = transport
+        self.base_path = base_path.rstrip("/")
+        self.breaker = breaker
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        operation = operation_name(request, self.base_path)
+        if not self.breaker.allow():
+            self.metrics.record(operation, "rejected")
+            retry_after = self.breaker.retry_after()
+            raise CircuitOpenError(f"circuit open after repeated failures, calls suspended for {retry_after:.0f}s",
+                                   retry_after, request=request)
+        deadline = FHIR_BATCH_DEADLINE if operation == "batch" else FHIR_DEADLINE
+
+        async def call():
+            response = await self.transport.handle_async_request(request)
+            try:
+                # Read the body here so the deadline covers it. The client
+                # gets it back as a fresh stream, so it still times the call.
+                if response.is_stream_consumed:
+                    return response, response.content
+                return response, b"".join([chunk async for chunk in response.aiter_raw()])
+            finally:
+                await response.aclose()
+
+        start = time.perf_counter()
+        ok = outcome = None
+        try:
+            response, body = await asyncio.wait_for(call(), deadline)
+            ok = response.status_code < 500
+            outcome = "ok" if ok else "error"
+        except asyncio.TimeoutError:
+            ok, outcome = False, "timeout"
+            raise DeadlineExceeded(f"FHIR {operation} took longer than {deadline:g}s", request=request) from None
+        except httpx.TimeoutException:
+            ok, outcome = False, "timeout"
+            raise
+        except httpx.TransportError:
+            ok, outcome = False, "error"
+            raise
+        finally:
+            self.breaker.record(ok)
+            if outcome is not None:
+                self.metrics.record(operation, outcome, time.perf_counter() - start)
+        return httpx.Response(response.status_code, headers=response.headers, stream=httpx.ByteStream(body),
+                              extensions=response.extensions, request=request)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def new_client(base_url: str = FHIR_BASE_URL, transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    """A client for `base_url` whose calls go through GuardedTransport around `transport` (default: HTTP)."""
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=FHIR_MAX_CONNECTIONS, max_keepalive_connections=FHIR_MAX_CONNECTIONS,
+                                keepalive_expiry=FHIR_KEEPALIVE_EXPIRY),
+        )
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(FHIR_TIMEOUT, connect=FHIR_CONNECT_TIMEOUT),
+        transport=GuardedTransport(transport, httpx.URL(base_url).path),
+        headers={"Accept": FHIR_JSON},
+    )
+
+
+_client: httpx.AsyncClient | None = None
+_client_loop = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """The shared client, created on first use on the running loop."""
+    global _client, _client_loop
+    # Its connections belong to the loop that opened them.
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client, _client_loop = new_client(), loop
+    return _client
+
+
+async def close():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class TTLCache:
+    """A size-bounded mapping whose entries expire `ttl` seconds after they are set."""
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable):
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._data.pop(key, None)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any):
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        self._data.pop(key, None)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class PatientIds:
+    """Server Patient id of each local user, cached with a TTL."""
+
+    def __init__(self, ttl: float, max_size: int):
+        self._cache = TTLCache(ttl, max_size)
+
+    def get(self, user_id) -> str | None:
+        return self._cache.get(versions.user_key(user_id))
+
+    def put(self, user_id, patient_id: str):
+        self._cache.put(versions.user_key(user_id), patient_id)
+
+    def forget(self, user_id):
+        self._cache.pop(versions.user_key(user_id))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._cache), "hits": self._cache.hits, "misses": self._cache.misses,
+                "ttl_seconds": self._cache.ttl}
+
+
+patient_ids = PatientIds(FHIR_PATIENT_CACHE_TTL, FHIR_PATIENT_CACHE_SIZE)
+
+
+async def read(http: httpx.AsyncClient, resource_type: str, resource_id: str) -> Dict[str, Any] | None:
+    """GET [base]/{type}/{id}; None if the server no longer has it."""
+    response = await http.get(f"{resource_type}/{resource_id}")
+    if response.status_code in (404, 410):
+        return None
+    response.raise_for_status()
+    return response.json()
+
+
+async def search_pages(http: httpx.AsyncClient, resource_type: str,
+                       params: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield the resources of each page of a search, following the Bundle's `next` links."""
+    response = await http.get(resource_type, params=params)
+    while True:
+        response.raise_for_status()
+        bundle = response.json()
+        yield [entry["resource"] for entry in bundle.get("entry") or [] if "resource" in entry]
+        next_url = next((link["url"] for link in bundle.get("link") or [] if link.get("relation") == "next"), None)
+        if next_url is None:
+            return
+        response = await http.get(next_url)
+
+
+async def search_all(http: httpx.AsyncClient, resource_type: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    resources: List[Dict[str, Any]] = []
+    async for page in search_pages(http, resource_type, params):
+        resources.extend(page)
+    return resources
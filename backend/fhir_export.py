@@ -0,0 +1,238 @@
+"""
+Concurrent export of a user's data to a FHIR server.
+
+Observations are posted as `Bundle(type='batch')` requests over the shared
+HTTP client (fhir_client.get_client), several chunks at a time. A chunk that gets a 429 or 5xx
+response (or a connection error / timeout) is retried with exponential
+backoff, honouring Retry-After (or, while fhir_client.breaker is open, its
+reset time). The chunk size adapts to how fast the server answers: it grows
+while batches come back quickly and shrinks when they are slow or rejected.
+
+Observations are written with updates (conditional on their identifier
+until the server id is known) rather than plain creates, so a retried
+batch or a repeated export does not duplicate them.
+"""
+import asyncio
+import os
+import random
+import time
+from urllib.parse import quote
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, List, Tuple
+
+import httpx
+
+from .fhir_client import FHIR_JSON, CircuitOpenError, patient_ids
+
+FHIR_MAX_CONCURRENCY = int(os.getenv("FHIR_MAX_CONCURRENCY", "4"))
+FHIR_MAX_RETRIES = int(os.getenv("FHIR_MAX_RETRIES", "5"))
+
+# Worth retrying: throttled, or the server (or a proxy in front of it) failed.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_CHUNK_SIZE = 250
+
+ChunkCallback = Callable[[int, List[Any], List[Dict[str, Any]]], Awaitable[None]]
+
+
+class ChunkSizer:
+    """
+    Adapts the batch size to the server's response time: additive increase
+    while batches take under half of `target_seconds`, proportional decrease
+    when they take longer than it, halving on a failed batch.
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = MAX_CHUNK_SIZE,
+                 target_seconds: float = 2.0):
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.size = min(max(initial, minimum), self.maximum)
+        self.target_seconds = target_seconds
+
+    def observe(self, size: int, seconds: float, ok: bool):
+        if not ok:
+            self.size = max(self.minimum, min(self.size, size) // 2)
+        elif seconds > self.target_seconds:
+            self.size = max(self.minimum, int(size * self.target_seconds / seconds))
+        elif seconds < self.target_seconds / 2 and size >= self.size:
+            self.size = min(self.maximum, self.size + max(1, self.size // 4))
+
+
+class FHIRBatchExporter:
+    """
+    Sends resources to `client`'s FHIR base in batch Bundles, at most
+    `max_concurrency` at a time. Chunks are cut as workers free up, so each
+    one uses the chunk size current at that moment.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, chunk_size: int = 75,
+                 max_concurrency: int = FHIR_MAX_CONCURRENCY, max_retries: int = FHIR_MAX_RETRIES,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0, target_seconds: float = 2.0):
+        self.client = client
+        self.max_concurrency = max(max_concurrency, 1)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sizer = ChunkSizer(chunk_size, target_seconds=target_seconds)
+        self.requests_sent = 0
+        self.retries = 0
+        self.batches_posted = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests_sent,
+            "retries": self.retries,
+            "batches": self.batches_posted,
+            "final_chunk_size": self.sizer.size,
+        }
+
+    def _backoff(self, attempt: int, response: httpx.Response | None, error: Exception | None = None) -> float:
+        if isinstance(error, CircuitOpenError):
+            # Nothing is sent until the breaker lets a trial call through.
+            return min(error.retry_after + random.uniform(0, self.backoff_base), self.backoff_max)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass  # an HTTP date; fall back to our own schedule
+        # Full jitter, so concurrent workers do not retry in lockstep.
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying RETRY_STATUSES and transport errors up to
+        max_retries times. Returns the last response; raises the last
+        httpx.TransportError if no response was ever received.
+        """
+        attempt = 0
+        while True:
+            response = error = None
+            self.requests_sent += 1
+            try:
+                response = await self.client.request(method, url, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    raise
+                error = e
+            await asyncio.sleep(self._backoff(attempt, response, error))
+            attempt += 1
+            self.retries += 1
+
+    async def find_or_create_patient(self, identifier: str, patient: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        (Patient resource, reused?) for the Patient with this identifier,
+        creating it if needed. Its id goes into fhir_client.patient_ids.
+        """
+        response = await self.request("GET", "Patient", params={"identifier": identifier})
+        response.raise_for_status()
+        entries = response.json().get("entry") or []
+        if entries:
+            resource, reused = entries[0]["resource"], True
+        else:
+            response = await self.request("POST", "Patient", json=patient, headers={"Content-Type": FHIR_JSON})
+            response.raise_for_status()
+            resource, reused = response.json(), False
+        patient_ids.put(identifier, resource["id"])
+        return resource, reused
+
+    async def post_entries(self, entries: AsyncIterable[Tuple[Any, Dict[str, Any]]],
+                           on_chunk: ChunkCallback) -> int:
+        """
+        Send batch Bundle entries (see observation_entry), given as
+        (key, entry) pairs. Returns how many were sent.
+
+        Entries are pulled from `entries` one chunk at a time as workers free
+        up, so at most max_concurrency chunks are held at once. After each
+        chunk, `on_chunk(processed, keys, outcomes)` is awaited with the
+        chunk's keys, one outcome per entry (the entry's `response` from the
+        server: 'status', 'location', ...; or an 'error' if its batch failed)
+        and the number of leading entries whose chunks have all finished,
+        e.g. to checkpoint progress.
+        """
+        source = aiter(entries)
+        pulling = asyncio.Lock()
+        ends: Dict[int, int] = {}
+        cursor = processed = 0
+        exhausted = False
+
+        async def next_chunk() -> Tuple[int, List[Tuple[Any, Dict[str, Any]]]]:
+            nonlocal cursor, exhausted
+            # One worker at a time cuts the next chunk off the source.
+            async with pulling:
+                start, chunk = cursor, []
+                while not exhausted and len(chunk) < self.sizer.size:
+                    try:
+                        chunk.append(await anext(source))
+                    except StopAsyncIteration:
+                        exhausted = True
+                cursor += len(chunk)
+                return start, chunk
+
+        async def worker():
+            nonlocal processed
+            while True:
+                start, chunk = await next_chunk()
+                if not chunk:
+                    return
+                keys = [key for key, _ in chunk]
+                outcomes = await self._post_chunk([entry for _, entry in chunk])
+                ends[start] = start + len(chunk)
+                while processed in ends:
+                    processed = ends.pop(processed)
+                await on_chunk(processed, keys, outcomes)
+
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+        return cursor
+
+    async def _post_chunk(self, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        bundle = {'resourceType': 'Bundle', 'type': 'batch', 'entry': chunk}
+        started = time.perf_counter()
+        try:
+            response = await self.request("POST", "", json=bundle, headers={"Content-Type": FHIR_JSON})
+        except httpx.TransportError as e:
+            self.sizer.observe(len(chunk), time.perf_counter() - started, ok=False)
+            return [{'error': f"{type(e).__name__}: {e}"}] * len(chunk)
+        # Time of the final attempt's round trip is what the size adapts to.
+        self.sizer.observe(len(chunk), response.elapsed.total_seconds(), ok=response.is_success)
+        self.batches_posted += 1
+
+        resp_text = response.text.strip()
+        try:
+            resp_json = response.json() if resp_text else {}
+        except ValueError:
+            resp_json = {}
+        resp_entries = resp_json.get('entry') if isinstance(resp_json, dict) else None
+        # A batch-response has one entry per request entry, in order.
+        if not resp_entries or len(resp_entries) != len(chunk):
+            return [{
+                "error": "Empty or invalid response from FHIR server",
+                "status_code": response.status_code,
+                "raw_text": resp_text[:200],
+            }] * len(chunk)
+        return [entry.get('response', {}) for entry in resp_entries]
+
+
+def observation_entry(observation: Dict[str, Any], identifier: str, resource_id: str | None = None) -> Dict[str, Any]:
+    """
+    Batch entry that writes `observation` idempotently: an update of
+    Observation/{resource_id} if the server id is known, else a conditional
+    update on `identifier`, which creates the Observation only if no
+    Observation carries that identifier yet.
+    """
+    if resource_id is not None:
+        return {'resource': {**observation, 'id': resource_id},
+                'request': {'method': 'PUT', 'url': f'Observation/{resource_id}'}}
+    return {'resource': observation,
+            'request': {'method': 'PUT', 'url': f'Observation?identifier={quote(identifier, safe="")}'}}
+
+
+def succeeded(outcome: Dict[str, Any]) -> bool:
+    """Whether an entry outcome is a create (201) or update (200) with a location."""
+    return outcome.get('status', '').startswith(('200', '201')) and bool(outcome.get('location'))
+
+
+def resource_id(location: str) -> str:
+    """'Observation/123/_history/1' (possibly with the base URL in front) -> '123'."""
+    parts = location.split('/_history/')[0].rstrip('/').split('/')
+    return parts[-1]
@@ -0,0 +1,127 @@
+"""
+FHIR Patient and Observation JSON built directly as dicts.
+
+These produce the same JSON as main.convert_user_to_fhir and
+main.convert_event_to_fhir followed by `as_json()`, without constructing
+fhirclient model objects, whose per-element validation dominated the cost
+of a large export. They accept ORM objects or row tuples with the same
+attribute names (e.g. fhir_state.PENDING_COLUMNS).
+
+`event_payload` and `event_id` read such an Observation back into the
+fields of an Event, for import.
+"""
+import uuid
+from datetime import datetime
+from typing import Any, Dict
+
+from .models import EventType, Severity, Unit, normalize_timestamp
+
+# Marks resources created by this app, next to each one's own identifier.
+APP_IDENTIFIER = {'use': 'temp', 'value': 'mitigate-app'}
+
+
+def patient(user) -> Dict[str, Any]:
+    return {
+        'resourceType': 'Patient',
+        'active': True,
+        'identifier': [{'use': 'usual', 'value': str(user.id)}, dict(APP_IDENTIFIER)],
+        'name': [{'use': 'official', 'text': user.name}],
+    }
+
+
+def observation(event, patient_id: str | None = None) -> Dict[str, Any]:
+    """
+    The event as an Observation, with `subject` set if `patient_id` is given.
+    The event's fields other than its codes travel as codings of
+    valueCodeableConcept, stringified as convert_event_to_fhir does.
+
+    Raises ValueError for an event without a description, like fhirclient
+    does (a note's text is required).
+    """
+    if event.description is None:
+        raise ValueError("Observation note needs a text; the event has no description")
+    obs = {
+        'resourceType': 'Observation',
+        'status': 'registered',
+        'code': {
+            'coding': [{'system': event.system, 'code': event.code}],
+            'text': event.event_type.value,
+        },
+        'identifier': [{'use': 'usual', 'value': str(event.id)}, dict(APP_IDENTIFIER)],
+        'valueCodeableConcept': {
+            'coding': [
+                {'system': 'severity', 'code': str(event.severity)},
+                {'system': 'value', 'code': str(event.numerical_value)},
+                {'system': 'unit', 'code': str(event.numerical_unit)},
+                {'system': 'eventTimestamp', 'code': str(event.event_timestamp)},
+            ]
+        },
+        'note': [{'text': event.description}],
+    }
+    if patient_id is not None:
+        obs['subject'] = {'reference': f'Patient/{patient_id}'}
+    return obs
+
+
+def event_id(observation: Dict[str, Any], server: str) -> uuid.UUID:
+    """
+    The local Event id of an Observation: its `usual` identifier when that is
+    an event id (one this app exported), otherwise an id derived from the
+    server and the Observation's id, stable across imports.
+    """
+    for identifier in observation.get('identifier') or []:
+        if identifier.get('use') == 'usual':
+            try:
+                return uuid.UUID(identifier.get('value', ''))
+            except ValueError:
+                break
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"{server.rstrip('/')}/Observation/{observation.get('id')}")
+
+
+def _coded(text: str | None, enum_cls, parse=str):
+    # str() of the member: its value, or 'Class.name' for the str enums.
+    if text in (None, '', 'None'):
+        return None
+    prefix = enum_cls.__name__ + '.'
+    if text.startswith(prefix):
+        return enum_cls[text[len(prefix):]]
+    return enum_cls(parse(text))
+
+
+def _timestamp(text: str | None) -> datetime | None:
+    # Naive UTC like the stored events; FHIR dateTimes carry 'Z' or an offset.
+    if text in (None, '', 'None'):
+        return None
+    return normalize_timestamp(datetime.fromisoformat(text))
+
+
+def event_payload(observation: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The event fields of an Observation written by `observation` (or
+    convert_event_to_fhir), keyed like a dumped EventRequest: the reverse of
+    its code and valueCodeableConcept encoding. The event time falls back to
+    `effectiveDateTime` when there is no eventTimestamp coding.
+
+    Raises ValueError if the Observation does not encode an event.
+    """
+    code = observation.get('code') or {}
+    coding = (code.get('coding') or [{}])[0]
+    if not coding.get('system') or not coding.get('code') or not code.get('text'):
+        raise ValueError("Observation has no event code")
+    values = {c.get('system'): c.get('code') for c in (observation.get('valueCodeableConcept') or {}).get('coding') or []}
+    timestamp = values['eventTimestamp'] if 'eventTimestamp' in values else observation.get('effectiveDateTime')
+    value = values.get('value')
+    notes = observation.get('note') or [{}]
+    try:
+        return {
+            'system': coding['system'],
+            'code': coding['code'],
+            'event_type': _coded(code.get('text'), EventType),
+            'severity': _coded(values.get('severity'), Severity, int),
+            'numerical_value': int(value) if value not in (None, '', 'None') else None,
+            'numerical_unit': _coded(values.get('unit'), Unit),
+            'description': notes[0].get('text'),
+            'event_timestamp': _timestamp(timestamp),
+        }
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Unrecognized value {e}") from e
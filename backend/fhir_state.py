@@ -0,0 +1,141 @@
+"""
+Bookkeeping for incremental FHIR export.
+
+fhir_export_state records, per user, the server and Patient id an export
+went to and a watermark: every event whose update_timestamp is below it has
+had its current version exported. fhir_resources maps each exported
+Event.id to its Observation id on the server and the update_timestamp that
+was sent. An export sends only the events at or above the watermark that
+are new or changed since they were last sent, then moves the watermark up
+to the first event it could not export (see `next_watermark`).
+
+The watermark assumes update_timestamp grows with each write. An event
+written with an explicit, older update_timestamp is not picked up until a
+full export (`reset`) re-checks every event.
+"""
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Iterable, List, Tuple
+
+from sqlalchemy import Row, and_, delete, func, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import AsyncSessionLocal
+from .models import Event, FhirExportState, FhirResource
+from .ingest import utc_now
+
+# How far behind an export's start the watermark stays, for writes that were
+# still committing when the export read the pending events.
+WATERMARK_LAG = timedelta(minutes=1)
+
+
+async def get(db: AsyncSession, user_id, server: str) -> FhirExportState | None:
+    """The user's export state for `server`; None (after a reset) if they were exported elsewhere."""
+    state = await db.get(FhirExportState, user_id)
+    if state is not None and state.server != server:
+        await reset(db, user_id)
+        return None
+    return state
+
+
+async def reset(db: AsyncSession, user_id):
+    """Forget what was exported for the user, so the next export sends every event."""
+    await db.execute(delete(FhirResource).where(FhirResource.user_id == user_id))
+    await db.execute(delete(FhirExportState).where(FhirExportState.user_id == user_id))
+
+
+# Event columns an export needs; see iter_pending.
+PENDING_COLUMNS = [
+    Event.id, Event.system, Event.code, Event.event_type, Event.severity, Event.numerical_value,
+    Event.numerical_unit, Event.description, Event.event_timestamp, Event.update_timestamp,
+]
+PAGE_SIZE = 1000
+
+
+def pending_events(user_id, watermark: datetime | None):
+    """
+    SELECT PENDING_COLUMNS plus the known Observation id (resource_id, or
+    None) for the user's events that are new or changed since they were last
+    exported, oldest change first.
+    """
+    stmt = (
+        select(*PENDING_COLUMNS, FhirResource.resource_id)
+          .outerjoin(FhirResource, FhirResource.event_id == Event.id)
+          .where(
+              Event.user_id == user_id,
+              or_(FhirResource.event_id.is_(None), FhirResource.exported_update_timestamp < Event.update_timestamp),
+          )
+          .order_by(Event.update_timestamp, Event.id)
+    )
+    if watermark is not None:
+        stmt = stmt.where(Event.update_timestamp >= watermark)
+    return stmt
+
+
+async def count_pending(db: AsyncSession, user_id, watermark: datetime | None) -> int:
+    return (await db.execute(
+        select(func.count()).select_from(pending_events(user_id, watermark).order_by(None).subquery())
+    )).scalar()
+
+
+async def iter_pending(user_id, watermark: datetime | None, page_size: int = PAGE_SIZE) -> AsyncIterator[List[Row]]:
+    """
+    Yield the pending_events rows a page at a time. Each page is its own
+    short keyset query on (update_timestamp, id) rather than one cursor
+    held open for the whole export, so the export's own writes (and other
+    writers, with the rollback journal) are never kept waiting on it.
+    """
+    stmt = pending_events(user_id, watermark).limit(page_size)
+    after = None
+    while True:
+        page_stmt = stmt
+        if after is not None:
+            ts, event_id = after
+            page_stmt = stmt.where(or_(Event.update_timestamp > ts,
+                                       and_(Event.update_timestamp == ts, Event.id > event_id)))
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(page_stmt)).all()
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        after = rows[-1].update_timestamp, rows[-1].id
+
+
+def next_watermark(started: datetime, first_failed: datetime | None) -> datetime:
+    """
+    Watermark after an export that read its pending events at `started`:
+    the update_timestamp of the first event it failed to write, but never
+    later than WATERMARK_LAG before the start. Events above it that were
+    exported are kept from being re-sent by their fhir_resources rows.
+    """
+    cap = started - WATERMARK_LAG
+    return min(first_failed, cap) if first_failed is not None else cap
+
+
+async def record(db: AsyncSession, user_id, exported: Iterable[Tuple[object, str, datetime]]):
+    """Upsert (event id, Observation id, exported update_timestamp) mappings. The caller commits."""
+    values = [
+        {'event_id': event_id, 'user_id': user_id, 'resource_id': resource_id, 'exported_update_timestamp': updated}
+        for event_id, resource_id, updated in exported
+    ]
+    if not values:
+        return
+    stmt = sqlite_insert(FhirResource.__table__).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['event_id'],
+        set_={'resource_id': stmt.excluded.resource_id,
+              'exported_update_timestamp': stmt.excluded.exported_update_timestamp},
+    )
+    await db.execute(stmt)
+
+
+async def save(db: AsyncSession, user_id, server: str, patient_id: str, watermark: datetime | None = None):
+    """Create or update the user's export state; a None watermark leaves the stored one. The caller commits."""
+    values = {'user_id': user_id, 'server': server, 'patient_id': patient_id,
+              'watermark': watermark, 'last_export_timestamp': utc_now()}
+    stmt = sqlite_insert(FhirExportState.__table__).values(values)
+    set_ = {'server': server, 'patient_id': patient_id, 'last_export_timestamp': values['last_export_timestamp']}
+    if watermark is not None:
+        set_['watermark'] = watermark
+    await db.execute(stmt.on_conflict_do_update(index_elements=['user_id'], set_=set_))
@@ -0,0 +1,284 @@
+"""
+Bulk event writes.
+
+Events are built as plain rows keyed by `events` column name and inserted
+with a Core executemany, skipping the ORM unit of work. The weekly rollup and
+the users' data versions are updated from the same rows, so callers only
+need to commit.
+
+Single-event writes go through `write_coalescer`, which commits the events
+that arrive within a few milliseconds of each other as one transaction.
+"""
+import asyncio
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from .database import AsyncSessionLocal
+from .models import Event, EventType, Severity, Unit, bucket_keys
+from . import rollup, versions
+
+NDJSON_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+
+# How long the coalescer waits for more writes after the first one arrives,
+# and the most events it commits in one transaction.
+WRITE_COALESCE_MS = float(os.getenv("WRITE_COALESCE_MS", "5"))
+WRITE_COALESCE_MAX_BATCH = int(os.getenv("WRITE_COALESCE_MAX_BATCH", "500"))
+
+
+def utc_now() -> datetime:
+    """Naive UTC 'now', matching the SQLite CURRENT_TIMESTAMP server default."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def new_event_row(user_id, payload: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """
+    Column-keyed row for a dumped EventRequest whose system/code are filled.
+    Every row carries the same keys so a batch is a single executemany.
+    """
+    event_ts_utc, event_day, event_week = bucket_keys(payload.get('event_timestamp'))
+    severity, unit = payload.get('severity'), payload.get('numerical_unit')
+    return {
+        'id': uuid.uuid4(),
+        'user_id': user_id,
+        'system': payload['system'],
+        'code': payload['code'],
+        'event_type': EventType(payload['event_type']),
+        'severity': Severity(severity) if severity is not None else None,
+        'numerical_value': payload.get('numerical_value'),
+        'unit': Unit(unit) if unit is not None else None,
+        'description': payload.get('description'),
+        'event_timestamp': event_ts_utc,
+        'event_ts_utc': event_ts_utc,
+        'event_day': event_day,
+        'event_week': event_week,
+        'creation_timestamp': payload.get('creation_timestamp') or now,
+        'update_timestamp': payload.get('update_timestamp') or now,
+    }
+
+
+async def insert_rows(db: AsyncSession, rows: List[Dict[str, Any]]):
+    """INSERT the rows, add them to weekly_rollup and bump the users' data versions. The caller commits."""
+    if not rows:
+        return
+    await db.execute(insert(Event.__table__), rows)
+    await db.run_sync(rollup.apply_rows, rows)
+    await db.run_sync(versions.bump, [row['user_id'] for row in rows])
+
+
+# Columns `upsert_rows` compares and overwrites; ids, owners and creation
+# times are kept.
+UPSERT_COLUMNS = [
+    'system', 'code', 'event_type', 'severity', 'numerical_value', 'unit', 'description',
+    'event_timestamp', 'event_ts_utc', 'event_day', 'event_week',
+]
+
+
+async def upsert_rows(db: AsyncSession, rows: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Write rows built by `new_event_row` by id: INSERT the new ones (see
+    `insert_rows`) and UPDATE the stored ones whose UPSERT_COLUMNS differ.
+    A changed row rebuilds its user's rollup. The caller commits.
+
+    Returns the rows as 'inserted', 'updated', 'unchanged' (carrying the
+    stored update_timestamp) and 'conflicts' (an id stored for another user,
+    left as is). Of rows sharing an id, the last one is written.
+    """
+    result = {'inserted': [], 'updated': [], 'unchanged': [], 'conflicts': []}
+    rows = list({row['id']: row for row in rows}.values())
+    if not rows:
+        return result
+    table = Event.__table__
+    stored = {
+        row.id: row for row in (await db.execute(
+            select(table.c.id, table.c.user_id, table.c.update_timestamp, *(table.c[c] for c in UPSERT_COLUMNS))
+              .where(table.c.id.in_([row['id'] for row in rows]))
+        )).all()
+    }
+    for row in rows:
+        old = stored.get(row['id'])
+        if old is None:
+            result['inserted'].append(row)
+        elif versions.user_key(old.user_id) != versions.user_key(row['user_id']):
+            result['conflicts'].append(row)
+        elif all(getattr(old, c) == row[c] for c in UPSERT_COLUMNS):
+            row['update_timestamp'] = old.update_timestamp
+            result['unchanged'].append(row)
+        else:
+            result['updated'].append(row)
+
+    await insert_rows(db, result['inserted'])
+    if result['updated']:
+        stmt = (
+            update(table)
+              .where(table.c.id == bindparam('_id'))
+              .values({c: bindparam(c) for c in [*UPSERT_COLUMNS, 'update_timestamp']})
+        )
+        await db.execute(stmt, [{'_id': row['id'], **{c: row[c] for c in [*UPSERT_COLUMNS, 'update_timestamp']}}
+                                for row in result['updated']])
+        # An update can take an event out of its week; recount the users' weeks.
+        user_ids = list({versions.user_key(row['user_id']): row['user_id'] for row in result['updated']}.values())
+        await db.run_sync(rollup.rebuild, user_ids)
+        await db.run_sync(versions.bump, user_ids)
+    return result
+
+
+async def iter_request_items(request: Request) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Yield (index, item) for each element of a JSON array body, or for each
+    non-blank line of an NDJSON body. NDJSON is parsed as it streams in.
+    A line that is not valid JSON is yielded as a ValueError item.
+    Raises ValueError if a JSON body is not an array.
+    """
+    content_type = request.headers.get('content-type', '').split(';')[0].strip().lower()
+    if content_type not in NDJSON_TYPES:
+        items = json.loads(await request.body() or b'null')
+        if not isinstance(items, list):
+            raise ValueError("Expected a JSON array of events")
+        for index, item in enumerate(items):
+            yield index, item
+        return
+
+    index, buffer = 0, b''
+
+    def parse(line: bytes):
+        try:
+            return json.loads(line)
+        except ValueError as e:
+            return ValueError(f"Invalid JSON: {e}")
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            if line.strip():
+                yield index, parse(line)
+                index += 1
+    if buffer.strip():
+        yield index, parse(buffer)
+
+
+class WriteCoalescer:
+    """
+    Group commit for single-event inserts.
+
+    `submit` queues a row and returns only once the transaction containing it
+    has committed (or raises its error). A worker task takes the first queued
+    row, keeps collecting for `max_delay` seconds or until `max_batch` rows,
+    and commits them together: one fsync instead of one per event. If a
+    batch fails, its rows are retried one by one so a bad row only fails its
+    own caller.
+    """
+
+    def __init__(self, session_factory, max_delay: float, max_batch: int):
+        self.session_factory = session_factory
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._loop = None
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self.batches_committed = 0
+        self.events_committed = 0
+        self.events_failed = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "batches_committed": self.batches_committed,
+            "events_committed": self.events_committed,
+            "events_failed": self.events_failed,
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size": self.max_batch_size,
+            "avg_batch_size": (self.events_committed / self.batches_committed) if self.batches_committed else None,
+            "max_delay_ms": self.max_delay * 1000,
+        }
+
+    def _ensure_worker(self):
+        # The worker is bound to the loop serving requests; start it lazily
+        # so it always runs on the current one.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+    async def submit(self, row: Dict[str, Any]):
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self._queue.put_nowait((row, future))
+        await future
+
+    async def close(self):
+        """Commit everything already queued, then stop the worker."""
+        if self._task is None or self._task.done():
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = self._loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._commit(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _commit(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        try:
+            await self._write([row for row, _ in batch])
+        except Exception as e:
+            # Must not escape: the worker would die with callers still waiting.
+            if len(batch) == 1:
+                self.events_failed += 1
+                _settle(batch[0][1], e)
+                return
+            for item in batch:
+                await self._commit([item])
+            return
+        self.batches_committed += 1
+        self.events_committed += len(batch)
+        self.last_batch_size = len(batch)
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        for _, future in batch:
+            _settle(future)
+
+    async def _write(self, rows: List[Dict[str, Any]]):
+        async with self.session_factory() as db:
+            await insert_rows(db, rows)
+            await db.commit()
+
+
+def _settle(future: asyncio.Future, error: BaseException | None = None):
+    # The caller may have gone away (request cancelled) in the meantime.
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+write_coalescer = WriteCoalescer(AsyncSessionLocal, WRITE_COALESCE_MS / 1000, WRITE_COALESCE_MAX_BATCH)
@@ -0,0 +1,206 @@
+"""
+Background jobs, persisted in the `jobs` table.
+
+`submit` stores a Job row and returns straight away; a small pool of worker
+tasks runs queued jobs with the handler registered for their kind. A handler
+reports progress through its JobRun, which saves it to the job's row for
+GET /api/jobs/{id} to poll. Jobs left queued or running when the server
+stopped are queued again by `resume` at startup, and their handlers carry
+on after the items already `processed`.
+
+Only one server process should run the jobs of a database: `resume` takes
+every running job to be left over from a previous run.
+"""
+import asyncio
+import json
+import os
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import select, update
+
+from .database import AsyncSessionLocal
+from .models import Job, JobStatus
+from .ingest import utc_now
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# A job that was interrupted this many times is failed rather than resumed.
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# Errors kept on a job's row; error_count still counts every one.
+JOB_MAX_ERRORS = int(os.getenv("JOB_MAX_ERRORS", "100"))
+
+
+class JobRun:
+    """A running job, as its handler sees it."""
+
+    def __init__(self, queue: "JobQueue", job: Job):
+        self.queue = queue
+        self.id = job.id
+        self.user_id = job.user_id
+        self.params: Dict[str, Any] = json.loads(job.params)
+        self.total = job.total
+        self.processed = job.processed
+        self.created_count = job.created_count
+        self.error_count = job.error_count
+        self.errors: List[Any] = json.loads(job.errors)
+
+    async def progress(self, processed: int | None = None, created: int = 0,
+                       errors: List[Any] = (), total: int | None = None):
+        """Add `created` and `errors` to the job's counts, set the others, and save."""
+        if total is not None:
+            self.total = total
+        if processed is not None:
+            self.processed = processed
+        self.created_count += created
+        self.error_count += len(errors)
+        self.errors.extend(errors[:max(JOB_MAX_ERRORS - len(self.errors), 0)])
+        await self.queue.update(
+            self.id, total=self.total, processed=self.processed, created_count=self.created_count,
+            error_count=self.error_count, errors=json.dumps(self.errors, default=str),
+        )
+
+
+Handler = Callable[[JobRun], Awaitable[Any]]
+
+
+class JobQueue:
+    """
+    Runs persisted jobs on `workers` tasks. A handler's return value is
+    saved as the job's result; an exception fails the job.
+    """
+
+    def __init__(self, session_factory, workers: int, max_attempts: int):
+        self.session_factory = session_factory
+        self.workers = max(workers, 1)
+        self.max_attempts = max_attempts
+        self.handlers: Dict[str, Handler] = {}
+        self._loop = None
+        self._queue: asyncio.Queue | None = None
+        self._tasks: List[asyncio.Task] = []
+
+    def register(self, kind: str, handler: Handler):
+        self.handlers[kind] = handler
+
+    def _ensure_workers(self):
+        # Like ingest.WriteCoalescer, bind the workers to the running loop.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or not self._tasks or all(task.done() for task in self._tasks):
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._tasks = [loop.create_task(self._run()) for _ in range(self.workers)]
+
+    async def submit(self, kind: str, user_id=None, params: Dict[str, Any] | None = None) -> Job:
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind {kind!r}")
+        async with self.session_factory() as db:
+            job = Job(kind=kind, user_id=user_id, params=json.dumps(params or {}), status=JobStatus.queued)
+            db.add(job)
+            await db.commit()
+        self._ensure_workers()
+        self._queue.put_nowait(job.id)
+        return job
+
+    async def get(self, job_id) -> Job | None:
+        async with self.session_factory() as db:
+            return await db.get(Job, job_id)
+
+    async def update(self, job_id, **values):
+        async with self.session_factory() as db:
+            await db.execute(update(Job).where(Job.id == job_id).values(update_timestamp=utc_now(), **values))
+            await db.commit()
+
+    async def resume(self) -> int:
+        """Queue the jobs an earlier run left unfinished. Returns how many."""
+        async with self.session_factory() as db:
+            await db.execute(
+                update(Job).where(Job.status == JobStatus.running).values(status=JobStatus.queued)
+            )
+            await db.execute(
+                update(Job)
+                  .where(Job.status == JobStatus.queued, Job.attempts >= self.max_attempts)
+                  .values(status=JobStatus.failed, error=f"Interrupted {self.max_attempts} times",
+                          finished_timestamp=utc_now(), update_timestamp=utc_now())
+            )
+            job_ids = (await db.execute(
+                select(Job.id).where(Job.status == JobStatus.queued).order_by(Job.creation_timestamp)
+            )).scalars().all()
+            await db.commit()
+        self._ensure_workers()
+        for job_id in job_ids:
+            self._queue.put_nowait(job_id)
+        return len(job_ids)
+
+    async def close(self):
+        """
+        Stop the workers. Jobs they were running stay 'running' and are
+        resumed by the next `resume`.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            job_id = await queue.get()
+            try:
+                await self._execute(job_id)
+            finally:
+                queue.task_done()
+
+    async def _claim(self, job_id) -> Job | None:
+        async with self.session_factory() as db:
+            claimed = await db.execute(
+                update(Job)
+                  .where(Job.id == job_id, Job.status == JobStatus.queued)
+                  .values(status=JobStatus.running, attempts=Job.attempts + 1,
+                          started_timestamp=utc_now(), update_timestamp=utc_now())
+            )
+            await db.commit()
+            if claimed.rowcount != 1:
+                return None
+            return await db.get(Job, job_id)
+
+    async def _execute(self, job_id):
+        try:
+            job = await self._claim(job_id)
+            if job is None:
+                return
+            handler = self.handlers.get(job.kind)
+            if handler is None:
+                raise LookupError(f"No handler for job kind {job.kind!r}")
+            result = await handler(JobRun(self, job))
+            await self.update(job_id, status=JobStatus.succeeded, finished_timestamp=utc_now(),
+                              result=json.dumps(result, default=str) if result is not None else None)
+        except Exception as e:
+            # Must not escape: the worker would die.
+            try:
+                await self.update(job_id, status=JobStatus.failed, error=f"{type(e).__name__}: {e}",
+                                  finished_timestamp=utc_now())
+            except Exception:
+                pass
+
+
+def describe(job: Job) -> Dict[str, Any]:
+    """The job as schemas.JobResponse fields, with its JSON columns parsed."""
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "user_id": job.user_id,
+        "status": job.status,
+        "attempts": job.attempts,
+        "total": job.total,
+        "processed": job.processed,
+        "created_count": job.created_count,
+        "error_count": job.error_count,
+        "errors": json.loads(job.errors),
+        "result": json.loads(job.result) if job.result else None,
+        "error": job.error,
+        "creation_timestamp": job.creation_timestamp,
+        "started_timestamp": job.started_timestamp,
+        "finished_timestamp": job.finished_timestamp,
+        "update_timestamp": job.update_timestamp,
+    }
+
+
+job_queue = JobQueue(AsyncSessionLocal, JOB_WORKERS, JOB_MAX_ATTEMPTS)
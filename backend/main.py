@@ -1,28 +1,32 @@
+import asyncio
 import random
 import os
+import uuid
+import httpx
+from contextlib import asynccontextmanager
 
 from typing import Union, Annotated, List, Dict, Any
-from sqlalchemy.orm import Session
-from fastapi import FastAPI, Depends, HTTPException, Path
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import FastAPI, Depends, HTTPException, Path, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from .database import engine, get_db
-from .models import Event, User, Base, EventType, Severity, Unit
-from . import schemas
-
-from sqlalchemy import func, cast, String, Float, case, and_
+from fastapi.responses import FileResponse, StreamingResponse, ORJSONResponse
+from .database import engine, async_engine, get_db, AsyncSessionLocal
+from .models import Event, User, EventType, Severity, Unit, JobStatus, normalize_timestamp, week_start_of
+from . import schemas, migrations, rollup, ingest, pagination, export, analytics, aggregates, versions, fhir_client, fhir_bulk, fhir_export, fhir_resources, fhir_state, jobs
+
+from sqlalchemy import func, cast, Float, and_, select, delete
+from sqlalchemy.exc import SQLAlchemyError
+from pydantic import ValidationError
 from fastapi import Query, Depends
 from datetime import datetime, timedelta, date, time
 
-from fhirclient import client
 from fhirclient.models.patient import Patient
 from fhirclient.models.observation import Observation
 from fhirclient.models.encounter import Encounter
-from fhirclient.models.fhirreference import FHIRReference
-from fhirclient.models.bundle import Bundle
 
-Base.metadata.create_all(bind=engine)
+# Creates missing tables and upgrades an existing app.db in place.
+migrations.upgrade(engine)
 
 VARS = {
     'migraineSystem': 'LOINC',
@@ -39,7 +43,18 @@ VARS = {
     'medicationCode': 'Z79.899'
 }
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pick up FHIR jobs that were queued or running when the server stopped.
+    await jobs.job_queue.resume()
+    yield
+    await jobs.job_queue.close()
+    await fhir_client.close()
+    # Commit single-event writes still waiting in the group-commit queue.
+    await ingest.write_coalescer.close()
+    await async_engine.dispose()
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
@@ -53,7 +68,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-db_dependency = Annotated[Session, Depends(get_db)]
+db_dependency = Annotated[AsyncSession, Depends(get_db)]
 
 
 def default_system_code_for(event_type: EventType) -> tuple[str, str]:
@@ -77,51 +92,261 @@ def default_system_code_for(event_type: EventType) -> tuple[str, str]:
 def read_root():
     return {"Hello": "World"}
 
+PageLimit = Annotated[int, Query(ge=1, le=pagination.MAX_LIMIT, description="Page size.")]
+PageBefore = Annotated[str | None, Query(description="Cursor (next_cursor) of a page; returns older items.")]
+PageAfter = Annotated[str | None, Query(description="Cursor (prev_cursor) of a page; returns newer items.")]
+Paginate = Annotated[bool, Query(description="Set false to get the full, unpaginated list.")]
+
+
+def fast_json(content: Any, response: Response | None = None) -> ORJSONResponse:
+    """
+    Serialize already-JSON-ready content with orjson, skipping
+    jsonable_encoder. Headers set on the endpoint's `response` (e.g. the
+    ETag) are carried over, since FastAPI does not merge them into a
+    returned Response.
+    """
+    headers = {k: v for k, v in response.headers.items() if k != 'content-length'} if response is not None else None
+    return ORJSONResponse(content, headers=headers)
+
+
+# Columns of the listing responses, selected as plain row tuples rather than
+# ORM objects; see schemas.UserResponse and schemas.EventResponse.
+USER_COLUMNS = [getattr(User, field) for field in schemas.UserResponse.model_fields]
+EVENT_COLUMNS = [getattr(Event, field) for field in schemas.EventResponse.model_fields]
+
+
+def row_dicts(rows) -> List[Dict[str, Any]]:
+    return [row._asdict() for row in rows]
+
+
+async def list_page(db: AsyncSession, stmt, ts_col, id_col, paginate: bool, limit: int,
+                    before: str | None, after: str | None, response: Response | None = None):
+    if not paginate:
+        return fast_json(row_dicts((await db.execute(stmt)).all()), response)
+    try:
+        page = await pagination.fetch_page(db, stmt, ts_col, id_col, limit, before, after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return fast_json({**page, "items": row_dicts(page["items"])}, response)
+
+
+def filter_events(stmt, event_type: EventType | None, start: datetime | None, end: datetime | None):
+    if event_type is not None:
+        stmt = stmt.where(Event.event_type == event_type)
+    if start is not None:
+        stmt = stmt.where(Event.event_timestamp >= normalize_timestamp(start))
+    if end is not None:
+        stmt = stmt.where(Event.event_timestamp < normalize_timestamp(end))
+    return stmt
+
+
+async def list_events(db: AsyncSession, stmt, paginate: bool, limit: int, before: str | None, after: str | None,
+                      event_type: EventType | None, start: datetime | None, end: datetime | None,
+                      response: Response | None = None):
+    stmt = filter_events(stmt, event_type, start, end)
+    return await list_page(db, stmt, Event.event_timestamp, Event.id, paginate, limit, before, after, response)
+
+
+async def check_etag(db: AsyncSession, request: Request, response: Response, user_id: str):
+    """
+    Tag a per-user response with the user's data version (see versions.py).
+    Returns (a 304 response if the client's If-None-Match still matches,
+    else None, the version), so callers can stop before running their query.
+    """
+    version = await versions.get(db, user_id)
+    tag = versions.etag(user_id, version)
+    if versions.matches(request.headers.get("if-none-match"), tag):
+        return Response(status_code=304, headers={"ETag": tag}), version
+    response.headers["ETag"] = tag
+    return None, version
+
+
 # Get the list of users from the database
-@app.get("/api/users")
-async def get_users(db: db_dependency):
-    return db.query(User).all()
+@app.get("/api/users", response_model=schemas.Page[schemas.UserResponse] | List[schemas.UserResponse])
+async def get_users(
+    db: db_dependency,
+    limit: PageLimit = pagination.DEFAULT_LIMIT,
+    before: PageBefore = None,
+    after: PageAfter = None,
+    paginate: Paginate = True
+):
+    """Users, newest first, one page at a time (see pagination.py)."""
+    return await list_page(db, select(*USER_COLUMNS), User.creation_timestamp, User.id, paginate, limit, before, after)
 
 # Get info for a specific user
-@app.get("/api/users/{user_id}")
+@app.get("/api/users/{user_id}", response_model=schemas.UserResponse)
 async def get_user(db: db_dependency, user_id: str):
-    user = db.query(User).filter(User.id == user_id).first()
+    user = (await db.execute(select(*USER_COLUMNS).where(User.id == user_id))).first()
     if user is not None:
-        return user
+        return fast_json(user._asdict())
     raise HTTPException(status_code=200, detail="User not found")
 
+@app.get("/api/users/{user_id}/events/export")
+async def export_user_events(
+    db: db_dependency,
+    request: Request,
+    user_id: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv."),
+    event_type: EventType | None = Query(None, description="Only this event type."),
+    start: datetime | None = Query(None, description="Only events at or after this time."),
+    end: datetime | None = Query(None, description="Only events before this time."),
+):
+    """
+    Streams all of a user's raw events, oldest first. Memory use does not
+    grow with history size. Compressed with gzip when the client sends
+    Accept-Encoding: gzip.
+    """
+    user = (await db.execute(select(User.id).where(User.id == user_id))).first()
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    stmt = filter_events(export.event_stmt(user_id), event_type, start, end)
+    body = export.stream_events(stmt, format)
+    headers = {"Content-Disposition": f'attachment; filename="events-{user_id}.{format}"'}
+    if export.accepts_gzip(request.headers.get("accept-encoding")):
+        body = export.gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=export.FORMATS[format], headers=headers)
+
 @app.post("/api/users", status_code=201)
 async def create_user(db: db_dependency, user_request: schemas.UserRequest):
     new_user = User(**user_request.model_dump())
     db.add(new_user)
-    db.commit()
+    await db.commit()
 
-@app.get("/api/migraines")
-async def get_migraines(db: db_dependency, user_id: str):
-    migraines = db.query(Event).filter(Event.user_id == user_id, Event.event_type == EventType.migraine).all()
-    if migraines is not None:
-        return migraines
-    return []
+@app.get("/api/migraines", response_model=schemas.Page[schemas.EventResponse] | List[schemas.EventResponse])
+async def get_migraines(
+    db: db_dependency,
+    request: Request,
+    response: Response,
+    user_id: str,
+    limit: PageLimit = pagination.DEFAULT_LIMIT,
+    before: PageBefore = None,
+    after: PageAfter = None,
+    start: datetime | None = Query(None, description="Only events at or after this time."),
+    end: datetime | None = Query(None, description="Only events before this time."),
+    paginate: Paginate = True
+):
+    """A user's migraine events, newest first, one page at a time."""
+    not_modified, _ = await check_etag(db, request, response, user_id)
+    if not_modified:
+        return not_modified
+    stmt = select(*EVENT_COLUMNS).where(Event.user_id == user_id, Event.event_type == EventType.migraine)
+    return await list_events(db, stmt, paginate, limit, before, after, None, start, end, response)
 
 @app.post("/api/event")
-async def create_event(db: db_dependency, user_id: str, event_request: schemas.EventRequest):
+async def create_event(user_id: str, event_request: schemas.EventRequest):
     payload = event_request.model_dump()
     # If system/code not provided, fill from VARS based on event_type
     if not payload.get("system") or not payload.get("code"):
         sys, code = default_system_code_for(payload["event_type"])
         payload["system"] = payload.get("system") or sys
         payload["code"] = payload.get("code") or code
-    new_event = Event(user_id=user_id, **payload)
+    # Group-committed with other events arriving at the same time; returns
+    # once the event's transaction has committed.
+    await ingest.write_coalescer.submit(ingest.new_event_row(user_id, payload, ingest.utc_now()))
 
-    db.add(new_event)
-    db.commit()
+@app.post("/api/events/batch")
+async def create_events_batch(
+    db: db_dependency,
+    request: Request,
+    user_id: str,
+    batch_size: int = Query(1000, ge=1, le=10000, description="Events per INSERT transaction.")
+):
+    """
+    Bulk version of POST /api/event. The body is either a JSON array of
+    EventRequest items or NDJSON (Content-Type: application/x-ndjson, one
+    item per line). Valid items are inserted `batch_size` at a time, one
+    transaction each. Returns one status per item, in input order.
+    """
+    defaults = {t: default_system_code_for(t) for t in EventType}
+    now = ingest.utc_now()
+    results: List[Dict[str, Any]] = []
+    pending: List[tuple[int, Dict[str, Any]]] = []
 
-@app.get("/api/triggers")
-async def get_triggers(db: db_dependency, user_id: str):
-    other_events = db.query(Event).filter(Event.user_id == user_id, Event.event_type != EventType.migraine).all()
-    if other_events is not None:
-        return other_events
-    return []
+    async def flush():
+        rows = [row for _, row in pending]
+        try:
+            await ingest.insert_rows(db, rows)
+            await db.commit()
+            results.extend({"index": i, "status": "created", "id": str(row["id"])} for i, row in pending)
+        except SQLAlchemyError as e:
+            await db.rollback()
+            error = str(getattr(e, "orig", None) or e)
+            results.extend({"index": i, "status": "error", "error": error} for i, _ in pending)
+        pending.clear()
+
+    try:
+        async for index, item in ingest.iter_request_items(request):
+            if isinstance(item, Exception):
+                results.append({"index": index, "status": "error", "error": str(item)})
+                continue
+            try:
+                payload = schemas.EventRequest.model_validate(item).model_dump()
+            except ValidationError as e:
+                results.append({"index": index, "status": "error",
+                                "error": e.errors(include_url=False, include_context=False, include_input=False)})
+                continue
+            if payload["event_type"] is None:
+                results.append({"index": index, "status": "error", "error": "event_type is required"})
+                continue
+            # If system/code not provided, fill from VARS based on event_type
+            if not payload.get("system") or not payload.get("code"):
+                sys, code = defaults[EventType(payload["event_type"])]
+                payload["system"] = payload.get("system") or sys
+                payload["code"] = payload.get("code") or code
+            pending.append((index, ingest.new_event_row(user_id, payload, now)))
+            if len(pending) >= batch_size:
+                await flush()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if pending:
+        await flush()
+
+    results.sort(key=lambda r: r["index"])
+    created = sum(1 for r in results if r["status"] == "created")
+    return {
+        "user_id": user_id,
+        "created": created,
+        "failed": len(results) - created,
+        "items": results
+    }
+
+@app.get("/api/metrics/fhir")
+async def get_fhir_metrics():
+    """Latency and outcomes of each kind of FHIR call, the circuit breaker's state and the Patient id cache."""
+    return {
+        "operations": fhir_client.metrics.snapshot(),
+        "breaker": fhir_client.breaker.stats(),
+        "patient_ids": fhir_client.patient_ids.stats(),
+    }
+
+
+@app.get("/api/metrics/writes")
+async def get_write_metrics():
+    """Queue depth and commit batch sizes of the single-event write coalescer."""
+    return ingest.write_coalescer.metrics()
+
+@app.get("/api/triggers", response_model=schemas.Page[schemas.EventResponse] | List[schemas.EventResponse])
+async def get_triggers(
+    db: db_dependency,
+    request: Request,
+    response: Response,
+    user_id: str,
+    limit: PageLimit = pagination.DEFAULT_LIMIT,
+    before: PageBefore = None,
+    after: PageAfter = None,
+    event_type: EventType | None = Query(None, description="Only this trigger type."),
+    start: datetime | None = Query(None, description="Only events at or after this time."),
+    end: datetime | None = Query(None, description="Only events before this time."),
+    paginate: Paginate = True
+):
+    """A user's non-migraine events, newest first, one page at a time."""
+    not_modified, _ = await check_etag(db, request, response, user_id)
+    if not_modified:
+        return not_modified
+    stmt = select(*EVENT_COLUMNS).where(Event.user_id == user_id, Event.event_type != EventType.migraine)
+    return await list_events(db, stmt, paginate, limit, before, after, event_type, start, end, response)
 
 def get_random_date_between(start_date: date, end_date: date):
     days_between = (end_date - start_date).days
@@ -138,6 +363,8 @@ B. Use the objects and send to the HAPI demo fhir server
     1. https://hapi.fhir.org/baseR4 
 """
 
+# fhirclient models of a user and an event. The export builds the same JSON
+# directly with fhir_resources.py, which is much faster.
 def convert_user_to_fhir(user: User):
     patient = Patient({
         'active': True,
@@ -202,15 +429,31 @@ def convert_event_to_fhir(event: Event):
     })
 
 
+def fhir_error(e: httpx.HTTPError) -> HTTPException:
+    """The response for a failed FHIR call: 503 while the breaker is open, 504 on a timeout, else 502."""
+    if isinstance(e, fhir_client.CircuitOpenError):
+        return HTTPException(status_code=503, detail=f"FHIR server unavailable: {e}",
+                             headers={"Retry-After": str(max(round(e.retry_after), 1))})
+    if isinstance(e, httpx.TimeoutException):
+        return HTTPException(status_code=504, detail=f"FHIR server timed out: {e}")
+    return HTTPException(status_code=502, detail=f"FHIR server error: {e}")
+
+
 @app.get("/api/get_patient_fhir/{user_id}", status_code=200)
 async def get_patient_fhir(user_id: str):
-    settings = {
-        'app_id': 'mitigate_app',
-        'api_base': 'https://hapi.fhir.org/baseR4'
-    }
-    smart = client.FHIRClient(settings=settings)
-    search = Patient.where(struct={'identifier': user_id})
-    res = [r.as_json() for r in search.perform_iter(smart.server)]
+    http = fhir_client.get_client()
+    try:
+        patient_id = fhir_client.patient_ids.get(user_id)
+        if patient_id is not None:
+            patient = await fhir_client.read(http, 'Patient', patient_id)
+            if patient is not None:
+                return [patient]
+            fhir_client.patient_ids.forget(user_id)
+        res = await fhir_client.search_all(http, 'Patient', {'identifier': user_id})
+    except httpx.HTTPError as e:
+        raise fhir_error(e)
+    if res:
+        fhir_client.patient_ids.put(user_id, res[0]['id'])
     return res
         
     # user = db.query(User).filter(User.id == user_id).first()
@@ -224,6 +467,8 @@ async def get_patient_fhir(user_id: str):
 @app.get("/api/migraines/weekly")
 async def get_migraines_weekly(
     db: db_dependency,
+    request: Request,
+    response: Response,
     user_id: str,
     use_localtime: bool = Query(False, description="Apply SQLite 'localtime' modifier before week calc")
 ):
@@ -233,25 +478,19 @@ async def get_migraines_weekly(
       - event_count: number of migraine events in that week
       - avg_severity: average severity for that week's migraine events
     """
+    not_modified, _ = await check_etag(db, request, response, user_id)
+    if not_modified:
+        return not_modified
 
-    # Normalize ISO-8601 timestamp: replace 'T' with ' ' and ensure text form
-    ts_text = cast(Event.event_timestamp, String)
-    ts_norm = func.replace(ts_text, 'T', ' ')
-
-    # Build the week-start (Monday) expression using SQLite date() modifiers
-    # Order matters: if use_localtime is True, apply 'localtime' *before* 'weekday 1' and '-7 days'
-    if use_localtime:
-        week_start = func.date(ts_norm, 'localtime', 'weekday 1', '-7 days')
-    else:
-        week_start = func.date(ts_norm, 'weekday 1', '-7 days')
+    week_start = aggregates.week_start_expr(use_localtime)
 
     query = (
-        db.query(
+        select(
             week_start.label('week_start_monday'),
             func.count(Event.id).label('event_count'),
             func.avg(cast(Event.severity, Float)).label('avg_severity')
         )
-        .filter(
+        .where(
             Event.user_id == user_id,
             Event.event_type == EventType.migraine
         )
@@ -259,7 +498,7 @@ async def get_migraines_weekly(
         .order_by(week_start)
     )
 
-    rows = query.all()
+    rows = (await db.execute(query)).all()
 
     # Convert SQLAlchemy rows to plain JSON-friendly dicts
     return [
@@ -275,280 +514,48 @@ async def get_migraines_weekly(
 @app.get("/api/weekly/rolling")
 async def get_weekly_rolling(
     db: db_dependency,
+    request: Request,
+    response: Response,
     user_id: str,
     window_size: int = Query(4, ge=1, le=52, description="Rolling window size in weeks."),
     use_localtime: bool = Query(False, description="Apply SQLite 'localtime' before week bucketing."),
-    start_date: str | None = Query(None, description="Optional YYYY-MM-DD lower bound (aligned to Monday)."),
-    end_date: str | None = Query(None, description="Optional YYYY-MM-DD upper bound (aligned to Monday)."),
-):
-    # Empty check (ORM binds GUID/BLOB correctly)
-    total_events = (
-        db.query(func.count(Event.id))
-          .filter(Event.user_id == user_id)
-          .scalar()
-    )
-    if not total_events:
-        return []
-
-    # Week bucket (Option B)
-    ts_text = cast(Event.event_timestamp, String)
-    ts_norm = func.replace(ts_text, 'T', ' ')
-    week_start = func.date(ts_norm, 'localtime', 'weekday 1', '-7 days') if use_localtime \
-                 else func.date(ts_norm, 'weekday 1', '-7 days')
-
-    # Normalize numeric metrics (sleep -> hours; meals -> count). Stress excluded.
-    value_std = case(
-        (
-            and_(Event.event_type == EventType.sleep,  Event.numerical_unit == Unit.minutes),
-            cast(Event.numerical_value, Float) / 60.0
-        ),
-        (
-            and_(Event.event_type == EventType.sleep,  Event.numerical_unit == Unit.hours),
-            cast(Event.numerical_value, Float)
-        ),
-        (
-            and_(Event.event_type == EventType.meals,  Event.numerical_unit == Unit.number),
-            cast(Event.numerical_value, Float)
-        ),
-        (
-            and_(Event.event_type == EventType.exercise, Event.numerical_unit == Unit.number),
-            cast(Event.numerical_value, Float)
-        ),
-        (
-            and_(Event.event_type == EventType.medication, Event.numerical_unit == Unit.number),
-            cast(Event.numerical_value, Float)
-        ),
-
-        else_=None
-    )
-
-    base_q = (
-        db.query(
-            week_start.label('week_start_monday'),
-            Event.event_type.label('event_type'),
-            Event.severity.label('severity'),
-            value_std.label('value_std')
-        )
-        .filter(Event.user_id == user_id, Event.event_timestamp.isnot(None))
-    ).subquery()
-
-    weekly_q = (
-        db.query(
-            base_q.c.week_start_monday,
-
-            # migraines
-            func.sum(case((base_q.c.event_type == EventType.migraine, 1), else_=0)).label('migraine_events'),
-            func.avg(case((base_q.c.event_type == EventType.migraine, cast(base_q.c.severity, Float)), else_=None)).label('migraine_avg_severity'),
-
-            # sleep hours
-            func.sum(case((base_q.c.event_type == EventType.sleep, base_q.c.value_std), else_=0.0)).label('sleep_hours'),
-
-            func.sum(case((base_q.c.event_type == EventType.stress, 1), else_=0)).label('stress_events'),
-            func.avg(case((base_q.c.event_type == EventType.stress, cast(base_q.c.severity, Float)), else_=None)).label('stress_avg_severity'),
-
-            # meals count
-            func.sum(case((base_q.c.event_type == EventType.meals, base_q.c.value_std), else_=0.0)).label('meals_count'),
-
-            # exercise
-            func.sum(case((base_q.c.event_type == EventType.exercise, base_q.c.value_std), else_=0.0)).label('exercise_days'),
-            # medication
-            func.sum(case((base_q.c.event_type == EventType.medication, base_q.c.value_std), else_=0.0)).label('medication_days'),
-
-        )
-        .group_by(base_q.c.week_start_monday)
-        .order_by(base_q.c.week_start_monday)
-    )
-
-    rows = weekly_q.all()
-    if not rows:
-        return []
-
-    # Continuous week calendar
-    def to_date(s: str) -> datetime:
-        return datetime.strptime(s, "%Y-%m-%d")
-
-    def align_to_monday(d: datetime) -> datetime:
-        return (d + timedelta(days=(7 - d.weekday()) % 7)) - timedelta(days=7)
-
-    min_week = to_date(rows[0].week_start_monday)
-    max_week = to_date(rows[-1].week_start_monday)
-    if start_date:
-        sd = align_to_monday(to_date(start_date)); min_week = min(sd, min_week)
-    if end_date:
-        ed = align_to_monday(to_date(end_date));    max_week = max(ed, max_week)
-
-    weeks, cur = [], min_week
-    while cur <= max_week:
-        weeks.append(cur.strftime("%Y-%m-%d"))
-        cur += timedelta(days=7)
-
-    sparse = {r.week_start_monday: r for r in rows}
-    series = []
-    for w in weeks:
-        r = sparse.get(w)
-        series.append({
-            "week_start_monday": w,
-            "migraine_events": int(r.migraine_events) if r else 0,
-            "migraine_avg_severity": float(r.migraine_avg_severity) if (r and r.migraine_avg_severity is not None) else None,
-            "sleep_hours": float(r.sleep_hours) if r else 0.0,
-            "stress_events": int(r.stress_events) if r else 0,
-            "stress_avg_severity": float(r.stress_avg_severity) if (r and r.stress_avg_severity is not None) else None,
-            "meals_count": float(r.meals_count) if r else 0.0,
-            "exercise_days": float(r.exercise_days) if r else 0.0,
-            "medication_days": float(r.medication_days) if r else 0.0,
-
-        })
-
-    # Lags / pct changes / moving averages
-    def pct_change(curr, prev):
-        if prev is None or prev == 0:
-            return None
-        return (curr - prev) / prev
-
-    def moving_avg(values, k):
-        out = []
-        for i in range(len(values)):
-            window = values[max(0, i - k + 1): i + 1]
-            nums = [v for v in window if v is not None]
-            out.append(sum(nums) / len(nums) if nums else None)
-        return out
-
-    k = max(window_size, 1)
-    migraine_events  = [x["migraine_events"]       for x in series]
-    migraine_sev     = [x["migraine_avg_severity"] for x in series]
-    sleep_hours      = [x["sleep_hours"]           for x in series]
-    stress_events    = [x["stress_events"]         for x in series]
-    stress_sev       = [x["stress_avg_severity"]   for x in series]
-    meals_count      = [x["meals_count"]           for x in series]
-    exercise_days = [x["exercise_days"] for x in series]
-    medication_days = [x["medication_days"] for x in series]
-
-    migraine_events_prev = [None] + migraine_events[:-1]
-    migraine_sev_prev    = [None] + migraine_sev[:-1]
-    sleep_hours_prev     = [None] + sleep_hours[:-1]
-    stress_events_prev   = [None] + stress_events[:-1]
-    stress_sev_prev      = [None] + stress_sev[:-1]
-    meals_count_prev     = [None] + meals_count[:-1]
-    exercise_days_prev   = [None] + exercise_days[:-1]
-    medication_days_prev = [None] + medication_days[:-1]
-
-    pct_migraine_events_change   = [pct_change(c, p) for c, p in zip(migraine_events, migraine_events_prev)]
-    pct_migraine_severity_change = [pct_change((c if c is not None else 0), (p if p is not None else 0)) for c, p in zip(migraine_sev, migraine_sev_prev)]
-    pct_sleep_hours_change       = [pct_change(c, p) for c, p in zip(sleep_hours, sleep_hours_prev)]
-    pct_stress_events_change     = [pct_change(c, p) for c, p in zip(stress_events, stress_events_prev)]
-    pct_stress_severity_change   = [pct_change((c if c is not None else 0), (p if p is not None else 0)) for c, p in zip(stress_sev, stress_sev_prev)]
-    pct_meals_count_change       = [pct_change(c, p) for c, p in zip(meals_count, meals_count_prev)]
-    pct_exercise_days_change     = [pct_change(c, p) for c, p in zip(exercise_days, exercise_days_prev)]
-    pct_medication_days_change   = [pct_change(c, p) for c, p in zip(medication_days, medication_days_prev)]
-
-    ma_migraine_events   = moving_avg(migraine_events, k)
-    ma_migraine_severity = moving_avg(migraine_sev, k)
-    ma_sleep_hours       = moving_avg(sleep_hours, k)
-    ma_stress_events     = moving_avg(stress_events, k)
-    ma_stress_severity   = moving_avg(stress_sev, k)
-    ma_meals_count       = moving_avg(meals_count, k)
-    ma_exercise_days     = moving_avg(exercise_days, k)
-    ma_medication_days   = moving_avg(medication_days, k)
-
-    out = []
-    for i, row in enumerate(series):
-        out.append({
-            **row,
-            "migraine_events_prev": migraine_events_prev[i],
-            "migraine_severity_prev": migraine_sev_prev[i],
-            "sleep_hours_prev": sleep_hours_prev[i],
-            "stress_events_prev": stress_events_prev[i],
-            "stress_severity_prev": stress_sev_prev[i],
-            "meals_count_prev": meals_count_prev[i],
-            "exercise_days_prev": exercise_days_prev[i],
-            "medication_days_prev": medication_days_prev[i],
-
-            "pct_migraine_events_change": pct_migraine_events_change[i],
-            "pct_migraine_severity_change": pct_migraine_severity_change[i],
-            "pct_sleep_hours_change": pct_sleep_hours_change[i],
-            "pct_stress_events_change": pct_stress_events_change[i],
-            "pct_stress_severity_change": pct_stress_severity_change[i],
-            "pct_meals_count_change": pct_meals_count_change[i],
-            "pct_exercise_days_change": pct_exercise_days_change[i],
-            "pct_medication_days_change": pct_medication_days_change[i],
-
-            "moving_average_migraine_events": ma_migraine_events[i],
-            "moving_average_migraine_severity": ma_migraine_severity[i],
-            "moving_average_sleep_hours": ma_sleep_hours[i],
-            "moving_average_stress_events": ma_stress_events[i],
-            "moving_average_stress_severity": ma_stress_severity[i],
-            "moving_average_meals_count": ma_meals_count[i],
-            "moving_average_exercise_days": ma_exercise_days[i],
-            "moving_average_medication_days": ma_medication_days[i],
-
-        })
-    return out
-
-
-@app.get("/api/action-items")
-async def get_action_items(
-    db: db_dependency,
-    user_id: str,
-    window_size: int = Query(2, ge=1, le=26, description="Weeks in current period (default 2)."),
-    use_localtime: bool = Query(False, description="Apply SQLite 'localtime' before week bucketing."),
-    min_sleep_hours: float = Query(7.0, description="Target average sleep hours/day."),
-    min_meals_per_day: float = Query(3.0, description="Target average meals/day."),
-    stress_severity_threshold: float = Query(3.0, description="Threshold for avg stress severity."),
-    min_exercise_days: int = Query(3, description="Target number of exercise days per week.")
+    start_date: str | None = Query(None, description="Optional YYYY-MM-DD; first week returned (aligned to Monday)."),
+    end_date: str | None = Query(None, description="Optional YYYY-MM-DD; last week returned (aligned to Monday)."),
+    format: str = Query("rows", pattern="^(rows|columnar)$",
+                        description="rows: one object per week; columnar: one array per field."),
 ):
-    # Week bucketing
-    ts_text = cast(Event.event_timestamp, String)
-    ts_norm = func.replace(ts_text, 'T', ' ')
-    week_start = func.date(ts_norm, 'localtime', 'weekday 1', '-7 days') if use_localtime \
-                 else func.date(ts_norm, 'weekday 1', '-7 days')
-
-    # Normalize numeric metrics (sleep hours, meals count) — stress excluded
-    value_std = case(
-        (
-            and_(Event.event_type == EventType.sleep,  Event.numerical_unit == Unit.minutes),
-            cast(Event.numerical_value, Float) / 60.0
-        ),
-        (
-            and_(Event.event_type == EventType.sleep,  Event.numerical_unit == Unit.hours),
-            cast(Event.numerical_value, Float)
-        ),
-        (
-            and_(Event.event_type == EventType.meals,  Event.numerical_unit == Unit.number),
-            cast(Event.numerical_value, Float)
-        ),
-        (
-            and_(Event.event_type == EventType.exercise, Event.numerical_unit == Unit.number),
-            cast(Event.numerical_value, Float)
-        ),
-        else_=None
-    )
-
-    base_q = (
-        db.query(
-            week_start.label('week_start_monday'),
-            Event.event_type.label('event_type'),
-            Event.severity.label('severity'),
-            value_std.label('value_std')
-        )
-        .filter(Event.user_id == user_id, Event.event_timestamp.isnot(None))
-    ).subquery()
-
-    weekly_q = (
-        db.query(
-            base_q.c.week_start_monday,
-            func.sum(case((base_q.c.event_type == EventType.migraine, 1), else_=0)).label('migraine_events'),
-            func.avg(case((base_q.c.event_type == EventType.migraine, cast(base_q.c.severity, Float)), else_=None)).label('migraine_avg_severity'),
-            func.sum(case((base_q.c.event_type == EventType.sleep,  base_q.c.value_std), else_=0.0)).label('sleep_hours'),
-            func.sum(case((base_q.c.event_type == EventType.stress, 1), else_=0)).label('stress_events'),
-            func.avg(case((base_q.c.event_type == EventType.stress, cast(base_q.c.severity, Float)), else_=None)).label('stress_avg_severity'),
-            func.sum(case((base_q.c.event_type == EventType.meals,  base_q.c.value_std), else_=0.0)).label('meals_count'),
-            func.sum(case((base_q.c.event_type == EventType.exercise, base_q.c.value_std), else_=0.0)).label('exercise_days'),
-        )
-        .group_by(base_q.c.week_start_monday)
-        .order_by(base_q.c.week_start_monday)
-    )
-
-    weekly = weekly_q.all()
+    not_modified, version = await check_etag(db, request, response, user_id)
+    if not_modified:
+        return not_modified
+    try:
+        start_week = week_start_of(datetime.strptime(start_date, "%Y-%m-%d").date()).isoformat() if start_date else None
+        end_week = week_start_of(datetime.strptime(end_date, "%Y-%m-%d").date()).isoformat() if end_date else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Only the requested weeks are read, plus the weeks before start_date
+    # that its first lags and moving averages look back on (if any exist).
+    rows, history_from = [], None
+    first = await aggregates.first_week(db, user_id, use_localtime, version=version) if start_week else None
+    if start_week is None or first is not None:
+        if first is not None:
+            history_from = analytics.history_start(start_date, window_size, first)
+        # Per-week aggregates (cached); see aggregates.py
+        rows = await aggregates.weekly_rows(db, user_id, use_localtime, history_from, end_week, version=version)
+
+    # Continuous week calendar with lags, pct changes and moving averages
+    build = analytics.rolling_weekly_columns if format == "columnar" else analytics.rolling_weekly
+    return fast_json(build(rows, window_size, start_date, end_date, history_from), response)
+
+
+def action_items_report(user_id: str, weekly: List[Any], first_week: str | None, window_size: int,
+                        min_sleep_hours: float, min_meals_per_day: float,
+                        stress_severity_threshold: float, min_exercise_days: int) -> Dict[str, Any]:
+    """
+    Action items from the user's weekly aggregates; only the last
+    2 * window_size weeks of `weekly` are used. `first_week` is the user's
+    earliest week with data.
+    """
     if not weekly:
         return {"user_id": user_id, "action_items": [], "summary": {"message": "No data found for user."}}
 
@@ -664,7 +671,7 @@ async def get_action_items(
         },
         "migraine_context": migraine_context,
         "bucket_range": {
-            "start_week": weekly[0].week_start_monday,
+            "start_week": first_week,
             "end_week": weekly[-1].week_start_monday
         }
     }
@@ -676,29 +683,133 @@ async def get_action_items(
     }
 
 
-@app.get("/api/get_patient_info_from_fhir/{user_id}", status_code=200)
-async def get_patient_info_from_fhir(user_id: str):
-    settings = {
-        'app_id': 'mitigate_app',
-        'api_base': 'https://hapi.fhir.org/baseR4'
-    }
-    smart = client.FHIRClient(settings=settings)
-    patients = Patient.where(struct={'identifier': user_id}).perform_resources(smart.server)
-    if not patients:
-        return {
-            "ok": False,
-            "error": f"No Patient found for identifier '{user_id}' on HAPI R4."
-        }
+@app.get("/api/action-items")
+async def get_action_items(
+    db: db_dependency,
+    request: Request,
+    response: Response,
+    user_id: str,
+    window_size: int = Query(2, ge=1, le=26, description="Weeks in current period (default 2)."),
+    use_localtime: bool = Query(False, description="Apply SQLite 'localtime' before week bucketing."),
+    min_sleep_hours: float = Query(7.0, description="Target average sleep hours/day."),
+    min_meals_per_day: float = Query(3.0, description="Target average meals/day."),
+    stress_severity_threshold: float = Query(3.0, description="Threshold for avg stress severity."),
+    min_exercise_days: int = Query(3, description="Target number of exercise days per week.")
+):
+    not_modified, version = await check_etag(db, request, response, user_id)
+    if not_modified:
+        return not_modified
+    # Per-week aggregates (cached); see aggregates.py
+    # Only the current and previous periods are read
+    weekly = await aggregates.weekly_rows(db, user_id, use_localtime, latest=2 * window_size, version=version)
+    first_week = await aggregates.first_week(db, user_id, use_localtime, version=version)
+    return action_items_report(user_id, weekly, first_week, window_size, min_sleep_hours, min_meals_per_day,
+                               stress_severity_threshold, min_exercise_days)
+
 
-    patient = patients[0]
-    patient_json = patient.as_json()
+DASHBOARD_FIELDS = ('user', 'migraines', 'triggers', 'weekly_rolling', 'action_items')
 
-    # 2) Fetch Observations linked to the Patient via subject reference
-    #    This is the canonical way to get observations for a patient:
-    #    GET [base]/Observation?subject=Patient/{patient_id}
-    #    (Reference-type search param per FHIR search.) [2](https://smilecdr.com/docs/fhir_standard/fhir_search_references.html)
-    obs_search = Observation.where(struct={"subject": f"Patient/{patient.id}"})
-    observations = [obs.as_json() for obs in obs_search.perform_iter(smart.server)]
+
+@app.get("/api/dashboard/{user_id}")
+async def get_dashboard(
+    db: db_dependency,
+    request: Request,
+    response: Response,
+    user_id: str,
+    fields: str | None = Query(None, description=f"Comma-separated sections to return (default all): {', '.join(DASHBOARD_FIELDS)}."),
+    window_size: int = Query(4, ge=1, le=52, description="Rolling window size in weeks (weekly_rolling)."),
+    action_window_size: int = Query(2, ge=1, le=26, description="Weeks in current period (action_items)."),
+    use_localtime: bool = Query(False, description="Apply SQLite 'localtime' before week bucketing."),
+    min_sleep_hours: float = Query(7.0, description="Target average sleep hours/day."),
+    min_meals_per_day: float = Query(3.0, description="Target average meals/day."),
+    stress_severity_threshold: float = Query(3.0, description="Threshold for avg stress severity."),
+    min_exercise_days: int = Query(3, description="Target number of exercise days per week.")
+):
+    """
+    Everything the dashboard page shows, in one request. Sections match
+    GET /api/users/{id}, /api/migraines and /api/triggers (unpaginated,
+    newest first), /api/weekly/rolling and /api/action-items. The events
+    are read in one scan, and both weekly sections share one read of the
+    weekly aggregates.
+    """
+    sections = set(DASHBOARD_FIELDS)
+    if fields:
+        sections = {f.strip() for f in fields.split(',') if f.strip()}
+        unknown = sections.difference(DASHBOARD_FIELDS)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    not_modified, version = await check_etag(db, request, response, user_id)
+    if not_modified:
+        return not_modified
+    user = (await db.execute(select(*USER_COLUMNS).where(User.id == user_id))).first()
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    out: Dict[str, Any] = {"user_id": user_id}
+    if 'user' in sections:
+        out['user'] = user._asdict()
+
+    if {'migraines', 'triggers'} & sections:
+        stmt = select(*EVENT_COLUMNS).where(Event.user_id == user_id)
+        if 'triggers' not in sections:
+            stmt = stmt.where(Event.event_type == EventType.migraine)
+        elif 'migraines' not in sections:
+            stmt = stmt.where(Event.event_type != EventType.migraine)
+        events = row_dicts((await db.execute(stmt.order_by(Event.event_timestamp.desc(), Event.id.desc()))).all())
+        if 'migraines' in sections:
+            out['migraines'] = [e for e in events if e['event_type'] == EventType.migraine]
+        if 'triggers' in sections:
+            out['triggers'] = [e for e in events if e['event_type'] != EventType.migraine]
+
+    if {'weekly_rolling', 'action_items'} & sections:
+        weekly = await aggregates.weekly_rows(db, user_id, use_localtime, version=version)
+        if 'weekly_rolling' in sections:
+            out['weekly_rolling'] = analytics.rolling_weekly(weekly, window_size)
+        if 'action_items' in sections:
+            first_week = weekly[0].week_start_monday if weekly else None
+            out['action_items'] = action_items_report(
+                user_id, weekly, first_week, action_window_size, min_sleep_hours, min_meals_per_day,
+                stress_severity_threshold, min_exercise_days)
+    return fast_json(out, response)
+
+
+@app.get("/api/get_patient_info_from_fhir/{user_id}", status_code=200)
+async def get_patient_info_from_fhir(user_id: str):
+    http = fhir_client.get_client()
+
+    # Observations linked to the Patient via subject reference
+    # This is the canonical way to get observations for a patient:
+    # GET [base]/Observation?subject=Patient/{patient_id}
+    # (Reference-type search param per FHIR search.) [2](https://smilecdr.com/docs/fhir_standard/fhir_search_references.html)
+    def observations_of(patient_id: str):
+        return fhir_client.search_all(http, 'Observation', {'subject': f'Patient/{patient_id}'})
+
+    try:
+        patient_json = None
+        patient_id = fhir_client.patient_ids.get(user_id)
+        if patient_id is not None:
+            # Known Patient: skip the identifier search, and read the Patient
+            # and its Observations at the same time.
+            patient_json, observations = await asyncio.gather(
+                fhir_client.read(http, 'Patient', patient_id), observations_of(patient_id)
+            )
+            patients = [patient_json]
+            if patient_json is None:
+                fhir_client.patient_ids.forget(user_id)
+
+        if patient_json is None:
+            patients = await fhir_client.search_all(http, 'Patient', {'identifier': user_id})
+            if not patients:
+                return {
+                    "ok": False,
+                    "error": f"No Patient found for identifier '{user_id}' on HAPI R4."
+                }
+            patient_json = patients[0]
+            fhir_client.patient_ids.put(user_id, patient_json['id'])
+            observations = await observations_of(patient_json['id'])
+    except httpx.HTTPError as e:
+        raise fhir_error(e)
 
     return {
         "ok": True,
@@ -712,113 +823,279 @@ async def get_patient_info_from_fhir(user_id: str):
 
 
 
-@app.post("/api/export_patient_data_to_fhir/{user_id}", status_code=200)
+async def run_fhir_export(job: jobs.JobRun):
+    """
+    Job handler: export a user's new and changed events to the FHIR server (FHIR_BASE_URL) using FHIR Bundle(type='batch').
+    1) Create or reuse Patient; its id is kept for later exports.
+    2) Write Observations in chunked batch Bundles, several at a time, retrying
+       throttled / failed batches (see fhir_export.py). Each one is an update,
+       conditional on the event's identifier until its server id is known, so
+       nothing is duplicated.
+    3) Record each exported event's Observation id and advance the user's
+       watermark (see fhir_state.py). With `full`, every event is sent again.
+    Events are read a page at a time and converted as the exporter asks for
+    the next chunk, so memory is bounded by the page and chunk sizes rather
+    than the user's history. Mappings are saved after each chunk, so a
+    resumed job only sends what is still pending.
+    """
+    chunk_size = job.params.get('chunk_size', 75)
+    max_concurrency = job.params.get('max_concurrency', fhir_export.FHIR_MAX_CONCURRENCY)
+    server = fhir_client.FHIR_BASE_URL
+
+    # -- Local data: the events not exported in their current version
+    async with AsyncSessionLocal() as db:
+        user = (await db.execute(select(User).where(User.id == job.user_id))).scalars().first()
+        if not user:
+            raise LookupError(f"User {job.user_id} not found")
+        if job.params.get('full') and not job.processed:
+            await fhir_state.reset(db, job.user_id)
+        state = await fhir_state.get(db, job.user_id, server)
+        watermark = state.watermark if state is not None else None
+        started = ingest.utc_now()
+        total = await fhir_state.count_pending(db, job.user_id, watermark)
+        await db.commit()
+    base = job.processed
+    await job.progress(total=base + total)
+
+    exporter = fhir_export.FHIRBatchExporter(fhir_client.get_client(), chunk_size=chunk_size, max_concurrency=max_concurrency)
+    patient_resource = fhir_resources.patient(user)
+
+    # -- Create or reuse Patient on server
+    if state is None:
+        patient_json, reused = await exporter.find_or_create_patient(str(job.user_id), patient_resource)
+        patient_id = patient_json['id']
+        async with AsyncSessionLocal() as db:
+            await fhir_state.save(db, job.user_id, server, patient_id)
+            await db.commit()
+    else:
+        patient_json, reused = {**patient_resource, 'id': state.patient_id}, True
+        patient_id = state.patient_id
+        fhir_client.patient_ids.put(job.user_id, patient_id)
+
+    # -- Events -> Observation entries, linked to Patient, as they are read
+    counts = {'created': 0, 'updated': 0, 'skipped': 0}
+    # update_timestamp of the first event whose write failed
+    first_failed = None
+
+    async def entries():
+        async for rows in fhir_state.iter_pending(job.user_id, watermark):
+            for row in rows:
+                try:
+                    obs = fhir_resources.observation(row, patient_id)
+                except ValueError as e:
+                    # Not retried until the event changes: the watermark passes it.
+                    counts['skipped'] += 1
+                    await job.progress(errors=[{'event_id': str(row.id), 'error': f"{type(e).__name__}: {e}"}])
+                    continue
+                yield row, fhir_export.observation_entry(obs, str(row.id), row.resource_id)
+
+    # -- Chunk and send, saving mappings and progress after each chunk
+    async def on_chunk(processed: int, rows: List[Any], outcomes: List[Dict[str, Any]]):
+        nonlocal first_failed
+        exported, errors, created = [], [], 0
+        for row, outcome in zip(rows, outcomes):
+            if fhir_export.succeeded(outcome):
+                exported.append((row.id, fhir_export.resource_id(outcome['location']), row.update_timestamp))
+                created += outcome['status'].startswith('201')
+            else:
+                errors.append({'event_id': str(row.id), **outcome})
+                first_failed = min(first_failed or row.update_timestamp, row.update_timestamp)
+        counts['created'] += created
+        counts['updated'] += len(exported) - created
+        async with AsyncSessionLocal() as db:
+            await fhir_state.record(db, job.user_id, exported)
+            await db.commit()
+        await job.progress(processed=base + counts['skipped'] + processed, created=created, errors=errors)
+
+    sent = await exporter.post_entries(entries(), on_chunk)
+
+    # -- Everything before the first failed write is exported
+    watermark = fhir_state.next_watermark(started, first_failed)
+    async with AsyncSessionLocal() as db:
+        await fhir_state.save(db, job.user_id, server, patient_id, watermark)
+        await db.commit()
+    await job.progress(processed=base + counts['skipped'] + sent)
+
+    return {
+        "patient": {
+            "id": patient_id,
+            "reused": reused,
+            "identifiers": patient_json.get('identifier') or []
+        },
+        "observations": {"sent": sent, **counts},
+        "watermark": watermark,
+        "stats": exporter.stats()
+    }
+
+jobs.job_queue.register('fhir_export', run_fhir_export)
+
+
+@app.post("/api/export_patient_data_to_fhir/{user_id}", status_code=202)
 async def export_patient_data_to_fhir(
     db: db_dependency,
     user_id: str,
-    chunk_size: int = Query(75, ge=1, le=250, description="Max Observation entries per batch POST.")
+    chunk_size: int = Query(75, ge=1, le=fhir_export.MAX_CHUNK_SIZE, description="Observation entries per batch POST to start with; adapted to server response times."),
+    max_concurrency: int = Query(fhir_export.FHIR_MAX_CONCURRENCY, ge=1, le=16, description="Batch POSTs in flight at once."),
+    full: bool = Query(False, description="Send every event again, not only those new or changed since the last export.")
 ):
     """
-    Export all of a user's data to the demo HAPI FHIR server using FHIR Bundle(type='batch').
-    1) Create or reuse Patient.
-    2) POST Observations in chunked batch Bundles to reduce HTTP calls.
+    Queue an export of a user's new and changed data to the FHIR server (see
+    run_fhir_export). Returns the job id at once; poll GET /api/jobs/{id}
+    for progress.
     """
-    settings = {
-        'app_id': 'mitigate_app',
-        'api_base': 'https://hapi.fhir.org/baseR4'
-    }
+    user = (await db.execute(select(User.id).where(User.id == user_id))).scalar()
+    if not user:
+        return {"ok": False, "error": f"User {user_id} not found"}
 
-    # -- Pull local data
-    user = db.query(User).filter(User.id == user_id).first()
+    job = await jobs.job_queue.submit(
+        'fhir_export', user, {'chunk_size': chunk_size, 'max_concurrency': max_concurrency, 'full': full}
+    )
+    return {"ok": True, "job_id": job.id, "status": JobStatus.queued, "status_url": f"/api/jobs/{job.id}"}
+
+
+async def run_fhir_import(job: jobs.JobRun):
+    """
+    Job handler: import the Observations of a user's Patient on the FHIR
+    server (FHIR_BASE_URL) as the user's events.
+    The search is read a page at a time, following the Bundle's `next`
+    links, and each page is written in its own transaction, so memory stays
+    bounded by the page size. Observations are matched to events by
+    identifier (fhir_resources.event_id): new ones are inserted, changed
+    ones updated and the rest left alone, so a repeated or resumed import
+    writes nothing twice. Imported events are recorded as exported in their
+    current version, so the next export does not send them back.
+    """
+    page_size = job.params.get('page_size', 200)
+    server = fhir_client.FHIR_BASE_URL
+    http = fhir_client.get_client()
+
+    async with AsyncSessionLocal() as db:
+        user = (await db.execute(select(User.id).where(User.id == job.user_id))).scalar()
+        if not user:
+            raise LookupError(f"User {job.user_id} not found")
+        state = await fhir_state.get(db, job.user_id, server)
+        await db.commit()
+
+    # -- The user's Patient: from the last export, the cache or a search
+    patient_id = state.patient_id if state is not None else fhir_client.patient_ids.get(job.user_id)
+    if patient_id is None:
+        patients = await fhir_client.search_all(http, 'Patient', {'identifier': str(job.user_id)})
+        if not patients:
+            raise LookupError(f"No Patient found for identifier '{job.user_id}'")
+        patient_id = patients[0]['id']
+    fhir_client.patient_ids.put(job.user_id, patient_id)
+
+    # -- Observations -> event rows, upserted a page at a time
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0}
+    processed = 0
+    pages = fhir_client.search_pages(http, 'Observation', {'subject': f'Patient/{patient_id}', '_count': page_size})
+    async for page in pages:
+        rows, resource_ids, errors = [], {}, []
+        now = ingest.utc_now()
+        for observation in page:
+            try:
+                row = ingest.new_event_row(job.user_id, fhir_resources.event_payload(observation), now)
+            except ValueError as e:
+                errors.append({'resource_id': observation.get('id'), 'error': f"{type(e).__name__}: {e}"})
+                continue
+            row['id'] = fhir_resources.event_id(observation, server)
+            resource_ids[row['id']] = observation['id']
+            rows.append(row)
+
+        async with AsyncSessionLocal() as db:
+            written = await ingest.upsert_rows(db, rows)
+            await fhir_state.record(db, job.user_id, [
+                (row['id'], resource_ids[row['id']], row['update_timestamp'])
+                for kind in ('inserted', 'updated', 'unchanged') for row in written[kind]
+            ])
+            await db.commit()
+        errors += [{'resource_id': resource_ids[row['id']], 'error': f"Event {row['id']} belongs to another user"}
+                   for row in written['conflicts']]
+        for kind in ('inserted', 'updated', 'unchanged'):
+            counts[kind] += len(written[kind])
+        counts['skipped'] += len(errors)
+        processed += len(page)
+        await job.progress(processed=processed, created=len(written['inserted']), errors=errors, total=processed)
+
+    return {"patient": {"id": patient_id}, "observations": {"read": processed, **counts}}
+
+jobs.job_queue.register('fhir_import', run_fhir_import)
+
+
+@app.post("/api/import_patient_data_from_fhir/{user_id}", status_code=202)
+async def import_patient_data_from_fhir(
+    db: db_dependency,
+    user_id: str,
+    page_size: int = Query(200, ge=1, le=1000, description="Observations per search page (_count).")
+):
+    """
+    Queue an import of the Observations of a user's Patient from the FHIR
+    server into the user's events (see run_fhir_import). Returns the job id
+    at once; poll GET /api/jobs/{id} for progress.
+    """
+    user = (await db.execute(select(User.id).where(User.id == user_id))).scalar()
     if not user:
         return {"ok": False, "error": f"User {user_id} not found"}
 
-    events: List[Event] = db.query(Event).filter(Event.user_id == user_id).all()
+    job = await jobs.job_queue.submit('fhir_import', user, {'page_size': page_size})
+    return {"ok": True, "job_id": job.id, "status": JobStatus.queued, "status_url": f"/api/jobs/{job.id}"}
 
-    # -- Build FHIRClient
-    smart = client.FHIRClient(settings=settings)
 
-    # -- Create or reuse Patient on server
-    patient_resource: Patient = convert_user_to_fhir(user)
-    existing_patients = Patient.where(struct={'identifier': user_id}).perform_resources(smart.server)
-    if existing_patients:
-        patient_json = existing_patients[0].as_json()
-        patient_id = patient_json['id']
-        reused = True
-    else:
-        created_patient_json = patient_resource.create(smart.server)  # POST /Patient
-        patient_id = created_patient_json['id']
-        reused = False
+async def run_fhir_bulk_export(job: jobs.JobRun):
+    """
+    Job handler: write every user as FHIR NDJSON files under
+    FHIR_BULK_DIR/<job id>, one set per partition of users, each on its own
+    worker process (see fhir_bulk.py). Progress counts finished partitions.
+    Returns the manifest, with the directory it describes.
+    """
+    workers = job.params.get('workers', fhir_bulk.FHIR_BULK_WORKERS)
+    output_dir = os.path.join(fhir_bulk.FHIR_BULK_DIR, str(job.id))
+    os.makedirs(output_dir, exist_ok=True)
+    started = fhir_bulk.transaction_time()
+    ranges = await asyncio.to_thread(fhir_bulk.partition, job.params.get('partitions') or workers)
+    await job.progress(processed=0, total=len(ranges))
+
+    loop = asyncio.get_running_loop()
+    pool = fhir_bulk.new_pool(workers)
+    try:
+        futures = [loop.run_in_executor(pool, fhir_bulk.export_partition, output_dir, i, first, last)
+                   for i, (first, last) in enumerate(ranges)]
+        for done, future in enumerate(asyncio.as_completed(futures), 1):
+            part = await future
+            await job.progress(processed=done, created=sum(e['count'] for e in part['output'] if e['type'] == 'Observation'),
+                               errors=part['error'])
+        parts = [future.result() for future in futures]
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    manifest = await asyncio.to_thread(
+        fhir_bulk.write_manifest, output_dir, started, "/api/fhir/$export", parts
+    )
+    return {"output_dir": output_dir, **manifest}
 
-    # -- Convert Events -> Observation JSON; link to Patient
-    obs_jsons: List[Dict[str, Any]] = []
-    for ev in events:
-        try:
-            obs: Observation = convert_event_to_fhir(ev)
-            obs.subject = FHIRReference({'reference': f'Patient/{patient_id}'})
-            obs_jsons.append(obs.as_json())
-        except Exception:
-            continue
-
-    created_obs_locations: List[str] = []
-    errors: List[Dict[str, Any]] = []
-
-    # -- Helper to POST batch bundle in one HTTP request
-    def post_batch(entries: List[Dict[str, Any]]):
-        bundle = Bundle({'type': 'batch', 'entry': entries})
-        # Explicitly set headers for FHIR JSON
-        return smart.server.session.post(
-            smart.server.base_uri,
-            headers={"Content-Type": "application/fhir+json"},
-            json=bundle.as_json()
-        )
+jobs.job_queue.register('fhir_bulk_export', run_fhir_bulk_export)
 
-    # -- Chunk and POST
-    for i in range(0, len(obs_jsons), chunk_size):
-        chunk = obs_jsons[i:i + chunk_size]
-        entries = [
-            {
-                'resource': obs,
-                'request': {'method': 'POST', 'url': 'Observation'}
-            } for obs in chunk
-        ]
-        try:
-            resp = post_batch(entries)
-            resp_text = resp.text.strip()
-            resp_json = resp.json() if resp_text else {}
-
-            if not resp_json or 'entry' not in resp_json:
-                errors.append({
-                    "error": "Empty or invalid response from FHIR server",
-                    "status_code": resp.status_code,
-                    "raw_text": resp_text[:200]
-                })
-                continue
 
-            for entry in resp_json.get('entry', []):
-                r = entry.get('response', {})
-                status = r.get('status', '')
-                location = r.get('location')
-                if status.startswith('201') and location:
-                    created_obs_locations.append(location)
-                else:
-                    errors.append({'status': status, 'outcome': r.get('outcome')})
-        except Exception as e:
-            errors.append({'error': str(e)})
+@app.post("/api/fhir/$export", status_code=202)
+async def bulk_export_fhir(
+    workers: int = Query(fhir_bulk.FHIR_BULK_WORKERS, ge=1, le=64, description="Worker processes."),
+    partitions: int | None = Query(None, ge=1, le=1024, description="Output files per resource type; defaults to `workers`.")
+):
+    """
+    Queue a bulk export of every user and event as Patient and Observation
+    NDJSON files on local disk (see run_fhir_bulk_export), without calling
+    the FHIR server. Poll GET /api/jobs/{id}; its result is the manifest.
+    """
+    job = await jobs.job_queue.submit('fhir_bulk_export', None, {'workers': workers, 'partitions': partitions})
+    return {"ok": True, "job_id": job.id, "status": JobStatus.queued, "status_url": f"/api/jobs/{job.id}"}
 
-    return {
-        "ok": True,
-        "patient": {
-            "id": patient_id,
-            "reused": reused,
-            "identifiers": [iden for iden in (patient_json.get('identifier') if reused else (created_patient_json.get('identifier') or []))]
-        },
-        "observations": {
-            "created_count": len(created_obs_locations),
-            "locations": created_obs_locations
-        },
-        "errors": errors
-    }
+
+@app.get("/api/jobs/{job_id}", response_model=schemas.JobResponse)
+async def get_job(job_id: uuid.UUID):
+    job = await jobs.job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return jobs.describe(job)
 
 @app.get("/api/populate", status_code=200)
 async def populate_data(db: db_dependency):
@@ -834,11 +1111,12 @@ async def populate_data(db: db_dependency):
     # Create a user for each name and then populate a map.
     users = [User(name=n) for n in names]
     db.add_all(users)
-    db.flush()
+    await db.flush()
     user_map = {u.name:u.id for u in users}
     random.seed(0)
     start_date = date(2025, 9, 30)
     end_date =  date(2025, 11, 3)
+    events: list[Event] = []
     for id in user_map.values():
         num_migraine_events = 10
         num_sleep_events = random.randint(3, 12)
@@ -858,7 +1136,7 @@ async def populate_data(db: db_dependency):
                 event_timestamp=get_random_date_between(start_date, end_date),
                 creation_timestamp=get_random_date_between(start_date, end_date)
                 )
-            db.add(m)
+            events.append(m)
         for _ in range(num_sleep_events):
             s = Event(
                 user_id=id,
@@ -871,7 +1149,7 @@ async def populate_data(db: db_dependency):
                 event_timestamp=get_random_date_between(start_date, end_date),
                 creation_timestamp=get_random_date_between(start_date, end_date)
                 )
-            db.add(s)
+            events.append(s)
         for _ in range(num_stress_events):
             s = Event(user_id=id,
                 system=VARS['stressSystem'],
@@ -881,7 +1159,7 @@ async def populate_data(db: db_dependency):
                 description='Had stress today',
                 event_timestamp=get_random_date_between(start_date, end_date),
                 creation_timestamp=get_random_date_between(start_date, end_date))
-            db.add(s)
+            events.append(s)
         for _ in range(num_meal_events):
             s = Event(user_id=id,
                 system=VARS['mealSystem'],
@@ -892,14 +1170,17 @@ async def populate_data(db: db_dependency):
                 description='Had some meals today',
                 event_timestamp=get_random_date_between(start_date, end_date),
                 creation_timestamp=get_random_date_between(start_date, end_date))
-            db.add(s)
-    db.commit()
+            events.append(s)
+    db.add_all(events)
+    await db.run_sync(rollup.apply_events, events)
+    await db.run_sync(versions.bump, [e.user_id for e in events])
+    await db.commit()
     return {'status': "OK"}
 
 
 @app.get("/api/populate_large", status_code=200)
 async def populate_large_data(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     days: int = Query(56, ge=7, le=365, description="Number of days to populate (default 56 = 8 weeks)."),
     seed: int | None = Query(42, description="Optional random seed for reproducibility."),
     reset: bool = Query(False, description="If true, delete existing events in the generated date range for these users before repopulating.")
@@ -910,10 +1191,10 @@ async def populate_large_data(
     names = ['Jessica', 'Albert', 'John', 'Susan']
     users: list[User] = []
     for n in names:
-        existing = db.query(User).filter(User.name == n).first()
+        existing = (await db.execute(select(User).where(User.name == n))).scalars().first()
         users.append(existing if existing else User(name=n))
         if not existing:
-            db.add(users[-1]); db.flush()
+            db.add(users[-1]); await db.flush()
     user_ids = [u.id for u in users]
 
     today = date.today()
@@ -922,14 +1203,14 @@ async def populate_large_data(
 
     if reset:
         for uid in user_ids:
-            db.query(Event).filter(
+            await db.execute(delete(Event).where(
                 Event.user_id == uid,
                 and_(
                     Event.event_timestamp >= datetime.combine(start_date, time.min),
                     Event.event_timestamp <= datetime.combine(end_date, time.max),
                 )
-            ).delete(synchronize_session=False)
-        db.flush()
+            ).execution_options(synchronize_session=False))
+        await db.flush()
 
     def dt_at(day: date, hour: int, minute: int = 0) -> datetime:
         return datetime.combine(day, time(hour=hour, minute=minute))
@@ -1059,7 +1340,11 @@ async def populate_large_data(
 
             day += timedelta(days=1)
 
-    db.commit()
+    # `reset` deletes events, which the incremental rollup cannot subtract.
+    await db.flush()
+    await db.run_sync(rollup.rebuild, user_ids)
+    await db.run_sync(versions.bump, user_ids)
+    await db.commit()
     return {
         "status": "OK", "users": names,
         "start_date": str(start_date), "end_date": str(end_date),
@@ -0,0 +1,124 @@
+"""
+In-place schema migrations for the SQLite database.
+
+`Base.metadata.create_all` only creates tables that are missing; it never
+alters a table that already exists. The steps below upgrade an existing
+app.db without dropping any data. The last applied step is tracked with
+SQLite's `PRAGMA user_version`.
+
+Pending steps are applied when the API starts. They can also be run by hand
+before a deploy:
+
+    python -m backend.migrations
+"""
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Connection, Engine
+
+from .database import Base, engine
+from .models import Event, User
+from . import rollup
+
+
+def _create_indexes(conn: Connection, table, names: List[str]):
+    """Build the named indexes declared on `table` if they do not exist yet."""
+    for index in table.indexes:
+        if index.name in names:
+            index.create(conn, checkfirst=True)
+
+
+def _add_columns(conn: Connection, table, names: List[str]):
+    """ALTER TABLE ADD COLUMN for each named model column the table lacks."""
+    existing = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table.name})")}
+    for name in names:
+        if name in existing:
+            continue
+        column = table.c[name]
+        col_type = column.type.compile(dialect=conn.dialect)
+        conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}")
+
+
+def _add_analytics_indexes(conn: Connection):
+    # ix_events_user_type_ts and ix_events_user_ts_analytics are no longer
+    # declared; step 4 replaces the first and step 6 drops the second.
+    _create_indexes(conn, Event.__table__, ['ix_events_user_type_ts', 'ix_events_user_ts_analytics'])
+    # Refresh the planner statistics so the new indexes are picked up.
+    conn.exec_driver_sql("ANALYZE events")
+
+
+def _add_event_buckets(conn: Connection):
+    _add_columns(conn, Event.__table__, ['event_ts_utc', 'event_day', 'event_week'])
+    # Backfill with the same SQLite expressions the analytics used to compute
+    # per row, so existing week buckets do not move.
+    conn.exec_driver_sql("""
+        UPDATE events SET
+          event_ts_utc = replace(CAST(event_timestamp AS TEXT), 'T', ' '),
+          event_day = date(replace(CAST(event_timestamp AS TEXT), 'T', ' ')),
+          event_week = date(replace(CAST(event_timestamp AS TEXT), 'T', ' '), 'weekday 1', '-7 days')
+        WHERE event_timestamp IS NOT NULL AND event_week IS NULL
+    """)
+    _create_indexes(conn, Event.__table__, ['ix_events_user_week'])
+    conn.exec_driver_sql("ANALYZE events")
+
+
+def _build_weekly_rollup(conn: Connection):
+    # create_all has created the empty table; fill it from existing events.
+    rollup.rebuild(conn)
+
+
+def _add_pagination_indexes(conn: Connection):
+    # ix_events_user_type_ts_id supersedes the index from step 1.
+    _create_indexes(conn, Event.__table__, ['ix_events_user_type_ts_id', 'ix_events_user_ts_id'])
+    _create_indexes(conn, User.__table__, ['ix_users_created_id'])
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_events_user_type_ts")
+    conn.exec_driver_sql("ANALYZE")
+
+
+def _add_export_index(conn: Connection):
+    _create_indexes(conn, Event.__table__, ['ix_events_user_updated_id'])
+    conn.exec_driver_sql("ANALYZE events")
+
+
+def _drop_analytics_index(conn: Connection):
+    # Only the localtime fallback scanned ix_events_user_ts_analytics, and it
+    # shares its leading columns with ix_events_user_ts_id from step 4.
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_events_user_ts_analytics")
+    conn.exec_driver_sql("ANALYZE events")
+
+
+# (version, step) pairs, applied in order. Steps must be idempotent: on a fresh
+# database create_all has already built everything they would add.
+MIGRATIONS: List[Tuple[int, Callable[[Connection], None]]] = [
+    (1, _add_analytics_indexes),
+    (2, _add_event_buckets),
+    (3, _build_weekly_rollup),
+    (4, _add_pagination_indexes),
+    (5, _add_export_index),
+    (6, _drop_analytics_index),
+]
+
+
+def get_version(conn: Connection) -> int:
+    return conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def upgrade(bind: Engine = engine) -> int:
+    """Create missing tables, then apply every pending migration step.
+
+    Returns the schema version the database ends up at.
+    """
+    Base.metadata.create_all(bind=bind)
+    with bind.begin() as conn:
+        current = get_version(conn)
+        for version, step in MIGRATIONS:
+            if version <= current:
+                continue
+            step(conn)
+            # PRAGMA does not accept bound parameters.
+            conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+            current = version
+    return current
+
+
+if __name__ == '__main__':
+    print(f"Database schema at version {upgrade()}")
@@ -1,7 +1,8 @@
 from typing import List
+from datetime import date, datetime, time, timedelta, timezone
 from .database import Base
-from sqlalchemy import TIMESTAMP, Column, String, Text, Enum, Integer, ForeignKey, TypeDecorator
-from sqlalchemy.orm import mapped_column, Mapped, relationship
+from sqlalchemy import TIMESTAMP, Column, String, Text, Enum, Integer, Float, ForeignKey, Index, TypeDecorator
+from sqlalchemy.orm import mapped_column, Mapped, relationship, validates
 from sqlalchemy.sql import func
 from fastapi_utils.guid_type import GUID, GUID_DEFAULT_SQLITE
 import enum
@@ -50,8 +51,44 @@ class Unit(str, enum.Enum):
     hours = 'hours'
     minutes = 'minutes'
     number = 'number' 
+
+class JobStatus(str, enum.Enum):
+    queued = 'queued'
+    running = 'running'
+    succeeded = 'succeeded'
+    failed = 'failed'
 # End Other classes
 
+# Bucket helpers
+
+def normalize_timestamp(ts: datetime | date | None) -> datetime | None:
+    """Naive UTC datetime for an event timestamp (dates become midnight)."""
+    if ts is None:
+        return None
+    if not isinstance(ts, datetime):
+        return datetime.combine(ts, time.min)
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+def week_start_of(d: date) -> date:
+    """Same bucket as SQLite's date(ts, 'weekday 1', '-7 days').
+
+    Note that SQLite leaves a Monday where it is before subtracting 7 days,
+    so Monday events land in the previous week's bucket.
+    """
+    return d + timedelta(days=(7 - d.weekday()) % 7 - 7)
+
+def bucket_keys(ts: datetime | date | None) -> tuple[datetime | None, str | None, str | None]:
+    """(normalized timestamp, 'YYYY-MM-DD' day key, 'YYYY-MM-DD' week key)."""
+    norm = normalize_timestamp(ts)
+    if norm is None:
+        return None, None, None
+    day = norm.date()
+    return norm, day.isoformat(), week_start_of(day).isoformat()
+
+# End Bucket helpers
+
 # Model definitions
 
 # App-specific definition of a user
@@ -63,6 +100,11 @@ class User(Base):
     # Metadata
     creation_timestamp = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
 
+    __table_args__ = (
+        # Keyset pagination of /api/users
+        Index('ix_users_created_id', 'creation_timestamp', 'id'),
+    )
+
 # Generic app-specific definition of any event used.
 # All observations/symptoms/triggers/etc will be used
 # as this event in the database.
@@ -77,6 +119,11 @@ class Event(Base):
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete='CASCADE'))
     user: Mapped["User"] = relationship(back_populates="events")
     event_timestamp = Column(TIMESTAMP(timezone=False), nullable=True)
+    # Derived from event_timestamp on write (see set_event_timestamp), so the
+    # analytics can group and range-scan on indexed keys.
+    event_ts_utc = Column(TIMESTAMP(timezone=False), nullable=True)
+    event_day = Column(String(10), nullable=True)
+    event_week = Column(String(10), nullable=True)
     # Data Columns
     # severity = Column('severity', Enum(Severity), nullable=True)
     severity = Column('severity', IntEnumType(Severity), nullable=True)
@@ -87,6 +134,111 @@ class Event(Base):
     creation_timestamp = Column(TIMESTAMP(timezone=False), nullable=False, server_default=func.now())
     update_timestamp = Column(TIMESTAMP(timezone=False), nullable=False, server_default=func.now())
 
+    # The primary key leads on (system, code), so none of the per-user API
+    # filters can use it. These indexes lead on user_id instead; keep them in
+    # sync with the matching step in migrations.py.
+    __table_args__ = (
+        # Keyset pagination of /api/migraines (and /api/triggers?event_type=),
+        # also /api/migraines/weekly
+        Index('ix_events_user_type_ts_id', 'user_id', 'event_type', 'event_timestamp', 'id'),
+        # Keyset pagination of /api/triggers
+        Index('ix_events_user_ts_id', 'user_id', 'event_timestamp', 'id'),
+        # Covers the weekly analytics grouped on the stored week bucket.
+        Index('ix_events_user_week', 'user_id', 'event_week', 'event_type', 'severity', 'unit', 'numerical_value'),
+        # Events changed since the last FHIR export (see fhir_state.py)
+        Index('ix_events_user_updated_id', 'user_id', 'update_timestamp', 'id'),
+    )
+
+    # Stored as naive UTC, like its buckets: an offset timestamp would
+    # otherwise keep its wall time while being bucketed by its UTC instant.
+    @validates('event_timestamp')
+    def set_event_timestamp(self, key, value):
+        self.event_ts_utc, self.event_day, self.event_week = bucket_keys(value)
+        return self.event_ts_utc
+
+# Per-user, per-week totals of the metrics the weekly analytics report.
+# Maintained incrementally on write and rebuilt from events by rollup.py.
+# Averages are stored as (sum, count) so they stay additive.
+class WeeklyRollup(Base):
+    __tablename__ = 'weekly_rollup'
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete='CASCADE'), primary_key=True)
+    # Same 'YYYY-MM-DD' key as Event.event_week
+    week_start = Column(String(10), primary_key=True)
+    migraine_events = Column(Integer, nullable=False, default=0)
+    migraine_severity_sum = Column(Integer, nullable=False, default=0)
+    migraine_severity_count = Column(Integer, nullable=False, default=0)
+    sleep_hours = Column(Float, nullable=False, default=0.0)
+    stress_events = Column(Integer, nullable=False, default=0)
+    stress_severity_sum = Column(Integer, nullable=False, default=0)
+    stress_severity_count = Column(Integer, nullable=False, default=0)
+    meals_count = Column(Float, nullable=False, default=0.0)
+    exercise_days = Column(Float, nullable=False, default=0.0)
+    medication_days = Column(Float, nullable=False, default=0.0)
+
+# Counter bumped in the same transaction as every change to a user's events
+# (see versions.py). Cached analytics and ETags are keyed on it. A user
+# without a row is at version 0.
+class UserDataVersion(Base):
+    __tablename__ = 'user_data_versions'
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete='CASCADE'), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+# Background jobs run by jobs.py. Kept in the database so jobs that were
+# queued or running when the server stopped are picked up again at startup.
+# params, errors and result are JSON text.
+class Job(Base):
+    __tablename__ = 'jobs'
+    id = Column(GUID, primary_key=True, default=GUID_DEFAULT_SQLITE)
+    kind = Column(String, nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete='CASCADE'), nullable=True)
+    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.queued)
+    params = Column(Text, nullable=False, default='{}')
+    attempts = Column(Integer, nullable=False, default=0)
+    # Progress: `processed` of `total` items are done, and a resumed job
+    # starts after them.
+    total = Column(Integer, nullable=True)
+    processed = Column(Integer, nullable=False, default=0)
+    created_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+    errors = Column(Text, nullable=False, default='[]')
+    result = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    # Metadata
+    creation_timestamp = Column(TIMESTAMP(timezone=False), nullable=False, server_default=func.now())
+    started_timestamp = Column(TIMESTAMP(timezone=False), nullable=True)
+    finished_timestamp = Column(TIMESTAMP(timezone=False), nullable=True)
+    update_timestamp = Column(TIMESTAMP(timezone=False), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        # Pending jobs in submission order, at startup
+        Index('ix_jobs_status_created', 'status', 'creation_timestamp'),
+    )
+
+# Where a user's FHIR export got to (see fhir_state.py): the server it went
+# to, the Patient id there, and the watermark below which every event's
+# current version has been exported.
+class FhirExportState(Base):
+    __tablename__ = 'fhir_export_state'
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete='CASCADE'), primary_key=True)
+    server = Column(String, nullable=False)
+    patient_id = Column(String, nullable=False)
+    watermark = Column(TIMESTAMP(timezone=False), nullable=True)
+    last_export_timestamp = Column(TIMESTAMP(timezone=False), nullable=True)
+
+# The FHIR Observation id of each exported event, and the update_timestamp
+# of the version that was sent.
+class FhirResource(Base):
+    __tablename__ = 'fhir_resources'
+    event_id = Column(GUID, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete='CASCADE'), nullable=False)
+    resource_id = Column(String, nullable=False)
+    exported_update_timestamp = Column(TIMESTAMP(timezone=False), nullable=False)
+
+    __table_args__ = (
+        # Dropping a user's mappings for a full re-export
+        Index('ix_fhir_resources_user', 'user_id'),
+    )
+
 # End Model definitions
 
 
@@ -0,0 +1,107 @@
+"""
+Keyset (cursor) pagination for the listing endpoints.
+
+Pages are ordered newest first by a (timestamp, id) key. A cursor encodes the
+key of the item on a page edge, so a page is a range scan that starts right
+after that key. Unlike OFFSET it costs the same at any depth, and inserts
+made between requests never shift or repeat items.
+
+Items without a timestamp sort after every dated one. A page crossing that
+boundary is read with two queries, one per side, so each stays a range
+seek on a (..., timestamp, id) index: `(ts, id) < (?, ?)` over the dated
+rows, then `ts IS NULL AND id < ?` over the undated ones. A single query
+OR-ing the two would make SQLite scan from the newest row instead.
+
+    next_cursor -> pass as `before` for the next (older) page
+    prev_cursor -> pass as `after` for the previous (newer) page
+"""
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+def encode_cursor(ts: datetime | None, id) -> str:
+    raw = json.dumps([ts.isoformat() if ts is not None else None, uuid.UUID(str(id)).hex])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime | None, uuid.UUID]:
+    """Raises ValueError for a cursor this module did not produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        ts, id = json.loads(raw)
+        return (datetime.fromisoformat(ts) if ts is not None else None), uuid.UUID(id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _older(ts_col, id_col, ts, id) -> List[Tuple[list, list]]:
+    """
+    (conditions, order) of the queries that read the items older than the
+    key (or all items, without one), in the order they are read. SQLite sorts
+    NULL timestamps last in DESC order, so the undated items come last.
+    """
+    desc = [ts_col.desc(), id_col.desc()]
+    if id is None:
+        return [([], desc)]
+    if ts is None:
+        return [([ts_col.is_(None), id_col < id], [id_col.desc()])]
+    return [([tuple_(ts_col, id_col) < (ts, id)], desc),
+            ([ts_col.is_(None)], [id_col.desc()])]
+
+
+def _newer(ts_col, id_col, ts, id) -> List[Tuple[list, list]]:
+    """As `_older`, for the items newer than the key, oldest first."""
+    asc = [ts_col.asc(), id_col.asc()]
+    if ts is None:
+        return [([ts_col.is_(None), id_col > id], [id_col.asc()]),
+                ([ts_col.isnot(None)], asc)]
+    return [([tuple_(ts_col, id_col) > (ts, id)], asc)]
+
+
+async def fetch_page(db, stmt: Select, ts_col, id_col, limit: int,
+                     before: str | None = None, after: str | None = None) -> Dict[str, Any]:
+    """
+    Run `stmt` for one page of rows, newest first. `stmt` selects columns,
+    including `ts_col` and `id_col`. `before` and `after` are mutually
+    exclusive cursors. Raises ValueError for a bad cursor.
+    """
+    if before and after:
+        raise ValueError("Pass either 'before' or 'after', not both")
+
+    if after:
+        # Walk forward from the cursor, then flip back to newest first.
+        queries = _newer(ts_col, id_col, *decode_cursor(after))
+    else:
+        queries = _older(ts_col, id_col, *(decode_cursor(before) if before else (None, None)))
+
+    items: List[Any] = []
+    for conditions, order in queries:
+        if len(items) > limit:
+            break
+        items += (await db.execute(stmt.where(*conditions).order_by(*order).limit(limit + 1 - len(items)))).all()
+    has_more = len(items) > limit
+    items = items[:limit]
+    if after:
+        items.reverse()
+        has_older, has_newer = True, has_more
+    else:
+        has_older, has_newer = has_more, bool(before)
+
+    def edge_cursor(item):
+        return encode_cursor(getattr(item, ts_col.key), getattr(item, id_col.key))
+
+    return {
+        "items": items,
+        "limit": limit,
+        "next_cursor": edge_cursor(items[-1]) if items and has_older else None,
+        "prev_cursor": edge_cursor(items[0]) if items and has_newer else None,
+    }
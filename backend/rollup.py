@@ -0,0 +1,229 @@
+"""
+Maintenance of the `weekly_rollup` table.
+
+Each row holds one user's totals for one week (keyed like Event.event_week),
+so the weekly analytics read a few dozen rollup rows instead of
+re-aggregating every event. Writers call `apply_events` in the same
+transaction as the event insert (`apply_rows` for bulk Core inserts). `rebuild` recomputes rows from the raw
+events and is used after deletes, by the migration that introduced the
+table, and from the command line to repair drift:
+
+    python -m backend.rollup [user_id ...]
+"""
+import sys
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from sqlalchemy import Float, and_, case, cast, delete, func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from .models import Event, EventType, Unit, WeeklyRollup
+
+# Additive columns, in table order
+METRICS = [
+    'migraine_events',
+    'migraine_severity_sum',
+    'migraine_severity_count',
+    'sleep_hours',
+    'stress_events',
+    'stress_severity_sum',
+    'stress_severity_count',
+    'meals_count',
+    'exercise_days',
+    'medication_days',
+]
+
+# Rollup rows per INSERT ... ON CONFLICT statement
+UPSERT_CHUNK = 500
+
+# (event_type, unit) pairs with a standardized numeric value, and the
+# divisor into that standard unit (sleep -> hours; others -> count).
+VALUE_STD_DIVISORS = {
+    (EventType.sleep, Unit.minutes): 60.0,
+    (EventType.sleep, Unit.hours): 1.0,
+    (EventType.meals, Unit.number): 1.0,
+    (EventType.exercise, Unit.number): 1.0,
+    (EventType.medication, Unit.number): 1.0,
+}
+
+# Metric that sums the standardized value of each event type
+VALUE_STD_METRICS = {
+    EventType.sleep: 'sleep_hours',
+    EventType.meals: 'meals_count',
+    EventType.exercise: 'exercise_days',
+    EventType.medication: 'medication_days',
+}
+
+
+def value_std_expr():
+    """SQL CASE for the standardized numeric value of an event row."""
+    return case(
+        (
+            and_(Event.event_type == EventType.sleep, Event.numerical_unit == Unit.minutes),
+            cast(Event.numerical_value, Float) / 60.0
+        ),
+        (
+            and_(Event.event_type == EventType.sleep, Event.numerical_unit == Unit.hours),
+            cast(Event.numerical_value, Float)
+        ),
+        (
+            and_(Event.event_type == EventType.meals, Event.numerical_unit == Unit.number),
+            cast(Event.numerical_value, Float)
+        ),
+        (
+            and_(Event.event_type == EventType.exercise, Event.numerical_unit == Unit.number),
+            cast(Event.numerical_value, Float)
+        ),
+        (
+            and_(Event.event_type == EventType.medication, Event.numerical_unit == Unit.number),
+            cast(Event.numerical_value, Float)
+        ),
+        else_=None
+    )
+
+
+def value_std(event_type: EventType, unit: Unit | None, value: int | None) -> float | None:
+    """Python counterpart of `value_std_expr` for a single event."""
+    divisor = VALUE_STD_DIVISORS.get((event_type, unit))
+    if divisor is None or value is None:
+        return None
+    return value / divisor
+
+
+def event_row(ev: Event) -> Dict[str, Any]:
+    """The values of an ORM Event that the rollup reads, keyed by column name."""
+    return {
+        'user_id': ev.user_id,
+        'event_week': ev.event_week,
+        'event_type': ev.event_type,
+        'severity': ev.severity,
+        'numerical_value': ev.numerical_value,
+        'unit': ev.numerical_unit,
+    }
+
+
+def event_deltas(rows: Iterable[Mapping[str, Any]]) -> Dict[Tuple[uuid.UUID, str], Dict[str, float]]:
+    """Sum the rollup contribution of each event row per (user_id, week_start)."""
+    deltas: Dict[Tuple[uuid.UUID, str], Dict[str, float]] = defaultdict(lambda: dict.fromkeys(METRICS, 0))
+    for row in rows:
+        if row['event_week'] is None:
+            continue
+        # Freshly built events still hold the raw request values
+        event_type = EventType(row['event_type'])
+        unit = Unit(row['unit']) if row['unit'] is not None else None
+        severity = row['severity']
+        d = deltas[(uuid.UUID(str(row['user_id'])), row['event_week'])]
+        if event_type == EventType.migraine:
+            d['migraine_events'] += 1
+            if severity is not None:
+                d['migraine_severity_sum'] += int(severity)
+                d['migraine_severity_count'] += 1
+        elif event_type == EventType.stress:
+            d['stress_events'] += 1
+            if severity is not None:
+                d['stress_severity_sum'] += int(severity)
+                d['stress_severity_count'] += 1
+        metric = VALUE_STD_METRICS.get(event_type)
+        v = value_std(event_type, unit, row['numerical_value'])
+        if metric is not None and v is not None:
+            d[metric] += v
+    return deltas
+
+
+def apply_events(db, events: Iterable[Event]):
+    """Add newly added ORM events to their rollup rows (upsert, no commit)."""
+    apply_rows(db, [event_row(ev) for ev in events])
+
+
+def apply_rows(db, rows: Iterable[Mapping[str, Any]]):
+    """Add column-keyed event rows to their rollup rows (upsert, no commit)."""
+    deltas = event_deltas(rows)
+    if not deltas:
+        return
+    values = [
+        {'user_id': user_id, 'week_start': week_start, **metrics}
+        for (user_id, week_start), metrics in deltas.items()
+    ]
+    # Multi-row VALUES, chunked to stay under SQLite's bound-parameter limit
+    for i in range(0, len(values), UPSERT_CHUNK):
+        stmt = sqlite_insert(WeeklyRollup).values(values[i:i + UPSERT_CHUNK])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['user_id', 'week_start'],
+            set_={m: WeeklyRollup.__table__.c[m] + stmt.excluded[m] for m in METRICS}
+        )
+        db.execute(stmt)
+
+
+def rebuild(db, user_ids: List | None = None):
+    """Recompute rollup rows from raw events; all users when `user_ids` is None.
+
+    `db` may be a Session or a Connection. Pending ORM changes must be
+    flushed first; nothing is committed.
+    """
+    value_std_col = value_std_expr()
+
+    def metric_sum(event_type: EventType):
+        return func.coalesce(func.sum(case((Event.event_type == event_type, value_std_col), else_=None)), 0.0)
+
+    def severity_sum(event_type: EventType):
+        return func.coalesce(func.sum(case((Event.event_type == event_type, Event.severity), else_=None)), 0)
+
+    def severity_count(event_type: EventType):
+        return func.count(case((Event.event_type == event_type, Event.severity), else_=None))
+
+    def event_count(event_type: EventType):
+        return func.sum(case((Event.event_type == event_type, 1), else_=0))
+
+    weekly = (
+        select(
+            Event.user_id,
+            Event.event_week,
+            event_count(EventType.migraine),
+            severity_sum(EventType.migraine),
+            severity_count(EventType.migraine),
+            metric_sum(EventType.sleep),
+            event_count(EventType.stress),
+            severity_sum(EventType.stress),
+            severity_count(EventType.stress),
+            metric_sum(EventType.meals),
+            metric_sum(EventType.exercise),
+            metric_sum(EventType.medication),
+        )
+        .where(Event.event_week.isnot(None))
+        .group_by(Event.user_id, Event.event_week)
+    )
+    clear = delete(WeeklyRollup)
+    if user_ids is not None:
+        weekly = weekly.where(Event.user_id.in_(user_ids))
+        clear = clear.where(WeeklyRollup.user_id.in_(user_ids))
+
+    db.execute(clear)
+    db.execute(insert(WeeklyRollup).from_select(['user_id', 'week_start', *METRICS], weekly))
+
+
+def weekly_columns():
+    """Rollup columns labelled like the raw weekly aggregation query."""
+    return (
+        WeeklyRollup.week_start.label('week_start_monday'),
+        WeeklyRollup.migraine_events,
+        (cast(WeeklyRollup.migraine_severity_sum, Float) / func.nullif(WeeklyRollup.migraine_severity_count, 0)).label('migraine_avg_severity'),
+        WeeklyRollup.sleep_hours,
+        WeeklyRollup.stress_events,
+        (cast(WeeklyRollup.stress_severity_sum, Float) / func.nullif(WeeklyRollup.stress_severity_count, 0)).label('stress_avg_severity'),
+        WeeklyRollup.meals_count,
+        WeeklyRollup.exercise_days,
+        WeeklyRollup.medication_days,
+    )
+
+
+if __name__ == '__main__':
+    from .database import engine
+
+    from . import versions
+
+    with engine.begin() as conn:
+        rebuild(conn, sys.argv[1:] or None)
+        # Drop cached analytics computed from the drifted rows.
+        versions.bump(conn, sys.argv[1:] or None)
+    print("weekly_rollup rebuilt")
@@ -1,6 +1,10 @@
+import uuid
 from datetime import datetime
+from typing import Any, Generic, List, TypeVar
 from pydantic import BaseModel, Field
-from .models import EventType, Severity, Unit
+from .models import EventType, JobStatus, Severity, Unit
+
+T = TypeVar('T')
 
 class UserRequest(BaseModel):
     name: str
@@ -22,4 +26,54 @@ class EventRequest(BaseModel):
     update_timestamp: datetime | None = None
 
     class Config:
-        use_enum_values = True
\ No newline at end of file
+        use_enum_values = True
+
+
+# Response types. The list endpoints select exactly these fields as row
+# tuples (see main.py) and serialize them with orjson, so the column types
+# must already match: ids are UUIDs, enums are the models' enums.
+
+class UserResponse(BaseModel):
+    id: uuid.UUID
+    name: str
+    creation_timestamp: datetime
+
+class EventResponse(BaseModel):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    system: str
+    code: str
+    event_type: EventType
+    severity: Severity | None = None
+    numerical_value: int | None = None
+    numerical_unit: Unit | None = None
+    description: str | None = None
+    event_timestamp: datetime | None = None
+    creation_timestamp: datetime
+    update_timestamp: datetime
+
+class Page(BaseModel, Generic[T]):
+    """One page of a keyset-paginated listing (see pagination.py)."""
+    items: List[T]
+    limit: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+class JobResponse(BaseModel):
+    """A background job and its progress (see jobs.py)."""
+    id: uuid.UUID
+    kind: str
+    user_id: uuid.UUID | None = None
+    status: JobStatus
+    attempts: int
+    total: int | None = None
+    processed: int
+    created_count: int
+    error_count: int
+    errors: List[Any]
+    result: Any = None
+    error: str | None = None
+    creation_timestamp: datetime
+    started_timestamp: datetime | None = None
+    finished_timestamp: datetime | None = None
+    update_timestamp: datetime
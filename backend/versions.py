@@ -0,0 +1,68 @@
+"""
+Per-user data versions and the ETags derived from them.
+
+Every write that inserts, updates or deletes a user's events calls `bump`
+in the same transaction, so a user's version changes exactly when their
+event data does. Reading it is a single primary-key lookup, which lets the
+analytics and listing endpoints answer `If-None-Match` with 304 before any
+aggregation SQL runs.
+"""
+import uuid
+from typing import Iterable
+
+from sqlalchemy import select, true
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import User, UserDataVersion
+
+
+def user_key(user_id) -> str:
+    """Canonical form of a user id, whether it arrives as a UUID, hex or dashed string."""
+    try:
+        return uuid.UUID(str(user_id)).hex
+    except ValueError:
+        return str(user_id)
+
+
+def bump(db, user_ids: Iterable | None = None):
+    """Increment the users' versions (no commit); all users when `user_ids` is None.
+
+    `db` may be a Session or a Connection.
+    """
+    table = UserDataVersion.__table__
+    if user_ids is None:
+        # SQLite needs a WHERE to tell the upsert's ON apart from a join's.
+        stmt = sqlite_insert(table).from_select(['user_id', 'version'], select(User.id, 1).where(true()))
+    else:
+        values = [{'user_id': user_id, 'version': 1} for user_id in set(map(user_key, user_ids))]
+        if not values:
+            return
+        stmt = sqlite_insert(table).values(values)
+    stmt = stmt.on_conflict_do_update(index_elements=['user_id'], set_={'version': table.c.version + 1})
+    db.execute(stmt)
+
+
+async def get(db: AsyncSession, user_id) -> int:
+    version = (await db.execute(
+        select(UserDataVersion.version).where(UserDataVersion.user_id == user_id)
+    )).scalar()
+    return version or 0
+
+
+def etag(user_id, version: int) -> str:
+    # Weak: the same version always serialises the same way, but the bytes
+    # are not guaranteed across deploys.
+    return f'W/"{user_key(user_id)}.{version}"'
+
+
+def matches(if_none_match: str | None, tag: str) -> bool:
+    """Whether an If-None-Match header value matches `tag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    opaque = tag.removeprefix('W/')
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == opaque:
+            return True
+    return False
@@ -15,6 +15,11 @@ export default defineConfig({
       '@': fileURLToPath(new URL('./src', import.meta.url))
     },
   },
+  build: {
+    // FastAPI serves the bundle from backend/dist; build straight into it.
+    outDir: '../backend/dist',
+    emptyOutDir: true,
+  },
   server: {
     proxy: {
       '^/api': {
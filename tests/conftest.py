@@ -0,0 +1,134 @@
+import os
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, List
+from urllib.parse import unquote
+
+import pytest
+
+# backend.database reads its settings at import: point it at a scratch
+# database before any test imports the backend.
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(prefix="backend-tests-"), "app.db"))
+os.environ.setdefault("FHIR_BASE_URL", "http://fhir.test/baseR4")
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from backend import fhir_client
+from backend.main import app
+from backend.database import SessionLocal
+from backend.models import User
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def user_id():
+    """A new user's id, as the API takes it."""
+    with SessionLocal() as db:
+        user = User(name=f"test-{uuid.uuid4().hex[:8]}")
+        db.add(user)
+        db.commit()
+        return str(user.id)
+
+
+class FHIRStub:
+    """
+    A FHIR server in memory: Patient search by identifier and create,
+    Observation search by subject, `page_size` results a page with `next`
+    links, and batch Bundles of Observation updates, by id or conditional
+    on an identifier. The entries of each batch are kept in `batches`.
+    """
+
+    def __init__(self):
+        self.patients: Dict[str, Dict[str, Any]] = {}
+        self.observations: List[Dict[str, Any]] = []
+        self.batches: List[List[Dict[str, Any]]] = []
+        self.searches = 0
+        self.app = FastAPI()
+        self.app.get("/baseR4/Patient")(self.search_patients)
+        self.app.post("/baseR4/Patient", status_code=201)(self.create_patient)
+        self.app.get("/baseR4/Observation")(self.search_observations)
+        self.app.post("/baseR4/")(self.batch)
+
+    async def search_patients(self, identifier: str):
+        patient = self.patients.get(identifier)
+        return {'resourceType': 'Bundle', 'type': 'searchset', 'entry': [{'resource': patient}] if patient else []}
+
+    async def create_patient(self, request: Request):
+        patient = {**await request.json(), 'id': f"pat-{len(self.patients) + 1}"}
+        usual = next(i['value'] for i in patient['identifier'] if i.get('use') == 'usual')
+        self.patients[usual] = patient
+        return patient
+
+    async def batch(self, request: Request):
+        entries = (await request.json())['entry']
+        self.batches.append(entries)
+        return {'resourceType': 'Bundle', 'type': 'batch-response',
+                'entry': [{'response': self.update_observation(entry)} for entry in entries]}
+
+    def update_observation(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        url = entry['request']['url']
+        if url.startswith('Observation?identifier='):
+            value = unquote(url.split('=', 1)[1])
+            index = next((i for i, o in enumerate(self.observations)
+                          if any(ident['value'] == value for ident in o.get('identifier') or [])), None)
+        else:
+            index = next((i for i, o in enumerate(self.observations) if o['id'] == url.split('/', 1)[1]), None)
+        if index is None:
+            observation = {**entry['resource'], 'id': f"obs-{len(self.observations) + 1}"}
+            self.observations.append(observation)
+            return {'status': '201 Created', 'location': f"Observation/{observation['id']}/_history/1"}
+        observation = self.observations[index] = {**entry['resource'], 'id': self.observations[index]['id']}
+        return {'status': '200 OK', 'location': f"Observation/{observation['id']}/_history/2"}
+
+    async def search_observations(self, subject: str, _count: int = 20, _offset: int = 0):
+        self.searches += 1
+        matches = [o for o in self.observations if o['subject']['reference'] == subject]
+        links = [{'relation': 'self', 'url': f"{fhir_client.FHIR_BASE_URL}/Observation"}]
+        if _offset + _count < len(matches):
+            links.append({'relation': 'next', 'url': f"{fhir_client.FHIR_BASE_URL}/Observation?subject={subject}"
+                                                     f"&_count={_count}&_offset={_offset + _count}"})
+        return {'resourceType': 'Bundle', 'type': 'searchset', 'total': len(matches), 'link': links,
+                'entry': [{'resource': o} for o in matches[_offset:_offset + _count]]}
+
+
+def guarded(transport: httpx.AsyncBaseTransport, base_path: str = "") -> fhir_client.GuardedTransport:
+    """GuardedTransport around `transport` with its own breaker and metrics, so tests do not share them."""
+    return fhir_client.GuardedTransport(transport, base_path, breaker=fhir_client.CircuitBreaker(5, 30),
+                                        metrics=fhir_client.OperationMetrics(100))
+
+
+@pytest.fixture
+def fhir_server(monkeypatch):
+    """A FHIRStub the app's FHIR client talks to."""
+    stub = FHIRStub()
+    transport = guarded(httpx.ASGITransport(stub.app), httpx.URL(fhir_client.FHIR_BASE_URL).path)
+    monkeypatch.setattr(fhir_client, 'get_client', lambda: httpx.AsyncClient(
+        base_url=fhir_client.FHIR_BASE_URL, transport=transport, headers={"Accept": fhir_client.FHIR_JSON}))
+    return stub
+
+
+@pytest.fixture
+def wait_for_job(client):
+    """Poll GET /api/jobs/{id} until the job finishes; returns its last status."""
+    def wait(job_id, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = client.get(f"/api/jobs/{job_id}").json()
+            if job['status'] not in ('queued', 'running'):
+                return job
+            time.sleep(0.02)
+        raise AssertionError(f"Job {job_id} did not finish in {timeout}s")
+    return wait
@@ -0,0 +1,58 @@
+import json
+
+from sqlalchemy import select
+
+from backend.database import SessionLocal
+from backend.models import Event
+
+VALID = {'event_type': 'migraine', 'severity': 3, 'description': 'headache', 'event_timestamp': '2025-11-03T08:00:00'}
+# Valid, a validation error, no event_type, valid.
+MIXED = [VALID, {**VALID, 'severity': 9}, {'severity': 2}, {**VALID, 'event_type': 'sleep', 'severity': None,
+                                                           'numerical_value': 7, 'numerical_unit': 'hours'}]
+
+
+def stored_ids(user_id):
+    with SessionLocal() as db:
+        return {str(i) for i in db.execute(select(Event.id).where(Event.user_id == user_id)).scalars()}
+
+
+def post_batch(client, user_id, content, content_type, **params):
+    return client.post("/api/events/batch", params={'user_id': user_id, **params},
+                       content=content, headers={'Content-Type': content_type})
+
+
+def assert_mixed_results(body, user_id, offset=0):
+    items = body['items']
+    assert [item['index'] for item in items] == list(range(len(items)))
+    assert [item['status'] for item in items[offset:]] == ['created', 'error', 'error', 'created']
+    assert items[offset + 1]['error'][0]['loc'] == ['severity']
+    assert items[offset + 2]['error'] == 'event_type is required'
+    assert (body['created'], body['failed']) == (2, len(items) - 2)
+    assert stored_ids(user_id) == {item['id'] for item in items if item['status'] == 'created'}
+
+
+def test_json_array_reports_each_item(client, user_id):
+    response = post_batch(client, user_id, json.dumps(MIXED), 'application/json', batch_size=1)
+
+    assert response.status_code == 200
+    assert response.json()['user_id'] == user_id
+    assert_mixed_results(response.json(), user_id)
+
+
+def test_ndjson_reports_invalid_lines(client, user_id):
+    lines = ['{"event_type": "migraine",'] + [json.dumps(item) for item in MIXED]
+    response = post_batch(client, user_id, '\n'.join(lines) + '\n\n', 'application/x-ndjson')
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body['items'][0]['status'] == 'error'
+    assert body['items'][0]['error'].startswith('Invalid JSON')
+    assert_mixed_results(body, user_id, offset=1)
+
+
+def test_non_array_body_is_rejected(client, user_id):
+    response = post_batch(client, user_id, json.dumps(VALID), 'application/json')
+
+    assert response.status_code == 400
+    assert response.json()['detail'] == 'Expected a JSON array of events'
+    assert stored_ids(user_id) == set()
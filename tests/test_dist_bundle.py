@@ -0,0 +1,30 @@
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DIST = ROOT / "backend" / "dist"
+API_URL = re.compile(r"/api/[^`'\"\s]*")
+# Minification renames the variables interpolated into a URL.
+PLACEHOLDER = re.compile(r"\$\{[^}]*\}")
+
+
+def api_urls(files):
+    return {PLACEHOLDER.sub("${}", url) for f in files for url in API_URL.findall(f.read_text())}
+
+
+def served_scripts():
+    index = (DIST / "index.html").read_text()
+    return [DIST / src.lstrip("/") for src in re.findall(r'<script[^>]* src="([^"]+)"', index)]
+
+
+def test_index_references_existing_assets():
+    scripts = served_scripts()
+    assert scripts
+    assert all(script.is_file() for script in scripts)
+
+
+def test_bundle_requests_the_same_urls_as_the_source():
+    # The committed bundle goes stale when frontend/src changes without `npm run build`;
+    # query strings are compared too, so a bundle edited apart from its source fails here.
+    source = api_urls(p for p in (ROOT / "frontend" / "src").rglob("*") if p.suffix in (".vue", ".ts"))
+    assert api_urls(served_scripts()) == source
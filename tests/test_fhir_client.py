@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from backend import fhir_client
+from backend.fhir_client import CircuitBreaker, CircuitOpenError, DeadlineExceeded, GuardedTransport, OperationMetrics
+
+pytestmark = pytest.mark.anyio
+
+BASE_URL = "http://fhir.test/baseR4"
+
+
+class Server:
+    """MockTransport handler answering with `status`, after `delay` seconds."""
+
+    def __init__(self, status=200, delay=0.0):
+        self.status = status
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return httpx.Response(self.status, json={'resourceType': 'Bundle', 'type': 'searchset'})
+
+
+def new_client(server, breaker=None, metrics=None):
+    transport = GuardedTransport(httpx.MockTransport(server), "/baseR4",
+                                 breaker=breaker or CircuitBreaker(5, 30), metrics=metrics or OperationMetrics(100))
+    return httpx.AsyncClient(base_url=BASE_URL, transport=transport)
+
+
+async def test_deadline(monkeypatch):
+    monkeypatch.setattr(fhir_client, 'FHIR_DEADLINE', 0.05)
+    monkeypatch.setattr(fhir_client, 'FHIR_BATCH_DEADLINE', 1.0)
+    metrics = OperationMetrics(100)
+    async with new_client(Server(delay=0.2), metrics=metrics) as client:
+        started = time.perf_counter()
+        with pytest.raises(DeadlineExceeded):
+            await client.get("Patient", params={'identifier': 'x'})
+        assert time.perf_counter() - started < 0.2
+        # Batch Bundles get the longer deadline.
+        response = await client.post("", json={'resourceType': 'Bundle', 'type': 'batch', 'entry': []})
+        assert response.status_code == 200
+        assert response.elapsed.total_seconds() >= 0.2
+
+    snapshot = metrics.snapshot()
+    assert snapshot['search Patient']['timeout'] == 1
+    assert snapshot['batch']['ok'] == 1
+
+
+async def test_breaker_opens_half_opens_and_closes():
+    breaker = CircuitBreaker(2, reset_timeout=0.05)
+    server = Server(status=503)
+    async with new_client(server, breaker=breaker) as client:
+        for _ in range(2):
+            assert (await client.get("Patient/1")).status_code == 503
+        assert breaker.state == "open"
+
+        # Open: calls fail at once, without reaching the server.
+        with pytest.raises(CircuitOpenError) as rejected:
+            await client.get("Patient/1")
+        assert 0 < rejected.value.retry_after <= 0.05
+        assert server.calls == 2
+
+        # Half open after reset_timeout: a failed trial call opens it again.
+        await asyncio.sleep(0.06)
+        assert breaker.state == "half_open"
+        assert (await client.get("Patient/1")).status_code == 503
+        assert breaker.state == "open"
+        assert breaker.times_opened == 1
+
+        # A successful trial call closes it.
+        await asyncio.sleep(0.06)
+        server.status = 200
+        assert (await client.get("Patient/1")).status_code == 200
+        assert breaker.state == "closed"
+        assert breaker.stats()['consecutive_failures'] == 0
+        assert server.calls == 4
+
+
+def test_breaker_allows_one_trial_call_at_a_time():
+    breaker = CircuitBreaker(1, reset_timeout=0)
+    breaker.record(False)
+    assert breaker.allow()
+    assert not breaker.allow()
+    # A cancelled trial call lets the next one through.
+    breaker.record(None)
+    assert breaker.allow()
+
+
+async def test_metrics_count_each_outcome(monkeypatch):
+    monkeypatch.setattr(fhir_client, 'FHIR_DEADLINE', 0.05)
+    metrics = OperationMetrics(100)
+    breaker = CircuitBreaker(3, reset_timeout=30)
+    server = Server()
+    async with new_client(server, breaker=breaker, metrics=metrics) as client:
+        for _ in range(3):
+            await client.get("Observation", params={'subject': 'Patient/1'})
+        await client.get("Observation/1")
+        await client.put("Observation/1", json={})
+        server.status = 500
+        await client.get("Observation", params={'subject': 'Patient/1'})
+        server.status, server.delay = 200, 0.2
+        for _ in range(2):
+            with pytest.raises(DeadlineExceeded):
+                await client.get("Observation", params={'subject': 'Patient/1'})
+        with pytest.raises(CircuitOpenError):
+            await client.get("Observation", params={'subject': 'Patient/1'})
+
+    snapshot = metrics.snapshot()
+    assert set(snapshot) == {'search Observation', 'read Observation', 'update Observation'}
+    search = snapshot['search Observation']
+    assert {k: search[k] for k in ('calls', 'ok', 'error', 'timeout', 'rejected')} == \
+        {'calls': 7, 'ok': 3, 'error': 1, 'timeout': 2, 'rejected': 1}
+    assert search['p50_ms'] <= search['p95_ms'] <= search['max_ms']
+    assert search['max_ms'] >= 50
+    assert snapshot['read Observation']['calls'] == snapshot['update Observation']['calls'] == 1
+
+
+def test_operation_name():
+    def name(method, url):
+        return fhir_client.operation_name(httpx.Request(method, url), "/baseR4")
+
+    assert name("GET", f"{BASE_URL}/Patient/1") == "read Patient"
+    assert name("GET", f"{BASE_URL}/Patient?identifier=x") == "search Patient"
+    assert name("POST", f"{BASE_URL}/Patient") == "create Patient"
+    assert name("PUT", f"{BASE_URL}/Observation?identifier=x") == "update Observation"
+    assert name("POST", f"{BASE_URL}/") == "batch"
+    assert name("GET", f"{BASE_URL}?_getpages=abc") == "search page"
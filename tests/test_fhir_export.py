@@ -0,0 +1,150 @@
+import asyncio
+import json
+
+import inspect
+
+import httpx
+import pytest
+
+from backend import fhir_client, fhir_export
+from backend.fhir_export import ChunkSizer, FHIRBatchExporter, succeeded
+
+pytestmark = pytest.mark.anyio
+
+BASE_URL = "http://fhir.test/baseR4/"
+
+# The `sleeps` fixture replaces asyncio.sleep; the stub server still sleeps.
+real_sleep = asyncio.sleep
+
+
+def batch_response(request: httpx.Request) -> httpx.Response:
+    """A batch-response Bundle creating every entry of the request."""
+    entries = json.loads(request.content)['entry']
+    return httpx.Response(200, json={'resourceType': 'Bundle', 'type': 'batch-response', 'entry': [
+        {'response': {'status': '201 Created', 'location': f"Observation/{i}/_history/1"}} for i in range(len(entries))
+    ]})
+
+
+class Server:
+    """MockTransport handler that answers each call with the next of `script`, then with batch_response."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.batch_sizes = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.batch_sizes.append(len(json.loads(request.content)['entry']))
+        step = self.script.pop(0) if self.script else batch_response
+        if isinstance(step, Exception):
+            raise step
+        response = step(request)
+        return await response if inspect.isawaitable(response) else response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """The backoff delays, recorded instead of slept."""
+    delays = []
+
+    async def record(seconds):
+        delays.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(fhir_export.asyncio, 'sleep', record)
+    return delays
+
+
+async def export(server, entries=10, **options):
+    outcomes = []
+
+    async def on_chunk(processed, keys, chunk_outcomes):
+        outcomes.extend(chunk_outcomes)
+
+    # Through GuardedTransport like the app's client (it times the calls),
+    # with a breaker that never opens.
+    transport = fhir_client.GuardedTransport(httpx.MockTransport(server), breaker=fhir_client.CircuitBreaker(1000, 30),
+                                             metrics=fhir_client.OperationMetrics(100))
+    async with httpx.AsyncClient(base_url=BASE_URL, transport=transport) as client:
+        exporter = FHIRBatchExporter(client, **{'max_concurrency': 1, **options})
+        sent = await exporter.post_entries(aiter_entries(entries), on_chunk)
+    assert sent == entries
+    return exporter, outcomes
+
+
+async def aiter_entries(count):
+    for i in range(count):
+        yield i, {'resource': {'resourceType': 'Observation'}, 'request': {'method': 'POST', 'url': 'Observation'}}
+
+
+async def test_retries_throttled_and_failed_batches(sleeps):
+    server = Server(
+        lambda request: httpx.Response(429, headers={'Retry-After': '7'}),
+        lambda request: httpx.Response(503),
+        httpx.ConnectError("connection refused"),
+    )
+    exporter, outcomes = await export(server, backoff_base=0.5)
+
+    assert len(outcomes) == 10 and all(succeeded(o) for o in outcomes)
+    assert exporter.stats()['requests'] == 4
+    assert exporter.stats()['retries'] == 3
+    # Retry-After is honoured; otherwise full jitter on a doubling schedule.
+    assert sleeps[0] == 7
+    assert 0 <= sleeps[1] <= 0.5 * 2 and 0 <= sleeps[2] <= 0.5 * 4
+
+
+async def test_retry_after_is_capped(sleeps):
+    server = Server(lambda request: httpx.Response(429, headers={'Retry-After': '3600'}))
+    await export(server, backoff_max=30.0)
+    assert sleeps == [30.0]
+
+
+async def test_gives_up_after_max_retries(sleeps):
+    server = Server(*[lambda request: httpx.Response(500)] * 10)
+    exporter, outcomes = await export(server, max_retries=2, chunk_size=10)
+
+    assert exporter.stats()['requests'] == 3
+    assert len(sleeps) == 2
+    assert outcomes == [{'error': "Empty or invalid response from FHIR server", 'status_code': 500, 'raw_text': ''}] * 10
+
+
+async def test_client_errors_are_not_retried(sleeps):
+    server = Server(lambda request: httpx.Response(400))
+    exporter, outcomes = await export(server, chunk_size=10)
+    assert exporter.stats()['requests'] == 1
+    assert sleeps == []
+    assert not any(succeeded(o) for o in outcomes)
+
+
+async def test_chunks_halve_on_failed_batches(sleeps):
+    server = Server(*[lambda request: httpx.Response(500)] * 5)
+    await export(server, entries=100, chunk_size=40, max_retries=0)
+    assert server.batch_sizes[:6] == [40, 20, 10, 5, 2, 1]
+
+
+async def test_chunks_shrink_when_slow_and_grow_when_fast(sleeps):
+    async def slow(request):
+        await real_sleep(0.05)
+        return batch_response(request)
+
+    server = Server(slow, slow)
+    await export(server, entries=200, chunk_size=40, target_seconds=0.02)
+    sizes = server.batch_sizes
+    assert sizes[0] == 40
+    assert sizes[1] < 40 and sizes[2] < sizes[1]
+    # Quick batches afterwards grow the chunks again.
+    assert sizes[-2] > sizes[2]
+
+
+def test_chunk_sizer():
+    sizer = ChunkSizer(100, target_seconds=2.0)
+    sizer.observe(100, 4.0, ok=True)
+    assert sizer.size == 50
+    sizer.observe(50, 0.5, ok=True)
+    assert sizer.size == 62
+    sizer.observe(62, 1.5, ok=True)
+    assert sizer.size == 62
+    sizer.observe(62, 0.1, ok=False)
+    assert sizer.size == 31
+    for _ in range(10):
+        sizer.observe(sizer.size, 0.1, ok=False)
+    assert sizer.size == 1
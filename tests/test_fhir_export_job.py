@@ -0,0 +1,55 @@
+from sqlalchemy import select, update
+
+from backend import ingest
+from backend.database import SessionLocal
+from backend.models import Event, FhirExportState, FhirResource
+
+
+def run_export(client, wait_for_job, user_id, **params):
+    response = client.post(f"/api/export_patient_data_to_fhir/{user_id}", params=params)
+    assert response.status_code == 202
+    job = wait_for_job(response.json()['job_id'])
+    assert job['status'] == 'succeeded', job['error']
+    return job['result']
+
+
+def add_events(client, user_id, count):
+    for hour in range(count):
+        response = client.post("/api/event", params={'user_id': user_id}, json={
+            'event_type': 'migraine', 'severity': 3, 'description': 'headache', 'event_timestamp': f"2025-11-03T{hour:02d}:00:00"})
+        assert response.status_code == 200
+
+
+def stored_watermark(user_id):
+    with SessionLocal() as db:
+        return db.execute(select(FhirExportState.watermark).where(FhirExportState.user_id == user_id)).scalar_one()
+
+
+def test_second_export_sends_only_the_changed_event(client, fhir_server, wait_for_job, user_id):
+    add_events(client, user_id, 5)
+
+    first = run_export(client, wait_for_job, user_id)
+    first_watermark = stored_watermark(user_id)
+
+    assert first['observations'] == {'sent': 5, 'created': 5, 'updated': 0, 'skipped': 0}
+    assert [entry['request']['method'] for batch in fhir_server.batches for entry in batch] == ['PUT'] * 5
+    assert all(entry['request']['url'].startswith('Observation?identifier=')
+               for batch in fhir_server.batches for entry in batch)
+
+    with SessionLocal() as db:
+        edited = db.execute(select(Event).where(Event.user_id == user_id).limit(1)).scalar_one()
+        db.execute(update(Event).where(Event.id == edited.id)
+                   .values(description='edited', update_timestamp=ingest.utc_now()))
+        db.commit()
+        resource_id = db.get(FhirResource, edited.id).resource_id
+    fhir_server.batches.clear()
+
+    second = run_export(client, wait_for_job, user_id)
+
+    assert second['observations'] == {'sent': 1, 'created': 0, 'updated': 1, 'skipped': 0}
+    # One update in one batch; the first export recorded the event's server id.
+    [[entry]] = fhir_server.batches
+    assert entry['request'] == {'method': 'PUT', 'url': f"Observation/{resource_id}"}
+    assert entry['resource']['note'] == [{'text': 'edited'}]
+    assert second['watermark'] > first['watermark']
+    assert stored_watermark(user_id) > first_watermark
@@ -0,0 +1,77 @@
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import func, select
+
+from backend import fhir_resources
+from backend.database import SessionLocal
+from backend.models import Event, EventType, Severity
+
+
+def new_observation(patient_id, hour, **fields):
+    event = SimpleNamespace(id=uuid.uuid4(), system='LOINC', code='LA15141-7', event_type=EventType.migraine,
+                            severity=Severity.med, numerical_value=None, numerical_unit=None,
+                            description='imported', event_timestamp=datetime(2025, 11, 3, hour))
+    observation = fhir_resources.observation(event, patient_id)
+    observation['id'] = f"obs-{event.id.hex[:12]}"
+    observation.update(fields)
+    return observation
+
+
+def stored_events(user_id):
+    with SessionLocal() as db:
+        return db.execute(select(Event).where(Event.user_id == user_id)).scalars().all()
+
+
+def run_import(client, wait_for_job, user_id, page_size):
+    response = client.post(f"/api/import_patient_data_from_fhir/{user_id}", params={'page_size': page_size})
+    assert response.status_code == 202
+    job = wait_for_job(response.json()['job_id'])
+    assert job['status'] == 'succeeded', job['error']
+    return job['result']
+
+
+def test_event_payload_normalizes_timestamps():
+    observation = new_observation('p', 0)
+    observation['valueCodeableConcept']['coding'][3]['code'] = '2025-11-10T23:30:00-05:00'
+    assert fhir_resources.event_payload(observation)['event_timestamp'] == datetime(2025, 11, 11, 4, 30)
+
+    # Without an eventTimestamp coding, the time comes from effectiveDateTime.
+    observation['valueCodeableConcept']['coding'].pop(3)
+    observation['effectiveDateTime'] = '2025-11-11T04:30:00Z'
+    assert fhir_resources.event_payload(observation)['event_timestamp'] == datetime(2025, 11, 11, 4, 30)
+
+
+def test_import_follows_next_links(client, fhir_server, wait_for_job, user_id):
+    fhir_server.patients[user_id] = {'resourceType': 'Patient', 'id': 'pat-paging'}
+    fhir_server.observations = [new_observation('pat-paging', hour) for hour in range(23)]
+    fhir_server.observations.append(new_observation('someone-else', 0))
+
+    result = run_import(client, wait_for_job, user_id, page_size=10)
+
+    assert fhir_server.searches == 3
+    assert result['patient'] == {'id': 'pat-paging'}
+    assert result['observations'] == {'read': 23, 'inserted': 23, 'updated': 0, 'unchanged': 0, 'skipped': 0}
+    events = stored_events(user_id)
+    assert {str(e.id) for e in events} == {o['identifier'][0]['value'] for o in fhir_server.observations[:23]}
+
+
+def test_reimport_adds_nothing(client, fhir_server, wait_for_job, user_id):
+    fhir_server.patients[user_id] = {'resourceType': 'Patient', 'id': 'pat-dedup'}
+    fhir_server.observations = [new_observation('pat-dedup', hour) for hour in range(5)]
+    # An Observation from another app: no event id, time in effectiveDateTime.
+    foreign = new_observation('pat-dedup', 0, id='foreign-1', effectiveDateTime='2025-11-10T23:30:00-05:00')
+    foreign['identifier'] = []
+    foreign['valueCodeableConcept']['coding'].pop(3)
+    fhir_server.observations.append(foreign)
+
+    first = run_import(client, wait_for_job, user_id, page_size=4)
+    assert first['observations']['inserted'] == 6
+    second = run_import(client, wait_for_job, user_id, page_size=4)
+    assert second['observations'] == {'read': 6, 'inserted': 0, 'updated': 0, 'unchanged': 6, 'skipped': 0}
+
+    with SessionLocal() as db:
+        assert db.execute(select(func.count()).select_from(Event).where(Event.user_id == user_id)).scalar() == 6
+    imported = [e for e in stored_events(user_id) if e.event_day == '2025-11-11']
+    assert [(e.event_timestamp, e.event_week) for e in imported] == [(datetime(2025, 11, 11, 4, 30), '2025-11-10')]
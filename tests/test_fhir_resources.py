@@ -0,0 +1,72 @@
+import itertools
+import uuid
+from collections import namedtuple
+from datetime import datetime
+
+import orjson
+import pytest
+from fhirclient.models.bundle import Bundle
+from fhirclient.models.observation import Observation
+from fhirclient.models.patient import Patient
+
+from backend import fhir_resources
+from backend.fhir_export import observation_entry
+from backend.fhir_state import PENDING_COLUMNS
+from backend.main import convert_event_to_fhir, convert_user_to_fhir
+from backend.models import EventType, Severity, Unit, User
+
+Row = namedtuple('Row', [c.key for c in PENDING_COLUMNS])
+
+
+def rows():
+    """Events covering every event type, severity and unit, with empty and None fields."""
+    values = itertools.cycle([None, 0, 7, 480])
+    timestamps = itertools.cycle([None, datetime(2025, 1, 1, 8, 30), datetime(2025, 11, 10, 23, 59, 59)])
+    descriptions = itertools.cycle(['', 'slept well', 'ünïcode ☕'])
+    for event_type, severity, unit in itertools.product(EventType, [None, *Severity], [None, *Unit]):
+        yield Row(uuid.uuid4(), 'LOINC', 'LA15141-7', event_type, severity, next(values), unit,
+                  next(descriptions), next(timestamps), datetime(2025, 1, 1))
+
+
+def as_json(resource):
+    # Through JSON, as the server receives it.
+    return orjson.loads(orjson.dumps(resource))
+
+
+@pytest.mark.parametrize('row', list(rows()), ids=lambda row: f"{row.event_type.value}-{row.severity}-{row.numerical_unit}")
+def test_observation_matches_fhirclient(row):
+    observation = fhir_resources.observation(row, 'patient-1')
+    # Valid for fhirclient's Observation model, which reads it back unchanged ...
+    assert as_json(Observation(as_json(observation)).as_json()) == as_json(observation)
+    # ... and the same JSON convert_event_to_fhir builds.
+    expected = as_json(convert_event_to_fhir(row).as_json())
+    assert as_json({k: v for k, v in observation.items() if k != 'subject'}) == expected
+    # Import reads the event back.
+    payload = fhir_resources.event_payload(as_json(observation))
+    assert payload == {'system': row.system, 'code': row.code, 'event_type': row.event_type,
+                       'severity': row.severity, 'numerical_value': row.numerical_value,
+                       'numerical_unit': row.numerical_unit, 'description': row.description,
+                       'event_timestamp': row.event_timestamp}
+
+
+def test_observation_without_description_fails_like_fhirclient():
+    row = next(rows())._replace(description=None)
+    with pytest.raises(ValueError):
+        fhir_resources.observation(row)
+    with pytest.raises(Exception):
+        convert_event_to_fhir(row).as_json()
+
+
+def test_batch_bundle_round_trips():
+    entries = [observation_entry(fhir_resources.observation(row, 'patient-1'), str(row.id), resource_id)
+               for row, resource_id in zip(rows(), itertools.cycle([None, '42']))]
+    bundle = as_json({'resourceType': 'Bundle', 'type': 'batch', 'entry': entries})
+    assert as_json(Bundle(bundle).as_json()) == bundle
+
+
+@pytest.mark.parametrize('name', ['Al', 'Zoë', ''])
+def test_patient_matches_fhirclient(name):
+    user = User(id=uuid.uuid4(), name=name)
+    patient = fhir_resources.patient(user)
+    assert as_json(Patient(as_json(patient)).as_json()) == as_json(patient)
+    assert as_json(convert_user_to_fhir(user).as_json()) == as_json(patient)
@@ -0,0 +1,24 @@
+from sqlalchemy import create_engine
+
+from backend.migrations import MIGRATIONS, upgrade
+
+
+def index_names(engine):
+    with engine.connect() as conn:
+        return {row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+def test_upgrade_drops_the_analytics_index(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    upgrade(engine)
+    # A database upgraded to step 5 still has the index step 1 built.
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE INDEX ix_events_user_ts_analytics ON events "
+                             "(user_id, event_timestamp, event_type, severity, unit, numerical_value)")
+        conn.exec_driver_sql("PRAGMA user_version = 5")
+
+    assert upgrade(engine) == MIGRATIONS[-1][0]
+    names = index_names(engine)
+    assert 'ix_events_user_ts_analytics' not in names
+    assert 'ix_events_user_ts_id' in names
+    engine.dispose()
@@ -0,0 +1,75 @@
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+
+from backend import ingest, pagination
+from backend.database import SessionLocal, engine
+from backend.main import EVENT_COLUMNS
+from backend.models import Event, EventType
+
+
+def add_events(user_id, dated, undated):
+    """`dated` events, some sharing a timestamp, and `undated` ones without a timestamp."""
+    rng = random.Random(0)
+    payloads = [{'system': 's', 'code': 'c', 'event_type': rng.choice(['sleep', 'stress', 'meal']),
+                 'event_timestamp': datetime(2025, 1, 1) + timedelta(hours=rng.randint(0, dated // 3))}
+                for _ in range(dated)]
+    payloads += [{'system': 's', 'code': 'c', 'event_type': 'stress', 'event_timestamp': None}] * undated
+    with SessionLocal() as db:
+        db.execute(insert(Event.__table__), [ingest.new_event_row(user_id, p, ingest.utc_now()) for p in payloads])
+        db.commit()
+
+
+def expected_ids(user_id):
+    # Newest first, undated last, as SQLite sorts NULLs in DESC order.
+    with SessionLocal() as db:
+        rows = db.execute(select(Event.event_timestamp, Event.id).where(Event.user_id == user_id)).all()
+    rows.sort(key=lambda r: (r.event_timestamp is not None, r.event_timestamp or datetime.min, r.id.hex), reverse=True)
+    return [str(r.id) for r in rows]
+
+
+def test_pages_cover_dated_and_undated_events(client, user_id):
+    add_events(user_id, dated=95, undated=12)
+    expected = expected_ids(user_id)
+
+    seen, params = [], {'user_id': user_id, 'limit': 10}
+    pages = []
+    while True:
+        page = client.get("/api/triggers", params=params).json()
+        pages.append(page)
+        seen += [item['id'] for item in page['items']]
+        if not page['next_cursor']:
+            break
+        params['before'] = page['next_cursor']
+    assert seen == expected
+
+    # And back again from the last page, newest first on each page.
+    seen, page = [], pages[-1]
+    while page['prev_cursor']:
+        page = client.get("/api/triggers", params={'user_id': user_id, 'limit': 10, 'after': page['prev_cursor']}).json()
+        seen = [item['id'] for item in page['items']] + seen
+    assert seen + [item['id'] for item in pages[-1]['items']] == expected
+
+
+def query_plan(stmt):
+    compiled = stmt.compile(engine)
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled), (None,) * len(compiled.positiontup)).all()
+    return ' '.join(row[-1] for row in rows)
+
+
+def test_page_queries_seek_on_the_index():
+    ts, id = datetime(2025, 1, 1), '00000000-0000-0000-0000-000000000001'
+    listings = [
+        (select(*EVENT_COLUMNS).where(Event.user_id == 1, Event.event_type != EventType.migraine), 'ix_events_user_ts_id'),
+        (select(*EVENT_COLUMNS).where(Event.user_id == 1, Event.event_type == EventType.migraine), 'ix_events_user_type_ts_id'),
+    ]
+    for stmt, index in listings:
+        for direction, op in ((pagination._older, '<'), (pagination._newer, '>')):
+            # The dated side of a page: a range on the index, in index order.
+            conditions, order = direction(Event.event_timestamp, Event.id, ts, id)[0]
+            plan = query_plan(stmt.where(*conditions).order_by(*order).limit(11))
+            assert f"USING INDEX {index} (" in plan, plan
+            assert f"(event_timestamp,id){op}(?,?)" in plan, plan
+            assert "TEMP B-TREE" not in plan, plan
@@ -0,0 +1,44 @@
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import select, text
+
+from backend import ingest
+from backend.database import SessionLocal
+from backend.models import Event, EventType
+
+# 23:30 on Monday 10 November in New York is Tuesday 11 November in UTC.
+OFFSET_TIMESTAMP = "2025-11-10T23:30:00-05:00"
+UTC_TIMESTAMP = datetime(2025, 11, 11, 4, 30)
+
+
+def sql_week(db, ts):
+    """The week bucket by the SQL rule the migrations backfill with."""
+    return db.execute(text("SELECT date(:ts, 'weekday 1', '-7 days')"), {'ts': str(ts)}).scalar()
+
+
+def test_new_event_row_stores_utc():
+    payload = {'system': 's', 'code': 'c', 'event_type': 'migraine',
+               'event_timestamp': datetime.fromisoformat(OFFSET_TIMESTAMP)}
+    row = ingest.new_event_row(1, payload, ingest.utc_now())
+    assert row['event_timestamp'] == row['event_ts_utc'] == UTC_TIMESTAMP
+    assert row['event_day'] == '2025-11-11'
+    assert row['event_week'] == '2025-11-10'
+
+
+def test_orm_event_stores_utc():
+    event = Event(event_timestamp=datetime(2025, 11, 10, 23, 30, tzinfo=timezone(timedelta(hours=-5))))
+    assert event.event_timestamp == event.event_ts_utc == UTC_TIMESTAMP
+    assert event.event_week == '2025-11-10'
+
+
+def test_offset_event_buckets_match_stored_timestamp(client, user_id):
+    response = client.post("/api/event", params={'user_id': user_id},
+                           json={'event_type': 'migraine', 'severity': 3, 'event_timestamp': OFFSET_TIMESTAMP})
+    assert response.status_code == 200
+
+    with SessionLocal() as db:
+        event = db.execute(select(Event).where(Event.user_id == user_id)).scalar_one()
+        assert event.event_type == EventType.migraine
+        assert event.event_timestamp == UTC_TIMESTAMP
+        assert event.event_day == str(event.event_timestamp.date())
+        assert event.event_week == sql_week(db, event.event_timestamp) == '2025-11-10'